@@ -3,21 +3,35 @@ Admin API Routes - Sprint 3 P1-1 + Sprint 4 OCR Metrics + Multi-Language Auto-Tr
 신규 메뉴 큐 관리 + 엔진 모니터링 + OCR Tier 메트릭 + 자동 번역
 """
 
+import base64
+import hmac
 import uuid
 import logging
 
 from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_, or_
+from sqlalchemy import select, func, text, tuple_
 from typing import Optional
 from pydantic import BaseModel
-from datetime import datetime, timedelta
-from database import get_db
-from models import ScanLog, CanonicalMenu, Modifier
+from datetime import date, datetime, timedelta
+from database import get_db, get_pool_stats
+from models import ScanLog, ScanLogDailyStat, CanonicalMenu, Modifier
 from config import settings
-from services.cache_service import cache_service, TTL_ADMIN_STATS
+from services.cache_service import (
+    cache_service,
+    TTL_ADMIN_STATS,
+    TTL_ADMIN_QUEUE_COUNT,
+)
 from services.ocr_orchestrator import ocr_orchestrator
+from services.ocr_near_duplicate import near_duplicate_index
+from services.preprocess_pool import preprocess_pool
+from services.scan_log_writer import scan_log_writer
+from services.menu_upload_worker import menu_upload_workers
+from services.bulk_translation_worker import (
+    STATUS_FILTERS as BULK_TRANSLATION_STATUS_FILTERS,
+    bulk_translation_worker,
+)
 from services.auto_translate_service import get_auto_translate_service
 from schemas.canonical_menu import (
     CanonicalMenuCreate,
@@ -44,6 +58,8 @@ def verify_admin_token(
 
 router = APIRouter(prefix="/api/v1/admin", tags=["admin"])
 
+QUEUE_COUNT_CACHE_PREFIX = "admin:queue:count"
+
 
 # ===========================
 # Request/Response Models
@@ -54,17 +70,105 @@ class QueueApproveRequest(BaseModel):
     action: str  # approve, reject, edit
     canonical_menu_id: Optional[str] = None
     notes: Optional[str] = None
+    created_at: Optional[datetime] = None  # 큐 항목의 created_at (파티션 프루닝용)
 
 
 # ===========================
 # Admin Endpoints
 # ===========================
+def _sign_queue_cursor(raw: str) -> str:
+    """커서 서명 (변조된 커서로 임의 위치 조회 방지)"""
+    digest = hmac.new(settings.SECRET_KEY.encode(), raw.encode(), "sha256")
+    return digest.hexdigest()[:16]
+
+
+def _encode_queue_cursor(created_at: datetime, log_id: uuid.UUID) -> str:
+    """Keyset 커서 인코딩 ((created_at, id) → 서명된 opaque string)"""
+    raw = f"{created_at.isoformat()}|{log_id}"
+    signed = f"{raw}|{_sign_queue_cursor(raw)}"
+    return base64.urlsafe_b64encode(signed.encode()).decode()
+
+
+def _decode_queue_cursor(cursor: str) -> tuple:
+    """Keyset 커서 디코딩 (opaque string → (created_at, id), 서명 불일치 시 400)"""
+    try:
+        raw, signature = (
+            base64.urlsafe_b64decode(cursor.encode()).decode().rsplit("|", 1)
+        )
+        if not hmac.compare_digest(signature, _sign_queue_cursor(raw)):
+            raise ValueError("cursor signature mismatch")
+        created_at_str, log_id = raw.split("|", 1)
+        return datetime.fromisoformat(created_at_str), uuid.UUID(log_id)
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+async def _get_queue_total(db: AsyncSession, status: str, source: str) -> tuple:
+    """
+    큐 전체 건수 조회 (캐시 + 근사치)
+
+    - 필터 없는 조회 (PostgreSQL): pg_class.reltuples 통계 추정치 사용
+    - 그 외: COUNT 결과를 짧은 TTL로 캐싱
+
+    Returns:
+        (total, is_estimate)
+    """
+    cache_key = cache_service.cache_key(QUEUE_COUNT_CACHE_PREFIX, status, source)
+    cached_total = await cache_service.get(cache_key)
+    if cached_total is not None:
+        return cached_total
+
+    if (
+        status == "all"
+        and source == "all"
+        and db.get_bind().dialect.name == "postgresql"
+    ):
+        # 파티션 부모는 reltuples를 갖지 않으므로 자식 파티션 합계 사용
+        estimate_result = await db.execute(
+            text(
+                "SELECT SUM(c.reltuples)::bigint FROM pg_inherits i "
+                "JOIN pg_class c ON c.oid = i.inhrelid "
+                "WHERE i.inhparent = 'scan_logs'::regclass AND c.reltuples >= 0"
+            )
+        )
+        estimate = estimate_result.scalar()
+        # NULL: 아직 ANALYZE 되지 않은 파티션만 존재 → 정확한 COUNT로 폴백
+        if estimate is not None and estimate >= 0:
+            total = (int(estimate), True)
+            await cache_service.set(cache_key, total, TTL_ADMIN_QUEUE_COUNT)
+            return total
+
+    count_query = select(func.count(ScanLog.id))
+    count_query = _apply_queue_filters(count_query, status, source)
+    total_result = await db.execute(count_query)
+    total = (total_result.scalar() or 0, False)
+
+    await cache_service.set(cache_key, total, TTL_ADMIN_QUEUE_COUNT)
+    return total
+
+
+def _apply_queue_filters(query, status: str, source: str):
+    """큐 조회 공통 필터 (status, source)"""
+    if status != "all":
+        query = query.where(ScanLog.status == status)
+
+    # Source filter (we'll need to add a source field to ScanLog)
+    # For now, we'll use shop_id: null = b2c, not null = b2b
+    if source == "b2c":
+        query = query.where(ScanLog.shop_id.is_(None))
+    elif source == "b2b":
+        query = query.where(ScanLog.shop_id.isnot(None))
+
+    return query
+
+
 @router.get("/queue")
 async def get_menu_queue(
     status: str = "all",  # all, pending, confirmed, rejected
     source: str = "all",  # all, b2c, b2b
     limit: int = 50,
     offset: int = 0,
+    cursor: Optional[str] = None,
     db: AsyncSession = Depends(get_db),
     _: None = Depends(verify_admin_token),
 ):
@@ -77,11 +181,14 @@ async def get_menu_queue(
         status: 필터 (all, pending, confirmed, rejected)
         source: 소스 (all, b2c, b2b)
         limit: 페이지 크기
-        offset: 페이지 오프셋
+        offset: 페이지 오프셋 (cursor 미지정 시에만 사용, 하위 호환)
+        cursor: Keyset 커서 (이전 응답의 next_cursor). 지정 시 offset 무시
 
     Returns:
         {
-            "total": int,
+            "total": int,                  # 캐시/추정치 (total_is_estimate 참고)
+            "total_is_estimate": bool,
+            "next_cursor": str or null,    # 다음 페이지 커서 (마지막 페이지면 null)
             "data": [
                 {
                     "id": str,
@@ -96,35 +203,41 @@ async def get_menu_queue(
             ]
         }
     """
-    # Build query
-    query = select(ScanLog).order_by(ScanLog.created_at.desc())
-
-    # Status filter
-    if status != "all":
-        query = query.where(ScanLog.status == status)
-
-    # Source filter (we'll need to add a source field to ScanLog)
-    # For now, we'll use shop_id: null = b2c, not null = b2b
-    if source == "b2c":
-        query = query.where(ScanLog.shop_id.is_(None))
-    elif source == "b2b":
-        query = query.where(ScanLog.shop_id.isnot(None))
-
-    # Count total
-    count_query = select(func.count()).select_from(query.subquery())
-    total_result = await db.execute(count_query)
-    total = total_result.scalar()
-
-    # Apply pagination
-    query = query.limit(limit).offset(offset)
+    # Build query: canonical 요약을 LEFT JOIN으로 함께 조회 (N+1 제거)
+    query = (
+        select(
+            ScanLog,
+            CanonicalMenu.id.label("canonical_id"),
+            CanonicalMenu.name_ko.label("canonical_name_ko"),
+            CanonicalMenu.name_en.label("canonical_name_en"),
+        )
+        .outerjoin(CanonicalMenu, ScanLog.matched_canonical_id == CanonicalMenu.id)
+        .order_by(ScanLog.created_at.desc(), ScanLog.id.desc())
+    )
+    query = _apply_queue_filters(query, status, source)
+
+    # Apply pagination (keyset on (created_at, id), OFFSET는 하위 호환용)
+    if cursor:
+        cursor_created_at, cursor_id = _decode_queue_cursor(cursor)
+        query = query.where(
+            # row 비교는 파티션 프루닝 대상이 아니므로 created_at 단독 조건을 함께 지정
+            ScanLog.created_at <= cursor_created_at,
+            tuple_(ScanLog.created_at, ScanLog.id)
+            < tuple_(cursor_created_at, cursor_id),
+        )
+    elif offset:
+        query = query.offset(offset)
+    query = query.limit(limit)
 
     # Execute
     result = await db.execute(query)
-    scan_logs = result.scalars().all()
+    rows = result.all()
+
+    total, total_is_estimate = await _get_queue_total(db, status, source)
 
     # Format response
     data = []
-    for log in scan_logs:
+    for log, canonical_id, canonical_name_ko, canonical_name_en in rows:
         item = {
             "id": str(log.id),
             "menu_name_ko": log.menu_name_ko,
@@ -134,22 +247,12 @@ async def get_menu_queue(
             "status": log.status or "pending",
         }
 
-        # Get matched canonical if exists
-        if log.matched_canonical_id:
-            canonical_result = await db.execute(
-                select(CanonicalMenu).where(
-                    CanonicalMenu.id == log.matched_canonical_id
-                )
-            )
-            canonical = canonical_result.scalars().first()
-            if canonical:
-                item["matched_canonical"] = {
-                    "id": str(canonical.id),
-                    "name_ko": canonical.name_ko,
-                    "name_en": canonical.name_en,
-                }
-            else:
-                item["matched_canonical"] = None
+        if canonical_id:
+            item["matched_canonical"] = {
+                "id": str(canonical_id),
+                "name_ko": canonical_name_ko,
+                "name_en": canonical_name_en,
+            }
         else:
             item["matched_canonical"] = None
 
@@ -159,7 +262,19 @@ async def get_menu_queue(
 
         data.append(item)
 
-    return {"total": total, "data": data, "limit": limit, "offset": offset}
+    next_cursor = None
+    if len(rows) == limit and rows[-1][0].created_at:
+        last_log = rows[-1][0]
+        next_cursor = _encode_queue_cursor(last_log.created_at, last_log.id)
+
+    return {
+        "total": total,
+        "total_is_estimate": total_is_estimate,
+        "data": data,
+        "limit": limit,
+        "offset": offset,
+        "next_cursor": next_cursor,
+    }
 
 
 @router.post("/queue/{queue_id}/approve")
@@ -182,8 +297,11 @@ async def approve_menu_queue(
     Returns:
         {"success": bool, "message": str}
     """
-    # Get scan log
-    result = await db.execute(select(ScanLog).where(ScanLog.id == uuid.UUID(queue_id)))
+    # Get scan log (created_at이 주어지면 해당 월 파티션만 조회)
+    query = select(ScanLog).where(ScanLog.id == uuid.UUID(queue_id))
+    if request.created_at is not None:
+        query = query.where(ScanLog.created_at == request.created_at)
+    result = await db.execute(query)
     scan_log = result.scalars().first()
 
     if not scan_log:
@@ -201,6 +319,7 @@ async def approve_menu_queue(
             scan_log.matched_canonical_id = uuid.UUID(request.canonical_menu_id)
 
         await db.commit()
+        await cache_service.delete_pattern(f"{QUEUE_COUNT_CACHE_PREFIX}:*")
 
         return {
             "success": True,
@@ -214,6 +333,7 @@ async def approve_menu_queue(
         scan_log.review_notes = request.notes
 
         await db.commit()
+        await cache_service.delete_pattern(f"{QUEUE_COUNT_CACHE_PREFIX}:*")
 
         return {"success": True, "message": f"Menu '{scan_log.menu_name_ko}' rejected"}
 
@@ -231,6 +351,7 @@ async def approve_menu_queue(
         scan_log.review_notes = request.notes
 
         await db.commit()
+        await cache_service.delete_pattern(f"{QUEUE_COUNT_CACHE_PREFIX}:*")
 
         return {
             "success": True,
@@ -241,14 +362,60 @@ async def approve_menu_queue(
         raise HTTPException(status_code=400, detail=f"Invalid action: {request.action}")
 
 
+# AI cost calculation (placeholder)
+# Assume: GPT-4o-mini = $0.00015 per 1K input tokens + $0.0006 per 1K output
+# Average: 200 input + 100 output = $0.00009 per call
+# Convert to KRW (1 USD = 1300 KRW)
+AI_COST_PER_CALL_KRW = 0.00009 * 1300
+
+
+def _window_stats(row, prefix: str) -> dict:
+    """롤업 집계 행에서 기간 통계 계산 (scans, hit rate, confidence, AI 비용)"""
+    scans = int(getattr(row, f"{prefix}_scans") or 0)
+    hits = int(getattr(row, f"{prefix}_hits") or 0)
+    conf_sum = float(getattr(row, f"{prefix}_conf_sum") or 0.0)
+    conf_count = int(getattr(row, f"{prefix}_conf_count") or 0)
+    ai_calls = int(getattr(row, f"{prefix}_ai_calls") or 0)
+
+    return {
+        "scans": scans,
+        "db_hit_rate": round(hits / scans if scans > 0 else 0.0, 3),
+        "avg_confidence": round(conf_sum / conf_count if conf_count > 0 else 0.0, 3),
+        "ai_cost": round(ai_calls * AI_COST_PER_CALL_KRW, 0),  # ₩
+    }
+
+
+def _window_columns(prefix: str, condition) -> list:
+    """기간 조건에 해당하는 롤업 버킷 합계 컬럼 (FILTER 절)"""
+    daily = ScanLogDailyStat
+    return [
+        func.sum(daily.scans).filter(condition).label(f"{prefix}_scans"),
+        func.sum(daily.hits).filter(condition).label(f"{prefix}_hits"),
+        func.sum(daily.confidence_sum).filter(condition).label(f"{prefix}_conf_sum"),
+        func.sum(daily.confidence_count)
+        .filter(condition)
+        .label(f"{prefix}_conf_count"),
+        func.sum(daily.ai_calls).filter(condition).label(f"{prefix}_ai_calls"),
+    ]
+
+
 @router.get("/stats")
 async def get_engine_stats(
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
     db: AsyncSession = Depends(get_db),
     _: None = Depends(verify_admin_token),
 ):
     """
     엔진 모니터링 통계 (P1-1)
 
+    scan_log_daily_stats 일별 롤업(트리거 증분 갱신)에서 단일 쿼리로 계산
+    7일 통계는 오늘 포함 최근 7개 UTC 일자 버킷 기준
+
+    Args:
+        date_from: 기간 통계 시작일 (UTC, 포함). 지정 시 "range" 반환
+        date_to: 기간 통계 종료일 (UTC, 포함). 기본값: 오늘
+
     Returns:
         {
             "canonical_count": int,      # 등록된 canonical 메뉴 수
@@ -258,81 +425,58 @@ async def get_engine_stats(
             "pending_queue_count": int,   # 미검토 큐 수
             "scans_7d": int,              # 7일 스캔 수
             "avg_confidence_7d": float,   # 7일 평균 신뢰도
+            "range": {...}                # date_from/date_to 지정 시에만
         }
     """
+    today = datetime.utcnow().date()
+    range_requested = date_from is not None or date_to is not None
+    if range_requested:
+        date_to = date_to or today
+        date_from = date_from or date_to
+        if date_from > date_to:
+            raise HTTPException(
+                status_code=400, detail="date_from must be on or before date_to"
+            )
+
     # Check cache first
     cache_key = "admin:stats"
+    if range_requested:
+        cache_key = cache_service.cache_key(cache_key, date_from, date_to)
     cached_stats = await cache_service.get(cache_key)
     if cached_stats is not None:
         return cached_stats
 
-    # 1. Canonical count
-    canonical_result = await db.execute(select(func.count(CanonicalMenu.id)))
-    canonical_count = canonical_result.scalar()
-
-    # 2. Modifier count
-    modifier_result = await db.execute(select(func.count(Modifier.id)))
-    modifier_count = modifier_result.scalar()
+    daily = ScanLogDailyStat
+    seven_days_from = today - timedelta(days=6)
 
-    # 3. Pending queue count
-    pending_result = await db.execute(
-        select(func.count(ScanLog.id)).where(
-            or_(ScanLog.status == "pending", ScanLog.status.is_(None))
-        )
-    )
-    pending_count = pending_result.scalar()
+    columns = [
+        select(func.count(CanonicalMenu.id)).scalar_subquery().label("canonical"),
+        select(func.count(Modifier.id)).scalar_subquery().label("modifiers"),
+        func.sum(daily.pending).label("pending"),
+        *_window_columns("w7", daily.day >= seven_days_from),
+    ]
+    if range_requested:
+        columns += _window_columns("rng", daily.day.between(date_from, date_to))
 
-    # 4. 7일 통계
-    seven_days_ago = datetime.utcnow() - timedelta(days=7)
-
-    # Scans in last 7 days
-    scans_7d_result = await db.execute(
-        select(func.count(ScanLog.id)).where(ScanLog.created_at >= seven_days_ago)
-    )
-    scans_7d = scans_7d_result.scalar()
-
-    # DB hit rate (scans with matched_canonical_id)
-    hits_7d_result = await db.execute(
-        select(func.count(ScanLog.id)).where(
-            and_(
-                ScanLog.created_at >= seven_days_ago,
-                ScanLog.matched_canonical_id.isnot(None),
-            )
-        )
-    )
-    hits_7d = hits_7d_result.scalar()
-    db_hit_rate_7d = hits_7d / scans_7d if scans_7d > 0 else 0.0
-
-    # Average confidence (last 7 days)
-    avg_conf_result = await db.execute(
-        select(func.avg(ScanLog.confidence)).where(ScanLog.created_at >= seven_days_ago)
-    )
-    avg_confidence_7d = avg_conf_result.scalar() or 0.0
-
-    # AI cost calculation (placeholder)
-    # Assume: GPT-4o-mini = $0.00015 per 1K input tokens + $0.0006 per 1K output
-    # Average: 200 input + 100 output = $0.00009 per call
-    # Convert to KRW (1 USD = 1300 KRW)
-    ai_calls_7d_result = await db.execute(
-        select(func.count(ScanLog.id)).where(
-            and_(
-                ScanLog.created_at >= seven_days_ago,
-                ScanLog.evidences.contains({"ai_called": True}),  # JSONB query
-            )
-        )
-    )
-    ai_calls_7d = ai_calls_7d_result.scalar() or 0
-    ai_cost_7d = ai_calls_7d * 0.00009 * 1300  # KRW
+    result = await db.execute(select(*columns).select_from(daily))
+    row = result.one()
 
+    stats_7d = _window_stats(row, "w7")
     stats = {
-        "canonical_count": canonical_count,
-        "modifier_count": modifier_count,
-        "pending_queue_count": pending_count,
-        "scans_7d": scans_7d,
-        "db_hit_rate_7d": round(db_hit_rate_7d, 3),
-        "avg_confidence_7d": round(float(avg_confidence_7d), 3),
-        "ai_cost_7d": round(ai_cost_7d, 0),  # ₩
+        "canonical_count": row.canonical or 0,
+        "modifier_count": row.modifiers or 0,
+        "pending_queue_count": int(row.pending or 0),
+        "scans_7d": stats_7d["scans"],
+        "db_hit_rate_7d": stats_7d["db_hit_rate"],
+        "avg_confidence_7d": stats_7d["avg_confidence"],
+        "ai_cost_7d": stats_7d["ai_cost"],  # ₩
     }
+    if range_requested:
+        stats["range"] = {
+            "date_from": date_from.isoformat(),
+            "date_to": date_to.isoformat(),
+            **_window_stats(row, "rng"),
+        }
 
     # Save to cache (5 minutes TTL)
     await cache_service.set(cache_key, stats, TTL_ADMIN_STATS)
@@ -360,7 +504,29 @@ async def get_ocr_metrics(
             "price_error_count": int,         # 가격 파싱 에러 수
             "price_error_rate": str,          # 가격 에러율 (%)
             "handwriting_detection_rate": str,# 손글씨 감지율 (%)
-            "last_updated": str               # 마지막 업데이트 시간 (ISO 8601)
+            "last_updated": str,              # 마지막 업데이트 시간 (ISO 8601)
+            "latency_histogram": {            # 전체 워커 합산 (Redis 해시)
+                "tier_1:gpt_vision": {"count": int, "avg_ms": float,
+                                      "p50_ms": float, "p90_ms": float,
+                                      "p99_ms": float, "buckets": {...}},
+                "tier_2:clova": {...}
+            },
+            "router": {                       # 워커 프로세스 단위 라우팅 메트릭
+                "hedge_rate": float,          # (hedged + parallel) / routed
+                "hedge_wins": int,            # Tier 1 응답 전 Tier 2 채택 수
+                "latency_ms": {"tier_1": {...p50/p90/p99}, "tier_2": {...}}
+            },
+            "near_duplicate": {               # pHash 근사 중복 재사용
+                "lookups": int,
+                "hits": int,
+                "hit_rate": float
+            },
+            "preprocess": {                   # OpenCV 전처리 프로세스 풀
+                "workers": int,
+                "in_flight": int,
+                "queue_depth": int,           # 실행 대기 작업 수
+                "avg_ms": float
+            }
         }
     """
     metrics = await ocr_orchestrator.get_metrics()
@@ -389,9 +555,82 @@ async def get_ocr_metrics(
         "last_updated": metrics.get(
             "last_updated", datetime.utcnow().isoformat() + "Z"
         ),
+        "latency_histogram": metrics.get("latency_histogram", {}),
+        "router": ocr_orchestrator.tier_router.get_stats(),
+        "near_duplicate": near_duplicate_index.get_stats(),
+        "preprocess": preprocess_pool.get_stats(),
     }
 
 
+@router.get("/db/pool")
+async def get_db_pool_metrics(
+    _: None = Depends(verify_admin_token),
+):
+    """
+    DB 커넥션 풀 메트릭 조회 (워커 프로세스 단위)
+
+    Returns:
+        {
+            "pool_size": int,              # 상시 유지 커넥션 수
+            "max_overflow": int,           # 초과 허용 커넥션 수
+            "checked_out": int,            # 사용 중 커넥션 수
+            "idle": int,                   # 유휴 커넥션 수
+            "overflow": int,               # 현재 초과 커넥션 수
+            "utilization": float,          # checked_out / (pool_size + max_overflow)
+            "peak_checked_out": int,       # 최대 동시 사용 커넥션 수
+            "checkouts": int,              # 누적 체크아웃 수
+            "checkout_timeouts": int,      # 풀 고갈로 인한 타임아웃 수
+            "avg_checkout_wait_ms": float, # 평균 체크아웃 대기 시간
+            "max_checkout_wait_ms": float  # 최대 체크아웃 대기 시간
+        }
+    """
+    return get_pool_stats()
+
+
+@router.get("/scan-logs/writer")
+async def get_scan_log_writer_stats(
+    _: None = Depends(verify_admin_token),
+):
+    """
+    ScanLog write-behind 버퍼 상태 조회 (워커 프로세스 단위)
+
+    Returns:
+        {
+            "enqueued": int,       # 누적 enqueue 수
+            "flushed": int,        # DB 저장 완료 행 수
+            "flushes": int,        # 배치 INSERT 횟수
+            "flush_errors": int,   # 배치 저장 실패 횟수
+            "spilled": int,        # 스필 파일로 기록된 행 수
+            "replayed": int,       # 시작 시 재적재된 행 수
+            "running": bool,
+            "buffered": int,       # 현재 큐 대기 행 수
+            "max_buffer": int
+        }
+    """
+    return scan_log_writer.get_stats()
+
+
+@router.get("/menu-upload/workers")
+async def get_menu_upload_worker_stats(
+    _: None = Depends(verify_admin_token),
+):
+    """
+    B2B 메뉴 업로드 작업 큐 / 워커 상태 조회 (큐 깊이는 전체, 카운터는 워커 프로세스 단위)
+
+    Returns:
+        {
+            "workers": int,
+            "running": bool,
+            "processed": int,      # 처리 완료 행 수
+            "retried": int,        # 재적재된 행 수
+            "failed": int,         # 재시도 소진 행 수
+            "busy": int,           # 현재 처리 중인 워커 수
+            "queue": {"backend": "redis" | "local", "queued": int, "in_progress": int}
+        }
+    """
+    return await menu_upload_workers.get_stats()
+
+
 # ===========================
 # Multi-Language Auto-Translation (Sprint 2 Phase 3)
 # ===========================
@@ -584,11 +823,9 @@ async def retranslate_menu(
     }
 
 
-@router.post("/canonical-menus/translate-all")
+@router.post("/canonical-menus/translate-all", status_code=202)
 async def translate_all_menus(
     request: TranslateRequest,
-    background_tasks: BackgroundTasks,
-    db: AsyncSession = Depends(get_db),
     _: None = Depends(verify_admin_token),
 ):
     """
@@ -601,64 +838,83 @@ async def translate_all_menus(
         - Fix all failed translations: status_filter=failed
         - Translate all pending menus: status_filter=pending
         - Re-translate everything: status_filter=all (use with caution!)
+
+    대상 메뉴를 pending으로 전환한 뒤 작업 1건으로 적재 → BulkTranslationWorker가
+    동시 처리 상한 / 키 잔여 RPD 내에서 번역 (진행 상황: GET .../translate-all/{job_id})
     """
-    # Build query
-    query = select(CanonicalMenu)
-
-    if request.status_filter == "failed":
-        query = query.where(CanonicalMenu.translation_status == "failed")
-    elif request.status_filter == "pending":
-        query = query.where(CanonicalMenu.translation_status == "pending")
-    elif request.status_filter == "all":
-        # Re-translate everything
-        pass
-    else:
+    if request.status_filter not in BULK_TRANSLATION_STATUS_FILTERS:
         raise HTTPException(
             status_code=400,
             detail=f"Invalid status_filter: {request.status_filter}. Use 'failed', 'pending', or 'all'",
         )
 
-    # Only translate menus with English description
-    query = query.where(CanonicalMenu.explanation_short.op("?")("en"))
-
-    result = await db.execute(query)
-    menus = result.scalars().all()
+    progress = await bulk_translation_worker.submit(request.status_filter)
 
-    if not menus:
+    if not progress["total"]:
         return {
             "success": True,
             "message": f"No menus found with status_filter={request.status_filter}",
             "count": 0,
         }
 
-    # Queue background translations
-    from config import settings
-
-    queued_count = 0
-    for menu in menus:
-        # Reset status
-        menu.translation_status = "pending"
-        menu.translation_error = None
-
-        # Queue translation
-        background_tasks.add_task(
-            _background_translate_menu,
-            menu_id=menu.id,
-            menu_name_ko=menu.name_ko,
-            description_en=menu.explanation_short.get("en", ""),
-            db_url=settings.DATABASE_URL,
-        )
-        queued_count += 1
-
-    await db.commit()
-
     logger.info(
-        f"🚀 Bulk translation queued: {queued_count} menus (filter={request.status_filter})"
+        f"🚀 Bulk translation job queued: {progress['job_id']} "
+        f"({progress['total']} menus, filter={request.status_filter})"
     )
 
     return {
         "success": True,
-        "message": f"Queued {queued_count} menus for translation",
-        "count": queued_count,
+        "message": f"Queued {progress['total']} menus for translation",
+        "count": progress["total"],
         "status_filter": request.status_filter,
+        "job_id": progress["job_id"],
+        "status_url": f"/api/v1/admin/canonical-menus/translate-all/{progress['job_id']}",
     }
+
+
+@router.get("/canonical-menus/translate-all/{job_id}")
+async def get_bulk_translation_status(
+    job_id: str,
+    _: None = Depends(verify_admin_token),
+):
+    """
+    일괄 재번역 작업 진행 상황 (페이지 단위 체크포인트)
+
+    Returns:
+        {
+            "job_id": str,
+            "status": "queued" | "running" | "paused" | "completed" | "failed",
+            "total": int, "processed": int, "succeeded": int, "failed": int,
+            "cursor": str | None,   # 마지막 처리 메뉴 ID (재개 지점)
+            "error": str | None,    # paused: 키 소진 (POST .../resume) / failed: 작업 오류
+            ...
+        }
+    """
+    progress = await bulk_translation_worker.get_progress(job_id)
+    if progress is None:
+        raise HTTPException(
+            status_code=404, detail=f"Bulk translation job not found: {job_id}"
+        )
+    return progress
+
+
+@router.post("/canonical-menus/translate-all/{job_id}/resume", status_code=202)
+async def resume_bulk_translation(
+    job_id: str,
+    _: None = Depends(verify_admin_token),
+):
+    """
+    키 소진으로 paused된 일괄 재번역 작업 재개
+
+    같은 job_id를 저장된 cursor부터 다시 적재 (완료된 메뉴는 재번역하지 않음).
+    translate-all 재요청은 대상 메뉴를 다시 pending으로 돌리므로 재개에는 이 API 사용
+    """
+    try:
+        progress = await bulk_translation_worker.resume(job_id)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if progress is None:
+        raise HTTPException(
+            status_code=404, detail=f"Bulk translation job not found: {job_id}"
+        )
+    return progress
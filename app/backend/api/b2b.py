@@ -4,8 +4,6 @@ B2B API Routes - 식당 등록 및 관리
 
 import json
 import logging
-import tempfile
-import os
 
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -20,9 +18,7 @@ from models.restaurant import Restaurant, RestaurantStatus
 from services.cache_service import cache_service, TTL_RESTAURANT_INFO
 from services.menu_approval_service import MenuApprovalService
 from services.menu_upload_service import MenuUploadService
-from services.ocr_orchestrator import ocr_orchestrator
 from services.qr_code_service import QRCodeService
-from utils.image_validation import validate_image
 
 logger = logging.getLogger(__name__)
 
@@ -250,7 +246,7 @@ async def list_restaurants(
     }
 
 
-@router.post("/restaurants/{restaurant_id}/menus/upload")
+@router.post("/restaurants/{restaurant_id}/menus/upload", status_code=202)
 async def upload_menus(
     restaurant_id: str, file: UploadFile = File(...), db: AsyncSession = Depends(get_db)
 ):
@@ -258,9 +254,9 @@ async def upload_menus(
     B2B 메뉴 일괄 업로드 API
 
     CSV 또는 JSON 파일로 메뉴를 일괄 등록
-    - 자동 번역 (GPT-4o-mini)
-    - 중복 체크
-    - 에러 처리 및 재시도
+    - 파싱/검증 후 즉시 upload_task_id 반환 (status=processing)
+    - 행 단위 작업 큐 → 워커가 동시 처리 (자동 번역, 중복 체크, 재시도)
+    - 진행 상황: GET .../menus/upload/{upload_task_id} (행별 status)
     """
     try:
         # MenuUploadService 인스턴스 생성
@@ -455,7 +451,7 @@ async def approve_restaurant_menus(
         raise HTTPException(status_code=500, detail=f"Menu approval failed: {str(e)}")
 
 
-@router.post("/restaurants/{restaurant_id}/menus/upload-images")
+@router.post("/restaurants/{restaurant_id}/menus/upload-images", status_code=202)
 async def bulk_upload_menu_images(
     restaurant_id: str,
     files: List[UploadFile] = File(...),
@@ -464,16 +460,18 @@ async def bulk_upload_menu_images(
     """
     B2B 메뉴 이미지 벌크 업로드 API (Sprint 4 - OCR Tier Router)
 
-    식당에서 다중 메뉴 이미지를 한 번에 업로드
+    식당에서 다중 메뉴 이미지를 한 번에 업로드.
+    이미지를 저장한 뒤 즉시 task_id를 반환하고, OCR은 백그라운드에서 처리
+    (진행 상황: GET .../menus/upload-images/{task_id})
 
-    Flow (Tier-based OCR):
+    Flow (Tier-based OCR, 백그라운드 / 동시 처리 B2B_IMAGE_UPLOAD_CONCURRENCY):
     1. 각 이미지 검증 (format, size, dimensions)
     2. OCR 분석 (Tier Router: GPT Vision → CLOVA fallback)
        - Tier 1: GPT-4o mini Vision (빠른 처리, JSON 구조화)
        - Tier 2: CLOVA OCR (Tier 1 실패 시, 한글 특화)
     3. 결과 캐싱 (해시 기반, 30일 TTL)
     4. ScanLog에 저장
-    5. MenuUploadTask로 진행 상황 추적
+    5. MenuUploadTask로 진행 상황 추적 (이미지 단위 갱신)
 
     Args:
         restaurant_id: 식당 UUID
@@ -483,170 +481,99 @@ async def bulk_upload_menu_images(
         {
             "success": bool,
             "task_id": str,
+            "status": "pending",
             "total": int,
-            "successful": int,
-            "failed": int,
-            "results": [
-                {
-                    "file": str,
-                    "status": "success" | "failed",
-                    "provider": "gpt_vision" | "clova" | null,
-                    "menu_count": int,
-                    "confidence": float,
-                    "fallback_triggered": bool,
-                    "processing_time_ms": int,
-                    "error": str (if failed)
-                }
-            ]
+            "progress_url": str
         }
     """
-    from datetime import timezone
-    from models.menu_upload import MenuUploadTask
-    from models.scan_log import ScanLog
-    from utils.image_validation import ImageValidationError
+    from models.menu_upload import MenuUploadTask, UploadStatus
+    from services.menu_image_upload import menu_image_processor
+
+    try:
+        restaurant_uuid = uuid.UUID(restaurant_id)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid UUID format: {str(e)}")
 
     # 1. 업로드 작업 생성
     task = MenuUploadTask(
         id=uuid.uuid4(),
-        restaurant_id=uuid.UUID(restaurant_id),
+        restaurant_id=restaurant_uuid,
         file_name=f"bulk_upload_{len(files)}_images.zip",
         file_type="images",
         total_menus=len(files),
-        status="processing",
-        started_at=datetime.now(timezone.utc),
+        successful=0,
+        failed=0,
+        status=UploadStatus.pending.value,
     )
     db.add(task)
     await db.commit()
 
-    successful = 0
-    failed = 0
-    results = []
-
-    # 2. 각 이미지 처리
-    for idx, file in enumerate(files):
-        temp_path = None
-
-        try:
-            # 2-1. 파일 읽기
-            content = await file.read()
-
-            # 2-2. 이미지 검증
-            try:
-                img_format, width, height = validate_image(content)
-            except ImageValidationError as e:
-                failed += 1
-                results.append(
-                    {
-                        "file": file.filename,
-                        "status": "failed",
-                        "error": f"Invalid image: {str(e)}",
-                    }
-                )
-                continue
-
-            # 2-3. 임시 파일 저장
-            with tempfile.NamedTemporaryFile(
-                delete=False, suffix=f".{img_format.lower()}"
-            ) as temp_file:
-                temp_file.write(content)
-                temp_path = temp_file.name
-
-            # 2-4. OCR 분석 (Tier Router 사용)
-            ocr_result = await ocr_orchestrator.extract_menu(
-                image_path=temp_path,
-                enable_preprocessing=True,
-                use_cache=True,  # 캐싱 활성화
-            )
-
-            # 2-5. 결과 처리
-            if ocr_result.success and ocr_result.menu_items:
-                # 각 메뉴 아이템을 ScanLog에 저장
-                for item in ocr_result.menu_items:
-                    scan_log = ScanLog(
-                        id=uuid.uuid4(),
-                        session_id=f"b2b_upload_{task.id}",
-                        language="ko",
-                        menu_name_ko=item.name_ko,
-                        ocr_raw_text=ocr_result.raw_text,
-                        confidence=ocr_result.confidence,
-                        shop_id=uuid.UUID(restaurant_id),
-                        status="pending",
-                        evidences={
-                            "source": "b2b_bulk_upload",
-                            "file_name": file.filename,
-                            "price": item.price,
-                            "ocr_provider": (
-                                ocr_result.provider.value
-                                if ocr_result.provider
-                                else None
-                            ),
-                            "fallback_triggered": ocr_result.triggered_fallback,
-                            "fallback_reason": ocr_result.fallback_reason,
-                        },
-                    )
-                    db.add(scan_log)
-
-                successful += 1
-                results.append(
-                    {
-                        "file": file.filename,
-                        "status": "success",
-                        "provider": (
-                            ocr_result.provider.value if ocr_result.provider else None
-                        ),
-                        "menu_count": len(ocr_result.menu_items),
-                        "confidence": float(ocr_result.confidence),
-                        "fallback_triggered": ocr_result.triggered_fallback,
-                        "processing_time_ms": ocr_result.processing_time_ms,
-                    }
-                )
-
-            else:
-                failed += 1
-                results.append(
-                    {
-                        "file": file.filename,
-                        "status": "failed",
-                        "error": f"OCR failed: {ocr_result.raw_text or 'Unknown error'}",
-                    }
-                )
-
-        except Exception as e:
-            failed += 1
-            logger.error(f"Error processing {file.filename}: {e}", exc_info=True)
-            results.append({"file": file.filename, "status": "failed", "error": str(e)})
-
-        finally:
-            # Cleanup
-            if temp_path and os.path.exists(temp_path):
-                try:
-                    os.remove(temp_path)
-                    # 전처리된 이미지도 정리
-                    base, _ = os.path.splitext(temp_path)
-                    preprocessed = f"{base}_preprocessed.jpg"
-                    if os.path.exists(preprocessed):
-                        os.remove(preprocessed)
-                except Exception as e:
-                    logger.warning(f"Failed to cleanup {temp_path}: {e}")
-
-    # 3. 작업 완료 업데이트
-    task.successful = successful
-    task.failed = failed
-    task.status = "completed"
-    task.completed_at = datetime.now(timezone.utc)
-    task.error_log = (
-        json.dumps([r for r in results if r["status"] == "failed"])
-        if failed > 0
-        else None
-    )
-
-    await db.commit()
+    # 2. 이미지 저장 + 백그라운드 처리 시작
+    contents = [(file.filename, await file.read()) for file in files]
+    await menu_image_processor.submit(task.id, restaurant_id, contents)
 
     return {
         "success": True,
         "task_id": str(task.id),
+        "status": task.status,
         "total": len(files),
-        "successful": successful,
-        "failed": failed,
-        "results": results,
+        "progress_url": (
+            f"/api/v1/b2b/restaurants/{restaurant_id}" f"/menus/upload-images/{task.id}"
+        ),
+    }
+
+
+@router.get("/restaurants/{restaurant_id}/menus/upload-images/{task_id}")
+async def get_image_upload_progress(
+    restaurant_id: str, task_id: str, db: AsyncSession = Depends(get_db)
+):
+    """
+    이미지 벌크 업로드 진행 상황 조회 API
+
+    Returns:
+        {
+            "task_id": str,
+            "status": "pending" | "processing" | "completed" | "failed",
+            "total": int,
+            "processed": int,
+            "successful": int,
+            "failed": int,
+            "progress": float,       # 0.0 ~ 1.0
+            "errors": [{"file": str, "error": str}, ...],
+            "started_at": str,
+            "completed_at": str
+        }
+    """
+    from models.menu_upload import MenuUploadTask
+
+    try:
+        task_uuid = uuid.UUID(task_id)
+        restaurant_uuid = uuid.UUID(restaurant_id)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid UUID format: {str(e)}")
+
+    result = await db.execute(
+        select(MenuUploadTask).where(
+            MenuUploadTask.id == task_uuid,
+            MenuUploadTask.restaurant_id == restaurant_uuid,
+        )
+    )
+    task = result.scalars().first()
+    if not task:
+        raise HTTPException(status_code=404, detail="Upload task not found")
+
+    total = task.total_menus or 0
+    processed = (task.successful or 0) + (task.failed or 0)
+
+    return {
+        "task_id": str(task.id),
+        "status": task.status,
+        "total": total,
+        "processed": processed,
+        "successful": task.successful or 0,
+        "failed": task.failed or 0,
+        "progress": round(processed / total, 4) if total else 1.0,
+        "errors": json.loads(task.error_log) if task.error_log else [],
+        "started_at": task.started_at.isoformat() if task.started_at else None,
+        "completed_at": task.completed_at.isoformat() if task.completed_at else None,
     }
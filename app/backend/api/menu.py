@@ -8,13 +8,12 @@ from sqlalchemy import select
 from typing import List, Optional, Dict, Any
 from pydantic import BaseModel, Field
 from uuid import UUID
-from database import get_db
+from database import get_db, get_read_db
 from models import Concept, Modifier, CanonicalMenu
 from services.matching_engine import MenuMatchingEngine
-from services.ocr_service import ocr_service
+from services.ocr_orchestrator import ocr_orchestrator
+from services.ocr_provider import MenuItem
 from utils.image_validation import validate_image, ImageValidationError
-import os
-import tempfile
 import logging
 
 logger = logging.getLogger(__name__)
@@ -30,14 +29,51 @@ class MenuIdentifyRequest(BaseModel):
     )
 
 
+def _parse_similar_dish(entry: Any) -> Dict[str, Any]:
+    """
+    Normalize one similar_dishes entry into {"name_ko", "name_en"}
+
+    Entries are either legacy strings ("갈비구이 (Galbi Gui - Description)")
+    or objects written at enrichment time.
+    """
+    if isinstance(entry, dict):
+        name_ko = (entry.get("name_ko") or "").strip()
+        return {
+            "name_ko": name_ko,
+            "name_en": entry.get("name_en") or name_ko,
+        }
+
+    dish_string = str(entry)
+    # "갈비구이 (Galbi Gui - Description)" -> "갈비구이"
+    name_ko = dish_string.split("(")[0].strip()
+    return {
+        "name_ko": name_ko,
+        "name_en": (
+            dish_string.split("(")[1].split(")")[0] if "(" in dish_string else name_ko
+        ),
+    }
+
+
+def _is_precomputed_similar_dish(entry: Any) -> bool:
+    """Enrichment-time snapshot: already resolved, no lookup needed"""
+    return isinstance(entry, dict) and "id" in entry and "image_url" in entry
+
+
 async def _resolve_similar_dishes(
-    similar_dishes: List[str], db: AsyncSession
+    similar_dishes: List[Any], db: AsyncSession
 ) -> List[Dict[str, Any]]:
     """
     Convert similar_dishes from string array to full menu objects
 
+    Precomputed entries (written by enrichment with "id" and "image_url")
+    are returned without a lookup; their snapshot fields are kept fresh by
+    the trg_refresh_similar_dish_snapshots trigger. The remaining names are
+    resolved with a single ``name_ko IN (...)`` query instead of one query
+    per dish. Extra fields such as similarity_reason / difference are kept.
+
     Args:
         similar_dishes: List of dish name strings (e.g., ["갈비구이 (Galbi Gui...)", ...])
+            or precomputed dish objects
         db: Database session
 
     Returns:
@@ -46,53 +82,67 @@ async def _resolve_similar_dishes(
     if not similar_dishes:
         return []
 
-    resolved = []
-    for dish_string in similar_dishes:
-        # Extract Korean name (before parenthesis or dash)
-        # "갈비구이 (Galbi Gui - Description)" -> "갈비구이"
-        name_ko = dish_string.split("(")[0].strip()
+    names = {
+        _parse_similar_dish(entry)["name_ko"]
+        for entry in similar_dishes
+        if not _is_precomputed_similar_dish(entry)
+    } - {""}
 
+    menus_by_name: Dict[str, CanonicalMenu] = {}
+    if names:
         try:
-            # Look up in canonical_menus by name_ko
             result = await db.execute(
-                select(CanonicalMenu).where(CanonicalMenu.name_ko == name_ko).limit(1)
+                select(CanonicalMenu).where(CanonicalMenu.name_ko.in_(names))
             )
-            menu = result.scalar_one_or_none()
-
-            if menu:
-                resolved.append(
-                    {
-                        "id": str(menu.id),
-                        "name_ko": menu.name_ko,
-                        "name_en": menu.name_en,
-                        "image_url": menu.image_url
-                        or (
-                            menu.primary_image.get("url")
-                            if menu.primary_image
-                            else None
-                        ),
-                        "spice_level": menu.spice_level,
-                    }
-                )
-            else:
-                # Fallback: return string-based object
-                resolved.append(
-                    {
-                        "id": None,
-                        "name_ko": name_ko,
-                        "name_en": (
-                            dish_string.split("(")[1].split(")")[0]
-                            if "(" in dish_string
-                            else name_ko
-                        ),
-                        "image_url": None,
-                        "spice_level": 0,
-                    }
-                )
+            for menu in result.scalars().all():
+                # Keep first match per name (name_ko is not unique)
+                menus_by_name.setdefault(menu.name_ko, menu)
         except Exception as e:
-            logger.warning(f"Failed to resolve similar dish '{dish_string}': {e}")
+            logger.warning(f"Failed to resolve similar dishes {sorted(names)}: {e}")
+
+    resolved = []
+    for entry in similar_dishes:
+        extra = dict(entry) if isinstance(entry, dict) else {}
+        if _is_precomputed_similar_dish(entry):
+            resolved.append(
+                {
+                    **extra,
+                    "name_en": entry.get("name_en") or entry.get("name_ko"),
+                    "spice_level": entry.get("spice_level") or 0,
+                }
+            )
+            continue
+
+        dish = _parse_similar_dish(entry)
+        if not dish["name_ko"]:
             continue
 
+        menu = menus_by_name.get(dish["name_ko"])
+        if menu:
+            resolved.append(
+                {
+                    **extra,
+                    "id": str(menu.id),
+                    "name_ko": menu.name_ko,
+                    "name_en": menu.name_en,
+                    "image_url": menu.image_url
+                    or (menu.primary_image.get("url") if menu.primary_image else None),
+                    "spice_level": menu.spice_level,
+                }
+            )
+        else:
+            # Fallback: return string-based object
+            resolved.append(
+                {
+                    **extra,
+                    "id": None,
+                    "name_ko": dish["name_ko"],
+                    "name_en": dish["name_en"],
+                    "image_url": None,
+                    "spice_level": 0,
+                }
+            )
+
     return resolved
 
 
@@ -165,7 +215,7 @@ def _serialize_canonical_menu(
 
 
 @router.get("/concepts")
-async def get_concepts(db: AsyncSession = Depends(get_db)):
+async def get_concepts(db: AsyncSession = Depends(get_read_db)):
     """Get all concepts (개념 트리 조회)"""
     result = await db.execute(select(Concept).order_by(Concept.sort_order))
     concepts = result.scalars().all()
@@ -187,7 +237,7 @@ async def get_concepts(db: AsyncSession = Depends(get_db)):
 
 
 @router.get("/modifiers")
-async def get_modifiers(db: AsyncSession = Depends(get_db)):
+async def get_modifiers(db: AsyncSession = Depends(get_read_db)):
     """Get all modifiers (수식어 사전 조회)"""
     result = await db.execute(
         select(Modifier).order_by(Modifier.priority.desc(), Modifier.text_ko)
@@ -214,7 +264,7 @@ async def get_modifiers(db: AsyncSession = Depends(get_db)):
 
 @router.get("/canonical-menus")
 async def get_canonical_menus(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     include_enriched: bool = False,
     limit: Optional[int] = Query(
         None, ge=1, le=500, description="결과 수 제한 (최대 500)"
@@ -261,7 +311,9 @@ async def get_canonical_menus(
 
 
 @router.get("/canonical-menus/{menu_id}")
-async def get_canonical_menu_by_id(menu_id: UUID, db: AsyncSession = Depends(get_db)):
+async def get_canonical_menu_by_id(
+    menu_id: UUID, db: AsyncSession = Depends(get_read_db)
+):
     """
     Get single canonical menu by ID with full enriched content
 
@@ -291,7 +343,9 @@ async def get_canonical_menu_by_id(menu_id: UUID, db: AsyncSession = Depends(get
 
 
 @router.get("/canonical-menus/{menu_id}/images")
-async def get_canonical_menu_images(menu_id: UUID, db: AsyncSession = Depends(get_db)):
+async def get_canonical_menu_images(
+    menu_id: UUID, db: AsyncSession = Depends(get_read_db)
+):
     """
     Get images only for a canonical menu (Sprint 2 Phase 1)
 
@@ -333,7 +387,7 @@ async def get_canonical_menu_images(menu_id: UUID, db: AsyncSession = Depends(ge
 
 @router.post("/menu/identify")
 async def identify_menu(
-    request: MenuIdentifyRequest, db: AsyncSession = Depends(get_db)
+    request: MenuIdentifyRequest, db: AsyncSession = Depends(get_read_db)
 ):
     """
     메뉴 식별 API
@@ -353,9 +407,9 @@ async def recognize_menu_image(
 
     Flow:
     1. Upload menu image
-    2. CLOVA OCR → Extract text
-    3. GPT-4o → Parse menu items (name_ko, price_ko)
-    4. Return structured menu list
+    2. OCR Orchestrator: 내용 해시 캐시 → 근사 중복 (다른 각도로 찍은 같은 메뉴판) →
+       Tier 라우팅 (GPT Vision / CLOVA)
+    3. Return structured menu list
 
     Returns:
         {
@@ -375,59 +429,39 @@ async def recognize_menu_image(
     except ImageValidationError as e:
         raise HTTPException(status_code=400, detail=f"Invalid image: {str(e)}")
 
-    # Save uploaded file temporarily
-    temp_path = None
     try:
-        # Create temp file with validated format
-        with tempfile.NamedTemporaryFile(
-            delete=False, suffix=f".{img_format.lower()}"
-        ) as temp_file:
-            temp_file.write(content)
-            temp_path = temp_file.name
-
-        # Process with OCR service
-        result = ocr_service.recognize_menu_image(temp_path)
+        # 매장 정보 없는 관광객 스캔 → 전체 근사 중복 인덱스 사용
+        result = await ocr_orchestrator.extract_menu(
+            image_data=content, enable_preprocessing=True, use_cache=True
+        )
 
-        if not result["success"]:
+        if not result.success:
             raise HTTPException(
-                status_code=500, detail=result.get("error", "OCR processing failed")
+                status_code=500,
+                detail=result.fallback_reason or "OCR processing failed",
             )
 
+        menu_items = [
+            {"name_ko": item.name_ko, "price_ko": _format_price_ko(item)}
+            for item in result.menu_items
+        ]
         return {
             "success": True,
-            "menu_items": result["menu_items"],
-            "raw_text": result.get("raw_text", ""),
-            "ocr_confidence": result.get("ocr_confidence", 0.0),
-            "count": len(result["menu_items"]),
+            "menu_items": menu_items,
+            "raw_text": result.raw_text,
+            "ocr_confidence": result.confidence,
+            "count": len(menu_items),
         }
 
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error processing image: {str(e)}")
-    finally:
-        # Clean up temp file (Bug #3 Fix: Log errors instead of silent failure)
-        if temp_path and os.path.exists(temp_path):
-            try:
-                os.remove(temp_path)
-                logger.debug(f"Cleaned up temp file: {temp_path}")
-            except PermissionError as e:
-                logger.error(
-                    f"Permission denied when deleting temp file {temp_path}: {e}"
-                )
-                # On Windows, file might be locked. Try delayed cleanup
-                try:
-                    import atexit
-
-                    atexit.register(
-                        lambda: (
-                            os.remove(temp_path) if os.path.exists(temp_path) else None
-                        )
-                    )
-                    logger.info(f"Scheduled delayed cleanup for {temp_path}")
-                except Exception as cleanup_error:
-                    logger.error(f"Failed to schedule delayed cleanup: {cleanup_error}")
-            except Exception as e:
-                logger.error(f"Error deleting temp file {temp_path}: {e}")
-                # File remains on disk - log for manual cleanup
-                logger.warning(f"DISK LEAK WARNING: Temp file not deleted: {temp_path}")
+
+
+def _format_price_ko(item: MenuItem) -> str:
+    """MenuItem 가격 → 기존 응답 형식 문자열 ("8,000", 다중 가격이면 첫 가격)"""
+    price = item.price
+    if price is None and item.prices:
+        price = item.prices[0].get("price")
+    return f"{price:,}" if isinstance(price, int) else ""
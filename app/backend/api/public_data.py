@@ -13,7 +13,7 @@ from typing import Optional
 from uuid import UUID
 from pydantic import BaseModel
 
-from database import get_db
+from database import get_db, get_read_db
 from models.canonical_menu import CanonicalMenu
 from services.nutrition_cache import nutrition_cache
 
@@ -26,13 +26,15 @@ router = APIRouter(prefix="/api/v1", tags=["public-data"])
 @router.get("/menu/nutrition/{canonical_id}")
 async def get_nutrition(
     canonical_id: UUID,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
+    write_db: AsyncSession = Depends(get_db),
 ):
     """
     메뉴 영양정보 조회
     3단계 fallback: Redis 캐시 → DB → 공공데이터 API
+    (조회는 read replica, API 결과 저장은 primary)
     """
-    result = await nutrition_cache.get_nutrition(canonical_id, db)
+    result = await nutrition_cache.get_nutrition(canonical_id, db, write_db=write_db)
 
     if not result:
         raise HTTPException(
@@ -64,7 +66,7 @@ async def category_search(
     category_2: Optional[str] = Query(None, description="중분류 (예: 찌개류, 구이류)"),
     page: int = Query(1, ge=1),
     per_page: int = Query(20, ge=1, le=100),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     카테고리 기반 메뉴 검색
@@ -128,7 +130,7 @@ async def category_search(
 @router.get("/menu/by-standard-code/{code}")
 async def get_by_standard_code(
     code: str,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     정부 표준 음식코드로 메뉴 조회
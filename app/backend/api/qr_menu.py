@@ -7,7 +7,7 @@ from fastapi import APIRouter, Depends
 from fastapi.responses import HTMLResponse, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
-from database import get_db
+from database import get_read_db
 from models import Shop, MenuVariant, CanonicalMenu
 import qrcode
 from io import BytesIO
@@ -20,7 +20,9 @@ router = APIRouter(prefix="/qr", tags=["qr"])
 # ===========================
 @router.get("/{shop_code}", response_class=HTMLResponse)
 async def get_qr_menu_page(
-    shop_code: str, lang: str = "en", db: AsyncSession = Depends(get_db)  # en, ja, zh
+    shop_code: str,
+    lang: str = "en",  # en, ja, zh
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     QR 메뉴 페이지 생성 (P2-1)
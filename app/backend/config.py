@@ -13,6 +13,85 @@ class Settings(BaseSettings):
     DATABASE_URL: str
     DB_PASSWORD: str = ""  # psycopg2 직접 연결 스크립트용 (auto_translate_service 등)
 
+    # Database Pool (PostgreSQL/asyncpg 전용)
+    # 워커당 최대 커넥션 = DB_POOL_SIZE + DB_MAX_OVERFLOW
+    # 워커 수 × 최대 커넥션 < Postgres max_connections 로 맞출 것
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: int = 30  # 체크아웃 대기 한도 (초)
+    DB_POOL_RECYCLE: int = 1800  # 커넥션 재생성 주기 (초, -1 = 비활성)
+    DB_POOL_PRE_PING: bool = True
+    DB_STATEMENT_CACHE_SIZE: int = (
+        500  # prepared statement 캐시 (PgBouncer transaction 모드면 0)
+    )
+    DB_QUERY_CACHE_SIZE: int = 1200  # SQLAlchemy 컴파일 캐시
+    DB_ECHO: bool = False  # SQL 로그 (DEBUG와 분리)
+
+    # Read Replica (읽기 전용 라우트용, 미설정 시 primary 사용)
+    READ_REPLICA_URL: str = ""
+    READ_REPLICA_MAX_LAG_SECONDS: float = 10.0  # 초과 시 primary로 폴백
+    READ_REPLICA_CHECK_INTERVAL_SECONDS: float = 5.0  # 헬스체크 캐시 주기
+
+    # ScanLog write-behind 버퍼
+    SCAN_LOG_FLUSH_SIZE: int = 500  # 배치당 최대 행 수
+    SCAN_LOG_FLUSH_INTERVAL_MS: int = 1000  # 첫 레코드 후 최대 대기
+    SCAN_LOG_BUFFER_MAX: int = 10000  # 큐 상한 (초과 시 backpressure)
+    SCAN_LOG_ENQUEUE_TIMEOUT_MS: int = 200  # backpressure 대기 후 스필
+    SCAN_LOG_SPILL_PATH: str = "data/scan_log_spill.jsonl"
+
+    # ScanLog 월 파티션 / 보존 정책 (PostgreSQL)
+    SCAN_LOG_PARTITION_MONTHS_AHEAD: int = 3  # 미리 만들어 둘 파티션 개월 수
+    SCAN_LOG_RETENTION_MONTHS: int = 12  # 초과 파티션은 아카이브 후 삭제
+    SCAN_LOG_ARCHIVE_DIR: str = "data/scan_log_archive"
+
+    # Modifier 사전 (프로세스 캐시, 버전 변경 시 재로드)
+    MODIFIER_DICT_CHECK_INTERVAL_SECONDS: float = 30.0
+
+    # OCR Tier hedging (Tier 1 지연 시 Tier 2 동시 실행)
+    OCR_HEDGE_ENABLED: bool = True
+    OCR_HEDGE_DELAY_MS: int = 6000  # Tier 1 p90 예산 (admin OCR 메트릭의 p90 참고)
+
+    # OCR 근사 중복 (pHash) - 다른 각도로 찍은 같은 메뉴판 결과 재사용
+    OCR_NEAR_DUP_ENABLED: bool = True
+    OCR_NEAR_DUP_MIN_SIMILARITY: float = (
+        0.9  # 64bit pHash 유사도 (0.9 = 6bit 이하 차이)
+    )
+    OCR_NEAR_DUP_MIN_SSIM: float = 0.8  # pHash 후보 2차 검증 (32px 썸네일 SSIM)
+    # 매장 이미지는 항상 같은 매장 내에서만 재사용, 매장 정보 없는 이미지(관광객 스캔)는
+    # 전체 인덱스 사용. True면 매장 정보 없는 이미지는 재사용 안 함 (opt-in)
+    OCR_NEAR_DUP_SAME_SHOP_ONLY: bool = False
+    OCR_NEAR_DUP_INDEX_SIZE: int = 2000  # 인덱스당 최근 이미지 수
+
+    # OpenCV 전처리 프로세스 풀 (API 워커 프로세스당 1개)
+    PREPROCESS_POOL_SIZE: int = 0  # 0 = CPU 코어 수
+    PREPROCESS_MAX_QUEUE: int = 32  # 실행 중 외 추가 대기 상한 (초과 시 await)
+    PREPROCESS_MAX_LONG_EDGE: int = 2048  # 전처리 이미지 긴 변 상한 (0 = 원본 유지)
+
+    # B2B 메뉴 이미지 벌크 업로드 (백그라운드 OCR)
+    B2B_IMAGE_UPLOAD_CONCURRENCY: int = 4  # 프로세스당 동시 OCR 이미지 수
+    B2B_IMAGE_UPLOAD_SPOOL_DIR: str = "data/menu_image_uploads"
+
+    # B2B CSV/JSON 메뉴 업로드 작업 큐 (행 단위 워커 처리)
+    MENU_UPLOAD_WORKERS: int = 8  # 프로세스당 워커 수 (번역 배치 크기 이상 권장)
+    MENU_UPLOAD_MAX_ATTEMPTS: int = 3  # 행당 최대 시도 횟수
+    MENU_UPLOAD_RETRY_DELAY_SECONDS: float = 2.0  # 재시도 백오프 시작값 (지수 증가)
+    MENU_UPLOAD_QUEUE_BACKEND: str = "auto"  # auto | redis | local
+    MENU_UPLOAD_VISIBILITY_TIMEOUT_SECONDS: float = 300.0  # 죽은 워커 작업 재배정
+
+    # LLM 다건 번역 배치 큐 (메뉴 업로드 OpenAI / 자동 번역 Gemini)
+    TRANSLATION_BATCH_SIZE: int = 8  # 요청 1회당 최대 메뉴 수
+    TRANSLATION_BATCH_MAX_WAIT_SECONDS: float = 0.5  # 배치 미달 시 flush 대기
+    TRANSLATION_BATCH_MAX_ATTEMPTS: int = 3  # 실패/누락 항목 재요청 포함 최대 시도
+
+    # 관리자 일괄 재번역 작업 (작업 1건 = 큐 작업 1건, 큐 백엔드는 MENU_UPLOAD_* 공용)
+    # 작업 내 동시 번역 메뉴 수 (0 = TRANSLATION_BATCH_SIZE, 배치를 채우도록 최소 배치 크기)
+    BULK_TRANSLATION_CONCURRENCY: int = 0
+    BULK_TRANSLATION_PAGE_SIZE: int = 50  # 체크포인트 단위 (keyset 페이지)
+
+    # 번역 메모리 (translation_memory 테이블, 번역 경로 공용 exact-match 재사용)
+    TRANSLATION_MEMORY_ENABLED: bool = True
+    TRANSLATION_MEMORY_L1_SIZE: int = 5000  # 프로세스 LRU 항목 수
+
     # Application
     APP_ENV: str = "development"
     DEBUG: bool = True
@@ -26,6 +105,11 @@ class Settings(BaseSettings):
     # API Keys
     CLOVA_OCR_API_KEY: str = ""
     CLOVA_OCR_SECRET: str = ""
+    CLOVA_OCR_API_URL: str = ""  # 비어 있으면 기본 custom endpoint 사용
+    CLOVA_OCR_TIMEOUT_SECONDS: float = 30.0
+    CLOVA_OCR_CONNECT_TIMEOUT_SECONDS: float = 5.0
+    CLOVA_OCR_MAX_RETRIES: int = 3  # 429/5xx/네트워크 오류 (지수 백오프 + jitter)
+    CLOVA_OCR_MAX_CONCURRENCY: int = 8  # 프로세스당 동시 호출 상한
     OPENAI_API_KEY: str = ""
     GOOGLE_API_KEY: str = ""  # Deprecated: Use GOOGLE_API_KEY_1 instead
     GOOGLE_API_KEY_1: str = ""  # Primary Gemini API key (20 RPD)
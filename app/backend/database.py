@@ -2,15 +2,32 @@
 Database connection and session management
 """
 
+import asyncio
+import logging
+import threading
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional
+
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import declarative_base
+from sqlalchemy.exc import (
+    DBAPIError,
+    InterfaceError,
+    OperationalError,
+    TimeoutError as PoolTimeoutError,
+)
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from config import settings
 
+logger = logging.getLogger(__name__)
+
 
 # Auto-detect database type and adjust URL
-def get_database_url() -> str:
+def get_database_url(url: Optional[str] = None) -> str:
     """Get database URL with correct driver"""
-    url = settings.DATABASE_URL
+    url = url or settings.DATABASE_URL
 
     # PostgreSQL: use asyncpg
     if url.startswith("postgresql://"):
@@ -24,12 +41,139 @@ def get_database_url() -> str:
     return url
 
 
+class PoolMetrics:
+    """커넥션 풀 체크아웃 대기 시간 / 사용률 메트릭 (프로세스 단위)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.checkouts = 0
+            self.timeouts = 0
+            self.wait_total_ms = 0.0
+            self.wait_max_ms = 0.0
+            self.peak_checked_out = 0
+
+    def record_checkout(self, wait_ms: float, checked_out: int):
+        with self._lock:
+            self.checkouts += 1
+            self.wait_total_ms += wait_ms
+            self.wait_max_ms = max(self.wait_max_ms, wait_ms)
+            self.peak_checked_out = max(self.peak_checked_out, checked_out)
+
+    def record_timeout(self, wait_ms: float):
+        with self._lock:
+            self.timeouts += 1
+            self.wait_total_ms += wait_ms
+            self.wait_max_ms = max(self.wait_max_ms, wait_ms)
+
+    def snapshot(self, pool) -> Dict[str, Any]:
+        """현재 풀 상태 + 누적 대기 메트릭"""
+        with self._lock:
+            waits = self.checkouts + self.timeouts
+            data = {
+                "checkouts": self.checkouts,
+                "checkout_timeouts": self.timeouts,
+                "avg_checkout_wait_ms": round(
+                    self.wait_total_ms / waits if waits else 0.0, 3
+                ),
+                "max_checkout_wait_ms": round(self.wait_max_ms, 3),
+                "peak_checked_out": self.peak_checked_out,
+            }
+
+        if isinstance(pool, AsyncAdaptedQueuePool):
+            capacity = pool.size() + max(pool._max_overflow, 0)
+            checked_out = pool.checkedout()
+            data.update(
+                {
+                    "pool_size": pool.size(),
+                    "max_overflow": pool._max_overflow,
+                    "checked_out": checked_out,
+                    "idle": pool.checkedin(),
+                    "overflow": max(pool.overflow(), 0),
+                    "utilization": round(
+                        checked_out / capacity if capacity else 0.0, 3
+                    ),
+                }
+            )
+        else:
+            data["pool_class"] = type(pool).__name__
+
+        return data
+
+
+pool_metrics = PoolMetrics()
+
+
+replica_pool_metrics = PoolMetrics()
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """체크아웃 대기 시간을 metrics에 기록하는 QueuePool"""
+
+    metrics: PoolMetrics = pool_metrics
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            record = super()._do_get()
+        except PoolTimeoutError:
+            self.metrics.record_timeout((time.perf_counter() - start) * 1000)
+            raise
+        self.metrics.record_checkout(
+            (time.perf_counter() - start) * 1000, self.checkedout()
+        )
+        return record
+
+
+class InstrumentedReplicaQueuePool(InstrumentedAsyncQueuePool):
+    """Read replica 엔진용 (메트릭 분리)"""
+
+    metrics = replica_pool_metrics
+
+
+def get_engine_options(
+    url: str, poolclass: type = InstrumentedAsyncQueuePool
+) -> Dict[str, Any]:
+    """
+    create_async_engine 옵션 (settings.DB_* 기반)
+
+    PostgreSQL(asyncpg)에서만 풀 크기/재활용/pre-ping과 prepared statement
+    캐시를 설정. SQLite는 드라이버 기본 풀 사용.
+    """
+    options: Dict[str, Any] = {
+        "echo": settings.DB_ECHO,
+        "future": True,
+        # 컴파일된 SQL 캐시 (동일 쿼리 → 동일 SQL 문자열 → prepared statement 재사용)
+        "query_cache_size": settings.DB_QUERY_CACHE_SIZE,
+    }
+
+    if url.startswith("postgresql+asyncpg://"):
+        options.update(
+            {
+                "poolclass": poolclass,
+                "pool_size": settings.DB_POOL_SIZE,
+                "max_overflow": settings.DB_MAX_OVERFLOW,
+                "pool_timeout": settings.DB_POOL_TIMEOUT,
+                "pool_recycle": settings.DB_POOL_RECYCLE,
+                "pool_pre_ping": settings.DB_POOL_PRE_PING,
+                "connect_args": {
+                    # SQLAlchemy asyncpg 어댑터의 커넥션별 prepared statement LRU
+                    "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+                    # asyncpg 내부 statement 캐시 (PgBouncer transaction 모드면 0)
+                    "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+                },
+            }
+        )
+
+    return options
+
+
 # Create async engine
-engine = create_async_engine(
-    get_database_url(),
-    echo=settings.DEBUG,
-    future=True,
-)
+_database_url = get_database_url()
+engine = create_async_engine(_database_url, **get_engine_options(_database_url))
 
 # Create async session factory
 AsyncSessionLocal = async_sessionmaker(
@@ -42,6 +186,157 @@ AsyncSessionLocal = async_sessionmaker(
 Base = declarative_base()
 
 
+class ReadReplicaRouter:
+    """
+    읽기 전용 세션 라우팅 (Read replica → Primary 폴백)
+
+    - replica 헬스체크 결과를 check_interval 동안 캐싱
+    - 연결 실패 또는 복제 지연(max_lag) 초과 시 primary로 폴백
+    - 요청 중 DB 오류 발생 시 즉시 unhealthy 처리 (다음 헬스체크까지 primary)
+    """
+
+    def __init__(
+        self,
+        primary_factory: async_sessionmaker,
+        replica_factory: Optional[async_sessionmaker] = None,
+        max_lag_seconds: float = 10.0,
+        check_interval_seconds: float = 5.0,
+    ):
+        self.primary_factory = primary_factory
+        self.replica_factory = replica_factory
+        self.max_lag_seconds = max_lag_seconds
+        self.check_interval_seconds = check_interval_seconds
+
+        self.healthy = replica_factory is not None
+        self.lag_seconds: Optional[float] = None
+        self.last_error: Optional[str] = None
+        self._last_checked = 0.0
+        self._check_lock: Optional[asyncio.Lock] = None  # Lazy initialization
+
+    @property
+    def enabled(self) -> bool:
+        return self.replica_factory is not None
+
+    def mark_unhealthy(self, reason: str):
+        """replica 사용 중단 (다음 헬스체크에서 복구 여부 재확인)"""
+        if self.healthy:
+            logger.warning(f"Read replica marked unhealthy: {reason}")
+        self.healthy = False
+        self.last_error = reason
+        self._last_checked = time.monotonic()
+
+    async def _measure_lag(self) -> float:
+        """replica 복제 지연 (초). PostgreSQL 외에는 0"""
+        async with self.replica_factory() as session:
+            if session.get_bind().dialect.name != "postgresql":
+                await session.execute(text("SELECT 1"))
+                return 0.0
+
+            result = await session.execute(
+                text(
+                    "SELECT CASE WHEN pg_is_in_recovery() "
+                    "THEN COALESCE(EXTRACT(EPOCH FROM "
+                    "now() - pg_last_xact_replay_timestamp()), 0) "
+                    "ELSE 0 END"
+                )
+            )
+            return float(result.scalar() or 0.0)
+
+    async def is_healthy(self) -> bool:
+        """캐싱된 헬스체크 (check_interval마다 재확인)"""
+        if not self.enabled:
+            return False
+
+        if time.monotonic() - self._last_checked < self.check_interval_seconds:
+            return self.healthy
+
+        if self._check_lock is None:
+            self._check_lock = asyncio.Lock()
+
+        async with self._check_lock:
+            # Double-check: 다른 태스크가 이미 확인했을 수 있음
+            if time.monotonic() - self._last_checked < self.check_interval_seconds:
+                return self.healthy
+
+            try:
+                lag = await self._measure_lag()
+                self.lag_seconds = lag
+                if lag > self.max_lag_seconds:
+                    self.mark_unhealthy(
+                        f"replication lag {lag:.1f}s > {self.max_lag_seconds}s"
+                    )
+                else:
+                    if not self.healthy:
+                        logger.info(f"Read replica recovered (lag {lag:.1f}s)")
+                    self.healthy = True
+                    self.last_error = None
+            except Exception as e:
+                self.mark_unhealthy(f"health check failed: {e}")
+
+            self._last_checked = time.monotonic()
+            return self.healthy
+
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator[AsyncSession]:
+        """읽기 세션 (replica 정상 시 replica, 아니면 primary)"""
+        use_replica = await self.is_healthy()
+        factory = self.replica_factory if use_replica else self.primary_factory
+
+        async with factory() as session:
+            try:
+                yield session
+            except DBAPIError as e:
+                # 연결 계열 오류만 replica 장애로 판단 (쿼리 오류는 제외)
+                if use_replica and (
+                    e.connection_invalidated
+                    or isinstance(e, (OperationalError, InterfaceError))
+                ):
+                    self.mark_unhealthy(f"connection error: {e}")
+                raise
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "healthy": self.healthy,
+            "lag_seconds": self.lag_seconds,
+            "last_error": self.last_error,
+        }
+
+
+# Read replica engine (READ_REPLICA_URL 미설정 시 primary만 사용)
+read_engine = None
+ReadSessionLocal = None
+if settings.READ_REPLICA_URL:
+    _replica_url = get_database_url(settings.READ_REPLICA_URL)
+    read_engine = create_async_engine(
+        _replica_url,
+        **get_engine_options(_replica_url, poolclass=InstrumentedReplicaQueuePool),
+    )
+    ReadSessionLocal = async_sessionmaker(
+        read_engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+    )
+
+read_router = ReadReplicaRouter(
+    AsyncSessionLocal,
+    ReadSessionLocal,
+    max_lag_seconds=settings.READ_REPLICA_MAX_LAG_SECONDS,
+    check_interval_seconds=settings.READ_REPLICA_CHECK_INTERVAL_SECONDS,
+)
+
+
+def get_pool_stats() -> Dict[str, Any]:
+    """커넥션 풀 메트릭 조회 (admin 모니터링용)"""
+    stats = pool_metrics.snapshot(engine.pool)
+    if read_engine is not None:
+        stats["replica"] = {
+            **replica_pool_metrics.snapshot(read_engine.pool),
+            **read_router.status(),
+        }
+    return stats
+
+
 async def get_db() -> AsyncSession:
     """Dependency for getting async database session"""
     async with AsyncSessionLocal() as session:
@@ -55,6 +350,17 @@ async def get_db() -> AsyncSession:
             await session.close()
 
 
+async def get_read_db() -> AsyncSession:
+    """
+    Dependency for read-only routes
+
+    Read replica가 설정되어 있고 정상이면 replica 세션, 아니면 primary 세션.
+    쓰기가 필요한 경우 get_db를 함께 사용할 것.
+    """
+    async with read_router.session() as session:
+        yield session
+
+
 async def init_db():
     """Initialize database - create all tables"""
     async with engine.begin() as conn:
@@ -2,6 +2,8 @@
 Menu Knowledge Engine - FastAPI Application
 """
 
+import logging
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
@@ -13,6 +15,15 @@ from api.qr_menu import router as qr_router
 from api.b2b import router as b2b_router
 from api.public_data import router as public_data_router
 from services.cache_service import cache_service
+from services.scan_log_writer import scan_log_writer
+from services.scan_log_partitions import scan_log_partitions
+from services.clova_client import clova_client
+from services.preprocess_pool import preprocess_pool
+from services.menu_image_upload import menu_image_processor
+from services.menu_upload_worker import menu_upload_workers
+from services.bulk_translation_worker import bulk_translation_worker
+
+logger = logging.getLogger(__name__)
 
 app = FastAPI(
     title="Menu Knowledge Engine API",
@@ -26,11 +37,28 @@ app = FastAPI(
 async def startup_event():
     """Initialize services on application startup"""
     await cache_service.connect()
+    try:
+        await scan_log_partitions.ensure_partitions()
+    except Exception as e:
+        logger.warning(f"scan_logs partition check failed: {e}")
+    await scan_log_writer.start()
+    try:
+        await menu_image_processor.start()
+    except Exception as e:
+        logger.warning(f"Image upload recovery failed: {e}")
+    await menu_upload_workers.start()
+    await bulk_translation_worker.start()
 
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Cleanup services on application shutdown"""
+    await menu_image_processor.stop()
+    await menu_upload_workers.stop()
+    await bulk_translation_worker.stop()
+    await scan_log_writer.stop()
+    await clova_client.aclose()
+    preprocess_pool.shutdown()
     await cache_service.disconnect()
 
 
@@ -0,0 +1,14 @@
+-- Migration: Keyset pagination indexes for admin queue
+-- Date: 2026-10-19
+-- Purpose: GET /api/v1/admin/queue pages by (created_at, id) instead of OFFSET
+
+-- Unfiltered queue (status=all)
+CREATE INDEX IF NOT EXISTS idx_scan_logs_created_id
+ON scan_logs(created_at DESC, id DESC);
+
+-- Status-filtered queue (pending/confirmed/rejected)
+CREATE INDEX IF NOT EXISTS idx_scan_logs_status_created_id
+ON scan_logs(status, created_at DESC, id DESC);
+
+-- Keep reltuples fresh for the approximate total count
+ANALYZE scan_logs;
@@ -0,0 +1,33 @@
+-- Migration: modifiers 테이블 변경 버전 카운터
+-- Date: 2026-10-19
+-- Purpose: 프로세스별 수식어 사전 캐시(services/modifier_dictionary.py)가
+--          modifiers 전체를 다시 읽지 않고 버전 1행만 조회해 변경 여부 판단
+--          (시드 재실행 / 수동 수정 시 statement 트리거로 증가)
+
+CREATE TABLE IF NOT EXISTS modifier_dictionary_version (
+    id SMALLINT PRIMARY KEY DEFAULT 1 CHECK (id = 1),
+    version BIGINT NOT NULL DEFAULT 1,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+);
+
+INSERT INTO modifier_dictionary_version (id, version)
+VALUES (1, 1)
+ON CONFLICT (id) DO NOTHING;
+
+CREATE OR REPLACE FUNCTION bump_modifier_dictionary_version()
+RETURNS TRIGGER AS $$
+BEGIN
+    UPDATE modifier_dictionary_version
+    SET version = version + 1, updated_at = NOW()
+    WHERE id = 1;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- 문장 단위 트리거: 시드 일괄 INSERT도 1회만 증가
+DROP TRIGGER IF EXISTS trg_modifier_dictionary_version ON modifiers;
+CREATE TRIGGER trg_modifier_dictionary_version
+AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON modifiers
+FOR EACH STATEMENT EXECUTE FUNCTION bump_modifier_dictionary_version();
+
+COMMENT ON TABLE modifier_dictionary_version IS 'modifiers 변경 버전 (수식어 사전 캐시 hot reload용)';
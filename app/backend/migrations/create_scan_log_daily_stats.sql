@@ -0,0 +1,109 @@
+-- Migration: scan_logs 일별 롤업 테이블 (GET /api/v1/admin/stats)
+-- Date: 2026-10-19
+-- Purpose: 엔진 통계를 scan_logs 전체 집계 대신 일별 버킷에서 1회 조회로 계산
+--          트리거로 INSERT/UPDATE/DELETE 시 증분 갱신
+
+-- ===========================
+-- 1. Rollup Table
+-- ===========================
+
+CREATE TABLE IF NOT EXISTS scan_log_daily_stats (
+    day DATE PRIMARY KEY,                         -- UTC 기준 일자
+    scans BIGINT NOT NULL DEFAULT 0,
+    hits BIGINT NOT NULL DEFAULT 0,               -- matched_canonical_id IS NOT NULL
+    pending BIGINT NOT NULL DEFAULT 0,            -- status = 'pending' OR NULL
+    ai_calls BIGINT NOT NULL DEFAULT 0,           -- evidences @> {"ai_called": true}
+    confidence_sum DOUBLE PRECISION NOT NULL DEFAULT 0,
+    confidence_count INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+);
+
+-- ===========================
+-- 2. Incremental Maintenance
+-- ===========================
+
+-- 한 행의 기여분을 sign(+1/-1)만큼 반영
+CREATE OR REPLACE FUNCTION scan_log_daily_stats_apply(r scan_logs, sign INTEGER)
+RETURNS VOID AS $$
+BEGIN
+    INSERT INTO scan_log_daily_stats AS s (
+        day, scans, hits, pending, ai_calls, confidence_sum, confidence_count, updated_at
+    )
+    VALUES (
+        (COALESCE(r.created_at, NOW()) AT TIME ZONE 'UTC')::date,
+        sign,
+        CASE WHEN r.matched_canonical_id IS NOT NULL THEN sign ELSE 0 END,
+        CASE WHEN r.status IS NULL OR r.status = 'pending' THEN sign ELSE 0 END,
+        CASE WHEN COALESCE(r.evidences @> '{"ai_called": true}'::jsonb, FALSE)
+             THEN sign ELSE 0 END,
+        COALESCE(r.confidence, 0) * sign,
+        CASE WHEN r.confidence IS NOT NULL THEN sign ELSE 0 END,
+        NOW()
+    )
+    ON CONFLICT (day) DO UPDATE SET
+        scans = s.scans + EXCLUDED.scans,
+        hits = s.hits + EXCLUDED.hits,
+        pending = s.pending + EXCLUDED.pending,
+        ai_calls = s.ai_calls + EXCLUDED.ai_calls,
+        confidence_sum = s.confidence_sum + EXCLUDED.confidence_sum,
+        confidence_count = s.confidence_count + EXCLUDED.confidence_count,
+        updated_at = NOW();
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION scan_log_daily_stats_trigger()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM scan_log_daily_stats_apply(OLD, -1);
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        PERFORM scan_log_daily_stats_apply(NEW, 1);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_scan_log_daily_stats ON scan_logs;
+CREATE TRIGGER trg_scan_log_daily_stats
+AFTER INSERT OR DELETE OR UPDATE OF status, matched_canonical_id, confidence, evidences, created_at
+ON scan_logs
+FOR EACH ROW EXECUTE FUNCTION scan_log_daily_stats_trigger();
+
+-- ===========================
+-- 3. Rebuild (백필 / 복구용)
+-- ===========================
+
+-- 지정 기간 버킷을 scan_logs에서 재계산
+-- 사용: SELECT refresh_scan_log_daily_stats('2026-01-01', CURRENT_DATE);
+CREATE OR REPLACE FUNCTION refresh_scan_log_daily_stats(p_from DATE, p_to DATE)
+RETURNS VOID AS $$
+BEGIN
+    DELETE FROM scan_log_daily_stats WHERE day BETWEEN p_from AND p_to;
+
+    INSERT INTO scan_log_daily_stats (
+        day, scans, hits, pending, ai_calls, confidence_sum, confidence_count, updated_at
+    )
+    SELECT
+        (created_at AT TIME ZONE 'UTC')::date AS day,
+        COUNT(*),
+        COUNT(*) FILTER (WHERE matched_canonical_id IS NOT NULL),
+        COUNT(*) FILTER (WHERE status IS NULL OR status = 'pending'),
+        COUNT(*) FILTER (WHERE evidences @> '{"ai_called": true}'::jsonb),
+        COALESCE(SUM(confidence), 0),
+        COUNT(confidence),
+        NOW()
+    FROM scan_logs
+    WHERE created_at >= p_from::timestamp AT TIME ZONE 'UTC'
+      AND created_at < (p_to + 1)::timestamp AT TIME ZONE 'UTC'
+    GROUP BY 1;
+END;
+$$ LANGUAGE plpgsql;
+
+-- 기존 데이터 백필
+SELECT refresh_scan_log_daily_stats(
+    COALESCE((SELECT MIN(created_at AT TIME ZONE 'UTC')::date FROM scan_logs), CURRENT_DATE),
+    CURRENT_DATE
+);
+
+COMMENT ON TABLE scan_log_daily_stats IS 'scan_logs 일별 롤업 (트리거 증분 갱신, admin stats용)';
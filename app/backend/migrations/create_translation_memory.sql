@@ -0,0 +1,19 @@
+-- Migration: 번역 메모리 (translation memory)
+-- Date: 2026-10-19
+-- Purpose: 같은 짧은 문자열(공통 설명, 수식어, 재료명 등)의 LLM 재번역 방지
+--          (원문 해시, 원문 언어, 대상 언어, 프롬프트 버전) 단위 exact-match 재사용
+--          AutoTranslateService / MenuUploadService / ContentGenerator / translate_deep_content.py 공용
+
+CREATE TABLE IF NOT EXISTS translation_memory (
+    source_hash VARCHAR(64) NOT NULL,             -- sha256(공백 정규화 원문)
+    source_lang VARCHAR(10) NOT NULL,
+    target_lang VARCHAR(20) NOT NULL,
+    prompt_version VARCHAR(50) NOT NULL,          -- 프롬프트 변경 시 버전 올려 무효화
+    source_text TEXT NOT NULL,
+    target_text TEXT NOT NULL,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (source_hash, source_lang, target_lang, prompt_version)
+);
+
+COMMENT ON TABLE translation_memory IS '번역 메모리 (원문 해시 exact-match, 번역 경로 공용)';
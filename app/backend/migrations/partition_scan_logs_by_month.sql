@@ -0,0 +1,204 @@
+-- Migration: scan_logs 월 단위 선언적 파티셔닝 (RANGE on created_at)
+-- Date: 2026-10-19
+-- Requires: PostgreSQL 13+ (파티션 테이블 row trigger / FK)
+-- Purpose: append-only scan_logs가 커질수록 admin 큐/통계/인덱스가 함께 느려지는 문제 해결
+--          - 파티션 프루닝: created_at 조건이 있는 쿼리는 해당 월 파티션만 스캔
+--          - 보존 정책: 오래된 파티션은 DETACH → 압축 아카이브 → DROP
+--            (services/scan_log_partitions.py, scripts/scan_log_retention.py)
+-- Prerequisite: create_scan_log_daily_stats.sql (롤업 트리거를 새 테이블에 재생성)
+-- Note: 기존 테이블은 scan_logs_legacy로 남김 (검증 후 수동 DROP)
+
+BEGIN;
+
+-- ===========================
+-- 1. 기존 테이블 분리
+-- ===========================
+
+-- 파티션 키는 NOT NULL이어야 함
+UPDATE scan_logs SET created_at = COALESCE(scanned_at, NOW()) WHERE created_at IS NULL;
+
+ALTER TABLE scan_logs RENAME TO scan_logs_legacy;
+
+-- 롤업 함수는 scan_logs 행 타입에 바인딩되어 있으므로 새 테이블 기준으로 재생성
+DROP TRIGGER IF EXISTS trg_scan_log_daily_stats ON scan_logs_legacy;
+DROP FUNCTION IF EXISTS scan_log_daily_stats_apply(scan_logs_legacy, INTEGER);
+
+-- 인덱스 이름 충돌 방지
+ALTER INDEX IF EXISTS idx_scan_logs_status_created RENAME TO idx_scan_logs_legacy_status_created;
+ALTER INDEX IF EXISTS idx_scan_logs_shop_id RENAME TO idx_scan_logs_legacy_shop_id;
+ALTER INDEX IF EXISTS idx_scan_logs_created_at RENAME TO idx_scan_logs_legacy_created_at;
+ALTER INDEX IF EXISTS idx_scan_logs_canonical_id RENAME TO idx_scan_logs_legacy_canonical_id;
+ALTER INDEX IF EXISTS idx_scan_logs_created_id RENAME TO idx_scan_logs_legacy_created_id;
+ALTER INDEX IF EXISTS idx_scan_logs_status_created_id RENAME TO idx_scan_logs_legacy_status_created_id;
+
+-- ===========================
+-- 2. 파티션 부모 테이블
+-- ===========================
+
+CREATE TABLE scan_logs (
+    id UUID NOT NULL DEFAULT gen_random_uuid(),
+    session_id VARCHAR(100),
+    language VARCHAR(10) NOT NULL,
+    image_url TEXT,
+    ocr_raw_text TEXT,
+    matched_variant_ids UUID[] DEFAULT '{}',
+    unmatched_texts TEXT[] DEFAULT '{}',
+    menu_name_ko VARCHAR(200),
+    confidence FLOAT,
+    evidences JSONB,
+    area_tag VARCHAR(50),
+    shop_id UUID REFERENCES shops(id),
+    ai_called BOOLEAN DEFAULT FALSE,
+    ai_new_entries INTEGER DEFAULT 0,
+    status VARCHAR(20) DEFAULT 'pending',
+    matched_canonical_id UUID REFERENCES canonical_menus(id),
+    reviewed_at TIMESTAMP WITH TIME ZONE,
+    review_notes TEXT,
+    scanned_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+    -- 파티션 테이블의 유니크 제약은 파티션 키를 포함해야 함
+    PRIMARY KEY (id, created_at)
+) PARTITION BY RANGE (created_at);
+
+-- 부모에 정의한 인덱스는 모든 파티션에 자동 생성
+-- (performance_optimization.sql의 idx_scan_logs_status_created / created_at은
+--  아래 keyset 인덱스로 대체)
+CREATE INDEX idx_scan_logs_created_id ON scan_logs (created_at DESC, id DESC);
+CREATE INDEX idx_scan_logs_status_created_id ON scan_logs (status, created_at DESC, id DESC);
+CREATE INDEX idx_scan_logs_shop_id ON scan_logs (shop_id) WHERE shop_id IS NOT NULL;
+CREATE INDEX idx_scan_logs_canonical_id ON scan_logs (matched_canonical_id)
+    WHERE matched_canonical_id IS NOT NULL;
+
+-- 범위 밖 행 보호용 (정상 운영 시 비어 있어야 함)
+CREATE TABLE scan_logs_default PARTITION OF scan_logs DEFAULT;
+
+-- ===========================
+-- 3. 파티션 관리 함수
+-- ===========================
+
+-- 월 파티션 생성 (이름: scan_logs_yYYYYmMM, 경계: UTC 월초)
+CREATE OR REPLACE FUNCTION create_scan_logs_partition(p_month DATE)
+RETURNS TEXT AS $$
+DECLARE
+    v_start DATE := date_trunc('month', p_month)::date;
+    v_name TEXT := format('scan_logs_y%sm%s', to_char(v_start, 'YYYY'), to_char(v_start, 'MM'));
+BEGIN
+    IF to_regclass(v_name) IS NULL THEN
+        EXECUTE format(
+            'CREATE TABLE %I PARTITION OF scan_logs FOR VALUES FROM (%L) TO (%L)',
+            v_name,
+            v_start::timestamp AT TIME ZONE 'UTC',
+            (v_start + INTERVAL '1 month')::timestamp AT TIME ZONE 'UTC'
+        );
+    END IF;
+    RETURN v_name;
+END;
+$$ LANGUAGE plpgsql;
+
+-- 이번 달부터 p_months_ahead개월 뒤까지 파티션 보장 (앱 시작/보존 작업 시 호출)
+CREATE OR REPLACE FUNCTION ensure_scan_logs_partitions(p_months_ahead INTEGER DEFAULT 3)
+RETURNS INTEGER AS $$
+DECLARE
+    v_month DATE := date_trunc('month', NOW() AT TIME ZONE 'UTC')::date;
+    i INTEGER;
+BEGIN
+    FOR i IN 0..p_months_ahead LOOP
+        PERFORM create_scan_logs_partition((v_month + make_interval(months => i))::date);
+    END LOOP;
+    RETURN p_months_ahead + 1;
+END;
+$$ LANGUAGE plpgsql;
+
+-- 기존 데이터 범위 + 향후 3개월 파티션 생성
+DO $$
+DECLARE
+    v_month DATE;
+BEGIN
+    SELECT date_trunc('month', MIN(created_at) AT TIME ZONE 'UTC')::date
+    INTO v_month
+    FROM scan_logs_legacy;
+
+    WHILE v_month IS NOT NULL
+          AND v_month < date_trunc('month', NOW() AT TIME ZONE 'UTC')::date LOOP
+        PERFORM create_scan_logs_partition(v_month);
+        v_month := (v_month + INTERVAL '1 month')::date;
+    END LOOP;
+
+    PERFORM ensure_scan_logs_partitions(3);
+END $$;
+
+-- ===========================
+-- 4. 데이터 이관
+-- ===========================
+
+INSERT INTO scan_logs (
+    id, session_id, language, image_url, ocr_raw_text, matched_variant_ids,
+    unmatched_texts, menu_name_ko, confidence, evidences, area_tag, shop_id,
+    ai_called, ai_new_entries, status, matched_canonical_id, reviewed_at,
+    review_notes, scanned_at, created_at
+)
+SELECT
+    id, session_id, language, image_url, ocr_raw_text, matched_variant_ids,
+    unmatched_texts, menu_name_ko, confidence, evidences, area_tag, shop_id,
+    ai_called, ai_new_entries, status, matched_canonical_id, reviewed_at,
+    review_notes, scanned_at, created_at
+FROM scan_logs_legacy;
+
+DO $$
+DECLARE
+    v_legacy BIGINT;
+    v_new BIGINT;
+BEGIN
+    SELECT COUNT(*) INTO v_legacy FROM scan_logs_legacy;
+    SELECT COUNT(*) INTO v_new FROM scan_logs;
+    IF v_legacy <> v_new THEN
+        RAISE EXCEPTION 'scan_logs row count mismatch: legacy=%, partitioned=%', v_legacy, v_new;
+    END IF;
+END $$;
+
+-- ===========================
+-- 5. 일별 롤업 트리거 재생성 (이관 후 생성 → 백필 중복 집계 없음)
+-- ===========================
+
+CREATE OR REPLACE FUNCTION scan_log_daily_stats_apply(r scan_logs, sign INTEGER)
+RETURNS VOID AS $$
+BEGIN
+    INSERT INTO scan_log_daily_stats AS s (
+        day, scans, hits, pending, ai_calls, confidence_sum, confidence_count, updated_at
+    )
+    VALUES (
+        (COALESCE(r.created_at, NOW()) AT TIME ZONE 'UTC')::date,
+        sign,
+        CASE WHEN r.matched_canonical_id IS NOT NULL THEN sign ELSE 0 END,
+        CASE WHEN r.status IS NULL OR r.status = 'pending' THEN sign ELSE 0 END,
+        CASE WHEN COALESCE(r.evidences @> '{"ai_called": true}'::jsonb, FALSE)
+             THEN sign ELSE 0 END,
+        COALESCE(r.confidence, 0) * sign,
+        CASE WHEN r.confidence IS NOT NULL THEN sign ELSE 0 END,
+        NOW()
+    )
+    ON CONFLICT (day) DO UPDATE SET
+        scans = s.scans + EXCLUDED.scans,
+        hits = s.hits + EXCLUDED.hits,
+        pending = s.pending + EXCLUDED.pending,
+        ai_calls = s.ai_calls + EXCLUDED.ai_calls,
+        confidence_sum = s.confidence_sum + EXCLUDED.confidence_sum,
+        confidence_count = s.confidence_count + EXCLUDED.confidence_count,
+        updated_at = NOW();
+END;
+$$ LANGUAGE plpgsql;
+
+-- 파티션 DETACH/DROP은 행 트리거를 발생시키지 않으므로 보존 작업 후에도 롤업 유지
+CREATE TRIGGER trg_scan_log_daily_stats
+AFTER INSERT OR DELETE OR UPDATE OF status, matched_canonical_id, confidence, evidences, created_at
+ON scan_logs
+FOR EACH ROW EXECUTE FUNCTION scan_log_daily_stats_trigger();
+
+COMMIT;
+
+ANALYZE scan_logs;
+
+-- 검증 후:
+-- DROP TABLE scan_logs_legacy;
+
+COMMENT ON TABLE scan_logs IS 'B2C/B2B 스캔 로그 (created_at 월 단위 RANGE 파티션)';
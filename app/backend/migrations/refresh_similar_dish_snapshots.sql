@@ -0,0 +1,77 @@
+-- Migration: similar_dishes 스냅샷 자동 갱신
+-- Date: 2026-10-19
+-- Purpose: enrich_missing_menus.py가 similar_dishes 항목에 병합한 canonical 스냅샷
+--          ({id, name_ko, name_en, image_url, spice_level})을 참조 메뉴의
+--          이미지/영문명/맵기 변경 시 함께 갱신 (상세 API는 스냅샷을 조회 없이 반환)
+--          similarity_reason / difference 등 나머지 필드는 유지
+
+-- ===========================
+-- 1. Snapshot
+-- ===========================
+
+CREATE OR REPLACE FUNCTION similar_dish_snapshot(m canonical_menus)
+RETURNS JSONB AS $$
+    SELECT jsonb_build_object(
+        'id', m.id::text,
+        'name_ko', m.name_ko,
+        'name_en', COALESCE(m.name_en, m.name_ko),
+        'image_url', COALESCE(m.image_url, m.primary_image->>'url'),
+        'spice_level', COALESCE(m.spice_level, 0)
+    );
+$$ LANGUAGE sql STABLE;
+
+-- ===========================
+-- 2. Incremental Maintenance
+-- ===========================
+
+-- 변경된 메뉴를 참조하는 항목만 스냅샷 필드 덮어쓰기 (배열 순서 유지)
+-- similar_dishes만 갱신하므로 아래 컬럼 지정 트리거가 재귀 발생하지 않음
+CREATE OR REPLACE FUNCTION refresh_similar_dish_snapshots_trigger()
+RETURNS TRIGGER AS $$
+BEGIN
+    UPDATE canonical_menus c
+    SET similar_dishes = ARRAY(
+        SELECT CASE WHEN t.d->>'id' = NEW.id::text
+                    THEN t.d || similar_dish_snapshot(NEW)
+                    ELSE t.d END
+        FROM unnest(c.similar_dishes) WITH ORDINALITY AS t(d, ord)
+        ORDER BY t.ord
+    )
+    WHERE c.similar_dishes IS NOT NULL
+      AND EXISTS (
+          SELECT 1 FROM unnest(c.similar_dishes) AS e(d)
+          WHERE e.d->>'id' = NEW.id::text
+      );
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_refresh_similar_dish_snapshots ON canonical_menus;
+CREATE TRIGGER trg_refresh_similar_dish_snapshots
+AFTER UPDATE OF image_url, primary_image, name_en, spice_level ON canonical_menus
+FOR EACH ROW
+WHEN (
+    OLD.image_url IS DISTINCT FROM NEW.image_url
+    OR OLD.primary_image IS DISTINCT FROM NEW.primary_image
+    OR OLD.name_en IS DISTINCT FROM NEW.name_en
+    OR OLD.spice_level IS DISTINCT FROM NEW.spice_level
+)
+EXECUTE FUNCTION refresh_similar_dish_snapshots_trigger();
+
+-- ===========================
+-- 3. Backfill (기존 스냅샷 1회 갱신)
+-- ===========================
+
+UPDATE canonical_menus c
+SET similar_dishes = ARRAY(
+    SELECT CASE WHEN s.id IS NOT NULL
+                THEN t.d || similar_dish_snapshot(s)
+                ELSE t.d END
+    FROM unnest(c.similar_dishes) WITH ORDINALITY AS t(d, ord)
+    LEFT JOIN canonical_menus s ON s.id::text = t.d->>'id'
+    ORDER BY t.ord
+)
+WHERE c.similar_dishes IS NOT NULL
+  AND EXISTS (
+      SELECT 1 FROM unnest(c.similar_dishes) AS e(d) WHERE e.d ? 'id'
+  );
@@ -9,10 +9,12 @@ from .menu_variant import MenuVariant
 from .menu_relation import MenuRelation
 from .shop import Shop
 from .scan_log import ScanLog
+from .scan_log_daily_stat import ScanLogDailyStat
 from .evidence import Evidence
 from .cultural_concept import CulturalConcept
 from .restaurant import Restaurant, RestaurantStatus
 from .menu_upload import MenuUploadTask, MenuUploadDetail, UploadStatus, MenuItemStatus
+from .translation_memory import TranslationMemory
 
 __all__ = [
     "Concept",
@@ -22,6 +24,7 @@ __all__ = [
     "MenuRelation",
     "Shop",
     "ScanLog",
+    "ScanLogDailyStat",
     "Evidence",
     "CulturalConcept",
     "Restaurant",
@@ -30,4 +33,5 @@ __all__ = [
     "MenuUploadDetail",
     "UploadStatus",
     "MenuItemStatus",
+    "TranslationMemory",
 ]
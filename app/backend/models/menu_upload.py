@@ -23,6 +23,7 @@ class UploadStatus(str, enum.Enum):
 class MenuItemStatus(str, enum.Enum):
     """개별 메뉴 아이템 상태"""
 
+    pending = "pending"  # 워커 처리 대기
     success = "success"  # 성공
     failed = "failed"  # 실패
     skipped = "skipped"  # 중복으로 건너뜀
@@ -55,7 +55,13 @@ class ScanLog(Base):
 
     # 시간
     scanned_at = Column(DateTime(timezone=True), server_default=func.now())
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    # 월 단위 RANGE 파티션 키 (PK에 포함, migrations/partition_scan_logs_by_month.sql)
+    created_at = Column(
+        DateTime(timezone=True),
+        primary_key=True,
+        nullable=False,
+        server_default=func.now(),
+    )
 
     # Relationships
     shop = relationship("Shop", backref="scan_logs")
@@ -0,0 +1,34 @@
+"""
+Scan Log Daily Stat Model - scan_logs 일별 롤업 (엔진 통계용)
+
+scan_logs INSERT/UPDATE/DELETE 트리거가 증분 갱신
+(migrations/create_scan_log_daily_stats.sql)
+"""
+
+from sqlalchemy import Column, Integer, BigInteger, Float, Date, DateTime
+from sqlalchemy.sql import func
+
+from database import Base
+
+
+class ScanLogDailyStat(Base):
+    __tablename__ = "scan_log_daily_stats"
+
+    day = Column(Date, primary_key=True)  # UTC 기준 일자
+
+    # 카운터 (트리거가 증감)
+    scans = Column(BigInteger, nullable=False, default=0)
+    hits = Column(BigInteger, nullable=False, default=0)  # matched_canonical_id 존재
+    pending = Column(BigInteger, nullable=False, default=0)  # status pending/NULL
+    ai_calls = Column(BigInteger, nullable=False, default=0)  # evidences.ai_called
+
+    # 평균 신뢰도 = confidence_sum / confidence_count
+    confidence_sum = Column(Float, nullable=False, default=0)
+    confidence_count = Column(Integer, nullable=False, default=0)
+
+    updated_at = Column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
+
+    def __repr__(self):
+        return f"<ScanLogDailyStat {self.day} scans={self.scans}>"
@@ -0,0 +1,34 @@
+"""
+Translation Memory Model - 번역 메모리 (원문 해시 exact-match 재사용)
+
+(migrations/create_translation_memory.sql)
+"""
+
+from sqlalchemy import Column, String, Text, DateTime
+from sqlalchemy.sql import func
+
+from database import Base
+
+
+class TranslationMemory(Base):
+    __tablename__ = "translation_memory"
+
+    # 키: (원문 해시, 원문 언어, 대상 언어, 프롬프트 버전)
+    source_hash = Column(String(64), primary_key=True)  # sha256(공백 정규화 원문)
+    source_lang = Column(String(10), primary_key=True)
+    target_lang = Column(String(20), primary_key=True)
+    prompt_version = Column(String(50), primary_key=True)
+
+    source_text = Column(Text, nullable=False)
+    target_text = Column(Text, nullable=False)
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
+
+    def __repr__(self):
+        return (
+            f"<TranslationMemory {self.source_lang}->{self.target_lang} "
+            f"{self.source_hash[:8]} ({self.prompt_version})>"
+        )
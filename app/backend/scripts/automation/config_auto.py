@@ -31,6 +31,7 @@ class AutomationSettings(BaseSettings):
     GOOGLE_API_KEY_3: str = ""
     GEMINI_MODEL: str = "gemini-2.5-flash-lite"
     GEMINI_RPM_LIMIT: int = 15  # 키 당 15 req/min
+    GEMINI_RPM_BURST: int = 1  # 키 당 연속 허용 요청 수 (토큰 버킷 용량)
     GEMINI_RPD_LIMIT: int = 20  # 키 당 RPD=20 (2026-02-20 실측)
 
     # Image APIs (무료 tier)
@@ -47,6 +48,7 @@ class AutomationSettings(BaseSettings):
     # Scheduler
     AUTOMATION_ENABLED: bool = True
     DAILY_MENU_TARGET: int = 54  # 3키 × 18 RPD (여유 2건/키 확보)
+    ENRICHMENT_CONCURRENCY: int = 0  # 0 = GeminiClient.max_in_flight (키 수 기준)
     AUTOMATION_HEALTH_PORT: int = 8099
 
     # Paths
@@ -6,8 +6,8 @@ Features:
 - 메뉴 콘텐츠 생성 (10개 필드 — name_en 포함)
 - 번역 생성 (EN/JA/ZH)
 - 카테고리 분류
-- 체크포인트 저장/복원 (10개마다)
-- 일일 배치 처리 (54개, 3키 기준)
+- 체크포인트 저장/복원 (완료 10개마다, staging/enrichment_results.jsonl에 append)
+- 일일 배치 처리 (54개, 3키 기준) — 키별 rate limit 용량까지 동시 처리, 결과는 입력 순서
 - 모든 키 소진 시 즉시 중단 (429 조기 중단)
 
 Author: terminal-developer
@@ -24,6 +24,7 @@ import time
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 
+from .config_auto import auto_settings
 from .gemini_client import GeminiClient
 from .prompt_templates import (
     SYSTEM_PROMPT,
@@ -33,18 +34,34 @@ from .prompt_templates import (
     detect_category,
     validate_enrichment,
 )
-from .state_manager import StateManager
+from .state_manager import ENRICHMENT_RESULTS, StateManager
 
 logger = logging.getLogger("automation.content")
 
+# build_translation_prompt 변경 시 올림 → 이전 번역 메모리 항목 무효화
+TRANSLATION_PROMPT_VERSION = "automation-translation-v1"
+
+
+def _load_translation_memory():
+    """백엔드 번역 메모리 (백엔드 설정/DB 없이 실행하면 None → 항상 LLM 호출)"""
+    try:
+        from services.translation_memory import translation_memory
+
+        return translation_memory
+    except Exception as e:
+        logger.info(f"Translation memory unavailable: {e}")
+        return None
+
 
 class ContentGenerator:
     """Gemini 기반 메뉴 콘텐츠 생성기 (무료 tier)"""
 
     def __init__(self, client: GeminiClient = None):
         self.client = client or GeminiClient()
+        self.memory = _load_translation_memory()
         self.state = StateManager("enrichment")
         self.results: List[Dict[str, Any]] = []
+        self._unsaved: List[Dict[str, Any]] = []  # 다음 체크포인트에 추가할 결과
         self.success_count = 0
         self.fail_count = 0
         self.start_time = 0.0
@@ -199,6 +216,16 @@ class ContentGenerator:
         Returns:
             번역 결과 dict
         """
+        # 번역 메모리: 같은 (메뉴명 + 설명, 대상 언어 조합)은 재사용
+        source_text = f"{name_ko}\n{description_ko}"
+        target_lang = ",".join(languages or ["en", "ja", "zh_cn"])
+        if self.memory is not None:
+            cached = await self.memory.lookup(
+                source_text, "ko", target_lang, TRANSLATION_PROMPT_VERSION
+            )
+            if cached:
+                return json.loads(cached)
+
         prompt = build_translation_prompt(name_ko, description_ko, languages)
 
         result = await self.client.generate_json(
@@ -207,6 +234,12 @@ class ContentGenerator:
             temperature=0.2,
         )
 
+        if result and self.memory is not None:
+            await self.memory.store(
+                [(source_text, target_lang, json.dumps(result, ensure_ascii=False))],
+                "ko",
+                TRANSLATION_PROMPT_VERSION,
+            )
         return result
 
     async def categorize_menu(self, name_ko: str) -> Optional[Dict[str, Any]]:
@@ -233,60 +266,82 @@ class ContentGenerator:
         self,
         menus: List[Dict[str, Any]],
         checkpoint_interval: int = 10,
+        concurrency: int = 0,
     ) -> List[Dict[str, Any]]:
         """
-        배치 콘텐츠 생성 (체크포인트 포함)
+        배치 콘텐츠 생성 (동시 처리 + 체크포인트 포함)
 
         Args:
             menus: 메뉴 데이터 리스트
-            checkpoint_interval: 체크포인트 저장 간격
+            checkpoint_interval: 체크포인트 저장 간격 (완료 건수 기준)
+            concurrency: 동시 생성 수 (0 = ENRICHMENT_CONCURRENCY → 클라이언트 max_in_flight)
 
         Returns:
-            생성된 결과 리스트
+            생성된 결과 리스트 (입력 순서 유지)
         """
         self.start_time = time.time()
         self.state.start_run()
 
+        concurrency = (
+            concurrency
+            or auto_settings.ENRICHMENT_CONCURRENCY
+            or self.client.max_in_flight
+        )
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        slots: List[Optional[Dict[str, Any]]] = [None] * len(menus)
+        completed = 0
+        stopped = False
+
         usage = self.client.get_daily_usage()
-        logger.info(f"Batch enrichment: {len(menus)} menus")
+        logger.info(f"Batch enrichment: {len(menus)} menus (concurrency={concurrency})")
         logger.info(f"Model: {self.client.model} (Gemini Free Tier)")
         logger.info(f"Daily RPD: {usage['used']}/{usage['limit']} used")
         logger.info("Cost: $0")
         logger.info("=" * 60)
 
-        for i, menu in enumerate(menus):
-            # 모든 키 소진 시 즉시 중단 (무의미한 루프 방지)
-            if self.client.is_all_exhausted():
-                logger.warning(
-                    f"All Gemini keys exhausted at menu {i + 1}/{len(menus)} — "
-                    f"stopping batch early ({self.success_count} enriched)"
-                )
-                break
-
-            result = await self.enrich_menu(menu)
-
-            if result:
-                self.results.append(result)
+        async def enrich(i: int, menu: Dict[str, Any]):
+            nonlocal completed, stopped
+            async with semaphore:
+                # 모든 키 소진 시 대기 중인 메뉴는 시작하지 않음 (무의미한 호출 방지)
+                if self.client.is_all_exhausted():
+                    if not stopped:
+                        stopped = True
+                        logger.warning(
+                            f"All Gemini keys exhausted after {completed}/{len(menus)} "
+                            f"menus — stopping batch early ({self.success_count} enriched)"
+                        )
+                    return
+                try:
+                    slots[i] = await self.enrich_menu(menu)
+                    if slots[i]:
+                        self._unsaved.append(slots[i])
+                except Exception as e:
+                    logger.error(f"  Enrichment error for {menu.get('name_ko')}: {e}")
+                    self.fail_count += 1
+                    self.state.mark_failed(
+                        str(menu.get("id", menu.get("name_ko", ""))), str(e)
+                    )
 
             # 진행도
-            progress = (i + 1) / len(menus) * 100
+            completed += 1
             elapsed = time.time() - self.start_time
-            if self.success_count > 0:
-                avg_time = elapsed / self.success_count
-                remaining_menus = len(menus) - i - 1
-                eta = remaining_menus * avg_time
-                logger.info(
-                    f"Progress: {progress:.1f}% "
-                    f"({self.success_count}/{len(menus)}) "
-                    f"ETA: {eta / 60:.1f}min"
-                )
+            eta = (len(menus) - completed) * elapsed / completed
+            logger.info(
+                f"Progress: {completed / len(menus) * 100:.1f}% "
+                f"({self.success_count}/{len(menus)}) "
+                f"ETA: {eta / 60:.1f}min"
+            )
 
-            # 체크포인트 저장
-            if (i + 1) % checkpoint_interval == 0:
+            # 체크포인트 저장 (완료 건수 기준, 새로 완료된 결과만 추가)
+            if completed % checkpoint_interval == 0:
                 self._save_checkpoint()
 
-        # 최종 저장
+        await asyncio.gather(*(enrich(i, menu) for i, menu in enumerate(menus)))
+        self.results.extend(r for r in slots if r)
+
+        # 최종 저장 + 같은 메뉴 중복 레코드 정리
         self._save_checkpoint()
+        self.state.compact_records(ENRICHMENT_RESULTS, key="name_ko")
         self.state.end_run(self.success_count, self.fail_count)
 
         total_time = time.time() - self.start_time
@@ -301,19 +356,15 @@ class ContentGenerator:
         return self.results
 
     def _save_checkpoint(self):
-        """체크포인트 저장 (enrich_content_gemini_v2.py 패턴)"""
-        checkpoint_data = {
-            "enriched_count": self.success_count,
-            "failed_count": self.fail_count,
-            "model": self.client.model,
-            "daily_usage": self.client.get_daily_usage(),
-            "saved_at": datetime.now().isoformat(),
-            "menus": self.results,
-        }
-        self.state.save_checkpoint(
-            checkpoint_data,
-            f"enrichment_batch_{self.success_count}",
-        )
+        """
+        체크포인트 저장 — 마지막 체크포인트 이후 완료된 결과만 append
+
+        결과(staging/enrichment_results.jsonl) 먼저 fsync → 처리 상태 journal 기록
+        (중단 시 최악의 경우 결과는 있고 처리 표시만 빠져 재생성, 결과 유실 없음)
+        """
+        if self._unsaved:
+            self.state.append_records(ENRICHMENT_RESULTS, self._unsaved)
+            self._unsaved = []
         self.state.save_state()
 
 
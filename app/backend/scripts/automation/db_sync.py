@@ -17,7 +17,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any
 
-from .state_manager import StateManager
+from .state_manager import ENRICHMENT_RESULTS, StateManager
 from .config_auto import auto_settings
 
 logger = logging.getLogger("automation.sync")
@@ -120,7 +120,7 @@ class ProductionSync:
                 except Exception as e:
                     result["errors"].append(str(e))
 
-        # 2. Enriched 콘텐츠 UPDATE (enrichment_batch_*.json에서)
+        # 2. Enriched 콘텐츠 UPDATE (enrichment_results.jsonl에서)
         for name_ko, enriched in enriched_map.items():
             try:
                 content = enriched.get("content", {})
@@ -164,27 +164,23 @@ class ProductionSync:
     def _load_enriched_data(self) -> Dict[str, Dict]:
         """
         스테이징에서 enriched 데이터 로드
-        enrichment_batch_*.json 파일들을 name_ko 기준으로 병합
+        enrichment_results.jsonl 1개 파일 (ContentGenerator append-only 체크포인트)
 
         Returns:
-            {name_ko: {name_en, content, ...}} 매핑
+            {name_ko: {name_en, content, ...}} 매핑 (같은 메뉴는 마지막 레코드 우선)
         """
         enriched_map: Dict[str, Dict] = {}
 
-        # enrichment_batch_*.json은 staging 루트에 저장됨
-        for json_file in sorted(self.staging_dir.glob("enrichment_batch_*.json")):
-            try:
-                with open(json_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-
-                menus = data.get("menus", [])
-                for menu in menus:
-                    name_ko = _sanitize_value(menu.get("name_ko", ""))
-                    if name_ko:
-                        enriched_map[name_ko] = menu
+        try:
+            menus = StateManager.load_records(ENRICHMENT_RESULTS)
+        except Exception as e:
+            logger.warning(f"Failed to load enriched data: {e}")
+            menus = []
 
-            except Exception as e:
-                logger.warning(f"Failed to load enriched data from {json_file}: {e}")
+        for menu in menus:
+            name_ko = _sanitize_value(menu.get("name_ko", ""))
+            if name_ko:
+                enriched_map[name_ko] = menu
 
         logger.info(f"Loaded enriched data: {len(enriched_map)} menus")
         return enriched_map
@@ -3,9 +3,12 @@ Gemini API Client — 멀티키 라운드 로빈
 Google Gemini 2.5 Flash-Lite 기반 비동기 LLM 클라이언트
 
 멀티키 전략 (3키 × 20 RPD = 60 RPD/일):
-- 키마다 독립 RPD 카운터 추적
-- 요청 시 가장 여유 있는 키 자동 선택
-- 429 에러 시 해당 키만 소진 처리 → 다음 키로 즉시 전환
+- 키마다 독립 RPD 카운터 추적 (state 디렉토리에 일일 사용량 영속화)
+- 키마다 독립 RPM 토큰 버킷 → 동시 호출이 전체 키 용량까지 병렬 분산
+- 요청 시 RPM 토큰이 가장 빨리 나고 여유 있는 키 자동 선택 (RPD 예약)
+- 429 에러 시 다음 키로 즉시 전환
+  - 일일 쿼터(PerDay) 429 또는 RPD 도달: 해당 키 소진 처리 (영속화)
+  - 분당(RPM) 429: 소진 아님 → 키 버킷을 retry delay만큼 뒤로 밀어 잠시 제외
 - 모든 키 소진 시 즉시 중단 (무의미한 재시도 없음)
 
 google.genai SDK 사용 (google.generativeai는 deprecated)
@@ -14,32 +17,76 @@ OllamaClient와 동일한 인터페이스 제공
 Author: terminal-developer
 Date: 2026-02-20
 Updated: 2026-02-21 (멀티키 라운드 로빈, 429 조기 중단)
+Updated: 2026-10-19 (키별 토큰 버킷, 사용량 영속화)
 Cost: $0 (무료 tier)
 """
 
 import asyncio
+import hashlib
 import json
 import logging
+import os
 import re
 import time
 from datetime import date
-from typing import Optional, Dict, Any, List
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Tuple
 
 from .config_auto import auto_settings
 
 logger = logging.getLogger("automation.gemini")
 
+# 429 응답 구분: 일일 쿼터 ID (예: GenerateRequestsPerDayPerProjectPerModel-FreeTier)
+_DAILY_QUOTA_RE = re.compile(r"PerDay|per day|daily", re.IGNORECASE)
+# 서버 권장 재시도 대기 ("retryDelay': '37s'" / "Please retry in 37.4s")
+_RETRY_DELAY_RE = re.compile(
+    r"retry(?:Delay| in)['\"]?[:\s]*['\"]?(\d+(?:\.\d+)?)s", re.IGNORECASE
+)
+
+
+class _TokenBucket:
+    """키별 RPM 토큰 버킷 (음수 잔량 = 예약된 대기열)"""
+
+    def __init__(self, rpm_limit: int, burst: int = 1):
+        self.rate = rpm_limit / 60.0  # 초당 토큰
+        self.capacity = float(max(1, burst))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def delay(self, now: float) -> float:
+        """다음 토큰까지 대기 시간 (초)"""
+        self._refill(now)
+        return max(0.0, (1.0 - self.tokens) / self.rate)
+
+    def reserve(self, now: float) -> float:
+        """토큰 1개 예약 → 호출자가 대기할 시간 반환"""
+        wait = self.delay(now)
+        self.tokens -= 1.0
+        return wait
+
+    def backoff(self, now: float, seconds: float):
+        """RPM 429: 다음 토큰이 최소 seconds 뒤에 나도록 잔량을 음수로"""
+        self._refill(now)
+        self.tokens = min(self.tokens, 1.0 - seconds * self.rate)
+
 
 class _KeyState:
     """단일 API 키의 상태 추적"""
 
-    def __init__(self, key: str, index: int, rpd_limit: int):
+    def __init__(self, key: str, index: int, rpd_limit: int, bucket: _TokenBucket):
         self.key = key
         self.index = index
         self.rpd_limit = rpd_limit
+        self.bucket = bucket
+        self.fingerprint = hashlib.sha256(key.encode()).hexdigest()[:12]
         self.daily_count: int = 0
         self.daily_date: str = ""
         self.exhausted: bool = False
+        self.in_flight: int = 0  # RPD 예약 (호출 진행 중)
         self.client = None  # lazy init
 
     def reset_if_new_day(self):
@@ -56,12 +103,17 @@ class _KeyState:
             return 0
         return max(0, self.rpd_limit - self.daily_count)
 
+    @property
+    def available(self) -> int:
+        """진행 중 호출을 제외한 잔여 RPD"""
+        return max(0, self.remaining - self.in_flight)
+
     def mark_used(self):
         self.reset_if_new_day()
         self.daily_count += 1
 
     def mark_exhausted(self):
-        """429 에러 시 이 키를 소진 처리"""
+        """일일 쿼터 429 시 이 키를 소진 처리"""
         self.exhausted = True
         self.daily_count = self.rpd_limit
         logger.warning(f"Key #{self.index + 1} exhausted (RPD limit reached)")
@@ -76,6 +128,7 @@ class GeminiClient:
         model: str = "",
         rpm_limit: int = 0,
         rpd_limit: int = 0,
+        usage_file: Optional[Path] = None,
     ):
         self.model = model or auto_settings.GEMINI_MODEL
         self.rpm_limit = rpm_limit or auto_settings.GEMINI_RPM_LIMIT
@@ -100,15 +153,24 @@ class GeminiClient:
                 seen.add(k)
                 unique_keys.append(k)
 
+        # Rate limiting: 키마다 독립 RPM 버킷 (키 수만큼 병렬 처리량 증가)
         self._key_states: List[_KeyState] = [
-            _KeyState(key=k, index=i, rpd_limit=self.rpd_limit)
+            _KeyState(
+                key=k,
+                index=i,
+                rpd_limit=self.rpd_limit,
+                bucket=_TokenBucket(self.rpm_limit, auto_settings.GEMINI_RPM_BURST),
+            )
             for i, k in enumerate(unique_keys)
         ]
-
-        # Rate limiting (키 무관, 전체 RPM 공유)
-        self._last_request_time: float = 0.0
         self._sdk_imported: bool = False
 
+        # 일일 사용량 영속화 (프로세스 재시작 후에도 RPD 유지, 키 원문 미저장)
+        self.usage_file = Path(
+            usage_file or Path(auto_settings.AUTOMATION_STATE_DIR) / "gemini_usage.json"
+        )
+        self._load_usage()
+
     @property
     def total_keys(self) -> int:
         return len(self._key_states)
@@ -118,16 +180,99 @@ class GeminiClient:
         """전체 일일 RPD 합계"""
         return self.total_keys * self.rpd_limit
 
-    def _pick_best_key(self) -> Optional[_KeyState]:
-        """가장 여유 있는 키 선택"""
-        best = None
+    def _handle_rate_limit(self, ks: _KeyState, error_str: str):
+        """429 처리: 일일 쿼터면 소진(영속화), 분당 제한이면 키 버킷만 백오프"""
+        if _DAILY_QUOTA_RE.search(error_str) or ks.daily_count >= ks.rpd_limit:
+            ks.mark_exhausted()
+            self._save_usage()
+            logger.info(f"Key #{ks.index + 1} hit daily quota 429 → switching key")
+            return
+
+        match = _RETRY_DELAY_RE.search(error_str)
+        delay = float(match.group(1)) if match else 60.0 / self.rpm_limit
+        ks.bucket.backoff(time.monotonic(), delay)
+        logger.info(
+            f"Key #{ks.index + 1} hit RPM 429 → backing off {delay:.1f}s, switching key"
+        )
+
+    @property
+    def max_in_flight(self) -> int:
+        """
+        병렬 호출 권장 상한: 사용 가능 키별 (버킷 용량 + 토큰 대기 1개)
+
+        대기 1개가 다음 토큰 시점에 바로 발사 → 응답 지연과 무관하게 RPM 포화
+        """
+        return (
+            sum(
+                int(ks.bucket.capacity) + 1
+                for ks in self._key_states
+                if ks.remaining > 0
+            )
+            or 1
+        )
+
+    def _load_usage(self):
+        """오늘 날짜의 키별 사용량 복원"""
+        try:
+            data = json.loads(self.usage_file.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return
+        except (json.JSONDecodeError, OSError) as e:
+            logger.warning(f"Gemini usage file unreadable, starting fresh: {e}")
+            return
+
+        today = date.today().isoformat()
+        if data.get("date") != today:
+            return
+        saved_keys = data.get("keys", {})
+        for ks in self._key_states:
+            saved = saved_keys.get(ks.fingerprint)
+            if saved:
+                ks.daily_date = today
+                ks.daily_count = int(saved.get("used", 0))
+                ks.exhausted = bool(saved.get("exhausted", False))
+
+    def _save_usage(self):
+        """키별 사용량 저장 (임시 파일 → rename)"""
         for ks in self._key_states:
             ks.reset_if_new_day()
-            if ks.exhausted or ks.remaining <= 0:
+        data = {
+            "date": date.today().isoformat(),
+            "keys": {
+                ks.fingerprint: {"used": ks.daily_count, "exhausted": ks.exhausted}
+                for ks in self._key_states
+            },
+        }
+        try:
+            self.usage_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.usage_file.with_suffix(".tmp")
+            tmp_file.write_text(json.dumps(data, indent=2), encoding="utf-8")
+            os.replace(tmp_file, self.usage_file)
+        except OSError as e:
+            logger.warning(f"Failed to save Gemini usage: {e}")
+
+    def _reserve_key(self) -> Tuple[Optional[_KeyState], float]:
+        """
+        RPD 잔여가 있는 키 중 RPM 토큰이 가장 빨리 나는 키를 예약
+
+        await 없이 선택 + 예약 → 동시 태스크 간 경쟁 없음 (이벤트 루프 단일 스레드)
+
+        Returns:
+            (키, 대기 시간 초) — 모든 키 소진 시 (None, 0)
+        """
+        now = time.monotonic()
+        best = None
+        best_rank = None
+        for ks in self._key_states:
+            if ks.available <= 0:
                 continue
-            if best is None or ks.remaining > best.remaining:
-                best = ks
-        return best
+            rank = (ks.bucket.delay(now), -ks.available)
+            if best_rank is None or rank < best_rank:
+                best, best_rank = ks, rank
+        if best is None:
+            return None, 0.0
+        best.in_flight += 1
+        return best, best.bucket.reserve(now)
 
     def _get_client_for_key(self, ks: _KeyState):
         """키별 genai.Client 초기화 (lazy)"""
@@ -181,16 +326,6 @@ class GeminiClient:
         """하위호환 인터페이스"""
         return await self.is_available()
 
-    async def _rate_limit(self):
-        """RPM rate limit (키 무관, 전체 공유)"""
-        min_interval = 60.0 / self.rpm_limit
-        elapsed = time.time() - self._last_request_time
-        if elapsed < min_interval:
-            wait = min_interval - elapsed
-            logger.debug(f"Rate limit: waiting {wait:.1f}s")
-            await asyncio.sleep(wait)
-        self._last_request_time = time.time()
-
     async def generate(
         self,
         prompt: str,
@@ -199,34 +334,65 @@ class GeminiClient:
         max_tokens: int = 4096,
     ) -> Optional[str]:
         """
-        텍스트 생성 — 자동으로 최적 키 선택
+        텍스트 생성 — 자동으로 최적 키 선택 (동시 호출 안전)
+
+        키별 RPM 버킷 + RPD 예약으로 병렬 호출이 전체 키 용량까지 분산됨
+        429 발생 시 해당 키 소진(일일 쿼터) 또는 백오프(RPM) 후 재시도
+        (RPM 429가 키 수 × 3회 연속이면 중단)
 
         Returns:
             생성된 텍스트 또는 None (모든 키 소진 시)
         """
-        ks = self._pick_best_key()
-        if ks is None:
+        if not self._key_states or self.is_all_exhausted():
             logger.warning("All keys exhausted — cannot generate")
             return None
 
         self._ensure_sdk()
-        await self._rate_limit()
-
         full_prompt = f"{system}\n\n{prompt}" if system else prompt
+        rate_limited = 0
 
-        try:
-            client = self._get_client_for_key(ks)
-            response = await asyncio.to_thread(
-                client.models.generate_content,
-                model=self.model,
-                contents=full_prompt,
-                config={
-                    "temperature": temperature,
-                    "max_output_tokens": max_tokens,
-                },
-            )
+        while True:
+            ks, wait = self._reserve_key()
+            if ks is None:
+                logger.warning("All keys exhausted — cannot generate")
+                return None
+
+            try:
+                if wait > 0:
+                    logger.debug(f"Key #{ks.index + 1} rate limit: waiting {wait:.1f}s")
+                    await asyncio.sleep(wait)
+                if ks.exhausted:  # 대기 중 다른 호출이 429로 소진 처리
+                    continue
+
+                client = self._get_client_for_key(ks)
+                response = await asyncio.to_thread(
+                    client.models.generate_content,
+                    model=self.model,
+                    contents=full_prompt,
+                    config={
+                        "temperature": temperature,
+                        "max_output_tokens": max_tokens,
+                    },
+                )
+
+            except Exception as e:
+                error_str = str(e)
+                if "429" in error_str or "RESOURCE_EXHAUSTED" in error_str:
+                    self._handle_rate_limit(ks, error_str)
+                    rate_limited += 1
+                    if rate_limited >= 3 * self.total_keys:
+                        logger.warning("Repeated 429 on all keys — giving up")
+                        return None
+                    # 다른 키로 즉시 재시도 (백오프된 키는 토큰이 날 때까지 후순위)
+                    continue
+                logger.error(f"Gemini generate error (key #{ks.index + 1}): {e}")
+                return None
+
+            finally:
+                ks.in_flight -= 1
 
             ks.mark_used()
+            self._save_usage()
             total_usage = self.get_daily_usage()
             logger.debug(
                 f"Key #{ks.index + 1} used ({ks.daily_count}/{self.rpd_limit}) | "
@@ -235,65 +401,7 @@ class GeminiClient:
 
             if response.text:
                 return response.text
-            else:
-                logger.warning("Gemini returned empty response")
-                return None
-
-        except Exception as e:
-            error_str = str(e)
-            if "429" in error_str or "RESOURCE_EXHAUSTED" in error_str:
-                ks.mark_exhausted()
-                # 다른 키로 즉시 재시도
-                next_ks = self._pick_best_key()
-                if next_ks:
-                    logger.info(
-                        f"Key #{ks.index + 1} hit 429 → switching to key #{next_ks.index + 1} "
-                        f"({next_ks.remaining} remaining)"
-                    )
-                    return await self._generate_with_key(
-                        next_ks, full_prompt, temperature, max_tokens
-                    )
-                else:
-                    logger.error("All keys exhausted after 429")
-                    return None
-            else:
-                logger.error(f"Gemini generate error: {e}")
-                return None
-
-    async def _generate_with_key(
-        self,
-        ks: _KeyState,
-        full_prompt: str,
-        temperature: float,
-        max_tokens: int,
-    ) -> Optional[str]:
-        """특정 키로 생성 (429 fallback용, 내부 전용)"""
-        await self._rate_limit()
-
-        try:
-            client = self._get_client_for_key(ks)
-            response = await asyncio.to_thread(
-                client.models.generate_content,
-                model=self.model,
-                contents=full_prompt,
-                config={
-                    "temperature": temperature,
-                    "max_output_tokens": max_tokens,
-                },
-            )
-
-            ks.mark_used()
-
-            if response.text:
-                return response.text
-            return None
-
-        except Exception as e:
-            error_str = str(e)
-            if "429" in error_str or "RESOURCE_EXHAUSTED" in error_str:
-                ks.mark_exhausted()
-            else:
-                logger.error(f"Gemini generate error (key #{ks.index + 1}): {e}")
+            logger.warning("Gemini returned empty response")
             return None
 
     async def generate_json(
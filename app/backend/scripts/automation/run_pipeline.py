@@ -35,6 +35,10 @@ sys.path.insert(0, str(SCRIPT_DIR.parent))
 
 from automation.config_auto import auto_settings  # noqa: E402
 from automation.logging_config import setup_logging  # noqa: E402
+from automation.state_manager import (  # noqa: E402
+    ENRICHMENT_RESULTS,
+    StateManager,
+)
 
 
 def print_status():
@@ -71,9 +75,9 @@ def print_status():
             if (staging_dir / "new_menus").exists()
             else []
         )
-        enriched = list(staging_dir.glob("enrichment_batch_*.json"))
+        enriched = StateManager.load_records(ENRICHMENT_RESULTS)
         logger.info(
-            f"Staging: {len(new_menus)} discovery files, {len(enriched)} enrichment files"
+            f"Staging: {len(new_menus)} discovery files, {len(enriched)} enriched menus"
         )
     else:
         logger.info("Staging directory not created yet")
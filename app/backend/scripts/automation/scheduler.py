@@ -21,6 +21,7 @@ from pathlib import Path
 from .config_auto import auto_settings
 from .logging_config import setup_logging
 from .metrics import DailyMetrics
+from .state_manager import ENRICHMENT_RESULTS, StateManager
 
 logger = logging.getLogger("automation.scheduler")
 
@@ -156,24 +157,17 @@ async def run_image_collection():
         matcher = ImageMatcher()
 
         # enriched JSON에서 name_en이 있는 메뉴 로드 (정확한 이미지 검색)
-        staging_dir = Path(auto_settings.AUTOMATION_STAGING_DIR)
         menus_without_images = []
 
-        for json_file in sorted(staging_dir.glob("enrichment_batch_*.json")):
-            try:
-                with open(json_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                for menu in data.get("menus", []):
-                    name_en = menu.get("name_en", "")
-                    if name_en:  # name_en이 있는 메뉴만
-                        menus_without_images.append(
-                            {
-                                "name_ko": menu.get("name_ko", ""),
-                                "name_en": name_en,
-                            }
-                        )
-            except Exception:
-                continue
+        for menu in StateManager.load_records(ENRICHMENT_RESULTS):
+            name_en = menu.get("name_en", "")
+            if name_en:  # name_en이 있는 메뉴만
+                menus_without_images.append(
+                    {
+                        "name_ko": menu.get("name_ko", ""),
+                        "name_en": name_en,
+                    }
+                )
 
         if not menus_without_images:
             logger.info("No enriched menus with name_en for image search")
@@ -1,24 +1,115 @@
 """
 State Manager - 체크포인트/재개 상태 관리
 기존 enrichment 스크립트의 checkpoint 패턴을 따름
+
+저장 구조 (append-only):
+- {task}_state.json: 스냅샷 (compaction 시에만 전체 재작성)
+- {task}_journal.jsonl: 스냅샷 이후 변경분 (processed / failed / meta 한 줄씩)
+  - 로드 시 스냅샷 + journal 재생, 끝의 깨진 줄은 무시 (중단 시 마지막 쓰기)
+  - 변경분은 메모리에 모았다가 save_state() 시 write 1회 + fsync 1회 (fsync 묶음)
+  - journal이 STATE_COMPACT_EVERY줄 이상이거나 end_run() 시 스냅샷으로 compaction
+- staging/{name}.jsonl: 결과 레코드 append-only 파일 (append_records / load_records)
 """
 
 import json
 import logging
+import os
 from pathlib import Path
 from datetime import datetime
-from typing import Any, Optional, Set
+from typing import Any, Dict, Iterable, List, Optional, Set
 
 from .config_auto import auto_settings
 
 logger = logging.getLogger("automation.state")
 
+STATE_COMPACT_EVERY = 500  # journal 줄 수가 이 이상이면 스냅샷으로 compaction
+
+# ContentGenerator 결과 통합 파일 (staging/enrichment_results.jsonl → db_sync, 이미지 수집)
+ENRICHMENT_RESULTS = "enrichment_results"
+
+# save_state()마다 journal에 기록하는 메타 필드 (작은 값만)
+_META_KEYS = ("last_run", "current_run_start", "history", "last_saved")
+
+
+def _write_atomic(path: Path, text: str):
+    """임시 파일 → fsync → rename (중단 시 기존 파일 보존)"""
+    tmp_file = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp_file, "w", encoding="utf-8") as f:
+        f.write(text)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_file, path)
+
+
+def _append_lines(path: Path, lines: List[str]):
+    """여러 줄을 write 1회 + fsync 1회로 추가"""
+    with open(path, "a", encoding="utf-8") as f:
+        f.write("".join(line + "\n" for line in lines))
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def _read_jsonl(path: Path) -> List[Dict[str, Any]]:
+    """JSONL 읽기 (깨진 줄은 건너뜀)"""
+    records = []
+    if not path.exists():
+        return records
+    with open(path, "r", encoding="utf-8") as f:
+        for line_no, line in enumerate(f, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                logger.warning(f"Skipping corrupt line {line_no} in {path.name}")
+    return records
+
+
+def _dumps(data: Any) -> str:
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+
+def _migrate_legacy_enrichment_batches(staging_dir: Path, records_file: Path):
+    """
+    이전 enrichment_batch_*.json 체크포인트를 통합 파일로 1회 이관
+
+    결과 파일 존재 여부가 아닌 .legacy_migrated 마커로 판단 (enrichment가 sync보다
+    먼저 결과 파일을 만들어도 이관 누락 없음). 이관분은 기존 레코드보다 앞에 두어
+    같은 메뉴는 새 결과가 우선
+    """
+    marker = staging_dir / ".legacy_migrated"
+    if marker.exists():
+        return
+
+    legacy_files = sorted(
+        staging_dir.glob("enrichment_batch_*.json"), key=lambda p: p.stat().st_mtime
+    )
+    legacy = []
+    for json_file in legacy_files:
+        try:
+            with open(json_file, "r", encoding="utf-8") as f:
+                legacy.extend(json.load(f).get("menus", []))
+        except Exception as e:
+            logger.warning(f"Failed to load legacy enrichment batch {json_file}: {e}")
+
+    if legacy:
+        current = _read_jsonl(records_file)
+        _write_atomic(
+            records_file,
+            "".join(_dumps(record) + "\n" for record in legacy + current),
+        )
+        logger.info(
+            f"Migrated {len(legacy)} menus from {len(legacy_files)} legacy enrichment batch files"
+        )
+    marker.write_text(datetime.now().isoformat(), encoding="utf-8")
+
 
 class StateManager:
     """
     자동화 파이프라인 상태 관리
-    - 처리 완료된 항목 추적
-    - 체크포인트 저장/복원
+    - 처리 완료된 항목 추적 (set 조회 O(1))
+    - 체크포인트 저장/복원 (append-only journal + 주기적 compaction)
     - 일일 메트릭 기록
     """
 
@@ -31,10 +122,15 @@ class StateManager:
         self.state_dir = Path(auto_settings.AUTOMATION_STATE_DIR)
         self.state_dir.mkdir(parents=True, exist_ok=True)
         self.state_file = self.state_dir / f"{task_name}_state.json"
+        self.journal_file = self.state_dir / f"{task_name}_journal.jsonl"
+        self._pending: List[str] = []  # 다음 save_state()에 기록할 journal 줄
+        self._journal_lines = 0
         self._state = self._load_state()
+        self._processed: Set[str] = set(self._state.pop("processed_ids", []))
+        self._replay_journal()
 
     def _load_state(self) -> dict:
-        """기존 상태 로드"""
+        """기존 상태 스냅샷 로드"""
         if self.state_file.exists():
             try:
                 with open(self.state_file, "r", encoding="utf-8") as f:
@@ -50,26 +146,69 @@ class StateManager:
             "history": [],
         }
 
+    def _replay_journal(self):
+        """스냅샷 이후 journal 변경분 적용"""
+        entries = _read_jsonl(self.journal_file)
+        for entry in entries:
+            op = entry.get("op")
+            if op == "processed":
+                self._processed.add(entry["id"])
+            elif op == "failed":
+                self._apply_failed(entry["id"], entry.get("error", ""), entry["at"])
+            elif op == "meta":
+                self._state.update(entry.get("state", {}))
+        self._journal_lines = len(entries)
+        self._state["total_processed"] = len(self._processed)
+
+    def _journal(self, entry: Dict[str, Any]):
+        self._pending.append(_dumps(entry))
+
+    def compact(self):
+        """스냅샷 전체 재작성 후 journal 비우기"""
+        self._pending = []  # 스냅샷에 모두 반영됨
+        snapshot = {**self._state, "processed_ids": sorted(self._processed)}
+        _write_atomic(self.state_file, _dumps(snapshot))
+        self.journal_file.unlink(missing_ok=True)
+        self._journal_lines = 0
+        logger.debug(f"State compacted: {self.task_name}")
+
     def save_state(self):
-        """상태 저장 (체크포인트)"""
+        """상태 저장 (체크포인트) — 메타 1줄 추가 + fsync, 필요 시 compaction"""
         self._state["last_saved"] = datetime.now().isoformat()
-        with open(self.state_file, "w", encoding="utf-8") as f:
-            json.dump(self._state, f, ensure_ascii=False, indent=2)
+        self._pending.append(
+            _dumps(
+                {
+                    "op": "meta",
+                    "state": {k: self._state.get(k) for k in _META_KEYS},
+                }
+            )
+        )
+        _append_lines(self.journal_file, self._pending)
+        self._journal_lines += len(self._pending)
+        self._pending = []
+        if self._journal_lines >= STATE_COMPACT_EVERY:
+            self.compact()
         logger.debug(f"State saved: {self.task_name}")
 
     @property
     def processed_ids(self) -> Set[str]:
         """이미 처리된 항목 ID 세트"""
-        return set(self._state.get("processed_ids", []))
+        return set(self._processed)
 
     def mark_processed(self, item_id: str):
         """항목을 처리 완료로 표시"""
-        if item_id not in self._state["processed_ids"]:
-            self._state["processed_ids"].append(item_id)
-            self._state["total_processed"] = len(self._state["processed_ids"])
+        if item_id not in self._processed:
+            self._processed.add(item_id)
+            self._state["total_processed"] = len(self._processed)
+            self._journal({"op": "processed", "id": item_id})
 
     def mark_failed(self, item_id: str, error: str = ""):
         """항목 처리 실패 기록"""
+        at = datetime.now().isoformat()
+        self._apply_failed(item_id, error, at)
+        self._journal({"op": "failed", "id": item_id, "error": error, "at": at})
+
+    def _apply_failed(self, item_id: str, error: str, at: str):
         self._state["total_failed"] = self._state.get("total_failed", 0) + 1
         if "failed_items" not in self._state:
             self._state["failed_items"] = []
@@ -77,13 +216,13 @@ class StateManager:
             {
                 "id": item_id,
                 "error": error,
-                "at": datetime.now().isoformat(),
+                "at": at,
             }
         )
 
     def is_processed(self, item_id: str) -> bool:
         """이미 처리된 항목인지 확인"""
-        return item_id in self.processed_ids
+        return item_id in self._processed
 
     def start_run(self):
         """새 실행 시작 기록"""
@@ -91,7 +230,7 @@ class StateManager:
         self._state["current_run_start"] = datetime.now().isoformat()
 
     def end_run(self, success_count: int = 0, fail_count: int = 0):
-        """실행 종료 기록"""
+        """실행 종료 기록 (스냅샷 compaction)"""
         run_info = {
             "started": self._state.get("current_run_start"),
             "ended": datetime.now().isoformat(),
@@ -103,7 +242,8 @@ class StateManager:
         self._state["history"].append(run_info)
         # 최근 30일만 유지
         self._state["history"] = self._state["history"][-30:]
-        self.save_state()
+        self._state["last_saved"] = datetime.now().isoformat()
+        self.compact()
 
     def get_last_run(self) -> Optional[str]:
         """마지막 실행 시간"""
@@ -135,3 +275,43 @@ class StateManager:
             with open(checkpoint_file, "r", encoding="utf-8") as f:
                 return json.load(f)
         return None
+
+    # ===========================
+    # Append-only 결과 레코드 (staging/{name}.jsonl)
+    # ===========================
+    @staticmethod
+    def _records_file(name: str) -> Path:
+        staging_dir = Path(auto_settings.AUTOMATION_STAGING_DIR)
+        staging_dir.mkdir(parents=True, exist_ok=True)
+        records_file = staging_dir / f"{name}.jsonl"
+        if name == ENRICHMENT_RESULTS:
+            _migrate_legacy_enrichment_batches(staging_dir, records_file)
+        return records_file
+
+    @classmethod
+    def append_records(cls, name: str, records: Iterable[Dict[str, Any]]) -> int:
+        """레코드 추가 (write 1회 + fsync 1회)"""
+        lines = [_dumps(record) for record in records]
+        if lines:
+            _append_lines(cls._records_file(name), lines)
+            logger.info(f"Checkpoint appended: {name}.jsonl (+{len(lines)})")
+        return len(lines)
+
+    @classmethod
+    def load_records(cls, name: str) -> List[Dict[str, Any]]:
+        """레코드 전체 로드 (추가 순서)"""
+        return _read_jsonl(cls._records_file(name))
+
+    @classmethod
+    def compact_records(cls, name: str, key: str) -> int:
+        """key 기준 최신 레코드만 남기도록 재작성 (마지막 추가분 우선)"""
+        latest: Dict[Any, Dict[str, Any]] = {}
+        for record in cls.load_records(name):
+            latest.pop(record.get(key), None)
+            latest[record.get(key)] = record
+        if latest:
+            _write_atomic(
+                cls._records_file(name),
+                "".join(_dumps(record) + "\n" for record in latest.values()),
+            )
+        return len(latest)
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+benchmark_preprocessing.py
+
+목적: 메뉴 이미지 전처리 CPU 시간 / 업로드 바이트 측정
+  - 단계별 시간 (resize, auto_rotate, CLAHE, blur, JPEG encode)
+  - 결과 JPEG 크기 + base64 크기 (GPT Vision 업로드 페이로드)
+  - 긴 변 상한 없음(0) vs PREPROCESS_MAX_LONG_EDGE 비교
+
+실행:
+  cd app/backend && python scripts/benchmark_preprocessing.py
+  cd app/backend && python scripts/benchmark_preprocessing.py photo1.jpg photo2.jpg
+  cd app/backend && python scripts/benchmark_preprocessing.py --max-long-edge 1600 -n 10
+"""
+import sys
+import time
+import base64
+import argparse
+import statistics
+from pathlib import Path
+from typing import Dict, List
+
+import cv2
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.image_preprocessing import (
+    DEFAULT_MAX_LONG_EDGE,
+    auto_rotate_image,
+    enhance_contrast,
+    normalize_resolution,
+    remove_noise,
+)
+
+
+def synthetic_menu_photo(width: int = 4032, height: int = 3024) -> np.ndarray:
+    """12MP 스마트폰 사진 크기의 합성 메뉴판 (텍스트 줄 모양 막대 + 노이즈)"""
+    rng = np.random.default_rng(0)
+    image = np.full((height, width, 3), 225, dtype=np.uint8)
+    for row in range(40):
+        y = 80 + row * 70
+        line_width = int(rng.integers(width // 4, width * 3 // 4))
+        cv2.rectangle(image, (120, y), (120 + line_width, y + 30), (40, 40, 40), -1)
+        cv2.rectangle(image, (width - 500, y), (width - 200, y + 30), (60, 60, 60), -1)
+    noise = rng.integers(0, 20, image.shape, dtype=np.uint8)
+    return cv2.add(image, noise)
+
+
+def run_pipeline(image: np.ndarray, max_long_edge: int) -> Dict[str, float]:
+    """preprocess_menu_image와 같은 단계 순서로 단계별 시간(ms) 측정"""
+    timings = {}
+
+    def timed(name, func, *args):
+        start = time.perf_counter()
+        result = func(*args)
+        timings[name] = (time.perf_counter() - start) * 1000
+        return result
+
+    image = timed("resize", normalize_resolution, image, max_long_edge)
+    image = timed("auto_rotate", auto_rotate_image, image)
+    image = timed("clahe", enhance_contrast, image)
+    image = timed("blur", remove_noise, image)
+    ok, encoded = timed("encode", cv2.imencode, ".jpg", image)
+
+    timings["total"] = sum(timings.values())
+    timings["jpeg_kb"] = len(encoded) / 1024
+    timings["base64_kb"] = len(base64.b64encode(encoded.tobytes())) / 1024
+    timings["long_edge"] = max(image.shape[:2])
+    return timings
+
+
+def summarize(runs: List[Dict[str, float]]) -> Dict[str, float]:
+    return {key: statistics.median(run[key] for run in runs) for key in runs[0]}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="메뉴 이미지 전처리 벤치마크")
+    parser.add_argument(
+        "images", nargs="*", help="이미지 경로 (없으면 합성 12MP 이미지)"
+    )
+    parser.add_argument("--max-long-edge", type=int, default=DEFAULT_MAX_LONG_EDGE)
+    parser.add_argument("-n", "--iterations", type=int, default=5)
+    args = parser.parse_args()
+
+    if args.images:
+        samples = [(path, cv2.imread(path)) for path in args.images]
+    else:
+        samples = [("synthetic 4032x3024", synthetic_menu_photo())]
+
+    columns = ["resize", "auto_rotate", "clahe", "blur", "encode", "total"]
+    print(
+        f"{'image':<28} {'cap':>5} {'edge':>5} "
+        + " ".join(f"{c:>11}" for c in columns)
+        + f" {'jpeg_kb':>9} {'base64_kb':>9}"
+    )
+    for name, image in samples:
+        if image is None:
+            print(f"{name:<28} 로드 실패")
+            continue
+        for cap in (0, args.max_long_edge):
+            stats = summarize(
+                [run_pipeline(image, cap) for _ in range(args.iterations)]
+            )
+            print(
+                f"{name[:28]:<28} {cap:>5} {int(stats['long_edge']):>5} "
+                + " ".join(f"{stats[c]:>9.1f}ms" for c in columns)
+                + f" {stats['jpeg_kb']:>9.0f} {stats['base64_kb']:>9.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -186,6 +186,65 @@ def get_enrichment_stats(conn) -> Dict:
     return dict(cur.fetchone())
 
 
+def resolve_similar_dishes(conn, similar: List) -> List[Dict]:
+    """
+    similar_dishes 항목에 canonical 스냅샷 병합 (단일 쿼리)
+    상세 API가 요청마다 조회하지 않도록 id/image_url을 미리 저장
+    similarity_reason / difference 등 기존 필드는 유지
+    (참조 메뉴 이미지 변경 시 스냅샷 갱신: migrations/refresh_similar_dish_snapshots.sql)
+    """
+    names = []
+    for dish in similar:
+        name = dish.get("name_ko", "") if isinstance(dish, dict) else str(dish)
+        names.append(name.split("(")[0].strip())
+
+    cur = conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
+    cur.execute(
+        """
+    SELECT DISTINCT ON (name_ko)
+        id::text, name_ko, name_en, image_url, primary_image, spice_level
+    FROM canonical_menus
+    WHERE name_ko = ANY(%s)
+    ORDER BY name_ko, created_at ASC
+    """,
+        ([n for n in names if n],),
+    )
+    by_name = {r["name_ko"]: r for r in cur.fetchall()}
+
+    resolved = []
+    for dish, name in zip(similar, names):
+        if not name:
+            continue
+        entry = dict(dish) if isinstance(dish, dict) else {}
+        row = by_name.get(name)
+        if row:
+            primary = row["primary_image"] or {}
+            entry.update(
+                {
+                    "id": row["id"],
+                    "name_ko": row["name_ko"],
+                    "name_en": row["name_en"] or row["name_ko"],
+                    "image_url": row["image_url"] or primary.get("url"),
+                    "spice_level": row["spice_level"] or 0,
+                }
+            )
+        else:
+            name_en = entry.get("name_en")
+            if not name_en and isinstance(dish, str) and "(" in dish:
+                name_en = dish.split("(")[1].split(")")[0]
+            entry.update(
+                {
+                    "id": None,
+                    "name_ko": name,
+                    "name_en": name_en or name,
+                    "image_url": None,
+                    "spice_level": 0,
+                }
+            )
+        resolved.append(entry)
+    return resolved
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # 체크포인트
 # ─────────────────────────────────────────────────────────────────────────────
@@ -389,6 +448,8 @@ def update_menu_enrichment(conn, menu_id: str, enriched: Dict):
     flavor_json = json.dumps(flavor, ensure_ascii=False) if flavor else None
 
     similar = enriched.get("similar_dishes", [])
+    if similar:
+        similar = resolve_similar_dishes(conn, similar)
     similar_json = json.dumps(similar, ensure_ascii=False) if similar else None
 
     # similar_dishes는 jsonb[] 타입이므로 별도 처리
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+scan_log_retention.py
+
+목적: scan_logs 월 파티션 유지보수 (cron 1일 1회 권장)
+  1. 이번 달 + SCAN_LOG_PARTITION_MONTHS_AHEAD개월 파티션 생성
+  2. SCAN_LOG_RETENTION_MONTHS 초과 파티션 → gzip CSV 아카이브 후 DROP
+
+전제: migrations/partition_scan_logs_by_month.sql 적용
+
+실행:
+  cd app/backend && python scripts/scan_log_retention.py --list
+  cd app/backend && python scripts/scan_log_retention.py --dry-run
+  cd app/backend && python scripts/scan_log_retention.py
+  cd app/backend && python scripts/scan_log_retention.py --retention-months 6
+"""
+import sys
+import asyncio
+import argparse
+import logging
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from database import engine
+from services.scan_log_partitions import scan_log_partitions, retention_cutoff
+
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+
+async def main(args):
+    if args.retention_months is not None:
+        scan_log_partitions.retention_months = args.retention_months
+
+    if not scan_log_partitions.enabled:
+        logger.error("scan_logs 파티셔닝은 PostgreSQL 전용입니다")
+        return 1
+
+    try:
+        created = await scan_log_partitions.ensure_partitions()
+        logger.info(f"Partitions ensured: {created} months from current month")
+
+        if args.list:
+            for p in await scan_log_partitions.list_partitions():
+                logger.info(f"  {p['name']:<24} ~{p['estimated_rows']:>10,} rows")
+            return 0
+
+        cutoff = retention_cutoff(scan_log_partitions.retention_months)
+        logger.info(
+            f"Retention: {scan_log_partitions.retention_months} months "
+            f"(archiving partitions before {cutoff})"
+        )
+        results = await scan_log_partitions.archive_expired(dry_run=args.dry_run)
+        for r in results:
+            logger.info(f"  {r}")
+        logger.info(
+            f"Done: {len(results)} partitions {'(dry run)' if args.dry_run else 'archived'}"
+        )
+        return 0
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="scan_logs partition maintenance")
+    parser.add_argument("--list", action="store_true", help="파티션 목록만 출력")
+    parser.add_argument("--dry-run", action="store_true", help="아카이브 대상만 출력")
+    parser.add_argument("--retention-months", type=int, default=None)
+    sys.exit(asyncio.run(main(parser.parse_args())))
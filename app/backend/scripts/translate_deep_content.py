@@ -9,6 +9,7 @@ translate_deep_content.py
   - cultural_context.ja / .zh (260개 메뉴, 현재 0%)
 
 API: Claude API (claude-haiku-4-5-20251001)
+번역 메모리: translation_memory 테이블 적중 시 Claude 호출 생략, 새 번역은 저장
 실행:
   cd app/backend && python scripts/translate_deep_content.py --test
   cd app/backend && python scripts/translate_deep_content.py --batch 10
@@ -21,6 +22,7 @@ import json
 import time
 import logging
 import argparse
+import hashlib
 import subprocess
 import socket
 from typing import Optional, List, Dict
@@ -186,25 +188,34 @@ def get_translation_stats(conn) -> Dict:
 # ─────────────────────────────────────────────────────────────────────────────
 # Claude API 번역
 # ─────────────────────────────────────────────────────────────────────────────
+def get_source_texts(m: Dict) -> Dict[str, str]:
+    """번역 대상 영문 원문 {"explanation_long": str, "cultural_context": str}"""
+    exp_long_en = None
+    if m.get("explanation_long") and isinstance(m["explanation_long"], dict):
+        exp_long_en = m["explanation_long"].get("en", "")
+    if not exp_long_en:
+        exp_long_en = m.get("description_long_en", "")
+
+    cultural_en = None
+    if m.get("cultural_context") and isinstance(m["cultural_context"], dict):
+        cultural_en = m["cultural_context"].get("en", "")
+
+    return {
+        "explanation_long": exp_long_en or "",
+        "cultural_context": cultural_en or "",
+    }
+
+
 def build_translation_prompt(menus: List[Dict]) -> str:
     menu_list = []
     for m in menus:
-        exp_long_en = None
-        if m.get("explanation_long") and isinstance(m["explanation_long"], dict):
-            exp_long_en = m["explanation_long"].get("en", "")
-        if not exp_long_en:
-            exp_long_en = m.get("description_long_en", "")
-
-        cultural_en = None
-        if m.get("cultural_context") and isinstance(m["cultural_context"], dict):
-            cultural_en = m["cultural_context"].get("en", "")
-
+        sources = get_source_texts(m)
         menu_list.append(
             {
                 "id": m["id"],
                 "name_ko": m["name_ko"],
-                "explanation_long_en": exp_long_en or "",
-                "cultural_context_en": cultural_en or "",
+                "explanation_long_en": sources["explanation_long"],
+                "cultural_context_en": sources["cultural_context"],
             }
         )
 
@@ -316,6 +327,116 @@ def update_menu_translations(
     conn.commit()
 
 
+# ─────────────────────────────────────────────────────────────────────────────
+# 번역 메모리 (translation_memory 테이블, migrations/create_translation_memory.sql)
+# ─────────────────────────────────────────────────────────────────────────────
+TM_SOURCE_LANG = "en"
+TM_TARGET_LANGS = ("ja", "zh")
+TM_PROMPT_VERSION = "deep-content-claude-v1"  # 프롬프트 변경 시 올림
+
+
+def source_hash(text: str) -> str:
+    """services/translation_memory.source_hash와 동일 (공백 정규화 후 sha256)"""
+    return hashlib.sha256(" ".join(text.split()).encode("utf-8")).hexdigest()
+
+
+def fetch_translation_memory(conn, texts: List[str]) -> Dict[tuple, str]:
+    """원문 목록 일괄 조회 → {(원문, lang): 번역문} (테이블 없으면 빈 dict)"""
+    hashes = {source_hash(t): t for t in texts if t and t.strip()}
+    if not hashes:
+        return {}
+    cur = conn.cursor()
+    try:
+        cur.execute(
+            """
+        SELECT source_hash, target_lang, target_text
+        FROM translation_memory
+        WHERE source_hash = ANY(%s) AND source_lang = %s
+          AND target_lang = ANY(%s) AND prompt_version = %s
+        """,
+            (list(hashes), TM_SOURCE_LANG, list(TM_TARGET_LANGS), TM_PROMPT_VERSION),
+        )
+        rows = cur.fetchall()
+        conn.commit()
+    except Exception as e:
+        logger.warning(f"Translation memory lookup failed: {e}")
+        conn.rollback()
+        return {}
+    return {(hashes[h], lang): text for h, lang, text in rows}
+
+
+def save_translation_memory(conn, entries: List[tuple]):
+    """[(원문, lang, 번역문), ...] 일괄 upsert"""
+    rows = {
+        (source_hash(src), lang): (
+            source_hash(src),
+            TM_SOURCE_LANG,
+            lang,
+            TM_PROMPT_VERSION,
+            " ".join(src.split()),
+            text,
+        )
+        for src, lang, text in entries
+        if src and src.strip() and text
+    }
+    if not rows:
+        return
+    cur = conn.cursor()
+    try:
+        psycopg2.extras.execute_values(
+            cur,
+            """
+        INSERT INTO translation_memory
+            (source_hash, source_lang, target_lang, prompt_version, source_text, target_text)
+        VALUES %s
+        ON CONFLICT (source_hash, source_lang, target_lang, prompt_version)
+        DO UPDATE SET target_text = EXCLUDED.target_text, updated_at = NOW()
+        """,
+            list(rows.values()),
+        )
+        conn.commit()
+    except Exception as e:
+        logger.warning(f"Translation memory store failed: {e}")
+        conn.rollback()
+
+
+def translate_from_memory(conn, menus: List[Dict]) -> tuple:
+    """
+    번역 메모리로 완성되는 메뉴는 바로 DB 반영
+
+    Returns:
+        (메모리로 처리한 메뉴 수, LLM이 필요한 메뉴 목록)
+    """
+    sources = {m["id"]: get_source_texts(m) for m in menus}
+    found = fetch_translation_memory(
+        conn, [t for fields in sources.values() for t in fields.values()]
+    )
+
+    done, remaining = 0, []
+    for m in menus:
+        updates = {}
+        for field, src in sources[m["id"]].items():
+            if not src:
+                continue
+            updates[field] = {lang: found.get((src, lang)) for lang in TM_TARGET_LANGS}
+        if not updates or not all(all(u.values()) for u in updates.values()):
+            remaining.append(m)
+            continue
+        try:
+            update_menu_translations(
+                conn,
+                m["id"],
+                updates.get("explanation_long", {}),
+                updates.get("cultural_context", {}),
+            )
+            done += 1
+            logger.info(f"  ♻️  {m['id']}: translation memory hit")
+        except Exception as e:
+            logger.error(f"  ❌ DB update failed for {m['id']}: {e}")
+            conn.rollback()
+    return done, remaining
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # 배치 처리
 # ─────────────────────────────────────────────────────────────────────────────
@@ -323,6 +444,11 @@ def process_batch(conn, client: anthropic.Anthropic, menus: List[Dict]) -> int:
     if not menus:
         return 0
 
+    # 번역 메모리 적중 메뉴는 Claude 호출 없이 반영
+    success, menus = translate_from_memory(conn, menus)
+    if not menus:
+        return success
+
     prompt = build_translation_prompt(menus)
     logger.info(f"Translating batch of {len(menus)} menus...")
 
@@ -336,7 +462,8 @@ def process_batch(conn, client: anthropic.Anthropic, menus: List[Dict]) -> int:
         logger.error(f"Invalid response structure: {text[:200]}")
         return 0
 
-    success = 0
+    sources = {m["id"]: get_source_texts(m) for m in menus}
+    memory_entries = []
     for trans in result["translations"]:
         menu_id = trans.get("id")
         if not menu_id:
@@ -346,6 +473,16 @@ def process_batch(conn, client: anthropic.Anthropic, menus: List[Dict]) -> int:
         cultural = trans.get("cultural_context", {})
         exp_long_clean = {k: v for k, v in exp_long.items() if v}
         cultural_clean = {k: v for k, v in cultural.items() if v}
+        menu_sources = sources.get(menu_id, {})
+        for field, clean in (
+            ("explanation_long", exp_long_clean),
+            ("cultural_context", cultural_clean),
+        ):
+            memory_entries.extend(
+                (menu_sources.get(field, ""), lang, text)
+                for lang, text in clean.items()
+                if lang in TM_TARGET_LANGS
+            )
 
         if exp_long_clean or cultural_clean:
             try:
@@ -358,6 +495,7 @@ def process_batch(conn, client: anthropic.Anthropic, menus: List[Dict]) -> int:
                 logger.error(f"  ❌ DB update failed for {menu_id}: {e}")
                 conn.rollback()
 
+    save_translation_memory(conn, memory_entries)
     return success
 
 
@@ -6,10 +6,10 @@
 - 새 canonical_menu 생성 시 자동 번역 트리거
 - 일본어/중국어 자동 생성
 - 백그라운드 비동기 처리
+- 다건 배치 번역 (동시 요청을 묶어 Gemini 호출 1회, 키당 20 RPD 절약)
 """
 
 import asyncio
-import json
 import logging
 from typing import Dict, Optional
 from uuid import UUID
@@ -17,7 +17,13 @@ from uuid import UUID
 from config import settings
 from models.canonical_menu import CanonicalMenu
 from sqlalchemy.ext.asyncio import AsyncSession
-from utils.retry import async_retry
+from services.batch_translator import (
+    BATCH_PROMPT_VERSION,
+    SOURCE_LANGUAGE,
+    TARGET_LANGUAGES,
+    BatchTranslator,
+)
+from services.translation_memory import translation_memory
 
 # Google Gemini (google-genai SDK — google.generativeai is deprecated)
 # from google import genai  # imported lazily in _translate_with_gemini
@@ -50,6 +56,16 @@ class AutoTranslateService:
         self.daily_usage = {i: 0 for i in range(len(self.api_keys))}  # 키별 사용량
         self.max_rpd = 20  # Requests Per Day per key
 
+        # 다건 번역 배치 큐 (요청 1회에 최대 TRANSLATION_BATCH_SIZE개 메뉴)
+        self.translator = BatchTranslator(
+            self._complete_with_gemini,
+            max_batch_size=settings.TRANSLATION_BATCH_SIZE,
+            max_wait_seconds=settings.TRANSLATION_BATCH_MAX_WAIT_SECONDS,
+            max_attempts=settings.TRANSLATION_BATCH_MAX_ATTEMPTS,
+            memory=translation_memory,
+            name="auto_translate_gemini",
+        )
+
         logger.info(
             f"✅ Google Gemini API 초기화 완료 ({len(self.api_keys)}개 키, 총 {len(self.api_keys) * self.max_rpd} RPD)"
         )
@@ -69,6 +85,10 @@ class AutoTranslateService:
         logger.warning("⚠️ All API keys exhausted (60 RPD limit reached)")
         return None
 
+    def remaining_requests(self) -> int:
+        """전체 키의 남은 일일 요청 수 (RPD 합계)"""
+        return sum(max(0, self.max_rpd - used) for used in self.daily_usage.values())
+
     def _mark_key_used(self):
         """현재 키 사용량 증가"""
         self.daily_usage[self.current_key_index] += 1
@@ -136,48 +156,55 @@ class AutoTranslateService:
 
         return {}
 
-    @async_retry(max_attempts=3, delay=1.0, backoff=2.0)
+    async def translate(self, menu_name_ko: str, description_en: str) -> Dict[str, str]:
+        """
+        메뉴 설명 번역 (DB 미반영, 일괄 재번역 워커 등 외부 호출용)
+
+        Returns:
+            {"ja": "...", "zh": "..."} (키 소진/실패 시 빈 dict 또는 일부 누락)
+        """
+        return await self._translate_with_gemini(menu_name_ko, description_en)
+
     async def _translate_with_gemini(
         self, menu_name_ko: str, description_en: str
     ) -> Dict[str, str]:
         """
-        Google Gemini로 번역 (Multi-Key Round Robin)
+        Google Gemini로 번역 (배치 큐 경유: 동시 요청 메뉴를 묶어 1회 호출 → RPD 절약)
 
-        Retry policy:
-        - Attempt 1: immediate
-        - Attempt 2: after 1.0 seconds (다음 키로 자동 전환)
-        - Attempt 3: after 2.0 seconds (다음 키로 자동 전환)
+        Retry policy (BatchTranslator):
+        - 요청 실패 시 배치 전체, 응답 누락/불량 시 해당 항목만 재요청
+        - 1.0초부터 지수 백오프, 재시도 시 다음 키로 자동 전환
         """
+        if not self._get_next_available_key():
+            # 키 소진 시에도 번역 메모리 적중분은 반환
+            found = await translation_memory.prefetch(
+                [description_en],
+                SOURCE_LANGUAGE,
+                TARGET_LANGUAGES,
+                BATCH_PROMPT_VERSION,
+            )
+            cached = {
+                lang: found.get((description_en, lang)) for lang in TARGET_LANGUAGES
+            }
+            if all(cached.values()):
+                return cached
+            logger.error("❌ All API keys exhausted (60 RPD)")
+            return {}
 
+        return await self.translator.translate(menu_name_ko, description_en)
+
+    async def _complete_with_gemini(self, prompt: str) -> str:
+        """Gemini 배치 요청 1회 (Multi-Key Round Robin, 요청 1회 = RPD 1)"""
         # 사용 가능한 키 확인
         api_key = self._get_next_available_key()
         if not api_key:
-            logger.error("❌ All API keys exhausted (60 RPD)")
-            return {}
+            raise RuntimeError("All API keys exhausted")
 
         # google-genai SDK 패턴 (google.generativeai deprecated)
         from google import genai
 
         client = genai.Client(api_key=api_key)
 
-        prompt = f"""
-당신은 한식 요리사이자 다국어 번역가입니다.
-
-다음 한식 메뉴의 영문 설명을 일본어와 중국어(간체)로 번역해주세요.
-- 한식 문화, 재료, 맛의 특징을 자연스럽게 표현하세요
-- 각 언어권 고객이 이해할 수 있도록 설명하세요
-
-메뉴 정보:
-- 메뉴명(한글): {menu_name_ko}
-- 영문 설명: {description_en}
-
-출력 형식 (JSON만 반환, 다른 텍스트 없이):
-{{
-    "ja": "일본어 번역",
-    "zh": "중국어(간체) 번역"
-}}
-"""
-
         try:
             # Gemini API 호출 (google-genai SDK)
             response = await asyncio.to_thread(
@@ -186,24 +213,15 @@ class AutoTranslateService:
                 contents=prompt,
                 config={
                     "temperature": 0.3,
-                    "max_output_tokens": 200,
+                    "max_output_tokens": 256 * self.translator.max_batch_size,
+                    "response_mime_type": "application/json",
                 },
             )
 
-            result_text = response.text.strip()
-
-            # JSON 파싱 (마크다운 코드블록 제거)
-            if result_text.startswith("```json"):
-                result_text = result_text.split("```json")[1].split("```")[0].strip()
-            elif result_text.startswith("```"):
-                result_text = result_text.split("```")[1].split("```")[0].strip()
-
-            result = json.loads(result_text)
-
             # 성공 시 사용량 증가
             self._mark_key_used()
 
-            return {"ja": result.get("ja", ""), "zh": result.get("zh", "")}
+            return response.text
 
         except Exception as e:
             error_msg = str(e)
@@ -219,7 +237,7 @@ class AutoTranslateService:
             logger.error(
                 f"Google Gemini 번역 오류 (Key {self.current_key_index + 1}): {e}"
             )
-            raise  # Retry decorator가 처리
+            raise  # BatchTranslator가 재시도
 
 
 # 싱글톤 인스턴스 (lazy init - 모듈 import 시 즉시 실행하지 않음)
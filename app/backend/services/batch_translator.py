@@ -0,0 +1,276 @@
+"""
+Batch Translator - 다건 메뉴 번역 배치 큐 (LLM 요청 1회에 N개 메뉴)
+
+Responsibilities:
+1. translate() 호출을 큐에 모았다가 크기(max_batch_size) 또는 시간(max_wait_seconds)
+   조건으로 flush → 구조화 JSON 프롬프트 1회로 번역 (scripts/translate_deep_content.py 방식)
+2. 응답을 항목별로 검증 (ja/zh 비어 있지 않은 문자열)
+   - 통과 항목은 즉시 반환, 누락/불량 항목만 모아 재요청 (지수 백오프)
+3. LLM 호출은 주입된 complete(prompt) 코루틴이 담당 (OpenAI / Gemini 공용)
+4. 번역 메모리(services/translation_memory.py) 적중 항목은 LLM 요청에서 제외
+   - 배치 시작 시 prefetch 1회, 성공 번역은 배치 종료 시 일괄 저장
+
+요청당 오버헤드(프롬프트, RPD/RPM)를 메뉴 수가 아닌 배치 수에 비례하게 줄임
+"""
+
+import asyncio
+import json
+import logging
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from services.translation_memory import TranslationMemoryService
+
+logger = logging.getLogger(__name__)
+
+TARGET_LANGUAGES = ("ja", "zh")
+SOURCE_LANGUAGE = "en"
+# 프롬프트/검증 규칙 변경 시 올림 → 이전 번역 메모리 항목 무효화
+BATCH_PROMPT_VERSION = "menu-batch-v1"
+
+
+class BatchTranslationError(Exception):
+    """재시도 후에도 유효한 번역을 얻지 못한 항목"""
+
+    pass
+
+
+@dataclass
+class _PendingItem:
+    name_ko: str
+    description_en: str
+    future: asyncio.Future
+
+
+def build_batch_prompt(items: List[Dict[str, str]]) -> str:
+    """
+    다건 번역 프롬프트
+
+    Args:
+        items: [{"id": str, "name_ko": str, "description_en": str}, ...]
+    """
+    return f"""You are a professional translator specializing in Korean food menus.
+Translate each menu's English description into Japanese and Chinese (Simplified).
+
+Rules:
+- Use established culinary terms (e.g., キムチ, 豆腐, 冷麺) and keep cultural nuance
+- Japanese: natural, polite tone (ですます体); Chinese: Simplified Chinese (简体中文)
+- Keep each translation concise (under 50 words)
+- Return one entry per input id, ONLY valid JSON, no extra text
+
+Input menus:
+{json.dumps(items, ensure_ascii=False, indent=2)}
+
+Output format (EXACTLY this JSON structure):
+{{
+  "translations": [
+    {{"id": "<id>", "ja": "<Japanese translation>", "zh": "<Chinese translation>"}}
+  ]
+}}
+"""
+
+
+def parse_batch_response(text: str) -> Dict[str, Dict[str, str]]:
+    """
+    배치 응답 파싱 → {id: {"ja": ..., "zh": ...}} (검증 통과 항목만)
+
+    JSON 전체가 깨진 경우 빈 dict (전 항목 재시도 대상)
+    """
+    text = (text or "").strip()
+    if "```json" in text:
+        text = text.split("```json", 1)[1].split("```", 1)[0]
+    elif text.startswith("```"):
+        text = text.split("```", 2)[1]
+    start, end = text.find("{"), text.rfind("}") + 1
+    if start == -1 or end == 0:
+        return {}
+    try:
+        data = json.loads(text[start:end])
+    except json.JSONDecodeError as e:
+        logger.warning(f"Batch translation JSON parse error: {e}")
+        return {}
+
+    entries = data.get("translations") if isinstance(data, dict) else None
+    results: Dict[str, Dict[str, str]] = {}
+    for entry in entries if isinstance(entries, list) else []:
+        if not isinstance(entry, dict):
+            continue
+        values = {lang: entry.get(lang) for lang in TARGET_LANGUAGES}
+        if all(isinstance(v, str) and v.strip() for v in values.values()):
+            results[str(entry.get("id"))] = {k: v.strip() for k, v in values.items()}
+    return results
+
+
+class BatchTranslator:
+    """크기/시간 flush 배치 번역 큐 (프로세스당 LLM 공급자별 1개)"""
+
+    def __init__(
+        self,
+        complete: Callable[[str], Awaitable[str]],
+        max_batch_size: int = 8,
+        max_wait_seconds: float = 0.5,
+        max_attempts: int = 3,
+        retry_delay_seconds: float = 1.0,
+        name: str = "translator",
+        memory: Optional["TranslationMemoryService"] = None,
+    ):
+        self._complete = complete
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait_seconds = max_wait_seconds
+        self.max_attempts = max_attempts
+        self.retry_delay_seconds = retry_delay_seconds
+        self.name = name
+        self.memory = memory
+
+        self._pending: List[_PendingItem] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._batches: set = set()  # 실행 중 배치 Task (GC 방지)
+        self.stats = {
+            "requests": 0,
+            "items": 0,
+            "memory_hits": 0,
+            "translated": 0,
+            "retried_items": 0,
+            "failed_items": 0,
+        }
+
+    async def translate(self, name_ko: str, description_en: str) -> Dict[str, str]:
+        """
+        메뉴 1건 번역 (배치에 합류해 결과 대기)
+
+        Returns:
+            {"ja": str, "zh": str}
+
+        Raises:
+            BatchTranslationError: 재시도 소진
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append(_PendingItem(name_ko, description_en, future))
+        self.stats["items"] += 1
+
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait_seconds, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        """대기 항목을 max_batch_size 단위로 잘라 배치 실행"""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        while self._pending:
+            batch = self._pending[: self.max_batch_size]
+            self._pending = self._pending[self.max_batch_size :]
+            task = asyncio.create_task(self._run_batch(batch))
+            self._batches.add(task)
+            task.add_done_callback(self._batches.discard)
+
+    async def _run_batch(self, items: List[_PendingItem]) -> None:
+        items = await self._resolve_from_memory(items)
+        translated: List[Tuple[str, str, str]] = []
+        try:
+            await self._translate_items(items, translated)
+        finally:
+            if self.memory is not None and translated:
+                await self.memory.store(
+                    translated, SOURCE_LANGUAGE, BATCH_PROMPT_VERSION
+                )
+
+    async def _resolve_from_memory(
+        self, items: List[_PendingItem]
+    ) -> List[_PendingItem]:
+        """번역 메모리 적중 항목 즉시 반환 → 나머지만 LLM 대상"""
+        if self.memory is None:
+            return items
+        found = await self.memory.prefetch(
+            [item.description_en for item in items],
+            SOURCE_LANGUAGE,
+            TARGET_LANGUAGES,
+            BATCH_PROMPT_VERSION,
+        )
+        remaining = []
+        for item in items:
+            translation = {
+                lang: found.get((item.description_en, lang))
+                for lang in TARGET_LANGUAGES
+            }
+            if not all(translation.values()):
+                remaining.append(item)
+            elif not item.future.done():
+                item.future.set_result(translation)
+                self.stats["memory_hits"] += 1
+        return remaining
+
+    async def _translate_items(
+        self, items: List[_PendingItem], translated: List[Tuple[str, str, str]]
+    ) -> None:
+        error: Optional[str] = None
+        for attempt in range(1, self.max_attempts + 1):
+            # 취소된 호출 제외
+            items = [item for item in items if not item.future.done()]
+            if not items:
+                return
+
+            results: Dict[str, Dict[str, str]] = {}
+            try:
+                self.stats["requests"] += 1
+                text = await self._complete(
+                    build_batch_prompt(
+                        [
+                            {
+                                "id": str(idx),
+                                "name_ko": item.name_ko,
+                                "description_en": item.description_en,
+                            }
+                            for idx, item in enumerate(items, start=1)
+                        ]
+                    )
+                )
+                results = parse_batch_response(text)
+                error = "Missing or invalid translation in batch response"
+            except Exception as e:
+                error = str(e)
+                logger.warning(f"{self.name} batch request failed: {e}")
+
+            remaining = []
+            for idx, item in enumerate(items, start=1):
+                translation = results.get(str(idx))
+                if translation is None:
+                    remaining.append(item)
+                else:
+                    translated.extend(
+                        (item.description_en, lang, text)
+                        for lang, text in translation.items()
+                    )
+                    if not item.future.done():
+                        item.future.set_result(translation)
+                        self.stats["translated"] += 1
+
+            if not remaining:
+                return
+            items = remaining
+            if attempt < self.max_attempts:
+                self.stats["retried_items"] += len(items)
+                await asyncio.sleep(self.retry_delay_seconds * 2 ** (attempt - 1))
+
+        for item in items:
+            if not item.future.done():
+                item.future.set_exception(BatchTranslationError(error))
+                self.stats["failed_items"] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "max_batch_size": self.max_batch_size,
+            "queued": len(self._pending),
+            "running_batches": len(self._batches),
+            **self.stats,
+            "items_per_request": (
+                round(self.stats["translated"] / self.stats["requests"], 2)
+                if self.stats["requests"]
+                else 0.0
+            ),
+        }
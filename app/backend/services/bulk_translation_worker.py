@@ -0,0 +1,391 @@
+"""
+Bulk Translation Worker - 관리자 일괄 재번역 작업 처리
+
+Responsibilities:
+1. 일괄 재번역 요청 1건 = 작업 큐(Redis Streams / 로컬) 작업 1건
+   - 요청 시 대상 메뉴를 UPDATE 1회로 translation_status='pending' 전환 후 적재
+2. 워커가 pending 메뉴를 id 순 keyset 페이지로 처리
+   - 페이지 내 동시 번역 상한 (BULK_TRANSLATION_CONCURRENCY, 최소 배치 크기 → 배치 채움)
+   - Gemini 키 잔여 RPD 기준으로 페이지 크기 제한, 전 키 소진 시 paused로 중단
+     (페이지 도중 소진되면 미번역 메뉴는 pending 유지, cursor는 그 앞까지만 전진)
+   - paused 작업은 resume(job_id)로 같은 작업을 저장된 cursor부터 재적재
+     (재요청(submit)과 달리 메뉴 상태를 다시 pending으로 돌리지 않음 → 완료분 재번역 없음)
+   (번역은 AutoTranslateService → BatchTranslator + 번역 메모리 경유)
+3. 페이지마다 진행 상황 체크포인트 (cursor, processed, succeeded, failed)
+   - Redis에 저장 → 관리자 상태 API 조회, 재배정된 작업은 cursor부터 재개
+   - 장시간 작업은 페이지마다 큐 heartbeat (visibility timeout 재배정 방지)
+"""
+
+import asyncio
+import logging
+import os
+import socket
+import uuid
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from config import settings
+from models.canonical_menu import CanonicalMenu
+from services.job_queue import Job, JobQueue, LocalJobQueue, RedisStreamJobQueue
+
+logger = logging.getLogger(__name__)
+
+BULK_TRANSLATION_STREAM = "jobs:bulk_translation"
+PROGRESS_KEY_PREFIX = "translation:bulk"
+TTL_BULK_TRANSLATION_PROGRESS = 86400 * 7  # 7일
+
+STATUS_FILTERS = ("failed", "pending", "all")
+
+
+class BulkTranslationWorker:
+    """일괄 재번역 작업 워커 (프로세스당 1개, 작업은 순차 / 작업 내 메뉴는 동시 처리)"""
+
+    def __init__(
+        self,
+        concurrency: int = 0,
+        page_size: int = 50,
+        visibility_timeout_seconds: float = 300.0,
+        backend: str = "auto",
+        session_factory: Optional[async_sessionmaker] = None,
+        queue: Optional[JobQueue] = None,
+    ):
+        self.concurrency = concurrency
+        self.page_size = page_size
+        self.visibility_timeout_seconds = visibility_timeout_seconds
+        self.backend = backend
+        self._session_factory = session_factory
+        self._queue = queue
+
+        self._task: Optional[asyncio.Task] = None
+        self._progress: Dict[str, Dict[str, Any]] = {}  # Redis 미사용 시 조회용
+        self.current_job: Optional[str] = None
+
+    @property
+    def session_factory(self) -> async_sessionmaker:
+        if self._session_factory is None:
+            from database import AsyncSessionLocal
+
+            self._session_factory = AsyncSessionLocal
+        return self._session_factory
+
+    @property
+    def queue(self) -> JobQueue:
+        if self._queue is None:
+            from services.cache_service import cache_service
+
+            use_redis = self.backend == "redis" or (
+                self.backend == "auto" and cache_service.redis is not None
+            )
+            if use_redis:
+                self._queue = RedisStreamJobQueue(
+                    cache_service.redis,
+                    BULK_TRANSLATION_STREAM,
+                    visibility_timeout_seconds=self.visibility_timeout_seconds,
+                )
+            else:
+                self._queue = LocalJobQueue()
+        return self._queue
+
+    def effective_concurrency(self, batch_size: int) -> int:
+        """동시 번역 수 (배치 1개를 채울 수 있도록 최소 배치 크기)"""
+        return max(self.concurrency, batch_size)
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    # ===========================
+    # Lifecycle
+    # ===========================
+    async def start(self) -> None:
+        """워커 시작 (cache_service.connect() 이후 호출)"""
+        if self.running:
+            return
+        consumer = f"{socket.gethostname()}-{os.getpid()}"
+        self._task = asyncio.create_task(self._run(consumer))
+        logger.info(
+            f"BulkTranslationWorker started (concurrency="
+            f"{self.effective_concurrency(settings.TRANSLATION_BATCH_SIZE)}, "
+            f"queue={type(self.queue).__name__})"
+        )
+
+    async def stop(self) -> None:
+        """워커 중지 (진행 중 작업은 체크포인트부터 재배정 시 재개)"""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    # ===========================
+    # Submit / Progress
+    # ===========================
+    async def submit(self, status_filter: str) -> Dict[str, Any]:
+        """
+        대상 메뉴를 pending으로 전환 (UPDATE 1회) 후 작업 1건 적재
+
+        Returns:
+            초기 진행 상황 (job_id 포함)
+        """
+        if status_filter not in STATUS_FILTERS:
+            raise ValueError(f"Invalid status_filter: {status_filter}")
+
+        conditions = [CanonicalMenu.explanation_short.op("?")("en")]
+        if status_filter != "all":
+            conditions.append(CanonicalMenu.translation_status == status_filter)
+
+        async with self.session_factory() as session:
+            result = await session.execute(
+                update(CanonicalMenu)
+                .where(*conditions)
+                .values(translation_status="pending", translation_error=None)
+                .execution_options(synchronize_session=False)
+            )
+            await session.commit()
+
+        job_id = str(uuid.uuid4())
+        progress = {
+            "job_id": job_id,
+            "status_filter": status_filter,
+            "status": "queued" if result.rowcount else "completed",
+            "total": result.rowcount,
+            "processed": 0,
+            "succeeded": 0,
+            "failed": 0,
+            "cursor": None,
+            "error": None,
+            "created_at": datetime.utcnow().isoformat(),
+            "updated_at": datetime.utcnow().isoformat(),
+        }
+        await self._save_progress(progress)
+        if result.rowcount:
+            await self.queue.enqueue(Job(payload={"job_id": job_id}))
+        return progress
+
+    async def resume(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        paused 작업을 저장된 cursor / 진행 상황 그대로 재적재 (키 일일 한도 초기화 후)
+
+        Returns:
+            갱신된 진행 상황 (작업 없으면 None)
+
+        Raises:
+            ValueError: paused 상태가 아닌 작업
+        """
+        progress = await self.get_progress(job_id)
+        if progress is None:
+            return None
+        if progress["status"] != "paused":
+            raise ValueError(f"Job {job_id} is not paused: {progress['status']}")
+
+        progress["status"] = "queued"
+        progress["error"] = None
+        await self._save_progress(progress)
+        await self.queue.enqueue(Job(payload={"job_id": job_id}))
+        return progress
+
+    async def get_progress(self, job_id: str) -> Optional[Dict[str, Any]]:
+        from services.cache_service import cache_service
+
+        progress = await cache_service.get(f"{PROGRESS_KEY_PREFIX}:{job_id}")
+        return progress or self._progress.get(job_id)
+
+    async def _save_progress(self, progress: Dict[str, Any]) -> None:
+        from services.cache_service import cache_service
+
+        progress["updated_at"] = datetime.utcnow().isoformat()
+        self._progress[progress["job_id"]] = dict(progress)
+        await cache_service.set(
+            f"{PROGRESS_KEY_PREFIX}:{progress['job_id']}",
+            progress,
+            ttl=TTL_BULK_TRANSLATION_PROGRESS,
+        )
+
+    # ===========================
+    # Worker
+    # ===========================
+    async def _run(self, consumer: str) -> None:
+        while True:
+            try:
+                job = await self.queue.claim(consumer)
+                if job is not None:
+                    await self._handle(job, consumer)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Bulk translation worker error: {e}", exc_info=True)
+                await asyncio.sleep(1.0)
+
+    async def _handle(self, job: Job, consumer: str) -> None:
+        job_id = job.payload["job_id"]
+        progress = await self.get_progress(job_id)
+        if progress is None or progress["status"] in ("completed", "paused"):
+            await self.queue.ack(job)
+            return
+
+        self.current_job = job_id
+        progress["status"] = "running"
+        try:
+            await self.process_job(progress, job, consumer)
+        except Exception as e:
+            logger.error(f"Bulk translation job {job_id} failed: {e}", exc_info=True)
+            progress["status"] = "failed"
+            progress["error"] = str(e)[:500]
+        finally:
+            self.current_job = None
+        await self._save_progress(progress)
+        await self.queue.ack(job)
+
+    async def process_job(
+        self, progress: Dict[str, Any], job: Job, consumer: str
+    ) -> None:
+        """pending 메뉴를 cursor 이후부터 페이지 단위로 번역 (페이지마다 체크포인트)"""
+        from services.auto_translate_service import get_auto_translate_service
+
+        translator = get_auto_translate_service()
+        batch_size = translator.translator.max_batch_size
+        concurrency = self.effective_concurrency(batch_size)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        while True:
+            # 키 잔여 RPD로 처리 가능한 메뉴 수 상한
+            # (요청 1회 = 동시 처리 중인 메뉴로 채운 배치 1개)
+            budget = translator.remaining_requests() * min(concurrency, batch_size)
+            if budget <= 0:
+                self._pause(progress)
+                return
+
+            menus = await self._load_page(
+                progress["cursor"], min(self.page_size, budget)
+            )
+            if not menus:
+                progress["status"] = "completed"
+                return
+
+            async def translate(menu: Dict[str, Any]) -> Optional[Dict[str, str]]:
+                async with semaphore:
+                    try:
+                        translations = await translator.translate(
+                            menu["name_ko"], menu["description_en"]
+                        )
+                    except Exception as e:
+                        menu["error"] = str(e)[:500]
+                        translations = None
+                    if not translations and translator.remaining_requests() <= 0:
+                        menu["exhausted"] = True  # 키 소진 → 실패 아님, pending 유지
+                    return translations
+
+            results = await asyncio.gather(*(translate(menu) for menu in menus))
+            exhausted_at = next(
+                (i for i, menu in enumerate(menus) if menu.get("exhausted")), None
+            )
+            done = [
+                (menu, translations)
+                for menu, translations in zip(menus, results)
+                if not menu.get("exhausted")
+            ]
+            succeeded = (
+                await self._apply_page([m for m, _ in done], [r for _, r in done])
+                if done
+                else 0
+            )
+
+            # 소진된 첫 메뉴 앞까지만 cursor 전진 (뒤의 완료분은 pending이 아니라 재조회 안 됨)
+            if exhausted_at is None:
+                progress["cursor"] = str(menus[-1]["id"])
+            elif exhausted_at > 0:
+                progress["cursor"] = str(menus[exhausted_at - 1]["id"])
+            progress["processed"] += len(done)
+            progress["succeeded"] += succeeded
+            progress["failed"] += len(done) - succeeded
+            await self._save_progress(progress)
+            await self.queue.touch(job, consumer)
+
+            if exhausted_at is not None:
+                self._pause(progress)
+                return
+
+    @staticmethod
+    def _pause(progress: Dict[str, Any]) -> None:
+        progress["status"] = "paused"
+        progress["error"] = (
+            "All Gemini API keys exhausted; resume this job after the daily quota resets"
+        )
+
+    async def _load_page(
+        self, cursor: Optional[str], limit: int
+    ) -> List[Dict[str, Any]]:
+        query = select(
+            CanonicalMenu.id, CanonicalMenu.name_ko, CanonicalMenu.explanation_short
+        ).where(
+            CanonicalMenu.translation_status == "pending",
+            CanonicalMenu.explanation_short.op("?")("en"),
+        )
+        if cursor:
+            query = query.where(CanonicalMenu.id > uuid.UUID(cursor))
+        async with self.session_factory() as session:
+            result = await session.execute(
+                query.order_by(CanonicalMenu.id).limit(limit)
+            )
+            return [
+                {
+                    "id": menu_id,
+                    "name_ko": name_ko,
+                    "description_en": (explanation or {}).get("en", ""),
+                }
+                for menu_id, name_ko, explanation in result.all()
+            ]
+
+    async def _apply_page(
+        self, menus: List[Dict[str, Any]], results: List[Optional[Dict[str, str]]]
+    ) -> int:
+        """페이지 번역 결과 반영 (1 트랜잭션)"""
+        now = datetime.utcnow()
+        succeeded = 0
+        async with self.session_factory() as session:
+            result = await session.execute(
+                select(CanonicalMenu).where(
+                    CanonicalMenu.id.in_([menu["id"] for menu in menus])
+                )
+            )
+            rows = {row.id: row for row in result.scalars().all()}
+            for menu, translations in zip(menus, results):
+                row = rows.get(menu["id"])
+                if row is None:
+                    continue
+                row.translation_attempted_at = now
+                if translations and any(translations.values()):
+                    row.explanation_short = {
+                        **(row.explanation_short or {}),
+                        **{k: v for k, v in translations.items() if v},
+                        "en": menu["description_en"],
+                    }
+                    row.translation_status = "completed"
+                    row.translation_error = None
+                    succeeded += 1
+                else:
+                    row.translation_status = "failed"
+                    row.translation_error = menu.get(
+                        "error", "No translations returned"
+                    )
+            await session.commit()
+        return succeeded
+
+    async def get_stats(self) -> Dict[str, Any]:
+        return {
+            "running": self.running,
+            "concurrency": self.effective_concurrency(settings.TRANSLATION_BATCH_SIZE),
+            "current_job": self.current_job,
+            "queue": await self.queue.get_stats(),
+        }
+
+
+# Global instance
+bulk_translation_worker = BulkTranslationWorker(
+    concurrency=settings.BULK_TRANSLATION_CONCURRENCY,
+    page_size=settings.BULK_TRANSLATION_PAGE_SIZE,
+    visibility_timeout_seconds=settings.MENU_UPLOAD_VISIBILITY_TIMEOUT_SECONDS,
+    backend=settings.MENU_UPLOAD_QUEUE_BACKEND,
+)
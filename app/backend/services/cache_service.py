@@ -3,7 +3,7 @@ Redis Cache Service - 캐싱 관리 서비스
 """
 
 import pickle
-from typing import Any, Optional, Callable
+from typing import Any, Callable, Dict, List, Optional, Union
 from functools import wraps
 import logging
 
@@ -165,6 +165,118 @@ class CacheService:
             logger.error(f"Cache exists error for key '{key}': {e}")
             return False
 
+    async def push_capped(self, key: str, value: Any, max_len: int, ttl: int) -> bool:
+        """
+        리스트 앞에 값 추가 후 최근 max_len개만 유지 (LPUSH + LTRIM + EXPIRE)
+
+        Args:
+            key: 캐시 키
+            value: 저장할 값 (pickle)
+            max_len: 최대 보관 개수
+            ttl: Time-To-Live (초, 마지막 추가 시점 기준)
+
+        Returns:
+            성공 여부
+        """
+        if not self.enabled or not self.redis:
+            return False
+
+        try:
+            async with self.redis.pipeline(transaction=True) as pipe:
+                pipe.lpush(key, pickle.dumps(value))
+                pipe.ltrim(key, 0, max_len - 1)
+                pipe.expire(key, ttl)
+                await pipe.execute()
+            return True
+
+        except Exception as e:
+            logger.error(f"Cache push_capped error for key '{key}': {e}")
+            return False
+
+    async def get_list(self, key: str) -> List[Any]:
+        """
+        push_capped로 저장한 리스트 조회 (최신순)
+
+        Args:
+            key: 캐시 키
+
+        Returns:
+            값 목록 (없거나 오류 시 빈 리스트)
+        """
+        if not self.enabled or not self.redis:
+            return []
+
+        try:
+            values = await self.redis.lrange(key, 0, -1)
+            return [pickle.loads(value) for value in values]
+
+        except Exception as e:
+            logger.error(f"Cache get_list error for key '{key}': {e}")
+            return []
+
+    async def incr_hashes(
+        self,
+        increments: Dict[str, Dict[str, Union[int, float]]],
+        ttl: int,
+        fields: Optional[Dict[str, Dict[str, str]]] = None,
+    ) -> bool:
+        """
+        여러 해시 필드를 원자적으로 증가 (HINCRBY / HINCRBYFLOAT, 1회 왕복)
+
+        Args:
+            increments: {hash_key: {field: 증가량}} (int → HINCRBY, float → HINCRBYFLOAT)
+            ttl: Time-To-Live (초, 마지막 갱신 시점 기준)
+            fields: {hash_key: {field: value}} 덮어쓸 필드 (HSET)
+
+        Returns:
+            성공 여부
+        """
+        if not self.enabled or not self.redis:
+            return False
+
+        try:
+            async with self.redis.pipeline(transaction=True) as pipe:
+                for key, values in increments.items():
+                    for field, amount in values.items():
+                        if isinstance(amount, float):
+                            pipe.hincrbyfloat(key, field, amount)
+                        else:
+                            pipe.hincrby(key, field, amount)
+                for key, mapping in (fields or {}).items():
+                    pipe.hset(key, mapping=mapping)
+                for key in set(increments) | set(fields or {}):
+                    pipe.expire(key, ttl)
+                await pipe.execute()
+            return True
+
+        except Exception as e:
+            logger.error(f"Cache incr_hashes error: {e}")
+            return False
+
+    async def get_hashes(self, *keys: str) -> List[Dict[str, str]]:
+        """
+        incr_hashes로 저장한 해시 조회 (HGETALL, 1회 왕복)
+
+        Returns:
+            키 순서대로 {field: value} (문자열, 없거나 오류 시 빈 dict)
+        """
+        if not self.enabled or not self.redis:
+            return [{} for _ in keys]
+
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for key in keys:
+                    pipe.hgetall(key)
+                results = await pipe.execute()
+            return [
+                {field.decode(): value.decode() for field, value in result.items()}
+                for result in results
+            ]
+
+        except Exception as e:
+            logger.error(f"Cache get_hashes error: {e}")
+            return [{} for _ in keys]
+
     def cache_key(self, *parts) -> str:
         """
         캐시 키 생성
@@ -238,7 +350,11 @@ def cached(
 
 # TTL Constants (초)
 TTL_ADMIN_STATS = 300  # 5분
+TTL_ADMIN_QUEUE_COUNT = 60  # 1분 (큐 전체 건수)
 TTL_MENU_TRANSLATION = 86400  # 24시간
 TTL_RESTAURANT_INFO = 3600  # 1시간
 TTL_QR_CODE = 7200  # 2시간
 TTL_NUTRITION = 7776000  # 90일 (영양정보)
+TTL_OCR_RESULT = 2592000  # 30일 (이미지 내용 해시 기반 OCR 결과)
+TTL_OCR_PHASH_INDEX = 86400  # 1일 (근사 중복 탐지용 최근 이미지 해시)
+TTL_OCR_HARD_SHOP = 86400  # 1일 (Tier 1 폴백이 발생한 매장 → 다음 이미지 병렬 실행)
@@ -0,0 +1,172 @@
+"""
+CLOVA OCR Client - 비동기 httpx 기반 공유 클라이언트
+
+Responsibilities:
+1. 프로세스 공유 커넥션 풀 (keep-alive, TLS 재사용)
+2. connect/read 타임아웃 분리
+3. 429/5xx/네트워크 오류 재시도 (지수 백오프 + full jitter)
+4. 동시 호출 상한 (Semaphore) - CLOVA 요금제 TPS 초과 방지
+
+OCRService(레거시 /menu/recognize)와 OcrProviderClova(Tier 2)가 함께 사용
+"""
+
+import asyncio
+import base64
+import logging
+import uuid
+from typing import Dict, Optional
+
+import httpx
+
+from config import settings
+from utils.retry import async_retry
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CLOVA_API_URL = "https://kko5u71wza.apigw.ntruss.com/custom/v1/33367/0ef5b16de3cdd8fb766e13f6a67a0aeb4b5a2c3c9e5a5b0dd79a1d58fe6e5cf6/general"
+
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+
+class ClovaRetryableError(Exception):
+    """재시도 가능한 CLOVA 응답 (429 / 5xx)"""
+
+    pass
+
+
+class ClovaOcrClient:
+    """CLOVA OCR V2 비동기 클라이언트 (프로세스당 1개)"""
+
+    def __init__(
+        self,
+        api_url: str = DEFAULT_CLOVA_API_URL,
+        secret: str = "",
+        timeout_seconds: float = 30.0,
+        connect_timeout_seconds: float = 5.0,
+        max_retries: int = 3,
+        max_concurrency: int = 8,
+    ):
+        self.api_url = api_url
+        self.secret = secret
+        self.timeout = httpx.Timeout(timeout_seconds, connect=connect_timeout_seconds)
+        self.max_retries = max_retries
+        self.max_concurrency = max_concurrency
+
+        self._client: Optional[httpx.AsyncClient] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None  # Lazy initialization
+
+        # 재시도 정책은 인스턴스 설정을 따름
+        self._post = async_retry(
+            max_attempts=max_retries,
+            delay=0.5,
+            backoff=2.0,
+            exceptions=(ClovaRetryableError, httpx.TransportError),
+            jitter=True,
+        )(self._post_once)
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_connections=self.max_concurrency,
+                    max_keepalive_connections=self.max_concurrency,
+                ),
+            )
+        return self._client
+
+    async def aclose(self):
+        """커넥션 풀 종료 (앱 shutdown 시)"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def recognize(self, image_data: bytes, image_format: str = "jpg") -> Dict:
+        """
+        이미지 바이트 → CLOVA OCR 텍스트
+
+        Returns:
+            {
+                "success": bool,
+                "text": str (combined text from all fields),
+                "confidence": float,
+                "raw_response": dict,
+                "error": str (if failed)
+            }
+        """
+        if not self.secret:
+            return {"success": False, "error": "CLOVA_OCR_SECRET not configured"}
+
+        request_json = {
+            "version": "V2",
+            "requestId": str(uuid.uuid4()),
+            "timestamp": 0,
+            "images": [
+                {
+                    "format": image_format,
+                    "name": "menu_image",
+                    "data": base64.b64encode(image_data).decode("utf-8"),
+                }
+            ],
+        }
+
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        try:
+            async with self._semaphore:
+                response = await self._post(request_json)
+        except ClovaRetryableError as e:
+            return {"success": False, "error": f"CLOVA OCR API error: {e}"}
+        except httpx.HTTPError as e:
+            return {"success": False, "error": f"CLOVA OCR error: {str(e)}"}
+
+        if response.status_code != 200:
+            return {
+                "success": False,
+                "error": f"CLOVA OCR API error: {response.status_code} {response.text}",
+            }
+
+        return self._extract_text(response.json())
+
+    async def _post_once(self, request_json: dict) -> httpx.Response:
+        response = await self.client.post(
+            self.api_url,
+            headers={"X-OCR-SECRET": self.secret},
+            json=request_json,
+        )
+        if response.status_code in RETRYABLE_STATUS:
+            raise ClovaRetryableError(f"{response.status_code} {response.text[:200]}")
+        return response
+
+    @staticmethod
+    def _extract_text(result: dict) -> Dict:
+        """OCR 필드 텍스트 결합 + 평균 신뢰도"""
+        text_lines = []
+        total_confidence = 0.0
+        field_count = 0
+
+        for image in result.get("images", []):
+            for field in image.get("fields", []):
+                text_lines.append(field.get("inferText", ""))
+                total_confidence += field.get("inferConfidence", 0.0)
+                field_count += 1
+
+        return {
+            "success": True,
+            "text": "\n".join(text_lines),
+            "confidence": total_confidence / field_count if field_count > 0 else 0.0,
+            "raw_response": result,
+        }
+
+
+# Global instance
+clova_client = ClovaOcrClient(
+    api_url=settings.CLOVA_OCR_API_URL or DEFAULT_CLOVA_API_URL,
+    secret=settings.CLOVA_OCR_SECRET,
+    timeout_seconds=settings.CLOVA_OCR_TIMEOUT_SECONDS,
+    connect_timeout_seconds=settings.CLOVA_OCR_CONNECT_TIMEOUT_SECONDS,
+    max_retries=settings.CLOVA_OCR_MAX_RETRIES,
+    max_concurrency=settings.CLOVA_OCR_MAX_CONCURRENCY,
+)
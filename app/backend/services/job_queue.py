@@ -0,0 +1,227 @@
+"""
+Job Queue - 백그라운드 작업 큐 (Redis Streams / 로컬 대체 구현)
+
+Responsibilities:
+1. RedisStreamJobQueue: Redis Streams + consumer group 기반 영속 큐
+   - XADD로 적재 (다건은 파이프라인 1회 왕복), XREADGROUP으로 워커 간 분배,
+     처리 완료 시 XACK + XDEL
+   - 처리 중 워커가 죽은 작업은 visibility timeout 후 XAUTOCLAIM으로 재배정
+   - 장시간 작업은 touch()로 heartbeat (XCLAIM 자기 재할당)
+2. LocalJobQueue: 프로세스 메모리 큐 (테스트 / Redis 미사용 환경)
+3. 재시도는 attempt를 증가시켜 다시 적재 (처리 로직은 멱등이어야 함)
+"""
+
+import asyncio
+import json
+import logging
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Job:
+    """큐 작업 (payload는 JSON 직렬화 가능한 dict)"""
+
+    payload: Dict[str, Any]
+    attempt: int = 1
+    not_before: float = 0.0  # 재시도 백오프 (epoch seconds)
+    id: Optional[str] = field(default=None, compare=False)
+
+    def encode(self) -> Dict[str, str]:
+        return {
+            "payload": json.dumps(self.payload, ensure_ascii=False),
+            "attempt": str(self.attempt),
+            "not_before": str(self.not_before),
+        }
+
+    @classmethod
+    def decode(cls, job_id: str, fields: Dict[Any, Any]) -> "Job":
+        values = {
+            (k.decode() if isinstance(k, bytes) else k): (
+                v.decode() if isinstance(v, bytes) else v
+            )
+            for k, v in fields.items()
+        }
+        return cls(
+            payload=json.loads(values["payload"]),
+            attempt=int(values.get("attempt", 1)),
+            not_before=float(values.get("not_before", 0)),
+            id=job_id,
+        )
+
+
+class JobQueue(ABC):
+    """작업 큐 인터페이스"""
+
+    @abstractmethod
+    async def enqueue(self, job: Job) -> None:
+        pass
+
+    async def enqueue_many(self, jobs: List[Job]) -> None:
+        """다건 적재 (기본: 1건씩)"""
+        for job in jobs:
+            await self.enqueue(job)
+
+    @abstractmethod
+    async def claim(self, consumer: str, block_ms: int = 1000) -> Optional[Job]:
+        """작업 1건 할당 (없으면 block_ms 대기 후 None)"""
+        pass
+
+    @abstractmethod
+    async def ack(self, job: Job) -> None:
+        """처리 완료 (재배정 대상에서 제거)"""
+        pass
+
+    async def retry(self, job: Job, delay_seconds: float) -> None:
+        """attempt 증가 후 재적재 + 원래 작업 완료 처리"""
+        await self.enqueue(
+            Job(
+                payload=job.payload,
+                attempt=job.attempt + 1,
+                not_before=time.time() + delay_seconds,
+            )
+        )
+        await self.ack(job)
+
+    async def touch(self, job: Job, consumer: str) -> None:
+        """장시간 작업 heartbeat (visibility timeout 재시작, 재배정 방지)"""
+        pass
+
+    async def get_stats(self) -> Dict[str, Any]:
+        return {}
+
+
+class LocalJobQueue(JobQueue):
+    """프로세스 메모리 큐 (영속성 없음, 테스트 / Redis 미사용 환경)"""
+
+    def __init__(self):
+        self._queue: Optional[asyncio.Queue] = None  # Lazy initialization
+        self._next_id = 0
+        self.in_progress: Dict[str, Job] = {}
+
+    @property
+    def queue(self) -> asyncio.Queue:
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+        return self._queue
+
+    async def enqueue(self, job: Job) -> None:
+        self._next_id += 1
+        job.id = str(self._next_id)
+        await self.queue.put(job)
+
+    async def claim(self, consumer: str, block_ms: int = 1000) -> Optional[Job]:
+        try:
+            job = await asyncio.wait_for(self.queue.get(), timeout=block_ms / 1000)
+        except asyncio.TimeoutError:
+            return None
+        self.in_progress[job.id] = job
+        return job
+
+    async def ack(self, job: Job) -> None:
+        self.in_progress.pop(job.id, None)
+
+    async def get_stats(self) -> Dict[str, Any]:
+        return {
+            "backend": "local",
+            "queued": self.queue.qsize(),
+            "in_progress": len(self.in_progress),
+        }
+
+
+class RedisStreamJobQueue(JobQueue):
+    """Redis Streams 영속 큐 (워커 프로세스 간 공유)"""
+
+    def __init__(
+        self,
+        redis,
+        stream: str,
+        group: str = "workers",
+        visibility_timeout_seconds: float = 300.0,
+    ):
+        self.redis = redis
+        self.stream = stream
+        self.group = group
+        self.visibility_timeout_ms = int(visibility_timeout_seconds * 1000)
+        self._group_ready = False
+
+    async def _ensure_group(self) -> None:
+        if self._group_ready:
+            return
+        try:
+            await self.redis.xgroup_create(
+                self.stream, self.group, id="0", mkstream=True
+            )
+        except Exception as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+        self._group_ready = True
+
+    async def enqueue(self, job: Job) -> None:
+        await self._ensure_group()
+        job.id = (await self.redis.xadd(self.stream, job.encode())).decode()
+
+    async def enqueue_many(self, jobs: List[Job], chunk_size: int = 500) -> None:
+        """XADD 파이프라인 (chunk_size건당 왕복 1회)"""
+        await self._ensure_group()
+        for start in range(0, len(jobs), chunk_size):
+            chunk = jobs[start : start + chunk_size]
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for job in chunk:
+                    pipe.xadd(self.stream, job.encode())
+                job_ids = await pipe.execute()
+            for job, job_id in zip(chunk, job_ids):
+                job.id = job_id.decode()
+
+    async def claim(self, consumer: str, block_ms: int = 1000) -> Optional[Job]:
+        await self._ensure_group()
+
+        # 1. 죽은 워커가 잡고 있던 작업 회수
+        _, reclaimed, *_ = await self.redis.xautoclaim(
+            self.stream,
+            self.group,
+            consumer,
+            min_idle_time=self.visibility_timeout_ms,
+            count=1,
+        )
+        entries = reclaimed
+        if not entries:
+            # 2. 새 작업
+            response = await self.redis.xreadgroup(
+                self.group, consumer, {self.stream: ">"}, count=1, block=block_ms
+            )
+            entries = response[0][1] if response else []
+
+        for job_id, fields in entries:
+            if fields:  # XDEL된 항목은 fields가 비어 있음
+                return Job.decode(job_id.decode(), fields)
+            await self.redis.xack(self.stream, self.group, job_id)
+        return None
+
+    async def touch(self, job: Job, consumer: str) -> None:
+        # 같은 consumer로 XCLAIM → idle time 0으로 초기화
+        await self.redis.xclaim(
+            self.stream, self.group, consumer, 0, [job.id], justid=True
+        )
+
+    async def ack(self, job: Job) -> None:
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.xack(self.stream, self.group, job.id)
+            pipe.xdel(self.stream, job.id)
+            await pipe.execute()
+
+    async def get_stats(self) -> Dict[str, Any]:
+        try:
+            pending = await self.redis.xpending(self.stream, self.group)
+            return {
+                "backend": "redis",
+                "stream": self.stream,
+                "queued": await self.redis.xlen(self.stream) - pending["pending"],
+                "in_progress": pending["pending"],
+            }
+        except Exception as e:
+            return {"backend": "redis", "stream": self.stream, "error": str(e)}
@@ -8,8 +8,9 @@ Step 3: AI Discovery (GPT-4o fallback)
 from typing import Dict, List, Optional, Any
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
-from models import CanonicalMenu, Modifier
+from models import CanonicalMenu
 from services.cache_service import cache_service, TTL_MENU_TRANSLATION
+from services.modifier_dictionary import modifier_dictionary
 from openai import OpenAI
 import asyncio
 import json
@@ -270,22 +271,14 @@ class MenuMatchingEngine:
                         continue
 
                     # 나머지 부분이 modifier인지 확인
-                    result_mod = await self.db.execute(select(Modifier))
-                    all_mods = result_mod.scalars().all()
+                    modifiers = await modifier_dictionary.get(self.db)
 
                     found_modifiers = []
                     temp_remaining = remaining_text
 
-                    for mod in all_mods:
+                    for mod in modifiers.find_all(remaining_text):
                         if mod.text_ko in temp_remaining:
-                            found_modifiers.append(
-                                {
-                                    "text_ko": mod.text_ko,
-                                    "type": mod.type,
-                                    "translation_en": mod.translation_en,
-                                    "semantic_key": mod.semantic_key,
-                                }
-                            )
+                            found_modifiers.append(mod.to_dict())
                             temp_remaining = temp_remaining.replace(
                                 mod.text_ko, "", 1
                             ).strip()
@@ -304,41 +297,15 @@ class MenuMatchingEngine:
                             ai_called=False,
                         )
 
-        # 2-1. 모든 수식어 조회 (기존 알고리즘 폴백)
-        result = await self.db.execute(select(Modifier))
-        all_modifiers = result.scalars().all()
-
-        # 2-1-1. 타입별 우선순위 정의 (숫자가 낮을수록 높은 우선순위)
-        # emotion/cooking/grade/origin: 메뉴 외부 수식어 (브랜드, 감성) - 최우선
-        # ingredient: 재료 강조 - cooking 다음 (한우불고기, 해물짬뽕 등)
-        # taste/size: 메뉴 내부 속성 - 그 다음
-        type_priority = {
-            "emotion": 1,  # 최우선 (원조, 할매 등)
-            "cooking": 2,
-            "ingredient": 3,  # cooking 다음 (한우, 해물 등)
-            "grade": 4,
-            "origin": 5,
-            "taste": 6,
-            "size": 7,
-        }
-
-        # 2-1-2. 타입 우선순위 → 길이 순 → priority 순으로 정렬
-        all_modifiers = sorted(
-            all_modifiers,
-            key=lambda m: (
-                type_priority.get(m.type, 50),  # 타입 우선순위
-                -len(m.text_ko),  # 길이 (긴 것부터, 그래서 음수)
-                -m.priority,  # priority (높은 것부터, 그래서 음수)
-            ),
-        )
+        # 2-1. 수식어 사전 조회 (기존 알고리즘 폴백)
+        # 사전은 타입 우선순위 → 길이 순 → priority 순으로 미리 정렬되어 있음
+        # (services/modifier_dictionary.py TYPE_PRIORITY)
+        modifiers = await modifier_dictionary.get(self.db)
 
-        # 2-2. 메뉴명에서 발견 가능한 수식어 목록 추출
+        # 2-2. 메뉴명에서 발견 가능한 수식어 목록 추출 (trie 탐색)
         # 모든 타입의 수식어를 포함 (ingredient 포함)
         # 이유: "한우불고기" = "한우"(ingredient) + "불고기"(canonical)와 같은 경우를 처리하기 위함
-        potential_modifiers = []
-        for modifier in all_modifiers:
-            if modifier.text_ko in working_name:
-                potential_modifiers.append(modifier)
+        potential_modifiers = modifiers.find_all(working_name)
 
         # 수식어가 하나도 없으면 실패
         if not potential_modifiers:
@@ -363,14 +330,7 @@ class MenuMatchingEngine:
                 continue
 
             # 이 수식어를 누적 목록에 추가
-            found_modifiers.append(
-                {
-                    "text_ko": modifier.text_ko,
-                    "type": modifier.type,
-                    "translation_en": modifier.translation_en,
-                    "semantic_key": modifier.semantic_key,
-                }
-            )
+            found_modifiers.append(modifier.to_dict())
             remaining_text = new_remaining
 
             # 매번 canonical 매칭 시도
@@ -451,24 +411,15 @@ class MenuMatchingEngine:
                 ai_called=False,  # 캐시에서 가져왔으므로 False
             )
 
-        # 먼저 수식어 추출 시도
-        result = await self.db.execute(
-            select(Modifier).order_by(func.length(Modifier.text_ko).desc())
-        )
-        modifiers = result.scalars().all()
+        # 먼저 수식어 추출 시도 (긴 수식어부터)
+        modifiers = await modifier_dictionary.get(self.db)
 
         found_modifiers = []
         remaining_text = menu_name
 
-        for modifier in modifiers:
+        for modifier in modifiers.find_all(menu_name, by_length=True):
             if modifier.text_ko in remaining_text:
-                found_modifiers.append(
-                    {
-                        "text_ko": modifier.text_ko,
-                        "type": modifier.type,
-                        "translation_en": modifier.translation_en,
-                    }
-                )
+                found_modifiers.append(modifier.to_dict(include_semantic_key=False))
                 remaining_text = remaining_text.replace(modifier.text_ko, "", 1)
 
         # OpenAI API 호출 (환경변수 확인)
@@ -0,0 +1,408 @@
+"""
+Menu Image Upload Processor - B2B 메뉴 이미지 벌크 업로드 백그라운드 처리
+
+Responsibilities:
+1. 업로드 이미지를 스풀 디렉터리에 저장 후 즉시 반환 (HTTP 요청은 OCR 대기 없음)
+2. 백그라운드에서 이미지별 검증 → OCR (Tier Router) → ScanLog 적재
+   - 프로세스 전체 동시 처리 상한 (Semaphore) → 처리량이 동시성 설정에 비례
+   - 이미지 바이트는 처리 직전에만 메모리로 로드 (대량 업로드 RSS 제한)
+3. MenuUploadTask 진행 상황 (successful / failed / error_log) 이미지 단위 갱신
+   - 처리 끝난 이미지는 스풀에서 즉시 삭제 → 재개 시 남은 이미지만 처리
+4. shutdown 시 미완료 작업은 상태(pending/processing)와 스풀을 그대로 두고 잠금만 해제
+   → 다음 기동 시 start()가 남은 이미지부터 재개 (접수된 업로드 유실 없음)
+5. 시작 시 복구 (start): shutdown / 크래시로 남은 pending/processing 작업
+   - 스풀 디렉터리가 남아 있으면 재제출, 없으면 failed 기록
+   - 작업 행이 없거나 끝난 스풀 디렉터리는 삭제
+   - 처리 중인 작업은 스풀 디렉터리 잠금 (.lock) 보유 → 다른 워커 프로세스는 건드리지 않음
+"""
+
+import asyncio
+import json
+import logging
+import re
+import shutil
+import uuid
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import IO, Any, Dict, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows 개발 환경: 단일 프로세스 가정, 잠금 생략
+    fcntl = None
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from config import settings
+from models.menu_upload import MenuUploadTask, UploadStatus
+from services.ocr_orchestrator import ocr_orchestrator
+from services.scan_log_writer import scan_log_writer
+from utils.image_validation import ImageValidationError, validate_image
+
+logger = logging.getLogger(__name__)
+
+_UNSAFE_FILENAME = re.compile(r"[^\w.\-가-힣]")
+_LOCK_FILE = ".lock"
+# 생성 직후 작업은 복구 대상에서 제외 (다른 워커가 아직 스풀 저장 중일 수 있음)
+RECOVERY_GRACE_SECONDS = 60
+
+
+class MenuImageUploadProcessor:
+    """이미지 벌크 업로드 백그라운드 처리기 (프로세스당 1개)"""
+
+    def __init__(
+        self,
+        session_factory: Optional[async_sessionmaker] = None,
+        concurrency: int = 4,
+        spool_dir: str = "data/menu_image_uploads",
+    ):
+        self._session_factory = session_factory
+        self.concurrency = concurrency
+        self.spool_dir = Path(spool_dir)
+
+        self._semaphore: Optional[asyncio.Semaphore] = None  # Lazy initialization
+        self._tasks: Dict[uuid.UUID, asyncio.Task] = {}
+        self._locks: Dict[uuid.UUID, asyncio.Lock] = {}
+        self._dir_locks: Dict[uuid.UUID, IO[str]] = {}  # 처리 중 스풀 디렉터리 잠금
+        self.in_flight = 0
+        self.stats = {
+            "tasks": 0,
+            "images": 0,
+            "succeeded": 0,
+            "failed": 0,
+            "recovered": 0,
+        }
+
+    @property
+    def session_factory(self) -> async_sessionmaker:
+        if self._session_factory is None:
+            from database import AsyncSessionLocal
+
+            self._session_factory = AsyncSessionLocal
+        return self._session_factory
+
+    # ===========================
+    # Submit
+    # ===========================
+    async def submit(
+        self, task_id: uuid.UUID, restaurant_id: str, files: List[Tuple[str, bytes]]
+    ) -> None:
+        """
+        이미지 스풀 저장 + 백그라운드 처리 시작
+
+        Args:
+            task_id: MenuUploadTask ID (status=pending으로 커밋된 상태)
+            restaurant_id: 식당 UUID
+            files: [(file_name, content), ...]
+        """
+        self._dir_locks[task_id] = await asyncio.to_thread(self._spool, task_id, files)
+        self.stats["tasks"] += 1
+        self._start_task(task_id, restaurant_id)
+
+    def _start_task(self, task_id: uuid.UUID, restaurant_id: str) -> None:
+        self._locks[task_id] = asyncio.Lock()
+        self._tasks[task_id] = asyncio.create_task(
+            self._run_task(task_id, restaurant_id)
+        )
+
+    def _task_dir(self, task_id: uuid.UUID) -> Path:
+        return self.spool_dir / str(task_id)
+
+    @staticmethod
+    def _lock_dir(task_dir: Path) -> Optional[IO[str]]:
+        """스풀 디렉터리 잠금 (non-blocking) → 잠긴 파일 또는 None (다른 프로세스 보유)"""
+        try:
+            lock_file = open(task_dir / _LOCK_FILE, "a")
+        except FileNotFoundError:
+            return None  # 그 사이 정리됨
+        if fcntl is not None:
+            try:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                lock_file.close()
+                return None
+        return lock_file
+
+    def _spool(self, task_id: uuid.UUID, files: List[Tuple[str, bytes]]) -> IO[str]:
+        """이미지 저장 (잠금 먼저 → 저장 중 다른 워커의 복구 대상에서 제외)"""
+        task_dir = self._task_dir(task_id)
+        task_dir.mkdir(parents=True, exist_ok=True)
+        lock_file = self._lock_dir(task_dir)
+        for idx, (file_name, content) in enumerate(files):
+            safe_name = _UNSAFE_FILENAME.sub("_", file_name or "image")
+            (task_dir / f"{idx:04d}_{safe_name}").write_bytes(content)
+        return lock_file
+
+    # ===========================
+    # Processing
+    # ===========================
+    async def _run_task(self, task_id: uuid.UUID, restaurant_id: str) -> None:
+        task_dir = self._task_dir(task_id)
+        interrupted = False
+        try:
+            await self._update_task(
+                task_id,
+                status=UploadStatus.processing.value,
+                started_at=datetime.now(timezone.utc),
+            )
+            paths = sorted(
+                path for path in task_dir.iterdir() if path.name != _LOCK_FILE
+            )
+            await asyncio.gather(
+                *(self._process_file(task_id, restaurant_id, path) for path in paths)
+            )
+            await self._update_task(
+                task_id,
+                status=UploadStatus.completed.value,
+                completed_at=datetime.now(timezone.utc),
+            )
+        except asyncio.CancelledError:
+            # shutdown: 이미 202로 접수한 업로드 → 상태/스풀 유지, 다음 기동 시 start()가 재개
+            interrupted = True
+            raise
+        except Exception as e:
+            logger.error(f"Image upload task {task_id} failed: {e}", exc_info=True)
+            await self._update_task(
+                task_id,
+                status=UploadStatus.failed.value,
+                completed_at=datetime.now(timezone.utc),
+                error={"error": str(e)},
+            )
+        finally:
+            if not interrupted:
+                await asyncio.to_thread(shutil.rmtree, task_dir, True)
+            lock_file = self._dir_locks.pop(task_id, None)
+            if lock_file is not None:
+                lock_file.close()
+            self._tasks.pop(task_id, None)
+            self._locks.pop(task_id, None)
+
+    async def _process_file(
+        self, task_id: uuid.UUID, restaurant_id: str, path: Path
+    ) -> None:
+        file_name = path.name.split("_", 1)[1]
+
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+
+        async with self._semaphore:
+            self.in_flight += 1
+            try:
+                content = await asyncio.to_thread(path.read_bytes)
+                result = await self.process_image(
+                    task_id, restaurant_id, file_name, content
+                )
+            except Exception as e:
+                logger.error(f"Error processing {file_name}: {e}", exc_info=True)
+                result = {"file": file_name, "status": "failed", "error": str(e)}
+            finally:
+                self.in_flight -= 1
+
+        self.stats["images"] += 1
+        if result["status"] == "success":
+            self.stats["succeeded"] += 1
+            await self._update_task(task_id, successful=1)
+        else:
+            self.stats["failed"] += 1
+            await self._update_task(task_id, failed=1, error=result)
+        # 집계 반영 후 삭제 → 복구 재개 시 이중 집계 없음
+        path.unlink(missing_ok=True)
+
+    async def process_image(
+        self, task_id: uuid.UUID, restaurant_id: str, file_name: str, content: bytes
+    ) -> Dict[str, Any]:
+        """
+        이미지 1장 처리: 검증 → OCR (Tier Router) → ScanLog 적재
+
+        Returns:
+            {"file": str, "status": "success" | "failed", ...}
+        """
+        try:
+            validate_image(content)
+        except ImageValidationError as e:
+            return {
+                "file": file_name,
+                "status": "failed",
+                "error": f"Invalid image: {str(e)}",
+            }
+
+        ocr_result = await ocr_orchestrator.extract_menu(
+            image_data=content,
+            enable_preprocessing=True,
+            use_cache=True,  # 캐싱 활성화
+            shop_id=restaurant_id,  # 같은 매장 근사 중복 사진 재사용
+        )
+
+        if not (ocr_result.success and ocr_result.menu_items):
+            return {
+                "file": file_name,
+                "status": "failed",
+                "error": f"OCR failed: {ocr_result.raw_text or 'Unknown error'}",
+            }
+
+        provider = ocr_result.provider.value if ocr_result.provider else None
+        # 각 메뉴 아이템을 ScanLog write-behind 버퍼에 추가
+        for item in ocr_result.menu_items:
+            await scan_log_writer.enqueue(
+                session_id=f"b2b_upload_{task_id}",
+                language="ko",
+                menu_name_ko=item.name_ko,
+                ocr_raw_text=ocr_result.raw_text,
+                confidence=ocr_result.confidence,
+                shop_id=uuid.UUID(restaurant_id),
+                status="pending",
+                evidences={
+                    "source": "b2b_bulk_upload",
+                    "file_name": file_name,
+                    "price": item.price,
+                    "ocr_provider": provider,
+                    "fallback_triggered": ocr_result.triggered_fallback,
+                    "fallback_reason": ocr_result.fallback_reason,
+                },
+            )
+
+        return {
+            "file": file_name,
+            "status": "success",
+            "provider": provider,
+            "menu_count": len(ocr_result.menu_items),
+            "confidence": float(ocr_result.confidence),
+            "fallback_triggered": ocr_result.triggered_fallback,
+            "processing_time_ms": ocr_result.processing_time_ms,
+        }
+
+    async def _update_task(
+        self,
+        task_id: uuid.UUID,
+        successful: int = 0,
+        failed: int = 0,
+        error: Optional[Dict[str, Any]] = None,
+        **fields,
+    ) -> None:
+        """
+        MenuUploadTask 진행 상황 갱신
+
+        작업은 이 프로세스만 갱신하므로 작업별 Lock으로 직렬화한 read-modify-write
+        """
+        lock = self._locks.get(task_id) or asyncio.Lock()
+        async with lock:
+            try:
+                async with self.session_factory() as session:
+                    result = await session.execute(
+                        select(MenuUploadTask).where(MenuUploadTask.id == task_id)
+                    )
+                    task = result.scalar_one_or_none()
+                    if task is None:
+                        return
+                    task.successful = (task.successful or 0) + successful
+                    task.failed = (task.failed or 0) + failed
+                    if error is not None:
+                        errors = json.loads(task.error_log) if task.error_log else []
+                        errors.append(error)
+                        task.error_log = json.dumps(errors, ensure_ascii=False)
+                    for name, value in fields.items():
+                        setattr(task, name, value)
+                    await session.commit()
+            except Exception as e:
+                logger.error(f"Failed to update upload task {task_id}: {e}")
+
+    # ===========================
+    # Lifecycle / Metrics
+    # ===========================
+    async def start(self) -> int:
+        """
+        크래시/재시작으로 남은 작업 복구 (앱 startup 시)
+
+        Returns:
+            재제출한 작업 수
+        """
+        cutoff = datetime.now(timezone.utc) - timedelta(seconds=RECOVERY_GRACE_SECONDS)
+        async with self.session_factory() as session:
+            result = await session.execute(
+                select(
+                    MenuUploadTask.id,
+                    MenuUploadTask.restaurant_id,
+                    MenuUploadTask.created_at,
+                ).where(
+                    MenuUploadTask.status.in_(
+                        [UploadStatus.pending.value, UploadStatus.processing.value]
+                    )
+                )
+            )
+            unfinished = result.all()
+
+        recovered = 0
+        active_dirs = set()
+        for task_id, restaurant_id, created_at in unfinished:
+            task_dir = self._task_dir(task_id)
+            active_dirs.add(task_dir.name)
+            if task_id in self._tasks:
+                continue
+            if created_at is not None and created_at.tzinfo is None:
+                created_at = created_at.replace(tzinfo=timezone.utc)
+            if created_at is not None and created_at > cutoff:
+                continue  # 다른 워커가 방금 접수한 작업
+
+            if not task_dir.is_dir():
+                await self._update_task(
+                    task_id,
+                    status=UploadStatus.failed.value,
+                    completed_at=datetime.now(timezone.utc),
+                    error={"error": "Interrupted by server restart; images were lost"},
+                )
+                continue
+
+            lock_file = self._lock_dir(task_dir)
+            if lock_file is None:
+                continue  # 다른 워커 프로세스가 처리 중
+            self._dir_locks[task_id] = lock_file
+            self._start_task(task_id, str(restaurant_id))
+            recovered += 1
+
+        removed = await asyncio.to_thread(self._remove_orphaned_dirs, active_dirs)
+        self.stats["recovered"] += recovered
+        if recovered or removed:
+            logger.info(
+                f"Image upload recovery: {recovered} tasks resubmitted, "
+                f"{removed} orphaned spool dirs removed"
+            )
+        return recovered
+
+    def _remove_orphaned_dirs(self, active_dirs: set) -> int:
+        """미완료 작업이 없는 스풀 디렉터리 삭제 (다른 프로세스가 잠근 디렉터리 제외)"""
+        if not self.spool_dir.is_dir():
+            return 0
+        removed = 0
+        for task_dir in self.spool_dir.iterdir():
+            if not task_dir.is_dir() or task_dir.name in active_dirs:
+                continue
+            lock_file = self._lock_dir(task_dir)
+            if lock_file is None:
+                continue
+            with lock_file:
+                shutil.rmtree(task_dir, ignore_errors=True)
+            removed += 1
+        return removed
+
+    async def stop(self) -> None:
+        """진행 중 작업 취소 (앱 shutdown 시, 스풀은 남겨 다음 기동 시 재개)"""
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "concurrency": self.concurrency,
+            "active_tasks": len(self._tasks),
+            "in_flight": self.in_flight,
+            **self.stats,
+        }
+
+
+# Global instance
+menu_image_processor = MenuImageUploadProcessor(
+    concurrency=settings.B2B_IMAGE_UPLOAD_CONCURRENCY,
+    spool_dir=settings.B2B_IMAGE_UPLOAD_SPOOL_DIR,
+)
@@ -1,16 +1,22 @@
 """
 Menu Upload Service - B2B 메뉴 일괄 업로드 처리
+
+요청 경로: 파싱/검증 → 중복 일괄 분류 → Task/Menu/Detail 일괄 저장 → 번역 필요 행 큐 적재
+워커 경로 (services/menu_upload_worker.py): 행 단위 process_row (멱등, 재시도 가능)
 """
 
 import csv
 import json
 import io
-from typing import List, Dict, Any
+import logging
+from typing import Any, Dict, List, Optional, Set, Tuple
 from datetime import datetime
 import uuid
+from collections import Counter
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import String, any_, bindparam, insert, select, text, update
+from sqlalchemy.dialects.postgresql import ARRAY
 from fastapi import UploadFile, HTTPException
 
 from models.menu_upload import (
@@ -21,9 +27,108 @@ from models.menu_upload import (
 )
 from models.restaurant import Restaurant
 from models.canonical_menu import CanonicalMenu
-from utils.retry import async_retry
-from openai import OpenAI
+from openai import AsyncOpenAI
 from config import settings
+from services.batch_translator import BatchTranslator
+from services.translation_memory import translation_memory
+
+logger = logging.getLogger(__name__)
+
+# 행 상태 → MenuUploadTask 카운터 컬럼
+_STATUS_COUNTERS = {
+    MenuItemStatus.success: MenuUploadTask.successful,
+    MenuItemStatus.skipped: MenuUploadTask.skipped,
+    MenuItemStatus.failed: MenuUploadTask.failed,
+}
+
+# 메뉴 생성 직렬화용 advisory lock 키 (요청 경로 exclusive / 워커 shared)
+_MENU_CREATION_LOCK = "canonical_menu_creation"
+
+# multi-row INSERT 1회당 행 수 (PostgreSQL bind parameter 상한 32767 이내)
+_INSERT_CHUNK_SIZE = 1000
+
+_openai_client = None
+
+
+def get_openai_client() -> AsyncOpenAI:
+    """프로세스 공유 AsyncOpenAI 클라이언트 (커넥션 풀 재사용)"""
+    global _openai_client
+    if _openai_client is None:
+        _openai_client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+    return _openai_client
+
+
+async def _complete_with_openai(prompt: str) -> str:
+    response = await get_openai_client().chat.completions.create(
+        model="gpt-4o-mini",
+        messages=[
+            {
+                "role": "system",
+                "content": "You are a professional translator specializing in Korean food menus.",
+            },
+            {"role": "user", "content": prompt},
+        ],
+        temperature=0.3,
+        response_format={"type": "json_object"},
+    )
+    return response.choices[0].message.content
+
+
+_upload_translator: Optional[BatchTranslator] = None
+
+
+def get_upload_translator() -> BatchTranslator:
+    """업로드 행 번역 배치 큐 (워커 행들이 공유)"""
+    global _upload_translator
+    if _upload_translator is None:
+        _upload_translator = BatchTranslator(
+            _complete_with_openai,
+            max_batch_size=settings.TRANSLATION_BATCH_SIZE,
+            max_wait_seconds=settings.TRANSLATION_BATCH_MAX_WAIT_SECONDS,
+            max_attempts=settings.TRANSLATION_BATCH_MAX_ATTEMPTS,
+            memory=translation_memory,
+            name="menu_upload_openai",
+        )
+    return _upload_translator
+
+
+def plan_upload_rows(
+    menus: List[Dict[str, Any]], existing_names: Set[str]
+) -> List[Tuple[Dict[str, Any], MenuItemStatus, Optional[str]]]:
+    """
+    파싱된 행 분류 (DB 접근 없음)
+
+    - 이미 등록된 name_ko → skipped
+    - 파일 내 같은 name_ko 재등장 → skipped (첫 행만 처리)
+    - description_en 없음 → success (번역 불필요, 요청 트랜잭션에서 바로 생성)
+    - description_en 있음 → pending (워커가 번역 후 생성)
+
+    Returns:
+        [(menu_data, status, error_message), ...] (입력 순서 유지)
+    """
+    first_rows: Dict[str, Any] = {}
+    planned = []
+    for menu_data in menus:
+        name_ko = menu_data["name_ko"]
+        if name_ko in existing_names:
+            planned.append((menu_data, MenuItemStatus.skipped, "Duplicate menu"))
+        elif name_ko in first_rows:
+            planned.append(
+                (
+                    menu_data,
+                    MenuItemStatus.skipped,
+                    f"Duplicate menu in file (row {first_rows[name_ko]})",
+                )
+            )
+        else:
+            first_rows[name_ko] = menu_data.get("row_number")
+            status = (
+                MenuItemStatus.pending
+                if menu_data.get("description_en")
+                else MenuItemStatus.success
+            )
+            planned.append((menu_data, status, None))
+    return planned
 
 
 class MenuUploadService:
@@ -31,19 +136,20 @@ class MenuUploadService:
 
     def __init__(self, db: AsyncSession):
         self.db = db
-        self.openai_client = OpenAI(api_key=settings.OPENAI_API_KEY)
+        self.openai_client = get_openai_client()
 
     async def process_upload(
         self, restaurant_id: uuid.UUID, file: UploadFile
     ) -> MenuUploadTask:
         """
-        메뉴 파일 업로드 처리
+        메뉴 파일 업로드 접수
 
         1. 파일 타입 검증 (DB 불필요)
         2. 파싱 (CSV 또는 JSON) (DB 불필요)
         3. Restaurant 존재 확인
-        4. 각 메뉴 처리 (번역, 저장)
-        5. 결과 반환
+        4. 1 트랜잭션: 중복 일괄 확인 (name_ko = ANY) + 파일 내 중복 분류
+           → Task, 번역 불필요 메뉴, 행별 Detail을 multi-row INSERT로 저장
+        5. 번역 필요 행만 작업 큐 적재 → 즉시 반환 (번역/저장은 워커가 처리)
         """
         # 1. 파일 타입 검증 (DB 접근 불필요, 빠른 실패)
         file_type = self._get_file_type(file.filename)
@@ -55,46 +161,84 @@ class MenuUploadService:
         # 3. Restaurant 존재 확인 (DB 필요)
         await self._verify_restaurant(restaurant_id)
 
-        # 4. Upload Task 생성
+        # 4. 중복 분류 (DB 조회 1회 + 파일 내 중복) → Task/Menu/Detail 일괄 저장
+        names = list({menu_data["name_ko"] for menu_data in menus})
+        await self._lock_menu_creation()
+        existing_names = await self._find_existing_names(names)
+        planned = plan_upload_rows(menus, existing_names)
+
+        now = datetime.utcnow()
+        counts = Counter(status for _, status, _ in planned)
+        pending = counts[MenuItemStatus.pending]
         upload_task = MenuUploadTask(
+            id=uuid.uuid4(),
             restaurant_id=restaurant_id,
             file_name=file.filename,
             file_type=file_type,
-            status=UploadStatus.pending.value,
+            status=(
+                UploadStatus.processing.value
+                if pending
+                else UploadStatus.completed.value
+            ),
+            total_menus=len(menus),
+            successful=counts[MenuItemStatus.success],
+            failed=0,
+            skipped=counts[MenuItemStatus.skipped],
+            started_at=now,
+            completed_at=None if pending else now,
         )
         self.db.add(upload_task)
+        await self.db.flush()
+
+        # 번역이 필요 없는 신규 메뉴는 바로 생성 (multi-row INSERT ... RETURNING)
+        created_ids = await self._insert_menus(
+            [
+                self._menu_values(menu_data, None)
+                for menu_data, status, _ in planned
+                if status == MenuItemStatus.success
+            ]
+        )
+        detail_rows = await self._insert_details(
+            [
+                {
+                    "upload_task_id": upload_task.id,
+                    "name_ko": menu_data["name_ko"],
+                    "name_en": menu_data.get("name_en"),
+                    "description_en": menu_data.get("description_en"),
+                    "price": menu_data.get("price"),
+                    "status": status.value,
+                    "error_message": error_message,
+                    "created_menu_id": (
+                        created_ids.get(menu_data["name_ko"])
+                        if status == MenuItemStatus.success
+                        else None
+                    ),
+                    "row_number": menu_data.get("row_number"),
+                }
+                for menu_data, status, error_message in planned
+            ]
+        )
         await self.db.commit()
-        await self.db.refresh(upload_task)
+
+        # 5. 번역이 필요한 행만 작업 큐 적재
+        #    적재 실패 시에도 행은 pending으로 커밋돼 있으므로 워커 풀 sweep이 재적재
+        from services.menu_upload_worker import menu_upload_workers
 
         try:
-            # 5. Upload Task 업데이트 (처리 시작)
-            upload_task.status = UploadStatus.processing.value
-            upload_task.started_at = datetime.utcnow()
-            upload_task.total_menus = len(menus)
-            await self.db.commit()
-
-            # 6. 각 메뉴 처리
-            await self._process_menus(upload_task, menus)
-
-            # 7. Upload Task 완료
-            upload_task.status = UploadStatus.completed.value
-            upload_task.completed_at = datetime.utcnow()
-            await self.db.commit()
-
-            return upload_task
-
-        except HTTPException:
-            upload_task.status = UploadStatus.failed.value
-            upload_task.completed_at = datetime.utcnow()
-            await self.db.commit()
-            raise
+            await menu_upload_workers.submit(
+                [
+                    detail_id
+                    for detail_id, status in detail_rows
+                    if status == MenuItemStatus.pending.value
+                ]
+            )
         except Exception as e:
-            # 실패 처리
-            upload_task.status = UploadStatus.failed.value
-            upload_task.error_log = str(e)
-            upload_task.completed_at = datetime.utcnow()
-            await self.db.commit()
-            raise HTTPException(status_code=500, detail=f"Upload failed: {str(e)}")
+            logger.error(
+                f"Failed to enqueue upload rows for task {upload_task.id}, "
+                f"leaving them for the pending sweep: {e}"
+            )
+
+        return upload_task
 
     async def _verify_restaurant(self, restaurant_id: uuid.UUID) -> Restaurant:
         """Restaurant 존재 확인"""
@@ -193,150 +337,227 @@ class MenuUploadService:
         except Exception as e:
             raise HTTPException(status_code=400, detail=f"JSON parsing error: {str(e)}")
 
-    async def _process_menus(
-        self, upload_task: MenuUploadTask, menus: List[Dict[str, Any]]
-    ):
-        """각 메뉴 처리"""
-        for menu_data in menus:
-            try:
-                # 중복 체크
-                is_duplicate = await self._check_duplicate(menu_data["name_ko"])
-
-                if is_duplicate:
-                    # 중복 메뉴 (건너뛰기)
-                    detail = MenuUploadDetail(
-                        upload_task_id=upload_task.id,
-                        name_ko=menu_data["name_ko"],
-                        name_en=menu_data.get("name_en"),
-                        description_en=menu_data.get("description_en"),
-                        price=menu_data.get("price"),
-                        status=MenuItemStatus.skipped.value,
-                        error_message="Duplicate menu",
-                        row_number=menu_data.get("row_number"),
-                    )
-                    self.db.add(detail)
-                    upload_task.skipped += 1
-
-                else:
-                    # 새 메뉴 생성
-                    created_menu_id = await self._create_menu(menu_data)
-
-                    detail = MenuUploadDetail(
-                        upload_task_id=upload_task.id,
-                        name_ko=menu_data["name_ko"],
-                        name_en=menu_data.get("name_en"),
-                        description_en=menu_data.get("description_en"),
-                        price=menu_data.get("price"),
-                        status=MenuItemStatus.success.value,
-                        created_menu_id=created_menu_id,
-                        row_number=menu_data.get("row_number"),
-                    )
-                    self.db.add(detail)
-                    upload_task.successful += 1
-
-            except Exception as e:
-                # 실패한 메뉴
-                detail = MenuUploadDetail(
-                    upload_task_id=upload_task.id,
-                    name_ko=menu_data["name_ko"],
-                    name_en=menu_data.get("name_en"),
-                    status=MenuItemStatus.failed.value,
-                    error_message=str(e),
-                    row_number=menu_data.get("row_number"),
-                )
-                self.db.add(detail)
-                upload_task.failed += 1
-
-        await self.db.commit()
-
-    async def _check_duplicate(self, name_ko: str) -> bool:
-        """중복 메뉴 확인"""
-        result = await self.db.execute(
-            select(CanonicalMenu).where(CanonicalMenu.name_ko == name_ko)
-        )
-        existing = result.scalars().first()
-        return existing is not None
-
-    @async_retry(max_attempts=3, delay=1.0, backoff=2.0)
-    async def _create_menu(self, menu_data: Dict[str, Any]) -> uuid.UUID:
+    # ===========================
+    # Row processing (worker)
+    # ===========================
+    async def process_row(self, detail_id: uuid.UUID) -> None:
         """
-        메뉴 생성 (자동 번역 포함)
+        업로드 행 1건 처리 (멱등: pending 행만 처리, 재시도/중복 적재 안전)
 
-        1. 기본 정보로 CanonicalMenu 생성
-        2. GPT-4o로 자동 번역 (JA, ZH)
-        3. DB 저장
+        1. 중복 확인 → skipped
+        2. 자동 번역 (트랜잭션 밖, DB 커넥션 점유 없음)
+        3. 1 트랜잭션: 중복 재확인 + CanonicalMenu 생성 + Detail/Task 카운터 갱신
         """
-        # 1. 기본 메뉴 생성
-        menu = CanonicalMenu(
-            name_ko=menu_data["name_ko"],
-            name_en=menu_data.get(
-                "name_en", menu_data["name_ko"]
-            ),  # Default to Korean name if EN missing
-            typical_price_min=menu_data.get("price"),
-            typical_price_max=menu_data.get("price"),
-        )
+        detail = await self.db.get(MenuUploadDetail, detail_id)
+        if detail is None or detail.status != MenuItemStatus.pending.value:
+            return  # 이미 처리된 행 (재전달)
+
+        menu_data = {
+            "name_ko": detail.name_ko,
+            "name_en": detail.name_en,
+            "description_en": detail.description_en,
+            "price": detail.price,
+        }
+        task_id = detail.upload_task_id
+
+        if await self._check_duplicate(menu_data["name_ko"]):
+            await self._finish_row(
+                detail_id,
+                task_id,
+                MenuItemStatus.skipped,
+                error_message="Duplicate menu",
+            )
+            return
+        await self.db.commit()  # 번역 대기 중 읽기 트랜잭션/커넥션 반납
 
-        # 2. 자동 번역 (description_en이 있으면)
+        translations = None
         if menu_data.get("description_en"):
             translations = await self._translate_menu(
                 menu_data["name_ko"], menu_data["description_en"]
             )
 
-            menu.explanation_short = translations
+        # 같은 name_ko를 다른 워커가 동시에 생성하지 않도록 직렬화 후 재확인
+        await self._lock_menu_name(menu_data["name_ko"])
+        if await self._check_duplicate(menu_data["name_ko"]):
+            await self._finish_row(
+                detail_id,
+                task_id,
+                MenuItemStatus.skipped,
+                error_message="Duplicate menu",
+            )
+            return
 
+        menu = CanonicalMenu(**self._menu_values(menu_data, translations))
         self.db.add(menu)
-        await self.db.commit()
-        await self.db.refresh(menu)
+        await self.db.flush()
+        await self._finish_row(
+            detail_id, task_id, MenuItemStatus.success, created_menu_id=menu.id
+        )
 
-        return menu.id
+    async def fail_row(self, detail_id: uuid.UUID, error_message: str) -> None:
+        """재시도 소진 행을 failed로 기록"""
+        detail = await self.db.get(MenuUploadDetail, detail_id)
+        if detail is None or detail.status != MenuItemStatus.pending.value:
+            return
+        await self._finish_row(
+            detail_id,
+            detail.upload_task_id,
+            MenuItemStatus.failed,
+            error_message=error_message[:1000],
+        )
 
-    async def _translate_menu(
-        self, name_ko: str, description_en: str
-    ) -> Dict[str, str]:
+    async def _finish_row(
+        self,
+        detail_id: uuid.UUID,
+        task_id: uuid.UUID,
+        status: MenuItemStatus,
+        created_menu_id: Optional[uuid.UUID] = None,
+        error_message: Optional[str] = None,
+    ) -> bool:
         """
-        GPT-4o로 자동 번역
+        Detail 상태 확정 + Task 카운터 증가 + 완료 판정 (같은 트랜잭션에서 commit)
 
-        EN은 이미 있으므로 JA, ZH만 번역
+        Returns:
+            False면 다른 워커가 이미 처리 (변경 없이 rollback)
         """
-        prompt = f"""Translate this Korean menu item to Japanese and Chinese:
-
-Menu: {name_ko}
-English Description: {description_en}
-
-Return ONLY a JSON object with this exact format:
-{{
-  "ja": "Japanese translation",
-  "zh": "Chinese translation"
-}}
+        result = await self.db.execute(
+            update(MenuUploadDetail)
+            .where(
+                MenuUploadDetail.id == detail_id,
+                MenuUploadDetail.status == MenuItemStatus.pending.value,
+            )
+            .values(
+                status=status.value,
+                created_menu_id=created_menu_id,
+                error_message=error_message,
+            )
+        )
+        if result.rowcount == 0:
+            await self.db.rollback()
+            return False
+
+        counter = _STATUS_COUNTERS[status]
+        await self.db.execute(
+            update(MenuUploadTask)
+            .where(MenuUploadTask.id == task_id)
+            .values({counter: counter + 1})
+        )
+        await self.db.execute(
+            update(MenuUploadTask)
+            .where(
+                MenuUploadTask.id == task_id,
+                MenuUploadTask.status == UploadStatus.processing.value,
+                MenuUploadTask.successful
+                + MenuUploadTask.failed
+                + MenuUploadTask.skipped
+                >= MenuUploadTask.total_menus,
+            )
+            .values(status=UploadStatus.completed.value, completed_at=datetime.utcnow())
+        )
+        await self.db.commit()
+        return True
 
-Keep it concise (under 50 words each)."""
+    async def _lock_menu_creation(self) -> None:
+        """
+        PostgreSQL: 업로드 요청 경로용 단일 트랜잭션 advisory lock (commit/rollback 시 해제)
 
-        response = self.openai_client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {
-                    "role": "system",
-                    "content": "You are a professional translator specializing in Korean food menus.",
-                },
-                {"role": "user", "content": prompt},
-            ],
-            temperature=0.3,
+        파일 내 이름 수와 무관하게 lock 1개 (이름별 lock은 대량 파일/동시 업로드 시
+        공유 lock 테이블 초과 → "out of shared memory"). 워커는 같은 키를 shared로 잡으므로
+        요청 경로의 중복 확인~INSERT 동안 워커의 메뉴 생성과 직렬화
+        """
+        if self.db.get_bind().dialect.name != "postgresql":
+            return
+        await self.db.execute(
+            text("SELECT pg_advisory_xact_lock(hashtext(:key))"),
+            {"key": _MENU_CREATION_LOCK},
         )
 
-        # 응답 파싱
-        content = response.choices[0].message.content.strip()
+    async def _lock_menu_name(self, name_ko: str) -> None:
+        """
+        PostgreSQL: 워커 경로용 name_ko 단위 트랜잭션 advisory lock
 
-        # JSON 추출 (```json ... ``` 제거)
-        if content.startswith("```json"):
-            content = content[7:]
-        if content.startswith("```"):
-            content = content[3:]
-        if content.endswith("```"):
-            content = content[:-3]
+        요청 경로 lock은 shared로 (워커끼리는 서로 막지 않음), 같은 name_ko는 exclusive로 획득
+        """
+        if self.db.get_bind().dialect.name != "postgresql":
+            return
+        await self.db.execute(
+            text(
+                "SELECT pg_advisory_xact_lock_shared(hashtext(:key)),"
+                " pg_advisory_xact_lock(hashtext('canonical_menu:' || :name))"
+            ),
+            {"key": _MENU_CREATION_LOCK, "name": name_ko},
+        )
 
-        translations = json.loads(content.strip())
+    async def _check_duplicate(self, name_ko: str) -> bool:
+        """중복 메뉴 확인"""
+        result = await self.db.execute(
+            select(CanonicalMenu.id).where(CanonicalMenu.name_ko == name_ko).limit(1)
+        )
+        return result.first() is not None
+
+    async def _find_existing_names(self, names: List[str]) -> Set[str]:
+        """이미 등록된 name_ko 집합 (파일 전체를 쿼리 1회로 확인)"""
+        if not names:
+            return set()
+        if self.db.get_bind().dialect.name == "postgresql":
+            condition = CanonicalMenu.name_ko == any_(
+                bindparam("names", names, type_=ARRAY(String))
+            )
+        else:
+            condition = CanonicalMenu.name_ko.in_(names)
+        result = await self.db.execute(
+            select(CanonicalMenu.name_ko).where(condition).distinct()
+        )
+        return set(result.scalars().all())
+
+    async def _insert_menus(self, rows: List[Dict[str, Any]]) -> Dict[str, uuid.UUID]:
+        """CanonicalMenu multi-row INSERT ... RETURNING → {name_ko: id}"""
+        created: Dict[str, uuid.UUID] = {}
+        for start in range(0, len(rows), _INSERT_CHUNK_SIZE):
+            result = await self.db.execute(
+                insert(CanonicalMenu)
+                .values(rows[start : start + _INSERT_CHUNK_SIZE])
+                .returning(CanonicalMenu.id, CanonicalMenu.name_ko)
+            )
+            created.update({name_ko: menu_id for menu_id, name_ko in result})
+        return created
+
+    async def _insert_details(
+        self, rows: List[Dict[str, Any]]
+    ) -> List[Tuple[uuid.UUID, str]]:
+        """MenuUploadDetail multi-row INSERT ... RETURNING → [(id, status)]"""
+        inserted: List[Tuple[uuid.UUID, str]] = []
+        for start in range(0, len(rows), _INSERT_CHUNK_SIZE):
+            result = await self.db.execute(
+                insert(MenuUploadDetail)
+                .values(rows[start : start + _INSERT_CHUNK_SIZE])
+                .returning(MenuUploadDetail.id, MenuUploadDetail.status)
+            )
+            inserted.extend((detail_id, status) for detail_id, status in result)
+        return inserted
+
+    @staticmethod
+    def _menu_values(
+        menu_data: Dict[str, Any], translations: Optional[Dict[str, str]]
+    ) -> Dict[str, Any]:
+        """CanonicalMenu 컬럼 값 (EN 이름 없으면 한국어 이름 사용)"""
+        values = {
+            "name_ko": menu_data["name_ko"],
+            "name_en": menu_data.get("name_en") or menu_data["name_ko"],
+            "typical_price_min": menu_data.get("price"),
+            "typical_price_max": menu_data.get("price"),
+        }
+        if translations:
+            values["explanation_short"] = translations
+        return values
 
-        # EN 추가
-        translations["en"] = description_en
+    async def _translate_menu(
+        self, name_ko: str, description_en: str
+    ) -> Dict[str, str]:
+        """
+        GPT-4o-mini로 자동 번역 (배치 큐 경유: 동시 처리 중인 행과 묶어 1회 요청)
 
-        return translations
+        EN은 이미 있으므로 JA, ZH만 번역
+        """
+        translations = await get_upload_translator().translate(name_ko, description_en)
+        return {**translations, "en": description_en}
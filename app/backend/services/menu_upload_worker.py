@@ -0,0 +1,257 @@
+"""
+Menu Upload Worker Pool - B2B CSV/JSON 메뉴 업로드 행 처리 워커
+
+Responsibilities:
+1. 업로드 행(MenuUploadDetail) 단위 작업을 큐에서 가져와 N개 워커가 동시 처리
+   - 큐: Redis Streams (영속, 워커 프로세스 간 분배) / Redis 미사용 시 LocalJobQueue
+2. 실패 행은 지수 백오프로 재적재, MENU_UPLOAD_MAX_ATTEMPTS 초과 시 failed 기록
+3. 처리 로직(MenuUploadService.process_row)은 멱등 → 재전달/재시작에 안전
+4. LocalJobQueue 사용 시 시작할 때 pending 행 재적재 (메모리 큐는 재시작 시 유실)
+5. 주기 sweep (백엔드 공통): 큐가 비었는데 visibility timeout보다 오래된 pending 행이
+   남아 있으면 재적재 (적재 실패 / 유실로 작업이 processing에 갇히는 것 방지)
+"""
+
+import asyncio
+import logging
+import os
+import socket
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from config import settings
+from models.menu_upload import (
+    MenuItemStatus,
+    MenuUploadDetail,
+    MenuUploadTask,
+    UploadStatus,
+)
+from services.job_queue import Job, JobQueue, LocalJobQueue, RedisStreamJobQueue
+
+logger = logging.getLogger(__name__)
+
+MENU_UPLOAD_STREAM = "jobs:menu_upload_rows"
+
+
+class MenuUploadWorkerPool:
+    """업로드 행 처리 워커 풀 (프로세스당 1개)"""
+
+    def __init__(
+        self,
+        workers: int = 4,
+        max_attempts: int = 3,
+        retry_delay_seconds: float = 2.0,
+        backend: str = "auto",
+        visibility_timeout_seconds: float = 300.0,
+        session_factory: Optional[async_sessionmaker] = None,
+        queue: Optional[JobQueue] = None,
+    ):
+        self.workers = workers
+        self.max_attempts = max_attempts
+        self.retry_delay_seconds = retry_delay_seconds
+        self.backend = backend
+        self.visibility_timeout_seconds = visibility_timeout_seconds
+        self._session_factory = session_factory
+        self._queue = queue
+
+        self._tasks: List[asyncio.Task] = []
+        self.stats = {
+            "processed": 0,
+            "retried": 0,
+            "failed": 0,
+            "busy": 0,
+            "swept": 0,
+        }
+
+    @property
+    def session_factory(self) -> async_sessionmaker:
+        if self._session_factory is None:
+            from database import AsyncSessionLocal
+
+            self._session_factory = AsyncSessionLocal
+        return self._session_factory
+
+    @property
+    def queue(self) -> JobQueue:
+        if self._queue is None:
+            from services.cache_service import cache_service
+
+            use_redis = self.backend == "redis" or (
+                self.backend == "auto" and cache_service.redis is not None
+            )
+            if use_redis:
+                self._queue = RedisStreamJobQueue(
+                    cache_service.redis,
+                    MENU_UPLOAD_STREAM,
+                    visibility_timeout_seconds=self.visibility_timeout_seconds,
+                )
+            else:
+                self._queue = LocalJobQueue()
+        return self._queue
+
+    @property
+    def running(self) -> bool:
+        return any(not task.done() for task in self._tasks)
+
+    # ===========================
+    # Lifecycle
+    # ===========================
+    async def start(self) -> None:
+        """워커 시작 (cache_service.connect() 이후 호출)"""
+        if self.running:
+            return
+        if isinstance(self.queue, LocalJobQueue):
+            await self.recover_pending()
+
+        consumer = f"{socket.gethostname()}-{os.getpid()}"
+        self._tasks = [
+            asyncio.create_task(self._run(f"{consumer}-{idx}"))
+            for idx in range(self.workers)
+        ]
+        self._tasks.append(asyncio.create_task(self._sweep_loop()))
+        logger.info(
+            f"MenuUploadWorkerPool started ({self.workers} workers, "
+            f"queue={type(self.queue).__name__})"
+        )
+
+    async def stop(self) -> None:
+        """워커 중지 (처리 중이던 행은 pending으로 남아 재전달 시 처리)"""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def submit(self, detail_ids: List[uuid.UUID]) -> None:
+        """업로드 행 적재 (Redis: XADD 파이프라인)"""
+        await self.queue.enqueue_many(
+            [Job(payload={"detail_id": str(detail_id)}) for detail_id in detail_ids]
+        )
+
+    async def recover_pending(self, older_than_seconds: float = 0.0) -> int:
+        """
+        처리 중인 업로드의 pending 행 재적재 (메모리 큐 재시작 / 적재 실패 복구)
+
+        Args:
+            older_than_seconds: 이보다 오래된 행만 (0 = 전체)
+        """
+        query = (
+            select(MenuUploadDetail.id)
+            .join(MenuUploadTask, MenuUploadTask.id == MenuUploadDetail.upload_task_id)
+            .where(
+                MenuUploadTask.status == UploadStatus.processing.value,
+                MenuUploadDetail.status == MenuItemStatus.pending.value,
+            )
+        )
+        if older_than_seconds:
+            cutoff = datetime.now(timezone.utc) - timedelta(seconds=older_than_seconds)
+            query = query.where(MenuUploadDetail.created_at < cutoff)
+        async with self.session_factory() as session:
+            result = await session.execute(query)
+            detail_ids = result.scalars().all()
+        await self.submit(detail_ids)
+        if detail_ids:
+            logger.info(f"Re-queued {len(detail_ids)} pending upload rows")
+        return len(detail_ids)
+
+    async def sweep(self) -> int:
+        """
+        큐가 비어 있을 때 오래된 pending 행 재적재
+
+        큐에 작업이 남아 있으면 대기 중인 행일 수 있으므로 건너뜀
+        (중복 적재돼도 process_row는 멱등)
+        """
+        stats = await self.queue.get_stats()
+        if "error" in stats or stats.get("queued") or stats.get("in_progress"):
+            return 0
+        swept = await self.recover_pending(
+            older_than_seconds=self.visibility_timeout_seconds
+        )
+        self.stats["swept"] += swept
+        return swept
+
+    async def _sweep_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.visibility_timeout_seconds)
+            try:
+                await self.sweep()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Menu upload sweep failed: {e}", exc_info=True)
+
+    # ===========================
+    # Workers
+    # ===========================
+    async def _run(self, consumer: str) -> None:
+        while True:
+            try:
+                job = await self.queue.claim(consumer)
+                if job is not None:
+                    await self._handle(job)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Menu upload worker error: {e}", exc_info=True)
+                await asyncio.sleep(1.0)
+
+    async def _handle(self, job: Job) -> None:
+        delay = job.not_before - time.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        detail_id = uuid.UUID(job.payload["detail_id"])
+        self.stats["busy"] += 1
+        try:
+            await self.process_row(detail_id)
+            self.stats["processed"] += 1
+            await self.queue.ack(job)
+        except Exception as e:
+            if job.attempt < self.max_attempts:
+                self.stats["retried"] += 1
+                logger.warning(
+                    f"Upload row {detail_id} failed (attempt {job.attempt}): {e}"
+                )
+                await self.queue.retry(
+                    job, self.retry_delay_seconds * 2 ** (job.attempt - 1)
+                )
+            else:
+                self.stats["failed"] += 1
+                logger.error(f"Upload row {detail_id} failed permanently: {e}")
+                await self.fail_row(detail_id, str(e))
+                await self.queue.ack(job)
+        finally:
+            self.stats["busy"] -= 1
+
+    async def process_row(self, detail_id: uuid.UUID) -> None:
+        from services.menu_upload_service import MenuUploadService
+
+        async with self.session_factory() as session:
+            await MenuUploadService(session).process_row(detail_id)
+
+    async def fail_row(self, detail_id: uuid.UUID, error_message: str) -> None:
+        from services.menu_upload_service import MenuUploadService
+
+        async with self.session_factory() as session:
+            await MenuUploadService(session).fail_row(detail_id, error_message)
+
+    async def get_stats(self) -> Dict[str, Any]:
+        return {
+            "workers": self.workers,
+            "running": self.running,
+            **self.stats,
+            "queue": await self.queue.get_stats(),
+        }
+
+
+# Global instance
+menu_upload_workers = MenuUploadWorkerPool(
+    workers=settings.MENU_UPLOAD_WORKERS,
+    max_attempts=settings.MENU_UPLOAD_MAX_ATTEMPTS,
+    retry_delay_seconds=settings.MENU_UPLOAD_RETRY_DELAY_SECONDS,
+    backend=settings.MENU_UPLOAD_QUEUE_BACKEND,
+    visibility_timeout_seconds=settings.MENU_UPLOAD_VISIBILITY_TIMEOUT_SECONDS,
+)
@@ -0,0 +1,215 @@
+"""
+Modifier Dictionary - 프로세스 단위 수식어 사전 캐시
+
+Responsibilities:
+1. modifiers 테이블을 1회 로드해 엔진 우선순위 (type_priority, -len, -priority)로 사전 정렬
+2. 문자 단위 trie로 입력 문자열 내 수식어 탐색 / 최장 일치 조회
+3. 버전 기반 hot reload: check_interval마다 버전만 조회, 변경 시에만 재로드
+   - PostgreSQL: modifier_dictionary_version (트리거 증가,
+     migrations/create_modifier_dictionary_version.sql)
+   - 그 외 / 마이그레이션 미적용: (COUNT, MAX(created_at)) 지문
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from config import settings
+from models import Modifier
+
+logger = logging.getLogger(__name__)
+
+# 타입별 우선순위 (숫자가 낮을수록 높은 우선순위)
+# emotion/cooking/grade/origin: 메뉴 외부 수식어 (브랜드, 감성) - 최우선
+# ingredient: 재료 강조 - cooking 다음 (한우불고기, 해물짬뽕 등)
+# taste/size: 메뉴 내부 속성 - 그 다음
+TYPE_PRIORITY = {
+    "emotion": 1,  # 최우선 (원조, 할매 등)
+    "cooking": 2,
+    "ingredient": 3,  # cooking 다음 (한우, 해물 등)
+    "grade": 4,
+    "origin": 5,
+    "taste": 6,
+    "size": 7,
+}
+DEFAULT_TYPE_PRIORITY = 50
+
+_TERMINAL = ""  # trie 노드의 종료 표시 키 (text_ko는 빈 문자열이 아님)
+
+
+@dataclass(frozen=True)
+class ModifierEntry:
+    """수식어 사전 항목 (ORM 세션과 분리된 불변 스냅샷)"""
+
+    text_ko: str
+    type: str
+    semantic_key: str
+    translation_en: Optional[str]
+    priority: int
+    rank: int  # 엔진 우선순위 순서
+    length_rank: int  # 길이 우선 순서 (AI Discovery용)
+
+    def to_dict(self, include_semantic_key: bool = True) -> Dict[str, Any]:
+        data = {
+            "text_ko": self.text_ko,
+            "type": self.type,
+            "translation_en": self.translation_en,
+        }
+        if include_semantic_key:
+            data["semantic_key"] = self.semantic_key
+        return data
+
+
+def _engine_order_key(row) -> Tuple[int, int, int]:
+    """타입 우선순위 → 길이 순 (긴 것부터) → priority 순 (높은 것부터)"""
+    return (
+        TYPE_PRIORITY.get(row.type, DEFAULT_TYPE_PRIORITY),
+        -len(row.text_ko),
+        -(row.priority or 0),
+    )
+
+
+class ModifierDictionary:
+    """정렬된 수식어 목록 + trie (불변, 재로드 시 통째로 교체)"""
+
+    def __init__(self, rows: Iterable[Any], version: Any = None):
+        self.version = version
+
+        ordered = sorted(rows, key=lambda r: (_engine_order_key(r), r.text_ko))
+        by_length = sorted(
+            range(len(ordered)), key=lambda i: (-len(ordered[i].text_ko), i)
+        )
+        length_ranks = {i: length_rank for length_rank, i in enumerate(by_length)}
+
+        self.entries: Tuple[ModifierEntry, ...] = tuple(
+            ModifierEntry(
+                text_ko=row.text_ko,
+                type=row.type,
+                semantic_key=row.semantic_key,
+                translation_en=row.translation_en,
+                priority=row.priority or 0,
+                rank=i,
+                length_rank=length_ranks[i],
+            )
+            for i, row in enumerate(ordered)
+        )
+
+        self._trie: Dict[str, Any] = {}
+        for entry in self.entries:
+            node = self._trie
+            for char in entry.text_ko:
+                node = node.setdefault(char, {})
+            node[_TERMINAL] = entry
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def find_all(self, text: str, by_length: bool = False) -> List[ModifierEntry]:
+        """
+        text에 포함된 모든 수식어 (중복 제거)
+
+        Args:
+            by_length: False = 엔진 우선순위 순, True = 길이 순 (긴 것부터)
+        """
+        found: Dict[str, ModifierEntry] = {}
+        for start in range(len(text)):
+            node = self._trie
+            for char in text[start:]:
+                node = node.get(char)
+                if node is None:
+                    break
+                entry = node.get(_TERMINAL)
+                if entry is not None:
+                    found[entry.text_ko] = entry
+
+        key = (lambda e: e.length_rank) if by_length else (lambda e: e.rank)
+        return sorted(found.values(), key=key)
+
+    def longest_match(self, text: str, start: int = 0) -> Optional[ModifierEntry]:
+        """text[start:]로 시작하는 가장 긴 수식어"""
+        node = self._trie
+        longest = None
+        for char in text[start:]:
+            node = node.get(char)
+            if node is None:
+                break
+            longest = node.get(_TERMINAL, longest)
+        return longest
+
+
+class ModifierDictionaryCache:
+    """프로세스당 1개 사전 스냅샷 + 버전 체크 기반 hot reload"""
+
+    VERSION_TABLE = "modifier_dictionary_version"
+
+    def __init__(self, check_interval_seconds: float = 30.0):
+        self.check_interval_seconds = check_interval_seconds
+        self._snapshot: Optional[ModifierDictionary] = None
+        self._last_checked = 0.0
+        self._lock: Optional[asyncio.Lock] = None  # Lazy initialization
+        self._has_version_table: Optional[bool] = None
+        self.reloads = 0
+
+    def invalidate(self):
+        """다음 get()에서 버전 재확인 (같은 프로세스에서 modifiers 수정 시)"""
+        self._last_checked = 0.0
+
+    async def get(self, db: AsyncSession) -> ModifierDictionary:
+        if (
+            self._snapshot is not None
+            and time.monotonic() - self._last_checked < self.check_interval_seconds
+        ):
+            return self._snapshot
+
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        async with self._lock:
+            # 대기 중 다른 코루틴이 이미 확인한 경우
+            if (
+                self._snapshot is not None
+                and time.monotonic() - self._last_checked < self.check_interval_seconds
+            ):
+                return self._snapshot
+
+            version = await self._fetch_version(db)
+            if self._snapshot is None or self._snapshot.version != version:
+                result = await db.execute(select(Modifier))
+                self._snapshot = ModifierDictionary(result.scalars().all(), version)
+                self.reloads += 1
+                logger.info(
+                    f"Modifier dictionary loaded: {len(self._snapshot)} entries "
+                    f"(version={version})"
+                )
+            self._last_checked = time.monotonic()
+            return self._snapshot
+
+    async def _fetch_version(self, db: AsyncSession) -> Any:
+        if db.get_bind().dialect.name == "postgresql":
+            if self._has_version_table is None:
+                result = await db.execute(
+                    text("SELECT to_regclass(:name) IS NOT NULL"),
+                    {"name": self.VERSION_TABLE},
+                )
+                self._has_version_table = bool(result.scalar())
+            if self._has_version_table:
+                result = await db.execute(
+                    text(f"SELECT version FROM {self.VERSION_TABLE} WHERE id = 1")
+                )
+                return result.scalar()
+
+        result = await db.execute(
+            select(func.count(Modifier.id), func.max(Modifier.created_at))
+        )
+        return tuple(result.one())
+
+
+# Global instance
+modifier_dictionary = ModifierDictionaryCache(
+    check_interval_seconds=settings.MODIFIER_DICT_CHECK_INTERVAL_SECONDS,
+)
@@ -30,7 +30,10 @@ class NutritionCacheService:
         return f"nutrition:{canonical_id}"
 
     async def get_nutrition(
-        self, canonical_id: UUID, db: AsyncSession
+        self,
+        canonical_id: UUID,
+        db: AsyncSession,
+        write_db: Optional[AsyncSession] = None,
     ) -> Optional[Dict[str, Any]]:
         """
         영양정보 조회 (3단계 fallback)
@@ -38,7 +41,8 @@ class NutritionCacheService:
 
         Args:
             canonical_id: canonical_menus.id
-            db: AsyncSession
+            db: AsyncSession (조회용, read replica 가능)
+            write_db: API 결과 저장용 primary 세션 (기본값: db)
 
         Returns:
             {"nutrition": {...}, "serving_size": str, "source": str, "cached": bool}
@@ -79,7 +83,7 @@ class NutritionCacheService:
             return nutrition_data
 
         # Step 3: 공공데이터 API에서 조회
-        return await self._fetch_and_cache(menu, db)
+        return await self._fetch_and_cache(menu, write_db or db)
 
     async def _fetch_and_cache(
         self, menu: CanonicalMenu, db: AsyncSession
@@ -0,0 +1,173 @@
+"""
+OCR Metrics - Redis 해시 카운터 기반 OCR 운영 메트릭
+
+Responsibilities:
+1. OCR 결과 1건당 카운터/지연 히스토그램을 HINCRBY/HINCRBYFLOAT 파이프라인 1회로 기록
+   (read-modify-write 없음 → 동시 요청에서도 누락 없음, 워커 프로세스 간 공유)
+2. 조회 시 카운터로 비율/평균 계산, 히스토그램으로 Tier/공급자별 p50/p90/p99 추정
+
+Redis 구조:
+- ocr:metrics:v2:counters  {total_count, tier_1_count, tier_2_count,
+                            processing_time_ms_sum, price_error_count,
+                            handwriting_count, last_updated}
+- ocr:metrics:v2:latency   {"{tier}:{provider}:le_{bucket}": count,
+                            "{tier}:{provider}:sum_ms": float}
+"""
+
+import logging
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from services.cache_service import cache_service
+from services.ocr_provider import OcrResult
+
+logger = logging.getLogger(__name__)
+
+METRICS_PREFIX = "ocr:metrics:v2"
+COUNTERS_KEY = f"{METRICS_PREFIX}:counters"
+LATENCY_KEY = f"{METRICS_PREFIX}:latency"
+METRICS_TTL = 86400 * 90  # 90일 보관
+
+# 지연 히스토그램 버킷 상한 (ms), 마지막은 +Inf
+LATENCY_BUCKETS_MS = (250, 500, 1000, 2000, 4000, 8000, 16000, 32000)
+_INF = "inf"
+
+
+def latency_bucket(latency_ms: float) -> str:
+    """지연 시간이 속하는 버킷 라벨 (le_250, ..., le_inf)"""
+    for bound in LATENCY_BUCKETS_MS:
+        if latency_ms <= bound:
+            return f"le_{bound}"
+    return f"le_{_INF}"
+
+
+def _bucket_labels() -> List[str]:
+    return [f"le_{bound}" for bound in LATENCY_BUCKETS_MS] + [f"le_{_INF}"]
+
+
+def histogram_percentile(buckets: Dict[str, int], q: float) -> Optional[float]:
+    """
+    버킷 카운트로 분위수 추정 (해당 버킷 상한값, +Inf 버킷은 마지막 유한 상한)
+    """
+    total = sum(buckets.values())
+    if total == 0:
+        return None
+    target = q * total
+    cumulative = 0
+    for label in _bucket_labels():
+        cumulative += buckets.get(label, 0)
+        if cumulative >= target:
+            bound = label[3:]
+            return float(LATENCY_BUCKETS_MS[-1] if bound == _INF else bound)
+    return float(LATENCY_BUCKETS_MS[-1])
+
+
+class OcrMetrics:
+    """OCR 메트릭 기록/조회 (상태 없음, Redis가 단일 저장소)"""
+
+    async def record(self, result: OcrResult) -> None:
+        """OCR 결과 1건 기록 (파이프라인 1회 왕복)"""
+        tier = "tier_2" if result.triggered_fallback else "tier_1"
+        provider = result.provider.value if result.provider else "unknown"
+        series = f"{tier}:{provider}"
+        latency_ms = float(result.processing_time_ms or 0)
+
+        counters: Dict[str, Any] = {
+            "total_count": 1,
+            f"{tier}_count": 1,
+            "processing_time_ms_sum": latency_ms,
+        }
+        if result.price_parse_errors:
+            counters["price_error_count"] = len(result.price_parse_errors)
+        if result.has_handwriting:
+            counters["handwriting_count"] = 1
+
+        await cache_service.incr_hashes(
+            {
+                COUNTERS_KEY: counters,
+                LATENCY_KEY: {
+                    f"{series}:{latency_bucket(latency_ms)}": 1,
+                    f"{series}:sum_ms": latency_ms,
+                },
+            },
+            ttl=METRICS_TTL,
+            fields={COUNTERS_KEY: {"last_updated": datetime.utcnow().isoformat()}},
+        )
+
+    async def snapshot(self) -> Dict[str, Any]:
+        """
+        카운터 + 히스토그램 조회 후 파생 지표 계산
+
+        Returns:
+            메트릭 dict (기록이 없으면 빈 dict)
+        """
+        counters_raw, latency_raw = await cache_service.get_hashes(
+            COUNTERS_KEY, LATENCY_KEY
+        )
+        if not counters_raw:
+            return {}
+
+        def count(field: str) -> int:
+            return int(float(counters_raw.get(field, 0)))
+
+        total = count("total_count")
+        metrics: Dict[str, Any] = {
+            "tier_1_count": count("tier_1_count"),
+            "tier_2_count": count("tier_2_count"),
+            "total_count": total,
+            "avg_processing_time_ms": (
+                float(counters_raw.get("processing_time_ms_sum", 0)) / total
+                if total
+                else 0
+            ),
+            "price_error_count": count("price_error_count"),
+            "handwriting_count": count("handwriting_count"),
+            "last_updated": counters_raw.get("last_updated"),
+        }
+
+        if total > 0:
+            metrics["tier_1_success_rate"] = (
+                f"{(metrics['tier_1_count'] / total * 100):.1f}%"
+            )
+            metrics["tier_2_fallback_rate"] = (
+                f"{(metrics['tier_2_count'] / total * 100):.1f}%"
+            )
+            metrics["price_error_rate"] = (
+                f"{(metrics['price_error_count'] / total * 100):.1f}%"
+            )
+            metrics["handwriting_detection_rate"] = (
+                f"{(metrics['handwriting_count'] / total * 100):.1f}%"
+            )
+
+        metrics["latency_histogram"] = self._summarize_latency(latency_raw)
+        return metrics
+
+    @staticmethod
+    def _summarize_latency(latency_raw: Dict[str, str]) -> Dict[str, Any]:
+        """{"tier:provider": {count, avg_ms, p50_ms, p90_ms, p99_ms, buckets}}"""
+        series: Dict[str, Dict[str, Any]] = {}
+        for field, value in latency_raw.items():
+            name, _, label = field.rpartition(":")
+            entry = series.setdefault(name, {"buckets": {}, "sum_ms": 0.0})
+            if label == "sum_ms":
+                entry["sum_ms"] = float(value)
+            else:
+                entry["buckets"][label] = int(value)
+
+        summary = {}
+        for name, entry in sorted(series.items()):
+            buckets = entry["buckets"]
+            samples = sum(buckets.values())
+            summary[name] = {
+                "count": samples,
+                "avg_ms": round(entry["sum_ms"] / samples, 1) if samples else 0.0,
+                "p50_ms": histogram_percentile(buckets, 0.50),
+                "p90_ms": histogram_percentile(buckets, 0.90),
+                "p99_ms": histogram_percentile(buckets, 0.99),
+                "buckets": {label: buckets.get(label, 0) for label in _bucket_labels()},
+            }
+        return summary
+
+
+# Global instance
+ocr_metrics = OcrMetrics()
@@ -0,0 +1,188 @@
+"""
+OCR Near-Duplicate Index - 근사 중복 메뉴 사진 탐지
+
+Responsibilities:
+1. 최근 OCR 성공 이미지의 pHash → 결과 캐시 키를 Redis 리스트로 보관 (크기/TTL 제한)
+   + 결과 키별 축소 썸네일 (SSIM 2차 검증용)
+2. 새 이미지의 pHash와 Hamming 거리 비교, 유사도 임계값 이상인 후보를
+   썸네일 SSIM으로 재확인한 뒤 이전 결과 캐시 키 반환
+   (pHash는 주로 레이아웃을 반영 → 같은 양식의 다른 메뉴판 오매칭 방지)
+3. 매장 단위 제한: shop_id가 있으면 그 매장 인덱스만 탐색 (전체 인덱스 미사용)
+   매장 정보 없는 이미지 (관광객 /menu/recognize)는 전체 인덱스 탐색
+   OCR_NEAR_DUP_SAME_SHOP_ONLY=True (opt-in)면 매장 정보 없는 이미지는 탐색 안 함
+4. 조회/히트/SSIM 거절 수 기록 (hit rate)
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+from config import settings
+from services.cache_service import cache_service, TTL_OCR_PHASH_INDEX
+from utils.perceptual_hash import (
+    HASH_BITS,
+    THUMBNAIL_SIZE,
+    compute_image_signature,
+    hamming_distance,
+    ssim,
+)
+
+logger = logging.getLogger(__name__)
+
+PHASH_INDEX_PREFIX = "ocr:phash"
+MAX_VERIFY_CANDIDATES = 3  # SSIM 재확인할 최대 후보 수 (가까운 순)
+
+
+@dataclass
+class ImageSignature:
+    """근사 중복 비교용 이미지 서명"""
+
+    phash: int
+    thumbnail: np.ndarray  # THUMBNAIL_SIZE² uint8 (정규화 grayscale)
+
+
+class NearDuplicateIndex:
+    """pHash 기반 근사 중복 인덱스 (Redis 공유, 선형 탐색 + SSIM 재확인)"""
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        min_similarity: float = 0.9,
+        min_ssim: float = 0.8,
+        same_shop_only: bool = False,
+        max_entries: int = 2000,
+    ):
+        self.enabled = enabled
+        self.min_similarity = min_similarity
+        self.min_ssim = min_ssim
+        self.same_shop_only = same_shop_only
+        self.max_entries = max_entries
+        self.stats = {"lookups": 0, "hits": 0, "rejected": 0, "errors": 0}
+
+    @property
+    def max_distance(self) -> int:
+        """허용 Hamming 거리 (64bit 중 다른 비트 수)"""
+        return int((1.0 - self.min_similarity) * HASH_BITS)
+
+    def _index_key(self, shop_id: Optional[str]) -> Optional[str]:
+        if shop_id:
+            return f"{PHASH_INDEX_PREFIX}:shop:{shop_id}"
+        if self.same_shop_only:
+            return None  # 매장 제한 모드에서 매장 정보가 없으면 탐색 안 함
+        return f"{PHASH_INDEX_PREFIX}:all"
+
+    @staticmethod
+    def _thumbnail_key(result_key: str) -> str:
+        return f"{PHASH_INDEX_PREFIX}:thumb:{result_key}"
+
+    async def compute(self, image_data: bytes) -> Optional[ImageSignature]:
+        """pHash + 썸네일 계산 (CPU 작업 → 스레드)"""
+        if not self.enabled:
+            return None
+        try:
+            signature = await asyncio.to_thread(compute_image_signature, image_data)
+        except Exception as e:
+            self.stats["errors"] += 1
+            logger.warning(f"pHash 계산 실패: {str(e)}")
+            return None
+        return ImageSignature(*signature) if signature else None
+
+    async def find(
+        self, signature: Optional[ImageSignature], shop_id: Optional[str] = None
+    ) -> Optional[str]:
+        """
+        가장 가까운 이전 이미지의 결과 캐시 키
+
+        shop_id가 있으면 그 매장 인덱스만 탐색 (다른 매장 결과 재사용 금지)
+
+        Returns:
+            결과 캐시 키 또는 None (임계값 미달 / SSIM 재확인 실패)
+        """
+        index_key = self._index_key(shop_id)
+        if signature is None or index_key is None:
+            return None
+
+        self.stats["lookups"] += 1
+        candidates = sorted(
+            (distance, result_key)
+            for entry_hash, result_key in await cache_service.get_list(index_key)
+            if (distance := hamming_distance(signature.phash, entry_hash))
+            <= self.max_distance
+        )
+
+        for distance, result_key in candidates[:MAX_VERIFY_CANDIDATES]:
+            score = await self._verify(signature, result_key)
+            if score is not None and score >= self.min_ssim:
+                self.stats["hits"] += 1
+                logger.info(
+                    f"근사 중복 이미지 발견 (distance={distance}, ssim={score:.3f})"
+                )
+                return result_key
+            self.stats["rejected"] += 1
+            logger.info(
+                f"근사 중복 후보 거절 (distance={distance}, ssim={score}) - 레이아웃만 유사"
+            )
+        return None
+
+    async def _verify(
+        self, signature: ImageSignature, result_key: str
+    ) -> Optional[float]:
+        """후보 썸네일과 SSIM 비교 (썸네일 없으면 검증 불가 → None)"""
+        stored = await cache_service.get(self._thumbnail_key(result_key))
+        if not stored:
+            return None
+        try:
+            other = np.frombuffer(stored, dtype=np.uint8).reshape(
+                THUMBNAIL_SIZE, THUMBNAIL_SIZE
+            )
+            return await asyncio.to_thread(ssim, signature.thumbnail, other)
+        except Exception as e:
+            self.stats["errors"] += 1
+            logger.warning(f"SSIM 비교 실패: {str(e)}")
+            return None
+
+    async def add(
+        self,
+        signature: Optional[ImageSignature],
+        result_key: str,
+        shop_id: Optional[str] = None,
+    ) -> None:
+        """OCR 성공 이미지 등록 (매장 이미지는 매장 인덱스에만) + 썸네일 저장"""
+        index_key = self._index_key(shop_id)
+        if signature is None or not result_key or index_key is None:
+            return
+        await cache_service.set(
+            self._thumbnail_key(result_key),
+            signature.thumbnail.tobytes(),
+            ttl=TTL_OCR_PHASH_INDEX,
+        )
+        await cache_service.push_capped(
+            index_key,
+            (signature.phash, result_key),
+            self.max_entries,
+            TTL_OCR_PHASH_INDEX,
+        )
+
+    def get_stats(self) -> dict:
+        lookups = self.stats["lookups"]
+        return {
+            "enabled": self.enabled,
+            "min_similarity": self.min_similarity,
+            "min_ssim": self.min_ssim,
+            "same_shop_only": self.same_shop_only,
+            **self.stats,
+            "hit_rate": round(self.stats["hits"] / lookups, 4) if lookups else 0.0,
+        }
+
+
+# Global instance
+near_duplicate_index = NearDuplicateIndex(
+    enabled=settings.OCR_NEAR_DUP_ENABLED,
+    min_similarity=settings.OCR_NEAR_DUP_MIN_SIMILARITY,
+    min_ssim=settings.OCR_NEAR_DUP_MIN_SSIM,
+    same_shop_only=settings.OCR_NEAR_DUP_SAME_SHOP_ONLY,
+    max_entries=settings.OCR_NEAR_DUP_INDEX_SIZE,
+)
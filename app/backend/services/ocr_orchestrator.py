@@ -3,22 +3,33 @@ OCR Orchestrator Service - Main entry point for OCR operations
 
 Responsibilities:
 1. Tier Router coordination
+   - 최근 Tier 1 폴백이 있었던 매장의 이미지는 hard로 라우팅 (Tier 1/2 병렬 실행)
 2. Result caching (hash-based)
 3. Operational metrics recording
 4. Retry logic and error handling
 """
 
+import asyncio
+import hashlib
 import logging
-import json
-from datetime import datetime
 from typing import Optional
 
 from services.ocr_tier_router import OcrTierRouter, TierLevel
 from services.ocr_provider import OcrResult
-from services.cache_service import cache_service
+from services.cache_service import (
+    cache_service,
+    TTL_OCR_HARD_SHOP,
+    TTL_OCR_RESULT,
+)
+from services.ocr_near_duplicate import near_duplicate_index
+from services.ocr_metrics import ocr_metrics
 
 logger = logging.getLogger(__name__)
 
+# 결과 스키마 변경 시 버전 증가 (이전 캐시 무효화)
+OCR_CACHE_PREFIX = "ocr:result:v2"
+OCR_HARD_SHOP_PREFIX = "ocr:hard_shop"
+
 
 class OcrOrchestrator:
     """
@@ -26,36 +37,41 @@ class OcrOrchestrator:
 
     역할:
     1. Tier Router 조율
-    2. 결과 캐싱 (결과 해시 기반)
+    2. 결과 캐싱 (이미지 내용 해시 기반)
     3. 연산 메트릭 기록
     4. 재시도 로직
     """
 
     def __init__(self):
         self.tier_router = OcrTierRouter()
-        self.cache_ttl_seconds = 86400 * 30  # 30일
+        self.cache_ttl_seconds = TTL_OCR_RESULT  # 30일
 
     async def extract_menu(
         self,
-        image_path: str,
+        image_data: bytes,
         enable_preprocessing: bool = True,
         force_tier: Optional[TierLevel] = None,  # 테스트용
         use_cache: bool = True,  # 캐싱 활성화
+        shop_id: Optional[str] = None,  # 근사 중복 탐색 범위 (매장)
     ) -> OcrResult:
         """
         메뉴 이미지 분석 (메인 진입점)
 
         프로세스:
-        1. 캐시 확인 (결과 해시 매칭)
+        1. 캐시 확인 (이미지 내용 해시 매칭, force_tier 지정 시 생략)
+           + 근사 중복 확인 (pHash Hamming 거리 + 썸네일 SSIM, 같은 매장 내 다른 각도 사진)
         2. 캐시 미스 시 Tier 라우팅
-        3. 결과 캐싱
+           (같은 매장의 직전 이미지가 Tier 1 폴백 → hard: Tier 1/2 병렬 실행)
+        3. 결과 캐싱 + pHash 인덱스 등록
         4. 메트릭 기록
 
         Args:
-            image_path: 이미지 파일 경로
+            image_data: 업로드 이미지 바이트 (JPEG/PNG/WEBP)
             enable_preprocessing: 전처리 활성화 여부
             force_tier: 강제 Tier 선택 (테스트용)
             use_cache: 캐싱 활성화 여부
+            shop_id: 매장 ID (근사 중복 탐색 범위 — 다른 매장 결과는 재사용 안 함,
+                     매장별 Tier 1 폴백 이력으로 hard 판정)
 
         Returns:
             OcrResult
@@ -64,85 +80,117 @@ class OcrOrchestrator:
             Exception: 모든 Tier 실패
         """
 
-        # 1. 캐시 조회
-        if use_cache:
-            cached_result = await self._get_cached_result(image_path)
+        # 1. 캐시 조회 (이미지 바이트 해시 + 전처리 여부)
+        cache_key = ""
+        image_signature = None
+        if use_cache and force_tier is None:
+            cache_key = await self._compute_cache_key(image_data, enable_preprocessing)
+            cached_result = await self._get_cached_result(cache_key)
             if cached_result:
-                logger.info(f"캐시 히트: {image_path}")
+                logger.info(f"캐시 히트: {cache_key}")
                 return cached_result
 
+            image_signature = await near_duplicate_index.compute(image_data)
+            similar_key = await near_duplicate_index.find(image_signature, shop_id)
+            similar_result = await self._get_cached_result(similar_key)
+            if similar_result:
+                logger.info(f"근사 중복 캐시 히트: {similar_key}")
+                await self._cache_result(cache_key, similar_result)
+                return similar_result
+
         # 2. Tier 라우팅
-        logger.info(f"OCR 분석 시작: {image_path}")
+        logger.info(f"OCR 분석 시작: {len(image_data)} bytes")
+        hard = force_tier is None and await self._is_hard_shop(shop_id)
         try:
             result = await self.tier_router.route(
-                image_path=image_path,
+                image_data=image_data,
                 enable_preprocessing=enable_preprocessing,
                 force_tier=force_tier,
+                hard=hard,
             )
         except Exception as e:
             logger.error(f"OCR 라우팅 오류: {str(e)}")
             raise
+        if force_tier is None:
+            await self._remember_shop_difficulty(shop_id, result, hard)
 
         # 3. 결과 캐싱
-        if use_cache and result.success:
-            await self._cache_result(image_path, result)
+        if cache_key and result.success:
+            await self._cache_result(cache_key, result)
+            await near_duplicate_index.add(image_signature, cache_key, shop_id)
 
         # 4. 메트릭 기록
         await self._record_metrics(result)
 
         return result
 
-    async def _get_cached_result(self, image_path: str) -> Optional[OcrResult]:
+    async def _is_hard_shop(self, shop_id: Optional[str]) -> bool:
+        """같은 매장의 최근 이미지에서 Tier 1 폴백이 있었는지 (손글씨/저화질 메뉴판 등)"""
+        if not shop_id:
+            return False
+        try:
+            return bool(await cache_service.get(f"{OCR_HARD_SHOP_PREFIX}:{shop_id}"))
+        except Exception as e:
+            logger.warning(f"hard 매장 조회 오류: {str(e)}")
+            return False
+
+    async def _remember_shop_difficulty(
+        self, shop_id: Optional[str], result: OcrResult, hard: bool
+    ) -> None:
         """
-        캐시에서 결과 조회
+        매장별 hard 힌트 갱신
 
-        캐시 키: ocr:result:{result_hash}
+        - Tier 1 결과 채택 → 해제 (다음 이미지는 일반 hedged 라우팅)
+        - 일반 라우팅에서 폴백 → TTL 동안 hard
+          (hard 실행 중 폴백은 TTL 갱신 안 함: Tier 2가 먼저 끝나 채택되는 경우
+           Tier 1 판정 없이 hard가 계속 연장되지 않도록)
         """
+        if not shop_id:
+            return
+        key = f"{OCR_HARD_SHOP_PREFIX}:{shop_id}"
         try:
-            # 이미지 해시 계산
-            cache_key = await self._compute_cache_key(image_path)
+            if not result.triggered_fallback:
+                if hard:
+                    await cache_service.delete(key)
+            elif not hard:
+                await cache_service.set(key, True, ttl=TTL_OCR_HARD_SHOP)
+        except Exception as e:
+            logger.warning(f"hard 매장 기록 오류: {str(e)}")
+
+    async def _get_cached_result(self, cache_key: Optional[str]) -> Optional[OcrResult]:
+        """
+        캐시에서 결과 조회
+
+        캐시 키: ocr:result:v2:{sha256(image bytes)}:pp{0|1}
+        """
+        if not cache_key:
+            return None
 
-            # Redis에서 조회
-            cached_json = await cache_service.get(cache_key)
-            if not cached_json:
+        try:
+            cached = await cache_service.get(cache_key)
+            if not cached:
                 return None
 
             logger.debug(f"캐시 조회 성공: {cache_key}")
-            # 캐시된 JSON을 원래대로 복원하기는 복잡하므로
-            # 여기서는 캐시 명중만 확인 (실제 OcrResult 복원은 필요시 별도 처리)
-            return None
+            return OcrResult.from_dict(cached)
 
         except Exception as e:
             logger.warning(f"캐시 조회 오류: {str(e)}")
             return None
 
-    async def _cache_result(self, image_path: str, result: OcrResult) -> None:
+    async def _cache_result(self, cache_key: str, result: OcrResult) -> None:
         """
         결과를 캐시에 저장
 
         캐시 구조:
-        - 키: ocr:result:{result_hash}
-        - 값: OcrResult JSON
+        - 키: ocr:result:v2:{sha256(image bytes)}:pp{0|1}
+        - 값: OcrResult.to_dict() (MenuItem 포함 전체)
         - TTL: 30일
         """
         try:
-            cache_key = f"ocr:result:{result.result_hash}"
-
-            # JSON 직렬화 (OcrResult → dict)
-            result_dict = {
-                "provider": result.provider.value if result.provider else None,
-                "success": result.success,
-                "menu_items_count": len(result.menu_items),
-                "raw_text_length": len(result.raw_text),
-                "confidence": float(result.confidence),
-                "result_hash": result.result_hash,
-                "processing_time_ms": result.processing_time_ms,
-                "cached_at": datetime.utcnow().isoformat(),
-            }
-
             await cache_service.set(
                 cache_key,
-                json.dumps(result_dict),
+                result.to_dict(),
                 ttl=self.cache_ttl_seconds,
             )
 
@@ -152,111 +200,47 @@ class OcrOrchestrator:
             logger.warning(f"캐시 저장 오류: {str(e)}")
             # 캐싱 실패는 비치명적, 로깅만 수행
 
-    async def _compute_cache_key(self, image_path: str) -> str:
-        """이미지 경로로부터 캐시 키 생성"""
-        import hashlib
-
+    async def _compute_cache_key(
+        self, image_data: bytes, enable_preprocessing: bool
+    ) -> str:
+        """이미지 내용 해시 + 전처리 여부로 캐시 키 생성 (파일명 무관)"""
         try:
-            with open(image_path, "rb") as f:
-                image_hash = hashlib.md5(f.read()).hexdigest()
-            return f"ocr:image:{image_hash}"
+            # hashlib은 큰 버퍼 해싱 중 GIL 해제 → 스레드에서 실행
+            image_hash = await asyncio.to_thread(self._hash_bytes, image_data)
+            return f"{OCR_CACHE_PREFIX}:{image_hash}:pp{int(enable_preprocessing)}"
         except Exception as e:
             logger.warning(f"캐시 키 생성 실패: {str(e)}")
             return ""
 
+    @staticmethod
+    def _hash_bytes(image_data: bytes) -> str:
+        return hashlib.sha256(image_data).hexdigest()
+
     async def _record_metrics(self, result: OcrResult) -> None:
         """
-        OCR 메트릭 기록
+        OCR 메트릭 기록 (Redis 해시 원자적 증가, services/ocr_metrics.py)
 
         수집 지표:
         - Tier 1 성공률
         - Tier 2 폴백 비율
-        - 평균 처리 시간
+        - 평균 처리 시간 + Tier/공급자별 지연 히스토그램
         - 가격 파싱 에러율
         - 손글씨 감지율
         """
         try:
-            metrics_key = "ocr:metrics"
-
-            # 기존 메트릭 조회
-            existing_json = await cache_service.get(metrics_key)
-            metrics = (
-                json.loads(existing_json)
-                if existing_json
-                else {
-                    "tier_1_count": 0,
-                    "tier_2_count": 0,
-                    "total_count": 0,
-                    "avg_processing_time_ms": 0,
-                    "price_error_count": 0,
-                    "handwriting_count": 0,
-                    "last_updated": datetime.utcnow().isoformat(),
-                }
-            )
-
-            # 메트릭 업데이트
-            metrics["total_count"] += 1
-            if result.triggered_fallback:
-                metrics["tier_2_count"] += 1
-            else:
-                metrics["tier_1_count"] += 1
-
-            # 평균 처리 시간
-            prev_total = metrics["total_count"] - 1
-            if prev_total > 0:
-                metrics["avg_processing_time_ms"] = (
-                    metrics["avg_processing_time_ms"] * prev_total
-                    + result.processing_time_ms
-                ) / metrics["total_count"]
-            else:
-                metrics["avg_processing_time_ms"] = result.processing_time_ms
-
-            if result.price_parse_errors:
-                metrics["price_error_count"] += len(result.price_parse_errors)
-
-            if result.has_handwriting:
-                metrics["handwriting_count"] += 1
-
-            metrics["last_updated"] = datetime.utcnow().isoformat()
-
-            # 메트릭 저장
-            await cache_service.set(
-                metrics_key,
-                json.dumps(metrics),
-                ttl=86400 * 90,  # 90일 보관
-            )
-
-            logger.debug(
-                f"메트릭 업데이트: total={metrics['total_count']}, "
-                f"tier2={metrics['tier_2_count']}, "
-                f"avg_time={metrics['avg_processing_time_ms']:.0f}ms"
-            )
-
+            await ocr_metrics.record(result)
         except Exception as e:
             logger.warning(f"메트릭 기록 오류: {str(e)}")
 
     async def get_metrics(self) -> dict:
-        """현재 OCR 메트릭 조회"""
+        """현재 OCR 메트릭 조회 (비율/분위수는 조회 시 계산)"""
         try:
-            metrics_json = await cache_service.get("ocr:metrics")
-            if not metrics_json:
+            metrics = await ocr_metrics.snapshot()
+            if not metrics:
                 return {}
 
-            metrics = json.loads(metrics_json)
-
-            # 계산된 지표 추가
-            total = metrics.get("total_count", 0)
-            if total > 0:
-                metrics["tier_1_success_rate"] = (
-                    f"{(metrics.get('tier_1_count', 0) / total * 100):.1f}%"
-                )
-                metrics["tier_2_fallback_rate"] = (
-                    f"{(metrics.get('tier_2_count', 0) / total * 100):.1f}%"
-                )
-                metrics["handwriting_detection_rate"] = (
-                    f"{(metrics.get('handwriting_count', 0) / total * 100):.1f}%"
-                )
-
+            metrics["router"] = self.tier_router.get_stats()
+            metrics["near_duplicate"] = near_duplicate_index.get_stats()
             return metrics
 
         except Exception as e:
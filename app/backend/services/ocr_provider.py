@@ -6,8 +6,8 @@ All providers must implement OcrProvider abstract class.
 """
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
-from typing import Optional, List
+from dataclasses import asdict, dataclass, field, fields
+from typing import Any, Dict, Optional, List
 from enum import Enum
 
 
@@ -80,6 +80,29 @@ class OcrResult:
     triggered_fallback: bool = False
     fallback_reason: Optional[str] = None
 
+    def to_dict(self) -> Dict[str, Any]:
+        """직렬화 (Enum → value, MenuItem → dict)"""
+        data = asdict(self)
+        data["provider"] = self.provider.value if self.provider else None
+        data["confidence_level"] = (
+            self.confidence_level.value if self.confidence_level else None
+        )
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "OcrResult":
+        """to_dict() 역변환 (알 수 없는 키는 무시)"""
+        known = {f.name for f in fields(cls)}
+        values = {k: v for k, v in data.items() if k in known}
+        if values.get("provider"):
+            values["provider"] = OcrProviderType(values["provider"])
+        if values.get("confidence_level"):
+            values["confidence_level"] = OcrConfidenceLevel(values["confidence_level"])
+        values["menu_items"] = [
+            MenuItem(**item) for item in values.get("menu_items") or []
+        ]
+        return cls(**values)
+
 
 class OcrProvider(ABC):
     """OCR 공급자 추상 기본 클래스"""
@@ -90,13 +113,13 @@ class OcrProvider(ABC):
 
     @abstractmethod
     async def extract(
-        self, image_path: str, enable_preprocessing: bool = True
+        self, image_data: bytes, enable_preprocessing: bool = True
     ) -> OcrResult:
         """
         이미지에서 메뉴 정보 추출
 
         Args:
-            image_path: 이미지 파일 경로
+            image_data: 이미지 바이트 (JPEG/PNG/WEBP, 임시 파일 없음)
             enable_preprocessing: 전처리 활성화 여부
 
         Returns:
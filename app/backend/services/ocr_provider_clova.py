@@ -31,7 +31,7 @@ class OcrProviderClova(OcrProvider):
         self.provider_type = OcrProviderType.CLOVA
 
     async def extract(
-        self, image_path: str, enable_preprocessing: bool = True
+        self, image_data: bytes, enable_preprocessing: bool = True
     ) -> OcrResult:
         """
         CLOVA OCR로 메뉴 이미지 분석
@@ -42,9 +42,9 @@ class OcrProviderClova(OcrProvider):
         start_time = time.time()
 
         try:
-            # 기존 CLOVA 함수 호출 (동기 함수를 비동기로 래핑)
-            clova_result = await self._call_clova_sync(
-                image_path=image_path,
+            # 기존 CLOVA 함수 호출
+            clova_result = await self._call_clova(
+                image_data=image_data,
                 enable_preprocessing=enable_preprocessing,
             )
 
@@ -58,7 +58,7 @@ class OcrProviderClova(OcrProvider):
             )
 
             # 결과 해시
-            result_hash = self._compute_result_hash(image_path, clova_result)
+            result_hash = self._compute_result_hash(image_data, clova_result)
 
             processing_time = int((time.time() - start_time) * 1000)
 
@@ -94,21 +94,21 @@ class OcrProviderClova(OcrProvider):
             logger.error(f"CLOVA 헬스 체크 실패: {str(e)}")
             return False
 
-    async def _call_clova_sync(
+    async def _call_clova(
         self,
-        image_path: str,
+        image_data: bytes,
         enable_preprocessing: bool,
     ) -> dict:
         """
-        동기 함수인 recognize_menu_image()를 비동기로 래핑
+        기존 recognize_menu_image() 호출 (CLOVA + LLM 파싱, 비동기)
 
         기존 Sprint 3B 코드와의 호환성 유지
         """
         try:
             # 기존 ocr_service.recognize_menu_image() 호출
-            # (현재는 동기 함수, 필요시 asyncio.to_thread로 래핑 가능)
-            clova_result = ocr_service.recognize_menu_image(
-                image_path=image_path,
+            # (공유 비동기 CLOVA 클라이언트 사용, 이벤트 루프 블로킹 없음)
+            clova_result = await ocr_service.recognize_menu_image(
+                image_data=image_data,
                 enable_preprocessing=enable_preprocessing,
             )
 
@@ -197,11 +197,10 @@ class OcrProviderClova(OcrProvider):
         else:
             return OcrConfidenceLevel.LOW
 
-    def _compute_result_hash(self, image_path: str, clova_result: dict) -> str:
+    def _compute_result_hash(self, image_data: bytes, clova_result: dict) -> str:
         """결과 해시 계산"""
         try:
-            with open(image_path, "rb") as f:
-                image_hash = hashlib.md5(f.read()).hexdigest()
+            image_hash = hashlib.md5(image_data).hexdigest()
 
             result_text = str(clova_result)
             combined = f"{image_hash}:{result_text}"
@@ -23,6 +23,7 @@ from services.ocr_provider import (
     OcrProviderException,
 )
 from config import settings
+from utils.image_validation import detect_image_format
 
 logger = logging.getLogger(__name__)
 
@@ -42,7 +43,7 @@ class OcrProviderGpt(OcrProvider):
         self.temperature = 0  # 결정론성 확보 (매번 같은 결과)
 
     async def extract(
-        self, image_path: str, enable_preprocessing: bool = True
+        self, image_data: bytes, enable_preprocessing: bool = True
     ) -> OcrResult:
         """
         GPT-4o mini Vision으로 메뉴 이미지 분석
@@ -55,11 +56,10 @@ class OcrProviderGpt(OcrProvider):
         start_time = time.time()
 
         try:
-            # Step 1: 이미지 로드 및 전처리
-            image_bytes = await self._load_and_preprocess(
-                image_path, enable_preprocessing
-            )
+            # Step 1: 이미지 전처리
+            image_bytes = await self._preprocess(image_data, enable_preprocessing)
             image_b64 = base64.b64encode(image_bytes).decode()
+            media_type = f"image/{detect_image_format(image_bytes).lower()}"
 
             # Step 2: GPT Vision 호출
             response = await self.client.messages.create(
@@ -74,7 +74,7 @@ class OcrProviderGpt(OcrProvider):
                                 "type": "image",
                                 "source": {
                                     "type": "base64",
-                                    "media_type": "image/jpeg",
+                                    "media_type": media_type,
                                     "data": image_b64,
                                 },
                             },
@@ -99,7 +99,7 @@ class OcrProviderGpt(OcrProvider):
             )
 
             # Step 5: 결과 해시 생성
-            result_hash = self._compute_result_hash(image_path, raw_text)
+            result_hash = self._compute_result_hash(image_data, raw_text)
 
             processing_time = int((time.time() - start_time) * 1000)
 
@@ -252,12 +252,11 @@ JSON Schema:
         else:
             return OcrConfidenceLevel.LOW
 
-    def _compute_result_hash(self, image_path: str, raw_text: str) -> str:
+    def _compute_result_hash(self, image_data: bytes, raw_text: str) -> str:
         """결과 해시 계산 (캐싱용)"""
         try:
-            # 이미지 파일의 MD5
-            with open(image_path, "rb") as f:
-                image_hash = hashlib.md5(f.read()).hexdigest()
+            # 원본 이미지 바이트의 MD5
+            image_hash = hashlib.md5(image_data).hexdigest()
 
             # 이미지 해시 + 출력 텍스트 해시
             combined = f"{image_hash}:{raw_text}"
@@ -266,18 +265,14 @@ JSON Schema:
             logger.warning(f"해시 계산 실패: {str(e)}")
             return ""
 
-    async def _load_and_preprocess(
-        self, image_path: str, enable_preprocessing: bool
-    ) -> bytes:
-        """이미지 로드 및 전처리"""
+    async def _preprocess(self, image_data: bytes, enable_preprocessing: bool) -> bytes:
+        """이미지 전처리 (실패 시 원본 바이트 사용)"""
         if enable_preprocessing:
             try:
-                from utils.image_preprocessing import preprocess_menu_image
+                from services.preprocess_pool import preprocess_pool
 
-                preprocessed_path = preprocess_menu_image(image_path)
-                image_path = preprocessed_path
+                return await preprocess_pool.preprocess(image_data)
             except Exception as e:
                 logger.warning(f"이미지 전처리 실패: {str(e)}, 원본 이미지 사용")
 
-        with open(image_path, "rb") as f:
-            return f.read()
+        return image_data
@@ -4,15 +4,14 @@ Integrates CLOVA OCR API + GPT-4o for menu text extraction
 """
 
 import json
-import base64
-import uuid
 import logging
 from typing import List, Dict
-import requests
-from openai import OpenAI
+from openai import AsyncOpenAI
 
 from config import settings
-from utils.image_preprocessing import preprocess_menu_image
+from services.clova_client import clova_client
+from services.preprocess_pool import preprocess_pool
+from utils.image_validation import detect_image_format
 
 logger = logging.getLogger(__name__)
 
@@ -27,20 +26,22 @@ class OCRService:
     """
 
     def __init__(self):
-        self.clova_api_url = "https://kko5u71wza.apigw.ntruss.com/custom/v1/33367/0ef5b16de3cdd8fb766e13f6a67a0aeb4b5a2c3c9e5a5b0dd79a1d58fe6e5cf6/general"
+        self.clova_client = clova_client
         self.clova_secret = settings.CLOVA_OCR_SECRET
         self.openai_client = (
-            OpenAI(api_key=settings.OPENAI_API_KEY) if settings.OPENAI_API_KEY else None
+            AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+            if settings.OPENAI_API_KEY
+            else None
         )
 
-    def recognize_menu_image(
-        self, image_path: str, enable_preprocessing: bool = True
+    async def recognize_menu_image(
+        self, image_data: bytes, enable_preprocessing: bool = True
     ) -> Dict:
         """
         Main entry point: Image → Menu items
 
         Args:
-            image_path: Path to menu image file
+            image_data: Menu image bytes (JPEG/PNG/WEBP)
             enable_preprocessing: Whether to apply image preprocessing (default True)
 
         Returns:
@@ -55,13 +56,14 @@ class OCRService:
             # Step 1: Preprocessing (optional)
             if enable_preprocessing:
                 try:
-                    preprocessed_path = preprocess_menu_image(image_path)
-                    ocr_result = self._call_clova_ocr(preprocessed_path)
+                    # OpenCV 전처리는 CPU 작업 → 프로세스 풀에서 실행
+                    preprocessed = await preprocess_pool.preprocess(image_data)
+                    ocr_result = await self._call_clova_ocr(preprocessed)
                 except Exception as e:
                     logger.warning(f"Preprocessing failed: {e}, using original")
-                    ocr_result = self._call_clova_ocr(image_path)
+                    ocr_result = await self._call_clova_ocr(image_data)
             else:
-                ocr_result = self._call_clova_ocr(image_path)
+                ocr_result = await self._call_clova_ocr(image_data)
 
             if not ocr_result["success"]:
                 return ocr_result
@@ -69,7 +71,7 @@ class OCRService:
             raw_text = ocr_result["text"]
 
             # Step 2: GPT-4o parsing
-            menu_items = self._parse_menu_with_llm(raw_text)
+            menu_items = await self._parse_menu_with_llm(raw_text)
 
             return {
                 "success": True,
@@ -81,9 +83,9 @@ class OCRService:
         except Exception as e:
             return {"success": False, "error": str(e), "menu_items": []}
 
-    def _call_clova_ocr(self, image_path: str) -> Dict:
+    async def _call_clova_ocr(self, image_data: bytes) -> Dict:
         """
-        Call CLOVA OCR API
+        Call CLOVA OCR API (shared async client: pooling, timeouts, retries)
 
         Returns:
             {
@@ -93,71 +95,14 @@ class OCRService:
                 "raw_response": dict
             }
         """
-        if not self.clova_secret:
-            return {"success": False, "error": "CLOVA_OCR_SECRET not configured"}
-
         try:
-            # Read image file
-            with open(image_path, "rb") as f:
-                image_data = f.read()
-
-            # Prepare request
-            headers = {
-                "X-OCR-SECRET": self.clova_secret,
-                "Content-Type": "application/json",
-            }
-
-            request_json = {
-                "version": "V2",
-                "requestId": str(uuid.uuid4()),
-                "timestamp": 0,
-                "images": [
-                    {
-                        "format": "jpg",  # Auto-detect in production
-                        "name": "menu_image",
-                        "data": base64.b64encode(image_data).decode("utf-8"),
-                    }
-                ],
-            }
-
-            # Call CLOVA OCR
-            response = requests.post(
-                self.clova_api_url, headers=headers, json=request_json, timeout=30
-            )
-
-            if response.status_code != 200:
-                return {
-                    "success": False,
-                    "error": f"CLOVA OCR API error: {response.status_code} {response.text}",
-                }
-
-            result = response.json()
-
-            # Extract text from OCR result
-            text_lines = []
-            total_confidence = 0.0
-            field_count = 0
-
-            for image in result.get("images", []):
-                for field in image.get("fields", []):
-                    text_lines.append(field.get("inferText", ""))
-                    total_confidence += field.get("inferConfidence", 0.0)
-                    field_count += 1
-
-            combined_text = "\n".join(text_lines)
-            avg_confidence = total_confidence / field_count if field_count > 0 else 0.0
-
-            return {
-                "success": True,
-                "text": combined_text,
-                "confidence": avg_confidence,
-                "raw_response": result,
-            }
+            image_format = "png" if detect_image_format(image_data) == "PNG" else "jpg"
+            return await self.clova_client.recognize(image_data, image_format)
 
         except Exception as e:
             return {"success": False, "error": f"CLOVA OCR error: {str(e)}"}
 
-    def _parse_menu_with_llm(self, raw_text: str) -> List[Dict]:
+    async def _parse_menu_with_llm(self, raw_text: str) -> List[Dict]:
         """
         Parse OCR text with GPT-4o to extract menu items
 
@@ -195,7 +140,7 @@ Return JSON array:
 If you cannot parse any menu items, return empty array [].
 """
 
-            response = self.openai_client.chat.completions.create(
+            response = await self.openai_client.chat.completions.create(
                 model="gpt-4o-mini",  # Cost-effective for parsing
                 messages=[
                     {
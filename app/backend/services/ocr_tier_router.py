@@ -7,8 +7,11 @@ Implements Tier-based routing with automatic fallback:
 - Tier 3: Tesseract (future)
 """
 
+import asyncio
 import logging
-from typing import Optional
+import time
+from collections import deque
+from typing import Dict, Optional
 from enum import Enum
 
 from services.ocr_provider import (
@@ -18,6 +21,7 @@ from services.ocr_provider import (
 )
 from services.ocr_provider_gpt import OcrProviderGpt
 from services.ocr_provider_clova import OcrProviderClova
+from config import settings
 
 logger = logging.getLogger(__name__)
 
@@ -48,6 +52,52 @@ class FallbackTrigger:
         self.allow_on_item_count_anomaly = allow_on_item_count_anomaly
 
 
+class OcrRouterStats:
+    """라우팅 메트릭 (워커 프로세스 단위, Tier별 최근 지연시간 샘플)"""
+
+    def __init__(self, sample_size: int = 500):
+        self.routed = 0  # 라우팅 요청 수 (force_tier 제외)
+        self.hedged = 0  # Tier 1 지연으로 Tier 2를 추가 실행한 수
+        self.parallel = 0  # hard 이미지로 처음부터 병렬 실행한 수
+        self.hedge_wins = 0  # Tier 1 응답 전에 Tier 2 결과가 채택된 수
+        self.fallbacks = 0  # Tier 2 결과를 반환한 수
+        self.cancelled = 0  # 채택되지 않아 취소된 호출 수
+        self._latencies: Dict[TierLevel, deque] = {
+            tier: deque(maxlen=sample_size) for tier in TierLevel
+        }
+
+    def record_latency(self, tier: TierLevel, elapsed_ms: float):
+        self._latencies[tier].append(elapsed_ms)
+
+    def percentile(self, tier: TierLevel, pct: float) -> Optional[float]:
+        samples = sorted(self._latencies[tier])
+        if not samples:
+            return None
+        index = min(len(samples) - 1, int(len(samples) * pct / 100))
+        return round(samples[index], 1)
+
+    def snapshot(self) -> dict:
+        routed = self.routed or 1
+        return {
+            "routed": self.routed,
+            "hedged": self.hedged,
+            "parallel": self.parallel,
+            "hedge_rate": round((self.hedged + self.parallel) / routed, 4),
+            "hedge_wins": self.hedge_wins,
+            "fallbacks": self.fallbacks,
+            "cancelled": self.cancelled,
+            "latency_ms": {
+                tier.value: {
+                    "samples": len(self._latencies[tier]),
+                    "p50": self.percentile(tier, 50),
+                    "p90": self.percentile(tier, 90),
+                    "p99": self.percentile(tier, 99),
+                }
+                for tier in (TierLevel.TIER_1, TierLevel.TIER_2)
+            },
+        }
+
+
 class OcrTierRouter:
     """
     Tier 기반 OCR 라우팅 시스템
@@ -55,6 +105,11 @@ class OcrTierRouter:
     Tier 1: GPT-4o mini Vision (빠르고, 구조화된 출력)
     Tier 2: CLOVA OCR (Tier 1 실패 시 fallback, 한글 특화)
     Tier 3: Tesseract (미래용, 로컬)
+
+    Hedged 모드 (OCR_HEDGE_ENABLED):
+    - Tier 1이 hedge_delay (Tier 1 p90 예산) 안에 응답하지 않으면 Tier 2 동시 시작
+    - hard 이미지는 처음부터 두 Tier 병렬 실행
+    - 트리거 조건을 통과한 첫 결과 채택 (동시 완료 시 Tier 1 우선), 나머지 호출은 취소
     """
 
     def __init__(self):
@@ -94,11 +149,17 @@ class OcrTierRouter:
             allow_on_item_count_anomaly=False,
         )
 
+        # Hedging 설정
+        self.hedge_enabled = settings.OCR_HEDGE_ENABLED
+        self.hedge_delay_seconds = settings.OCR_HEDGE_DELAY_MS / 1000
+        self.stats = OcrRouterStats()
+
     async def route(
         self,
-        image_path: str,
+        image_data: bytes,
         enable_preprocessing: bool = True,
         force_tier: Optional[TierLevel] = None,  # 강제 Tier 선택 (테스트용)
+        hard: bool = False,  # 손글씨/저화질 등 Tier 1 폴백이 예상되는 이미지
     ) -> OcrResult:
         """
         Tier 라우팅 로직
@@ -107,11 +168,13 @@ class OcrTierRouter:
         1. Tier 1 (GPT Vision) 시도
         2. Tier 1 실패 또는 폴백 조건 만족 시 Tier 2 (CLOVA) 시도
         3. Tier 2 실패 시 최후의 결과 반환
+        (Hedged 모드에서는 1/2를 지연 예산 기준으로 겹쳐 실행)
 
         Args:
-            image_path: 이미지 파일 경로
+            image_data: 이미지 바이트
             enable_preprocessing: 전처리 활성화 여부
             force_tier: 강제 Tier 선택 (테스트용)
+            hard: True면 (hedged 모드에서) Tier 1/2 동시 실행
 
         Returns:
             OcrResult
@@ -124,13 +187,17 @@ class OcrTierRouter:
         if force_tier:
             logger.info(f"강제 Tier 선택: {force_tier}")
             return await self._execute_tier(
-                force_tier, image_path, enable_preprocessing
+                force_tier, image_data, enable_preprocessing
             )
 
+        self.stats.routed += 1
+        if self.hedge_enabled and self.tier_2_provider is not None:
+            return await self._route_hedged(image_data, enable_preprocessing, hard)
+
         # Tier 1: GPT Vision
-        logger.info(f"Tier 1 (GPT Vision) 시도: {image_path}")
+        logger.info("Tier 1 (GPT Vision) 시도")
         result_tier_1 = await self._execute_tier(
-            TierLevel.TIER_1, image_path, enable_preprocessing
+            TierLevel.TIER_1, image_data, enable_preprocessing
         )
 
         # Tier 1 결과 평가
@@ -141,15 +208,12 @@ class OcrTierRouter:
             logger.warning(f"Tier 1 폴백 트리거: {fallback_reason}")
 
             # Tier 2: CLOVA
-            logger.info(f"Tier 2 (CLOVA) 시도: {image_path}")
+            logger.info("Tier 2 (CLOVA) 시도")
             result_tier_2 = await self._execute_tier(
-                TierLevel.TIER_2, image_path, enable_preprocessing
+                TierLevel.TIER_2, image_data, enable_preprocessing
             )
 
-            result_tier_2.triggered_fallback = True
-            result_tier_2.fallback_reason = fallback_reason
-
-            return result_tier_2
+            return self._mark_fallback(result_tier_2, fallback_reason)
 
         logger.info(
             f"Tier 1 성공: confidence={result_tier_1.confidence:.2f}, "
@@ -157,13 +221,129 @@ class OcrTierRouter:
         )
         return result_tier_1
 
+    async def _route_hedged(
+        self, image_data: bytes, enable_preprocessing: bool, hard: bool
+    ) -> OcrResult:
+        """
+        Hedged 라우팅
+
+        - Tier 1 결과가 트리거 통과 → 즉시 채택
+        - Tier 2 결과가 트리거 통과 → 채택 (Tier 1 미응답 시 hedge win)
+        - 둘 다 미달 → 직렬 모드와 동일하게 Tier 2 결과 반환
+        """
+        tasks: Dict[asyncio.Task, TierLevel] = {}
+
+        def start(tier: TierLevel) -> asyncio.Task:
+            task = asyncio.create_task(
+                self._execute_tier(tier, image_data, enable_preprocessing)
+            )
+            tasks[task] = tier
+            return task
+
+        tier_1_task = start(TierLevel.TIER_1)
+        hedge_reason = None
+
+        if hard:
+            self.stats.parallel += 1
+            hedge_reason = "hard 이미지 병렬 실행"
+            start(TierLevel.TIER_2)
+        else:
+            done, _ = await asyncio.wait(
+                {tier_1_task}, timeout=self.hedge_delay_seconds
+            )
+            if not done:
+                self.stats.hedged += 1
+                hedge_reason = (
+                    f"Tier 1 응답 지연 (>{int(self.hedge_delay_seconds * 1000)}ms)"
+                )
+                logger.info("Tier 2 (CLOVA) hedge 시작")
+                start(TierLevel.TIER_2)
+
+        results: Dict[TierLevel, OcrResult] = {}
+        pending = set(tasks)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    results[tasks[task]] = task.result()
+
+                result_tier_1 = results.get(TierLevel.TIER_1)
+                result_tier_2 = results.get(TierLevel.TIER_2)
+
+                if result_tier_1 is not None and not self._should_fallback(
+                    result_tier_1, self.tier_1_trigger
+                ):
+                    logger.info(
+                        f"Tier 1 성공: confidence={result_tier_1.confidence:.2f}, "
+                        f"items={len(result_tier_1.menu_items)}"
+                    )
+                    return result_tier_1
+
+                if result_tier_2 is not None and not self._should_fallback(
+                    result_tier_2, self.tier_2_trigger
+                ):
+                    if result_tier_1 is None:
+                        self.stats.hedge_wins += 1
+                        reason = hedge_reason
+                    else:
+                        reason = self._get_fallback_reason(
+                            result_tier_1, self.tier_1_trigger
+                        )
+                    return self._mark_fallback(result_tier_2, reason)
+
+                # Tier 1 폴백 조건 만족 + Tier 2 미시작 → 직렬 폴백
+                if result_tier_1 is not None and TierLevel.TIER_2 not in tasks.values():
+                    logger.warning(
+                        "Tier 1 폴백 트리거: "
+                        f"{self._get_fallback_reason(result_tier_1, self.tier_1_trigger)}"
+                    )
+                    pending.add(start(TierLevel.TIER_2))
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+                    self.stats.cancelled += 1
+
+        # 두 Tier 모두 조건 미달
+        return self._mark_fallback(
+            results[TierLevel.TIER_2],
+            self._get_fallback_reason(results[TierLevel.TIER_1], self.tier_1_trigger),
+        )
+
+    def _mark_fallback(self, result: OcrResult, reason: Optional[str]) -> OcrResult:
+        self.stats.fallbacks += 1
+        result.triggered_fallback = True
+        result.fallback_reason = reason
+        return result
+
+    def get_stats(self) -> dict:
+        """라우팅 메트릭 (hedge 비율, Tier별 지연시간 p50/p90/p99)"""
+        return {
+            "hedge_enabled": self.hedge_enabled,
+            "hedge_delay_ms": int(self.hedge_delay_seconds * 1000),
+            **self.stats.snapshot(),
+        }
+
     async def _execute_tier(
         self,
         tier_level: TierLevel,
-        image_path: str,
+        image_data: bytes,
+        enable_preprocessing: bool,
+    ) -> OcrResult:
+        """특정 Tier 실행 (취소된 호출은 지연시간 샘플에서 제외)"""
+        start_time = time.monotonic()
+        result = await self._run_provider(tier_level, image_data, enable_preprocessing)
+        self.stats.record_latency(tier_level, (time.monotonic() - start_time) * 1000)
+        return result
+
+    async def _run_provider(
+        self,
+        tier_level: TierLevel,
+        image_data: bytes,
         enable_preprocessing: bool,
     ) -> OcrResult:
-        """특정 Tier 실행"""
         try:
             if tier_level == TierLevel.TIER_1:
                 provider = self.tier_1_provider
@@ -177,7 +357,7 @@ class OcrTierRouter:
             if not provider:
                 raise OcrProviderException(f"{tier_level}은 활성화되지 않았습니다")
 
-            result = await provider.extract(image_path, enable_preprocessing)
+            result = await provider.extract(image_data, enable_preprocessing)
             return result
 
         except OcrProviderException as e:
@@ -0,0 +1,147 @@
+"""
+Preprocess Pool - OpenCV 이미지 전처리 전용 프로세스 풀
+
+Responsibilities:
+1. preprocess_image_bytes (CLAHE, blur, 회전 판정)를 ProcessPoolExecutor에서 실행
+   → 이벤트 루프/GIL과 분리, 업로드 처리량이 CPU 코어 수에 비례
+2. 인코딩된 이미지 바이트만 전달 (디코딩된 픽셀 배열/임시 파일 없음)
+3. 대기열 상한 (Semaphore) + 대기열 깊이 / 처리 시간 메트릭
+4. 워커 비정상 종료 (BrokenProcessPool) 시 풀 재생성
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, Optional
+
+from config import settings
+from utils.image_preprocessing import DEFAULT_MAX_LONG_EDGE, preprocess_image_bytes
+
+logger = logging.getLogger(__name__)
+
+
+def _init_worker():
+    """워커 프로세스 초기화: OpenCV 내부 스레드 비활성화 (코어 과할당 방지)"""
+    import cv2
+
+    cv2.setNumThreads(1)
+
+
+class PreprocessPool:
+    """전처리 프로세스 풀 (API 워커 프로세스당 1개, lazy 생성)"""
+
+    def __init__(
+        self,
+        max_workers: int = 0,
+        max_queue: int = 32,
+        max_long_edge: int = DEFAULT_MAX_LONG_EDGE,
+    ):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_queue = max_queue
+        self.max_long_edge = max_long_edge
+
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._slots: Optional[asyncio.Semaphore] = None  # Lazy initialization
+        self.in_flight = 0  # 풀에 제출된 작업 (실행 중 + 풀 내부 대기)
+        self.waiting = 0  # 대기열 상한으로 제출 전 대기 중인 작업
+        self.peak_queue_depth = 0
+        self.completed = 0
+        self.failed = 0
+        self.restarts = 0
+        self._total_ms = 0.0
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # fork는 이벤트 루프/스레드 상태를 복제하므로 spawn 사용
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+            )
+            logger.info(f"Preprocess pool started ({self.max_workers} workers)")
+        return self._executor
+
+    @property
+    def queue_depth(self) -> int:
+        """실행 대기 중인 작업 수 (풀 내부 대기 + 상한 대기)"""
+        return max(0, self.in_flight - self.max_workers) + self.waiting
+
+    async def preprocess(self, image_data: bytes) -> bytes:
+        """
+        전처리 실행 (preprocess_image_bytes와 동일한 입출력)
+
+        Returns:
+            전처리된 JPEG 바이트
+        """
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_workers + self.max_queue)
+
+        self.waiting += 1
+        self.peak_queue_depth = max(self.peak_queue_depth, self.queue_depth)
+        try:
+            await self._slots.acquire()
+        finally:
+            self.waiting -= 1
+
+        self.in_flight += 1
+        self.peak_queue_depth = max(self.peak_queue_depth, self.queue_depth)
+        start_time = time.monotonic()
+        try:
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(
+                self.executor, preprocess_image_bytes, image_data, self.max_long_edge
+            )
+            self.completed += 1
+            self._total_ms += (time.monotonic() - start_time) * 1000
+            return result
+        except BrokenProcessPool:
+            self.failed += 1
+            self._restart()
+            raise
+        except Exception:
+            self.failed += 1
+            raise
+        finally:
+            self.in_flight -= 1
+            self._slots.release()
+
+    def _restart(self):
+        logger.error("Preprocess pool broken, recreating")
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+        self.restarts += 1
+
+    def shutdown(self):
+        """앱 shutdown 시 워커 종료"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "workers": self.max_workers,
+            "max_queue": self.max_queue,
+            "in_flight": self.in_flight,
+            "queue_depth": self.queue_depth,
+            "peak_queue_depth": self.peak_queue_depth,
+            "completed": self.completed,
+            "failed": self.failed,
+            "restarts": self.restarts,
+            "avg_ms": (
+                round(self._total_ms / self.completed, 1) if self.completed else 0.0
+            ),
+        }
+
+
+# Global instance
+preprocess_pool = PreprocessPool(
+    max_workers=settings.PREPROCESS_POOL_SIZE,
+    max_queue=settings.PREPROCESS_MAX_QUEUE,
+    max_long_edge=settings.PREPROCESS_MAX_LONG_EDGE,
+)
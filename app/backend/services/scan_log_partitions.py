@@ -0,0 +1,204 @@
+"""
+Scan Log Partitions - scan_logs 월 파티션 생성 / 보존 정책
+
+Responsibilities:
+1. 이번 달 + N개월 파티션 사전 생성 (ensure_scan_logs_partitions SQL 함수)
+2. 보존 기간이 지난 파티션: DETACH → gzip CSV 아카이브 (COPY) → DROP
+   - DROP과 같은 트랜잭션에서 해당 월 롤업(scan_log_daily_stats)의 pending을 0으로
+     (드롭된 행은 검토 큐에서 사라짐 → 관리자 통계 pending_queue_count 드리프트 방지)
+3. DETACH 후 아카이브가 실패한 테이블은 다음 실행 시 재시도
+
+PostgreSQL 전용 (migrations/partition_scan_logs_by_month.sql 적용 후)
+다른 dialect에서는 no-op
+"""
+
+import gzip
+import logging
+import os
+import re
+from datetime import date, datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+PARTITION_NAME_RE = re.compile(r"^scan_logs_y(\d{4})m(\d{2})$")
+
+
+def partition_month(name: str) -> Optional[date]:
+    """파티션 이름 → 해당 월 1일 (scan_logs_default 등은 None)"""
+    match = PARTITION_NAME_RE.match(name)
+    if not match:
+        return None
+    return date(int(match.group(1)), int(match.group(2)), 1)
+
+
+def next_month(month: date) -> date:
+    """다음 달 1일 (파티션 상한 경계)"""
+    months = month.year * 12 + month.month
+    return date(months // 12, months % 12 + 1, 1)
+
+
+def retention_cutoff(retention_months: int, today: Optional[date] = None) -> date:
+    """이 날짜(월초) 이전 월의 파티션은 보존 기간 만료"""
+    today = today or datetime.now(timezone.utc).date()
+    months = today.year * 12 + (today.month - 1) - retention_months
+    return date(months // 12, months % 12 + 1, 1)
+
+
+class ScanLogPartitionManager:
+    """scan_logs 파티션 관리 (앱 시작 시 ensure, 보존 작업은 스크립트/cron)"""
+
+    def __init__(
+        self,
+        engine: Optional[AsyncEngine] = None,
+        months_ahead: int = 3,
+        retention_months: int = 12,
+        archive_dir: str = "data/scan_log_archive",
+    ):
+        self._engine = engine
+        self.months_ahead = months_ahead
+        self.retention_months = retention_months
+        self.archive_dir = Path(archive_dir)
+
+    @property
+    def engine(self) -> AsyncEngine:
+        if self._engine is None:
+            from database import engine
+
+            self._engine = engine
+        return self._engine
+
+    @property
+    def enabled(self) -> bool:
+        return self.engine.dialect.name == "postgresql"
+
+    async def ensure_partitions(self) -> int:
+        """이번 달부터 months_ahead개월 뒤까지 파티션 생성 (이미 있으면 skip)"""
+        if not self.enabled:
+            return 0
+        async with self.engine.begin() as conn:
+            result = await conn.execute(
+                text("SELECT ensure_scan_logs_partitions(:months)"),
+                {"months": self.months_ahead},
+            )
+            return result.scalar() or 0
+
+    async def list_partitions(self) -> List[Dict[str, Any]]:
+        """scan_logs 파티션 목록 (이름, 월, 추정 행 수)"""
+        if not self.enabled:
+            return []
+        async with self.engine.connect() as conn:
+            result = await conn.execute(
+                text(
+                    "SELECT c.relname, c.reltuples::bigint FROM pg_inherits i "
+                    "JOIN pg_class c ON c.oid = i.inhrelid "
+                    "WHERE i.inhparent = 'scan_logs'::regclass "
+                    "ORDER BY c.relname"
+                )
+            )
+            return [
+                {
+                    "name": name,
+                    "month": partition_month(name),
+                    "estimated_rows": max(int(rows), 0),
+                }
+                for name, rows in result.all()
+            ]
+
+    async def archive_expired(self, dry_run: bool = False) -> List[Dict[str, Any]]:
+        """
+        보존 기간이 지난 월 파티션 아카이브 후 삭제
+
+        파티션 DETACH/DROP은 행 트리거를 발생시키지 않으므로
+        scan_log_daily_stats 롤업(통계)은 그대로 유지됨
+        (단 pending은 검토 큐 잔량이므로 DROP 시 해당 월분을 0으로 정리)
+        """
+        if not self.enabled:
+            return []
+
+        cutoff = retention_cutoff(self.retention_months)
+        expired = [
+            p["name"]
+            for p in await self.list_partitions()
+            if p["month"] is not None and p["month"] < cutoff
+        ]
+        # 이전 실행에서 DETACH만 되고 아카이브되지 못한 테이블
+        orphaned = await self._detached_partitions()
+        if dry_run:
+            return [{"partition": name, "dry_run": True} for name in orphaned + expired]
+
+        archived = []
+        for name in orphaned + expired:
+            if name in expired:
+                await self._detach(name)
+            archived.append(await self._archive_and_drop(name))
+        return archived
+
+    async def _detached_partitions(self) -> List[str]:
+        async with self.engine.connect() as conn:
+            result = await conn.execute(
+                text(
+                    "SELECT relname FROM pg_class "
+                    "WHERE relkind = 'r' AND NOT relispartition "
+                    "AND relname ~ '^scan_logs_y[0-9]{4}m[0-9]{2}$' "
+                    "ORDER BY relname"
+                )
+            )
+            return [row[0] for row in result.all()]
+
+    async def _detach(self, name: str):
+        # 부모 테이블에 짧은 ACCESS EXCLUSIVE 락 (DEFAULT 파티션이 있어 CONCURRENTLY 불가)
+        async with self.engine.begin() as conn:
+            await conn.execute(text(f'ALTER TABLE scan_logs DETACH PARTITION "{name}"'))
+        logger.info(f"Detached scan_logs partition {name}")
+
+    async def _archive_and_drop(self, name: str) -> Dict[str, Any]:
+        """COPY → gzip CSV (임시 파일 + fsync + rename) 후 DROP + 롤업 pending 정리"""
+        self.archive_dir.mkdir(parents=True, exist_ok=True)
+        path = self.archive_dir / f"{name}.csv.gz"
+        tmp_path = path.with_suffix(".gz.tmp")
+
+        async with self.engine.connect() as conn:
+            raw = await conn.get_raw_connection()
+            with gzip.open(tmp_path, "wb") as f:
+
+                async def write_chunk(chunk: bytes):
+                    f.write(chunk)
+
+                status = await raw.driver_connection.copy_from_table(
+                    name, output=write_chunk, format="csv", header=True
+                )
+            with open(tmp_path, "rb+") as f:
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+
+            # asyncpg COPY 상태 문자열: "COPY <rows>"
+            rows = int(status.split()[-1]) if status else 0
+            await conn.execute(text(f'DROP TABLE "{name}"'))
+            month = partition_month(name)
+            if month is not None:
+                await conn.execute(
+                    text(
+                        "UPDATE scan_log_daily_stats SET pending = 0, updated_at = NOW() "
+                        "WHERE day >= :start AND day < :end AND pending <> 0"
+                    ),
+                    {"start": month, "end": next_month(month)},
+                )
+            await conn.commit()
+
+        logger.info(f"Archived scan_logs partition {name}: {rows} rows → {path}")
+        return {"partition": name, "rows": rows, "archive": str(path)}
+
+
+# Global instance
+scan_log_partitions = ScanLogPartitionManager(
+    months_ahead=settings.SCAN_LOG_PARTITION_MONTHS_AHEAD,
+    retention_months=settings.SCAN_LOG_RETENTION_MONTHS,
+    archive_dir=settings.SCAN_LOG_ARCHIVE_DIR,
+)
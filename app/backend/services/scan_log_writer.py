@@ -0,0 +1,389 @@
+"""
+Scan Log Writer - Write-behind 버퍼 기반 scan_logs 배치 저장
+
+Responsibilities:
+1. ScanLog 레코드를 메모리 큐에 모아 N건 / T ms 단위로 multi-row INSERT
+2. Backpressure: 큐가 가득 차면 enqueue_timeout 동안 대기, 초과 시 스필 파일로 기록
+3. Crash-safe spill: DB 저장 실패/종료 시 잔여분을 JSONL 파일에 fsync 후 기록,
+   다음 시작 시 재적재 (PK 기준 중복 무시)
+   - 스필 파일은 프로세스별 (scan_log_spill.<pid>.jsonl) → 멀티 워커 append 경합 없음
+   - 재적재는 파일 잠금 + 고유 이름 rename으로 선점, 다른 워커가 먼저 가져간 파일은 건너뜀
+"""
+
+import asyncio
+import io
+import json
+import logging
+import os
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, IO, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows 개발 환경: rename 선점만 사용
+    fcntl = None
+
+from sqlalchemy import insert
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from config import settings
+from models.scan_log import ScanLog
+
+logger = logging.getLogger(__name__)
+
+# executemany는 모든 레코드의 키가 같아야 하므로 고정 컬럼 + 기본값으로 정규화
+_RECORD_DEFAULTS: Dict[str, Any] = {
+    "session_id": None,
+    "language": "ko",
+    "image_url": None,
+    "ocr_raw_text": None,
+    "menu_name_ko": None,
+    "confidence": None,
+    "evidences": None,
+    "area_tag": None,
+    "shop_id": None,
+    "ai_called": False,
+    "ai_new_entries": 0,
+    "status": "pending",
+    "matched_canonical_id": None,
+}
+_UUID_FIELDS = ("id", "shop_id", "matched_canonical_id")
+_DATETIME_FIELDS = ("scanned_at", "created_at")
+
+
+def _is_current(path: Path, f: IO[str]) -> bool:
+    """열린 파일이 아직 path에 있는지 (잠금 대기 중 다른 워커가 rename/삭제하지 않았는지)"""
+    try:
+        return os.stat(path).st_ino == os.fstat(f.fileno()).st_ino
+    except FileNotFoundError:
+        return False
+
+
+class ScanLogWriter:
+    """Write-behind scan_logs 배치 writer (프로세스당 1개)"""
+
+    def __init__(
+        self,
+        session_factory: Optional[async_sessionmaker] = None,
+        flush_size: int = 500,
+        flush_interval_ms: int = 1000,
+        max_buffer: int = 10000,
+        enqueue_timeout_ms: int = 200,
+        spill_path: str = "data/scan_log_spill.jsonl",
+    ):
+        self._session_factory = session_factory
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval_ms / 1000
+        self.max_buffer = max_buffer
+        self.enqueue_timeout = enqueue_timeout_ms / 1000
+        self.spill_base = Path(spill_path)
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._pending: List[Dict[str, Any]] = []  # 수집 중인 배치
+        self._inflight: Optional[asyncio.Future] = None  # 저장 중인 배치
+        self.stats = {
+            "enqueued": 0,
+            "flushed": 0,
+            "flushes": 0,
+            "flush_errors": 0,
+            "spilled": 0,
+            "replayed": 0,
+        }
+
+    @property
+    def session_factory(self) -> async_sessionmaker:
+        if self._session_factory is None:
+            from database import AsyncSessionLocal
+
+            self._session_factory = AsyncSessionLocal
+        return self._session_factory
+
+    @property
+    def spill_path(self) -> Path:
+        """이 프로세스의 스필 파일 (uvicorn 워커마다 분리)"""
+        base = self.spill_base
+        return base.with_name(f"{base.stem}.{os.getpid()}{base.suffix}")
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    # ===========================
+    # Lifecycle
+    # ===========================
+    async def start(self):
+        """스필 파일 재적재 후 flush 루프 시작"""
+        if self.running:
+            return
+
+        self._queue = asyncio.Queue(maxsize=self.max_buffer)
+        await self.replay_spill()
+        self._task = asyncio.create_task(self._run())
+        logger.info(
+            f"ScanLogWriter started (flush_size={self.flush_size}, "
+            f"interval={int(self.flush_interval * 1000)}ms, max_buffer={self.max_buffer})"
+        )
+
+    async def stop(self):
+        """flush 루프 중지 + 잔여 버퍼 저장 (실패 시 스필)"""
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+        # 저장 중이던 배치는 완료까지 대기, 수집 중이던 배치는 잔여분과 함께 저장
+        if self._inflight is not None and not self._inflight.done():
+            await self._inflight
+        remaining = self._pending + self._drain()
+        self._pending = []
+        if remaining:
+            await self._flush(remaining)
+        logger.info(f"ScanLogWriter stopped: {self.stats}")
+
+    # ===========================
+    # Enqueue
+    # ===========================
+    async def enqueue(self, **values) -> None:
+        """
+        ScanLog 레코드 추가 (ScanLog 컬럼명 kwargs)
+
+        writer가 시작되지 않은 경우 (스크립트/테스트) 즉시 저장
+        """
+        record = self._prepare(values)
+        self.stats["enqueued"] += 1
+
+        if not self.running:
+            await self._flush([record])
+            return
+
+        try:
+            self._queue.put_nowait(record)
+            return
+        except asyncio.QueueFull:
+            pass
+
+        # Backpressure: flush 루프가 따라잡을 때까지 잠시 대기
+        try:
+            await asyncio.wait_for(self._queue.put(record), self.enqueue_timeout)
+        except asyncio.TimeoutError:
+            logger.warning("ScanLog buffer full, spilling record to disk")
+            self._spill([record])
+
+    def _prepare(self, values: Dict[str, Any]) -> Dict[str, Any]:
+        """고정 키 집합 + 기본값 + enqueue 시점 타임스탬프"""
+        now = datetime.now(timezone.utc)
+        record = {**_RECORD_DEFAULTS, **values}
+        record.setdefault("id", uuid.uuid4())
+        record.setdefault("created_at", now)
+        record.setdefault("scanned_at", record["created_at"])
+        return record
+
+    # ===========================
+    # Flush
+    # ===========================
+    async def _run(self):
+        while True:
+            await self._collect_batch(self._pending)
+            batch, self._pending = self._pending, []
+            # stop()의 cancel이 저장 중인 배치를 중단시키지 않도록 shield
+            self._inflight = asyncio.ensure_future(self._flush(batch))
+            await asyncio.shield(self._inflight)
+
+    async def _collect_batch(self, batch: List[Dict[str, Any]]):
+        """첫 레코드 도착 후 flush_size 또는 flush_interval까지 수집"""
+        loop = asyncio.get_running_loop()
+        batch.append(await self._queue.get())
+        deadline = loop.time() + self.flush_interval
+
+        while len(batch) < self.flush_size:
+            try:
+                batch.append(self._queue.get_nowait())
+                continue
+            except asyncio.QueueEmpty:
+                pass
+
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+
+    def _drain(self) -> List[Dict[str, Any]]:
+        records = []
+        while self._queue is not None and not self._queue.empty():
+            records.append(self._queue.get_nowait())
+        return records
+
+    async def _flush(self, batch: List[Dict[str, Any]]):
+        """배치 저장, 실패 시 스필 파일로 기록"""
+        try:
+            await self._write_batch(batch)
+            self.stats["flushed"] += len(batch)
+            self.stats["flushes"] += 1
+        except Exception as e:
+            self.stats["flush_errors"] += 1
+            logger.error(f"ScanLog batch insert failed ({len(batch)} rows): {e}")
+            self._spill(batch)
+
+    async def _write_batch(self, batch: List[Dict[str, Any]]):
+        """단일 트랜잭션 multi-row INSERT (id 중복은 무시 → 재적재 idempotent)"""
+        async with self.session_factory() as session:
+            await session.execute(self._insert_stmt(session), batch)
+            await session.commit()
+
+    @staticmethod
+    def _insert_stmt(session: AsyncSession):
+        dialect = session.get_bind().dialect.name
+        table = ScanLog.__table__
+        # PK = (id, created_at): 파티션 테이블의 유니크 제약은 파티션 키 포함
+        conflict_keys = [column.name for column in table.primary_key.columns]
+        if dialect == "postgresql":
+            return postgresql.insert(table).on_conflict_do_nothing(
+                index_elements=conflict_keys
+            )
+        if dialect == "sqlite":
+            return sqlite.insert(table).on_conflict_do_nothing(
+                index_elements=conflict_keys
+            )
+        return insert(table)
+
+    # ===========================
+    # Spill file
+    # ===========================
+    def _spill(self, records: List[Dict[str, Any]]):
+        """JSONL 스필 (append + fsync, 재적재 선점과는 파일 잠금으로 직렬화)"""
+        path = self.spill_path
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            while True:
+                with open(path, "a", encoding="utf-8") as f:
+                    if fcntl is not None:
+                        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+                        if not _is_current(path, f):
+                            continue  # 잠금 대기 중 재적재 워커가 선점 → 새 파일에 기록
+                    for record in records:
+                        f.write(json.dumps(record, ensure_ascii=False, default=str))
+                        f.write("\n")
+                    f.flush()
+                    os.fsync(f.fileno())
+                break
+            self.stats["spilled"] += len(records)
+        except Exception as e:
+            logger.error(
+                f"ScanLog spill failed, {len(records)} records lost: {e}",
+                exc_info=True,
+            )
+
+    @staticmethod
+    def _restore(record: Dict[str, Any]) -> Dict[str, Any]:
+        for field in _UUID_FIELDS:
+            if record.get(field):
+                record[field] = uuid.UUID(record[field])
+        for field in _DATETIME_FIELDS:
+            if record.get(field):
+                record[field] = datetime.fromisoformat(record[field])
+        return {**_RECORD_DEFAULTS, **record}
+
+    def _spill_files(self) -> List[Path]:
+        """재적재 대상: 모든 워커의 스필 파일 + 이전 재적재 실패분 (구버전 단일 파일 포함)"""
+        base = self.spill_base
+        if not base.parent.exists():
+            return []
+        return sorted(p for p in base.parent.glob(f"{base.stem}*") if p.is_file())
+
+    def _claim(self, path: Path) -> Optional[Tuple[Path, IO[str]]]:
+        """
+        스필 파일 선점: 잠금 → 고유 이름으로 rename
+
+        Returns:
+            (선점한 파일 경로, 열린 파일) 또는 None (다른 워커가 먼저 가져갔거나 사용 중)
+        """
+        base = self.spill_base
+        claimed = base.with_name(
+            f"{base.stem}.replaying.{os.getpid()}.{uuid.uuid4().hex[:8]}{base.suffix}"
+        )
+        try:
+            if fcntl is None:
+                os.rename(path, claimed)
+                # 열린 파일은 삭제 불가 (Windows) → 내용만 읽어 둠
+                return claimed, io.StringIO(claimed.read_text(encoding="utf-8"))
+
+            f = open(path, "r", encoding="utf-8")
+        except FileNotFoundError:
+            return None
+
+        try:
+            # 재적재 중 잠금 유지 → 실패/크래시 시 잠금만 풀리고 파일은 다음 시작 때 재선점
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            if not _is_current(path, f):
+                raise FileNotFoundError(path)
+            os.rename(path, claimed)
+        except (BlockingIOError, FileNotFoundError):
+            f.close()
+            return None
+        return claimed, f
+
+    async def replay_spill(self) -> int:
+        """스필 파일 재적재 (선점한 파일만, 성공 시 삭제)"""
+        replayed = 0
+        for path in self._spill_files():
+            claim = self._claim(path)
+            if claim is None:
+                continue
+
+            claimed, f = claim
+            with f:
+                records = []
+                for line_no, line in enumerate(f, 1):
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        records.append(self._restore(json.loads(line)))
+                    except Exception as e:
+                        logger.warning(f"Skipping corrupt spill line {line_no}: {e}")
+
+                try:
+                    for i in range(0, len(records), self.flush_size):
+                        await self._write_batch(records[i : i + self.flush_size])
+                except Exception as e:
+                    logger.error(
+                        f"ScanLog spill replay failed, will retry on restart: {e}"
+                    )
+                    break
+                claimed.unlink(missing_ok=True)
+            replayed += len(records)
+
+        if replayed:
+            self.stats["replayed"] += replayed
+            logger.info(f"Replayed {replayed} spilled scan logs")
+        return replayed
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "running": self.running,
+            "buffered": self._queue.qsize() if self._queue is not None else 0,
+            "max_buffer": self.max_buffer,
+        }
+
+
+# Global instance
+scan_log_writer = ScanLogWriter(
+    flush_size=settings.SCAN_LOG_FLUSH_SIZE,
+    flush_interval_ms=settings.SCAN_LOG_FLUSH_INTERVAL_MS,
+    max_buffer=settings.SCAN_LOG_BUFFER_MAX,
+    enqueue_timeout_ms=settings.SCAN_LOG_ENQUEUE_TIMEOUT_MS,
+    spill_path=settings.SCAN_LOG_SPILL_PATH,
+)
@@ -0,0 +1,220 @@
+"""
+Translation Memory Service - 번역 경로 공용 번역 메모리
+
+Responsibilities:
+1. (원문 해시, 원문 언어, 대상 언어, 프롬프트 버전) exact-match 조회
+   - 프로세스 L1 (LRU) → translation_memory 테이블 순서
+   - prefetch(): 여러 원문 × 대상 언어를 쿼리 1회로 조회 (배치 번역 전 호출)
+2. LLM 번역 결과 일괄 upsert (같은 키는 최신 번역으로 갱신)
+3. 메모리 장애는 miss로 취급 (번역 경로를 막지 않음)
+
+원문은 앞뒤/연속 공백을 정규화한 뒤 sha256으로 해시
+"""
+
+import hashlib
+import logging
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional, Set, Tuple
+
+from sqlalchemy import func, insert, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from config import settings
+from models.translation_memory import TranslationMemory
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_source(text: str) -> str:
+    """해시 대상 원문 정규화 (앞뒤/연속 공백 제거)"""
+    return " ".join((text or "").split())
+
+
+def source_hash(text: str) -> str:
+    return hashlib.sha256(normalize_source(text).encode("utf-8")).hexdigest()
+
+
+class TranslationMemoryService:
+    """번역 메모리 (프로세스 L1 + PostgreSQL)"""
+
+    def __init__(
+        self,
+        session_factory: Optional[async_sessionmaker] = None,
+        l1_size: int = 5000,
+        enabled: bool = True,
+    ):
+        self._session_factory = session_factory
+        self.l1_size = l1_size
+        self.enabled = enabled
+        self._l1: "OrderedDict[Tuple[str, str, str, str], str]" = OrderedDict()
+        self.stats = {"lookups": 0, "l1_hits": 0, "db_hits": 0, "stored": 0}
+
+    @property
+    def session_factory(self) -> async_sessionmaker:
+        if self._session_factory is None:
+            from database import AsyncSessionLocal
+
+            self._session_factory = AsyncSessionLocal
+        return self._session_factory
+
+    # ===========================
+    # Lookup
+    # ===========================
+    async def lookup(
+        self, text: str, source_lang: str, target_lang: str, prompt_version: str
+    ) -> Optional[str]:
+        """원문 1건 exact-match 조회"""
+        found = await self.prefetch([text], source_lang, [target_lang], prompt_version)
+        return found.get((text, target_lang))
+
+    async def prefetch(
+        self,
+        texts: Iterable[str],
+        source_lang: str,
+        target_langs: Iterable[str],
+        prompt_version: str,
+    ) -> Dict[Tuple[str, str], str]:
+        """
+        여러 원문 × 대상 언어 일괄 조회 (L1 miss만 DB 쿼리 1회)
+
+        Returns:
+            {(원문, 대상 언어): 번역문} (적중한 항목만)
+        """
+        texts = [text for text in dict.fromkeys(texts) if normalize_source(text)]
+        target_langs = list(target_langs)
+        if not self.enabled or not texts or not target_langs:
+            return {}
+        self.stats["lookups"] += len(texts) * len(target_langs)
+
+        found: Dict[Tuple[str, str], str] = {}
+        missing_hashes: Dict[str, Set[str]] = {}
+        for text in texts:
+            digest = source_hash(text)
+            for target_lang in target_langs:
+                key = (digest, source_lang, target_lang, prompt_version)
+                if key in self._l1:
+                    self._l1.move_to_end(key)
+                    found[(text, target_lang)] = self._l1[key]
+                    self.stats["l1_hits"] += 1
+                else:
+                    missing_hashes.setdefault(digest, set()).add(text)
+        if not missing_hashes:
+            return found
+
+        try:
+            async with self.session_factory() as session:
+                result = await session.execute(
+                    select(
+                        TranslationMemory.source_hash,
+                        TranslationMemory.target_lang,
+                        TranslationMemory.target_text,
+                    ).where(
+                        TranslationMemory.source_hash.in_(list(missing_hashes)),
+                        TranslationMemory.source_lang == source_lang,
+                        TranslationMemory.target_lang.in_(target_langs),
+                        TranslationMemory.prompt_version == prompt_version,
+                    )
+                )
+                rows = result.all()
+        except Exception as e:
+            logger.warning(f"Translation memory lookup failed: {e}")
+            return found
+
+        for digest, target_lang, target_text in rows:
+            self._remember(
+                (digest, source_lang, target_lang, prompt_version), target_text
+            )
+            for text in missing_hashes[digest]:
+                if (text, target_lang) not in found:
+                    found[(text, target_lang)] = target_text
+                    self.stats["db_hits"] += 1
+        return found
+
+    # ===========================
+    # Store
+    # ===========================
+    async def store(
+        self,
+        entries: Iterable[Tuple[str, str, str]],
+        source_lang: str,
+        prompt_version: str,
+    ) -> int:
+        """
+        번역 결과 일괄 upsert
+
+        Args:
+            entries: [(원문, 대상 언어, 번역문), ...]
+        """
+        rows: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        for text, target_lang, target_text in entries:
+            if not self.enabled or not normalize_source(text) or not target_text:
+                continue
+            digest = source_hash(text)
+            rows[(digest, target_lang)] = {
+                "source_hash": digest,
+                "source_lang": source_lang,
+                "target_lang": target_lang,
+                "prompt_version": prompt_version,
+                "source_text": normalize_source(text),
+                "target_text": target_text,
+            }
+        if not rows:
+            return 0
+
+        try:
+            async with self.session_factory() as session:
+                await session.execute(self._upsert_stmt(session), list(rows.values()))
+                await session.commit()
+        except Exception as e:
+            logger.warning(f"Translation memory store failed: {e}")
+            return 0
+
+        for row in rows.values():
+            self._remember(
+                (row["source_hash"], source_lang, row["target_lang"], prompt_version),
+                row["target_text"],
+            )
+        self.stats["stored"] += len(rows)
+        return len(rows)
+
+    @staticmethod
+    def _upsert_stmt(session: AsyncSession):
+        dialect = session.get_bind().dialect.name
+        table = TranslationMemory.__table__
+        keys = [column.name for column in table.primary_key.columns]
+        if dialect in ("postgresql", "sqlite"):
+            stmt = (postgresql if dialect == "postgresql" else sqlite).insert(table)
+            return stmt.on_conflict_do_update(
+                index_elements=keys,
+                set_={
+                    "source_text": stmt.excluded.source_text,
+                    "target_text": stmt.excluded.target_text,
+                    "updated_at": func.now(),
+                },
+            )
+        return insert(table)
+
+    def _remember(self, key: Tuple[str, str, str, str], target_text: str) -> None:
+        self._l1[key] = target_text
+        self._l1.move_to_end(key)
+        while len(self._l1) > self.l1_size:
+            self._l1.popitem(last=False)
+
+    def get_stats(self) -> Dict[str, Any]:
+        hits = self.stats["l1_hits"] + self.stats["db_hits"]
+        return {
+            "enabled": self.enabled,
+            "l1_entries": len(self._l1),
+            **self.stats,
+            "hit_rate": (
+                round(hits / self.stats["lookups"], 3) if self.stats["lookups"] else 0.0
+            ),
+        }
+
+
+# Global instance
+translation_memory = TranslationMemoryService(
+    l1_size=settings.TRANSLATION_MEMORY_L1_SIZE,
+    enabled=settings.TRANSLATION_MEMORY_ENABLED,
+)
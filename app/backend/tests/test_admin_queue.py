@@ -0,0 +1,174 @@
+"""
+Admin Menu Queue Tests
+keyset 커서 왕복 / 변조 거절, 같은 created_at 경계의 페이지 연속성, 승인/거부 시 건수 캐시 무효화 검증
+"""
+
+import base64
+import fnmatch
+import uuid
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import bindparam, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from api import admin as admin_module
+from api.admin import (
+    QueueApproveRequest,
+    _decode_queue_cursor,
+    _encode_queue_cursor,
+    approve_menu_queue,
+    get_menu_queue,
+)
+from models import ScanLog
+
+BASE_TIME = datetime(2026, 10, 1, 12, 0, tzinfo=timezone.utc)
+
+
+class FakeCache:
+    def __init__(self):
+        self.store = {}
+        self.deleted_patterns = []
+
+    def cache_key(self, *parts):
+        return ":".join(str(part) for part in parts)
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def set(self, key, value, ttl=None):
+        self.store[key] = value
+        return True
+
+    async def delete_pattern(self, pattern):
+        self.deleted_patterns.append(pattern)
+        keys = [k for k in self.store if fnmatch.fnmatch(k, pattern)]
+        for key in keys:
+            del self.store[key]
+        return len(keys)
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    fake = FakeCache()
+    monkeypatch.setattr(admin_module, "cache_service", fake)
+    return fake
+
+
+@pytest.fixture
+async def session_factory(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'queue.db'}")
+    # ARRAY/JSONB 컬럼은 sqlite DDL로 생성 불가 → 타입 없는 컬럼으로 동일 이름 테이블 생성
+    table = ScanLog.__table__
+    columns = ", ".join(c.name for c in table.columns)
+    primary_key = ", ".join(c.name for c in table.primary_key)
+    async with engine.begin() as conn:
+        await conn.execute(
+            text(f"CREATE TABLE scan_logs ({columns}, PRIMARY KEY ({primary_key}))")
+        )
+        await conn.execute(
+            text("CREATE TABLE canonical_menus (id PRIMARY KEY, name_ko, name_en)")
+        )
+    yield async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    await engine.dispose()
+
+
+async def _seed(factory, created_ats):
+    """ScanLog 행 삽입 (ARRAY 기본값([])은 sqlite 바인딩 불가 → 필요한 컬럼만 INSERT)"""
+    rows = [
+        {"id": uuid.uuid4(), "menu_name_ko": f"메뉴-{i}", "created_at": created_at}
+        for i, created_at in enumerate(created_ats)
+    ]
+    table = ScanLog.__table__
+    async with factory() as db:
+        for row in rows:
+            await db.execute(
+                text(
+                    "INSERT INTO scan_logs (id, language, menu_name_ko, status, created_at) "
+                    "VALUES (:id, 'en', :menu_name_ko, 'pending', :created_at)"
+                ).bindparams(
+                    bindparam("id", type_=table.c.id.type),
+                    bindparam("created_at", type_=table.c.created_at.type),
+                ),
+                row,
+            )
+        await db.commit()
+    return [SimpleNamespace(**row) for row in rows]
+
+
+def test_cursor_round_trip():
+    log_id = uuid.uuid4()
+
+    cursor = _encode_queue_cursor(BASE_TIME, log_id)
+
+    assert _decode_queue_cursor(cursor) == (BASE_TIME, log_id)
+
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", "", "!!!"])
+def test_malformed_cursor_rejected(cursor):
+    with pytest.raises(HTTPException) as exc:
+        _decode_queue_cursor(cursor)
+    assert exc.value.status_code == 400
+
+
+def test_tampered_cursor_rejected():
+    cursor = _encode_queue_cursor(BASE_TIME, uuid.uuid4())
+    raw, signature = base64.urlsafe_b64decode(cursor).decode().rsplit("|", 1)
+    # 형식은 유효하지만 다른 위치를 가리키도록 수정 (서명 유지)
+    forged = raw.replace(str(BASE_TIME.year), str(BASE_TIME.year + 1), 1)
+    tampered = base64.urlsafe_b64encode(f"{forged}|{signature}".encode()).decode()
+
+    with pytest.raises(HTTPException) as exc:
+        _decode_queue_cursor(tampered)
+    assert exc.value.status_code == 400
+
+
+async def test_pages_continue_across_equal_created_at(session_factory, cache):
+    # 5건이 같은 created_at → 페이지 경계가 동일 시각 한가운데에 걸림
+    same = BASE_TIME
+    logs = await _seed(
+        session_factory,
+        [same + timedelta(minutes=1)] + [same] * 5 + [same - timedelta(minutes=1)],
+    )
+    expected = [
+        str(log.id)
+        for log in sorted(logs, key=lambda log: (log.created_at, log.id), reverse=True)
+    ]
+
+    seen, cursor, pages = [], None, 0
+    async with session_factory() as db:
+        while True:
+            page = await get_menu_queue(limit=2, cursor=cursor, db=db, _=None)
+            seen.extend(item["id"] for item in page["data"])
+            pages += 1
+            cursor = page["next_cursor"]
+            if cursor is None:
+                break
+
+    assert seen == expected  # 누락/중복 없이 (created_at, id) 내림차순
+    assert pages == 4
+    assert page["total"] == 7 and page["total_is_estimate"] is False
+
+
+async def test_approve_and_reject_invalidate_queue_count(session_factory, cache):
+    approved, rejected = await _seed(session_factory, [BASE_TIME, BASE_TIME])
+
+    async with session_factory() as db:
+        first = await get_menu_queue(status="pending", limit=10, db=db, _=None)
+        assert first["total"] == 2
+        assert cache.store == {"admin:queue:count:pending:all": (2, False)}
+
+        await approve_menu_queue(
+            str(approved.id), QueueApproveRequest(action="approve"), db=db, _=None
+        )
+        assert cache.store == {}
+        assert (await get_menu_queue(status="pending", db=db, _=None))["total"] == 1
+
+        await approve_menu_queue(
+            str(rejected.id), QueueApproveRequest(action="reject"), db=db, _=None
+        )
+        assert (await get_menu_queue(status="pending", db=db, _=None))["total"] == 0
+
+    assert cache.deleted_patterns == ["admin:queue:count:*"] * 2
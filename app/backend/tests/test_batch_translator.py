@@ -0,0 +1,77 @@
+"""
+Batch Translator Tests
+가짜 LLM complete()로 크기/시간 flush, 항목별 검증, 실패 항목만 재요청 검증
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from services.batch_translator import BatchTranslationError, BatchTranslator
+
+
+class FakeLLM:
+    """입력 id별로 번역을 돌려주되, bad 메뉴는 지정 횟수만큼 누락"""
+
+    def __init__(self, drop_times=None):
+        self.drop_times = dict(drop_times or {})
+        self.prompts = []
+
+    async def __call__(self, prompt):
+        items = json.loads(
+            prompt.split("Input menus:\n", 1)[1].split("\n\nOutput", 1)[0]
+        )
+        self.prompts.append([item["name_ko"] for item in items])
+        translations = []
+        for item in items:
+            if self.drop_times.get(item["name_ko"], 0) > 0:
+                self.drop_times[item["name_ko"]] -= 1
+                translations.append({"id": item["id"], "ja": "", "zh": ""})
+                continue
+            translations.append(
+                {
+                    "id": item["id"],
+                    "ja": f"ja:{item['name_ko']}",
+                    "zh": f"zh:{item['name_ko']}",
+                }
+            )
+        return "```json\n" + json.dumps({"translations": translations}) + "\n```"
+
+
+async def test_full_batch_flushes_in_one_request_and_retries_only_bad_items():
+    llm = FakeLLM(drop_times={"냉면": 1})
+    translator = BatchTranslator(
+        llm, max_batch_size=4, max_wait_seconds=10, retry_delay_seconds=0
+    )
+    names = ["김치찌개", "불고기", "냉면", "비빔밥"]
+
+    results = await asyncio.gather(
+        *(translator.translate(name, f"{name} description") for name in names)
+    )
+
+    assert results[2] == {"ja": "ja:냉면", "zh": "zh:냉면"}
+    assert llm.prompts == [names, ["냉면"]]
+    assert translator.get_stats()["retried_items"] == 1
+
+
+async def test_partial_batch_flushes_after_wait_and_gives_up_after_attempts():
+    llm = FakeLLM(drop_times={"냉면": 99})
+    translator = BatchTranslator(
+        llm,
+        max_batch_size=10,
+        max_wait_seconds=0.01,
+        max_attempts=2,
+        retry_delay_seconds=0,
+    )
+
+    ok, failed = await asyncio.gather(
+        translator.translate("불고기", "Marinated beef"),
+        translator.translate("냉면", "Cold noodles"),
+        return_exceptions=True,
+    )
+
+    assert ok == {"ja": "ja:불고기", "zh": "zh:불고기"}
+    assert isinstance(failed, BatchTranslationError)
+    assert llm.prompts == [["불고기", "냉면"], ["냉면"]]
+    assert translator.get_stats()["failed_items"] == 1
@@ -0,0 +1,167 @@
+"""
+Bulk Translation Worker Tests
+LocalJobQueue + 메모리 메뉴 목록으로 동시 처리 상한, 페이지 체크포인트, 키 소진 시 중단 검증
+"""
+
+import asyncio
+import uuid
+
+import pytest
+
+import services.auto_translate_service as auto_translate_module
+from services.bulk_translation_worker import BulkTranslationWorker
+from services.job_queue import Job, LocalJobQueue
+
+
+class FakeTranslator:
+    def __init__(self, remaining=100, batch_size=2):
+        self.remaining = remaining
+        self.translator = type("T", (), {"max_batch_size": batch_size})()
+        self.credit = 0  # 현재 요청(배치)에 남은 메뉴 자리
+        self.active = 0
+        self.peak = 0
+        self.calls = []
+
+    def remaining_requests(self):
+        return self.remaining
+
+    async def translate(self, name_ko, description_en):
+        self.calls.append(name_ko)
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        if self.credit == 0:
+            if self.remaining <= 0:
+                return {}  # AutoTranslateService: 키 소진 시 빈 결과
+            self.remaining -= 1
+            self.credit = self.translator.max_batch_size
+        self.credit -= 1
+        if name_ko == "재시도":
+            self.remaining = max(0, self.remaining - 1)  # 누락 항목 재요청
+        if name_ko == "실패":
+            raise RuntimeError("Gemini timeout")
+        return {"ja": f"ja:{name_ko}", "zh": f"zh:{name_ko}"}
+
+
+class InMemoryWorker(BulkTranslationWorker):
+    def __init__(self, menus, **kwargs):
+        super().__init__(queue=LocalJobQueue(), **kwargs)
+        self.menus = menus  # id 순
+        self.applied = {}
+
+    async def _load_page(self, cursor, limit):
+        return [
+            {"id": menu_id, "name_ko": name, "description_en": f"en:{name}"}
+            for menu_id, name in self.menus
+            if menu_id not in self.applied and (not cursor or str(menu_id) > cursor)
+        ][:limit]
+
+    async def _apply_page(self, menus, results):
+        for menu, translations in zip(menus, results):
+            self.applied[menu["id"]] = translations or menu.get("error")
+        return sum(1 for translations in results if translations)
+
+
+def _menus(names):
+    ids = sorted(uuid.uuid4() for _ in names)
+    return list(zip(ids, names))
+
+
+async def _run_job(worker, total):
+    progress = {
+        "job_id": "job-1",
+        "status_filter": "failed",
+        "status": "queued",
+        "total": total,
+        "processed": 0,
+        "succeeded": 0,
+        "failed": 0,
+        "cursor": None,
+        "error": None,
+    }
+    await worker._save_progress(progress)
+    await worker.queue.enqueue(Job(payload={"job_id": "job-1"}))
+    job = await worker.queue.claim("test")
+    await worker._handle(job, "test")
+    return await worker.get_progress("job-1")
+
+
+@pytest.fixture
+def translator(monkeypatch):
+    fake = FakeTranslator()
+    monkeypatch.setattr(auto_translate_module, "_auto_translate_service", fake)
+    return fake
+
+
+async def test_job_translates_pages_with_bounded_concurrency(translator):
+    worker = InMemoryWorker(
+        _menus(["비빔밥", "실패", "냉면", "김치찌개", "불고기"]),
+        concurrency=2,
+        page_size=2,
+    )
+
+    progress = await _run_job(worker, total=5)
+
+    assert progress["status"] == "completed"
+    assert (progress["processed"], progress["succeeded"], progress["failed"]) == (
+        5,
+        4,
+        1,
+    )
+    assert progress["cursor"] == str(worker.menus[-1][0])
+    assert translator.peak == 2
+    assert "Gemini timeout" in worker.applied.values()
+
+
+async def test_job_pauses_when_keys_run_out(translator):
+    translator.remaining = 1  # 배치 1회 = 메뉴 2개
+    worker = InMemoryWorker(_menus(["비빔밥", "냉면", "불고기"]), page_size=10)
+
+    progress = await _run_job(worker, total=3)
+
+    assert progress["status"] == "paused"
+    assert progress["processed"] == 2
+    assert progress["cursor"] == str(worker.menus[1][0])
+
+
+async def test_keys_exhausted_mid_page_keep_menus_pending(translator):
+    translator.remaining = 2  # 예산 = 메뉴 4개, 재요청으로 페이지 도중 소진
+    # 설정값이 배치 크기(2)보다 작아도 배치를 채우도록 2개씩 동시 처리
+    worker = InMemoryWorker(
+        _menus(["비빔밥", "재시도", "불고기", "잡채", "김밥"]), concurrency=1
+    )
+
+    progress = await _run_job(worker, total=5)
+
+    assert translator.peak == 2
+    assert progress["status"] == "paused"
+    assert (progress["processed"], progress["succeeded"], progress["failed"]) == (
+        2,
+        2,
+        0,
+    )
+    # 소진으로 번역 못 한 메뉴는 실패 처리하지 않고 cursor도 그 앞에서 멈춤
+    assert set(worker.applied) == {menu_id for menu_id, _ in worker.menus[:2]}
+    assert progress["cursor"] == str(worker.menus[1][0])
+
+
+async def test_paused_job_resumes_from_cursor(translator):
+    translator.remaining = 1
+    worker = InMemoryWorker(_menus(["비빔밥", "냉면", "불고기"]), page_size=10)
+    assert (await _run_job(worker, total=3))["status"] == "paused"
+
+    translator.remaining = 10  # 일일 한도 초기화
+    resumed = await worker.resume("job-1")
+    assert resumed["status"] == "queued" and resumed["error"] is None
+    await worker._handle(await worker.queue.claim("test"), "test")
+    progress = await worker.get_progress("job-1")
+
+    assert progress["status"] == "completed"
+    assert (progress["processed"], progress["succeeded"]) == (3, 3)
+    # 중단 전 완료분은 재번역 없음, 남은 메뉴만 번역
+    assert translator.calls.count("비빔밥") == 1
+    assert translator.calls.count("냉면") == 1
+    assert progress["cursor"] == str(worker.menus[-1][0])
+    with pytest.raises(ValueError):
+        await worker.resume("job-1")
@@ -0,0 +1,84 @@
+"""
+CLOVA OCR Client Tests
+httpx.MockTransport로 재시도 / 동시성 상한 / 응답 변환 검증
+"""
+
+import asyncio
+
+import httpx
+
+from services.clova_client import ClovaOcrClient
+
+OK_BODY = {
+    "images": [
+        {
+            "fields": [
+                {"inferText": "김치찌개", "inferConfidence": 0.9},
+                {"inferText": "8,000", "inferConfidence": 0.7},
+            ]
+        }
+    ]
+}
+
+
+def _client(handler, **kwargs) -> ClovaOcrClient:
+    client = ClovaOcrClient(api_url="https://clova.test/ocr", secret="s", **kwargs)
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client
+
+
+async def test_retries_transient_errors_then_succeeds():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        if len(calls) < 3:
+            return httpx.Response(503, text="busy")
+        return httpx.Response(200, json=OK_BODY)
+
+    client = _client(handler, max_retries=3)
+    result = await client.recognize(b"img")
+
+    assert result["success"]
+    assert result["text"] == "김치찌개\n8,000"
+    assert abs(result["confidence"] - 0.8) < 1e-9
+    assert len(calls) == 3
+    assert calls[0].headers["X-OCR-SECRET"] == "s"
+
+
+async def test_client_errors_are_not_retried():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(400, text="bad image")
+
+    result = await _client(handler).recognize(b"img")
+
+    assert not result["success"]
+    assert "400" in result["error"]
+    assert len(calls) == 1
+
+
+async def test_concurrency_is_capped():
+    active = 0
+    peak = 0
+
+    async def handler(request):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return httpx.Response(200, json=OK_BODY)
+
+    client = _client(handler, max_concurrency=2)
+    await asyncio.gather(*(client.recognize(b"img") for _ in range(6)))
+
+    assert peak == 2
+
+
+async def test_missing_secret_fails_fast():
+    client = ClovaOcrClient(secret="")
+    result = await client.recognize(b"img")
+    assert result == {"success": False, "error": "CLOVA_OCR_SECRET not configured"}
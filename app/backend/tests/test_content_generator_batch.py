@@ -0,0 +1,136 @@
+"""
+ContentGenerator.enrich_batch Tests
+가짜 Gemini 클라이언트로 동시 처리 상한, 입력 순서 유지, 완료 건수 기준 체크포인트 검증
+"""
+
+import asyncio
+
+import pytest
+
+from scripts.automation import content_generator as content_module
+from scripts.automation.config_auto import auto_settings
+from scripts.automation.content_generator import ContentGenerator
+from scripts.automation.state_manager import ENRICHMENT_RESULTS, StateManager
+
+VALID_CONTENT = {
+    "description_ko": "설명",
+    "description_en": "description",
+    "regional_variants": [],
+    "preparation_steps": ["a", "b", "c"],
+    "nutrition": {},
+    "flavor_profile": {},
+    "visitor_tips": "",
+    "similar_dishes": ["x", "y"],
+    "cultural_background": "",
+}
+
+
+class FakeClient:
+    model = "fake-model"
+    rpd_limit = 20
+    total_keys = 2
+    max_in_flight = 3
+
+    def __init__(self, delays):
+        self.delays = delays
+        self.active = 0
+        self.peak = 0
+
+    def is_all_exhausted(self):
+        return False
+
+    def get_daily_usage(self):
+        return {"used": 0, "limit": 40, "remaining": 40, "keys": [], "total_keys": 2}
+
+    async def generate_json(self, prompt, system="", temperature=0.3):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        name = next(n for n in self.delays if n in prompt)
+        await asyncio.sleep(self.delays[name])
+        self.active -= 1
+        return dict(VALID_CONTENT)
+
+
+@pytest.fixture
+def generator(tmp_path, monkeypatch):
+    monkeypatch.setattr(auto_settings, "AUTOMATION_STATE_DIR", str(tmp_path / "state"))
+    monkeypatch.setattr(
+        auto_settings, "AUTOMATION_STAGING_DIR", str(tmp_path / "staging")
+    )
+    monkeypatch.setattr(auto_settings, "ENRICHMENT_CONCURRENCY", 0)
+    monkeypatch.setattr(content_module, "_load_translation_memory", lambda: None)
+
+    def build(delays):
+        return ContentGenerator(FakeClient(delays))
+
+    return build
+
+
+async def test_enrich_batch_runs_concurrently_and_keeps_order(generator):
+    delays = {"메뉴-A": 0.05, "메뉴-B": 0.01, "메뉴-C": 0.03, "메뉴-D": 0.01}
+    gen = generator(delays)
+    appended = []
+    append_records = StateManager.append_records
+
+    def record_append(name, records):
+        appended.append([m["name_ko"] for m in records])
+        return append_records(name, records)
+
+    gen.state.append_records = record_append
+
+    results = await gen.enrich_batch(
+        [{"id": str(i), "name_ko": name} for i, name in enumerate(delays)],
+        checkpoint_interval=2,
+    )
+
+    assert [r["name_ko"] for r in results] == list(delays)
+    assert gen.client.peak == 3  # max_in_flight
+    # 체크포인트는 완료 2건마다 새로 완료된 결과만 추가
+    assert appended == [["메뉴-B", "메뉴-D"], ["메뉴-C", "메뉴-A"]]
+    saved = StateManager.load_records(ENRICHMENT_RESULTS)
+    assert sorted(m["name_ko"] for m in saved) == sorted(delays)
+    assert StateManager("enrichment").processed_ids == {"0", "1", "2", "3"}
+
+
+def test_state_manager_replays_journal_and_compacts(generator, tmp_path):
+    state = StateManager("images")
+    state.mark_processed("a")
+    state.mark_failed("b", "timeout")
+    state.save_state()
+    state.mark_processed("c")  # save_state 전 중단 → 유실 허용
+
+    restored = StateManager("images")
+    assert restored.processed_ids == {"a"}
+    assert restored.is_processed("a") and not restored.is_processed("c")
+    assert restored._state["failed_items"][0]["error"] == "timeout"
+
+    restored.mark_processed("c")
+    restored.end_run(2, 1)
+    assert not restored.journal_file.exists()
+    assert StateManager("images").processed_ids == {"a", "c"}
+
+
+def test_legacy_batches_migrate_once_even_if_results_file_exists(generator, tmp_path):
+    import json
+
+    staging = tmp_path / "staging"
+    staging.mkdir()
+    (staging / "enrichment_batch_10.json").write_text(
+        json.dumps(
+            {"menus": [{"name_ko": "메뉴-A", "v": "old"}, {"name_ko": "메뉴-B"}]}
+        ),
+        encoding="utf-8",
+    )
+    # enrichment가 sync보다 먼저 통합 파일을 만든 상태
+    (staging / f"{ENRICHMENT_RESULTS}.jsonl").write_text(
+        json.dumps({"name_ko": "메뉴-A", "v": "new"}) + "\n", encoding="utf-8"
+    )
+
+    StateManager.append_records(ENRICHMENT_RESULTS, [{"name_ko": "메뉴-C"}])
+    StateManager.compact_records(ENRICHMENT_RESULTS, key="name_ko")
+    records = {r["name_ko"]: r for r in StateManager.load_records(ENRICHMENT_RESULTS)}
+
+    assert set(records) == {"메뉴-A", "메뉴-B", "메뉴-C"}
+    assert records["메뉴-A"]["v"] == "new"
+    assert (staging / ".legacy_migrated").exists()
+    assert len(StateManager.load_records(ENRICHMENT_RESULTS)) == 3  # 재이관 없음
@@ -0,0 +1,101 @@
+"""
+Gemini Client Rate Limiter Tests
+키별 토큰 버킷으로 병렬 호출 분산, 429 키 전환(일일 쿼터 소진 / RPM 백오프), 일일 사용량 영속화 검증
+(SDK 호출은 가짜 모델)
+"""
+
+import asyncio
+import time
+
+from scripts.automation.gemini_client import GeminiClient
+
+DAILY_429 = (
+    "429 RESOURCE_EXHAUSTED quotaId: GenerateRequestsPerDayPerProjectPerModel-FreeTier"
+)
+RPM_429 = (
+    "429 RESOURCE_EXHAUSTED quotaId: GenerateRequestsPerMinutePerProjectPerModel-FreeTier"
+    " 'retryDelay': '0.3s'"
+)
+
+
+class FakeModels:
+    def __init__(self, key, calls, fail_with=None, fail_times=None):
+        self.key = key
+        self.calls = calls
+        self.fail_with = fail_with
+        self.fail_times = fail_times  # None = 항상 실패
+
+    def generate_content(self, model, contents, config):
+        self.calls.append((self.key, time.monotonic()))
+        if self.fail_with and self.fail_times != 0:
+            if self.fail_times:
+                self.fail_times -= 1
+            raise RuntimeError(self.fail_with)
+        return type("Response", (), {"text": f"ok:{self.key}"})()
+
+
+def _client(tmp_path, keys, rpm_limit, calls, failing=(), error=DAILY_429, times=None):
+    client = GeminiClient(
+        api_keys=keys,
+        model="test-model",
+        rpm_limit=rpm_limit,
+        rpd_limit=20,
+        usage_file=tmp_path / "gemini_usage.json",
+    )
+    client._sdk_imported = True
+    for ks in client._key_states:
+        fail_with = error if ks.key in failing else None
+        models = FakeModels(ks.key, calls, fail_with, times)
+        ks.client = type("C", (), {"models": models})()
+    return client
+
+
+async def test_parallel_calls_spread_across_keys_within_rpm(tmp_path):
+    calls = []
+    client = _client(tmp_path, ["k1", "k2"], rpm_limit=600, calls=calls)  # 0.1초 간격
+
+    results = await asyncio.gather(*(client.generate("hi") for _ in range(6)))
+
+    assert sorted(results) == ["ok:k1"] * 3 + ["ok:k2"] * 3
+    for key in ("k1", "k2"):
+        times = [t for k, t in calls if k == key]
+        gaps = [b - a for a, b in zip(times, times[1:])]
+        assert all(gap >= 0.09 for gap in gaps)
+    # 전역 간격(0.1초 × 5)이 아닌 키별 간격(0.1초 × 2)으로 완료
+    assert max(t for _, t in calls) - min(t for _, t in calls) < 0.4
+
+
+async def test_429_switches_key_and_usage_survives_restart(tmp_path):
+    calls = []
+    client = _client(tmp_path, ["k1", "k2"], rpm_limit=600, calls=calls, failing={"k1"})
+
+    assert await client.generate("a") == "ok:k2"
+    assert await client.generate("b") == "ok:k2"
+
+    restored = _client(tmp_path, ["k1", "k2"], rpm_limit=600, calls=[])
+    usage = {k["key_index"]: k for k in restored.get_daily_usage()["keys"]}
+    assert usage[1]["exhausted"] and usage[1]["remaining"] == 0
+    assert usage[2]["used"] == 2
+
+
+async def test_rpm_429_backs_off_key_without_exhausting(tmp_path):
+    calls = []
+    client = _client(
+        tmp_path,
+        ["k1", "k2"],
+        rpm_limit=6000,
+        calls=calls,
+        failing={"k1"},
+        error=RPM_429,
+        times=1,
+    )
+
+    assert await client.generate("a") == "ok:k2"  # k1 분당 429 → k2로 전환
+    assert await client.generate("b") == "ok:k2"  # k1은 retryDelay 동안 후순위
+    await asyncio.sleep(0.3)
+    assert await client.generate("c") == "ok:k1"
+
+    usage = {k["key_index"]: k for k in client.get_daily_usage()["keys"]}
+    assert not usage[1]["exhausted"] and usage[1]["used"] == 1
+    k1_times = [t for k, t in calls if k == "k1"]
+    assert k1_times[1] - k1_times[0] >= 0.3
@@ -0,0 +1,40 @@
+"""
+Image Preprocessing Tests
+해상도 정규화 + 썸네일 기반 방향 판정
+"""
+
+import cv2
+import numpy as np
+
+from utils.image_preprocessing import auto_rotate_image, normalize_resolution
+
+
+def _menu_photo(width: int = 3000, height: int = 2000) -> np.ndarray:
+    """가로 텍스트 줄 모양 막대가 있는 합성 메뉴판 (BGR)"""
+    image = np.full((height, width, 3), 230, dtype=np.uint8)
+    for y in range(100, height - 100, 80):
+        cv2.rectangle(image, (100, y), (width - 400, y + 25), (30, 30, 30), -1)
+    return image
+
+
+def test_normalize_resolution_caps_long_edge_and_keeps_aspect():
+    resized = normalize_resolution(_menu_photo(3000, 2000), 1500)
+
+    assert resized.shape[:2] == (1000, 1500)
+
+
+def test_normalize_resolution_never_upscales():
+    image = _menu_photo(800, 600)
+
+    assert normalize_resolution(image, 2048) is image
+    assert normalize_resolution(image, 0) is image
+
+
+def test_auto_rotate_restores_sideways_photo_at_full_resolution():
+    photo = _menu_photo()
+    sideways = cv2.rotate(photo, cv2.ROTATE_90_CLOCKWISE)
+
+    restored = auto_rotate_image(sideways)
+
+    assert restored.shape == photo.shape
+    assert auto_rotate_image(photo) is photo
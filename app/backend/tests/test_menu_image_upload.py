@@ -0,0 +1,142 @@
+"""
+Menu Image Upload Processor Tests
+OCR/DB 대신 기록용 처리기로 동시성 상한, 진행 상황 갱신, 스풀 정리, 시작 시 복구 검증
+"""
+
+import asyncio
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+import pytest_asyncio
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from api.b2b import get_image_upload_progress
+from models.menu_upload import MenuUploadTask
+from services.menu_image_upload import MenuImageUploadProcessor
+
+
+class RecordingProcessor(MenuImageUploadProcessor):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.updates = []
+        self.task_updates = {}
+        self.peak_in_flight = 0
+
+    async def process_image(self, task_id, restaurant_id, file_name, content):
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        await asyncio.sleep(0.02)
+        if content == b"broken":
+            return {"file": file_name, "status": "failed", "error": "Invalid image"}
+        return {"file": file_name, "status": "success"}
+
+    async def _update_task(self, task_id, successful=0, failed=0, error=None, **fields):
+        self.updates.append((successful, failed, error, fields.get("status")))
+        self.task_updates.setdefault(task_id, []).append(fields.get("status"))
+
+
+@pytest_asyncio.fixture
+async def session_factory(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'tasks.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(MenuUploadTask.__table__.create)
+    yield async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    await engine.dispose()
+
+
+async def _add_task(session_factory, status, age_seconds=600):
+    task = MenuUploadTask(
+        id=uuid.uuid4(),
+        restaurant_id=uuid.uuid4(),
+        file_name="bulk_upload.zip",
+        file_type="images",
+        status=status,
+        created_at=datetime.now(timezone.utc) - timedelta(seconds=age_seconds),
+    )
+    async with session_factory() as session:
+        session.add(task)
+        await session.commit()
+    return task.id
+
+
+async def test_images_processed_concurrently_with_progress(tmp_path):
+    processor = RecordingProcessor(concurrency=3, spool_dir=str(tmp_path))
+    task_id = uuid.uuid4()
+    files = [(f"menu {i}.jpg", b"image") for i in range(8)] + [("bad.jpg", b"broken")]
+
+    await processor.submit(task_id, str(uuid.uuid4()), files)
+    await processor._tasks[task_id]
+
+    assert processor.peak_in_flight == 3
+    statuses = [u[3] for u in processor.updates if u[3]]
+    assert statuses == ["processing", "completed"]
+    assert sum(u[0] for u in processor.updates) == 8
+    assert sum(u[1] for u in processor.updates) == 1
+    errors = [u[2] for u in processor.updates if u[2]]
+    assert errors == [{"file": "bad.jpg", "status": "failed", "error": "Invalid image"}]
+    assert not (tmp_path / str(task_id)).exists()  # 스풀 정리
+
+
+async def test_stop_keeps_running_task_for_recovery(tmp_path):
+    processor = RecordingProcessor(concurrency=1, spool_dir=str(tmp_path))
+    task_id = uuid.uuid4()
+    await processor.submit(task_id, str(uuid.uuid4()), [("a.jpg", b"image")] * 5)
+    await asyncio.sleep(0.03)
+
+    await processor.stop()
+
+    # 접수된 업로드는 failed 처리하지 않고 남은 이미지를 스풀에 유지 (잠금만 해제)
+    assert all(update[3] != "failed" for update in processor.updates)
+    assert processor.get_stats()["active_tasks"] == 0
+    remaining = [p for p in (tmp_path / str(task_id)).iterdir() if p.name != ".lock"]
+    assert 0 < len(remaining) < 5
+    lock = processor._lock_dir(tmp_path / str(task_id))
+    assert lock is not None
+    lock.close()
+
+
+async def test_start_recovers_interrupted_tasks(tmp_path, session_factory):
+    spool = tmp_path / "spool"
+    processor = RecordingProcessor(
+        session_factory=session_factory, spool_dir=str(spool)
+    )
+    resumable = await _add_task(session_factory, "processing")
+    (spool / str(resumable)).mkdir(parents=True)
+    (spool / str(resumable) / "0001_b.jpg").write_bytes(b"image")  # 0000은 처리 완료
+    lost = await _add_task(session_factory, "pending")
+    just_created = await _add_task(session_factory, "pending", age_seconds=0)
+    owned = await _add_task(session_factory, "processing")
+    (spool / str(owned)).mkdir()
+    orphan = spool / str(uuid.uuid4())
+    orphan.mkdir()
+    (orphan / "0000_a.jpg").write_bytes(b"image")
+
+    # 다른 워커 프로세스가 처리 중인 작업 (스풀 잠금 보유)
+    other_worker_lock = processor._lock_dir(spool / str(owned))
+    try:
+        assert await processor.start() == 1
+        await processor._tasks[resumable]
+    finally:
+        other_worker_lock.close()
+
+    assert processor.task_updates[resumable] == ["processing", None, "completed"]
+    assert sum(u[0] for u in processor.updates) == 1  # 남은 이미지만 처리
+    assert processor.task_updates[lost] == ["failed"]
+    assert just_created not in processor.task_updates
+    assert owned not in processor.task_updates
+    assert (spool / str(owned)).exists()
+    assert not orphan.exists()
+    assert not (spool / str(resumable)).exists()
+
+
+async def test_progress_rejects_malformed_and_unknown_task_ids(session_factory):
+    restaurant_id = str(uuid.uuid4())
+    async with session_factory() as db:
+        with pytest.raises(HTTPException) as bad:
+            await get_image_upload_progress(restaurant_id, "not-a-uuid", db=db)
+        with pytest.raises(HTTPException) as missing:
+            await get_image_upload_progress(restaurant_id, str(uuid.uuid4()), db=db)
+
+    assert bad.value.status_code == 400
+    assert missing.value.status_code == 404
@@ -0,0 +1,166 @@
+"""
+Menu Upload Row Planning Tests
+DB 중복 / 파일 내 중복 / 번역 필요 여부에 따른 행 분류 검증,
+process_upload의 청크 단위 multi-row INSERT ... RETURNING / created_menu_id 매핑 검증
+"""
+
+import io
+import json
+import sqlite3
+import uuid
+
+import pytest_asyncio
+from fastapi import UploadFile
+from sqlalchemy import event, select, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+import services.menu_upload_service as upload_module
+from models.canonical_menu import CanonicalMenu
+from models.menu_upload import (
+    MenuItemStatus,
+    MenuUploadDetail,
+    MenuUploadTask,
+)
+from models.restaurant import Restaurant
+from services.menu_upload_service import MenuUploadService, plan_upload_rows
+from services.menu_upload_worker import menu_upload_workers
+
+
+def _row(row_number, name_ko, description_en=""):
+    return {
+        "row_number": row_number,
+        "name_ko": name_ko,
+        "description_en": description_en,
+    }
+
+
+def test_plan_marks_db_and_in_file_duplicates():
+    menus = [
+        _row(1, "김치찌개", "Spicy kimchi stew"),
+        _row(2, "불고기"),
+        _row(3, "비빔밥", "Mixed rice"),
+        _row(4, "김치찌개"),
+        _row(5, "불고기", "Marinated beef"),
+    ]
+
+    planned = plan_upload_rows(menus, existing_names={"비빔밥"})
+
+    assert [(row["row_number"], status, error) for row, status, error in planned] == [
+        (1, MenuItemStatus.pending, None),
+        (2, MenuItemStatus.success, None),
+        (3, MenuItemStatus.skipped, "Duplicate menu"),
+        (4, MenuItemStatus.skipped, "Duplicate menu in file (row 1)"),
+        (5, MenuItemStatus.skipped, "Duplicate menu in file (row 2)"),
+    ]
+
+
+@pytest_asyncio.fixture
+async def session_factory(tmp_path, monkeypatch):
+    # ARRAY 컬럼 기본값([])은 sqlite 바인딩 불가 → JSON 문자열로 저장
+    monkeypatch.setitem(sqlite3.adapters, (list, sqlite3.PrepareProtocol), json.dumps)
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'upload.db'}")
+    # canonical_menus는 ARRAY/JSONB DDL 불가 → 타입 없는 컬럼으로 동일 이름 테이블 생성
+    columns = ", ".join(c.name for c in CanonicalMenu.__table__.columns)
+    async with engine.begin() as conn:
+        await conn.execute(
+            text(f"CREATE TABLE canonical_menus ({columns}, PRIMARY KEY (id))")
+        )
+        await conn.run_sync(Restaurant.__table__.create)
+        await conn.run_sync(MenuUploadTask.__table__.create)
+        await conn.run_sync(MenuUploadDetail.__table__.create)
+
+    inserts = []
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def record_insert(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("INSERT INTO"):
+            inserts.append(statement.split()[2])
+
+    factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    factory.inserts = inserts
+    yield factory
+    await engine.dispose()
+
+
+async def test_process_upload_inserts_in_chunks_and_maps_created_menus(
+    session_factory, monkeypatch
+):
+    monkeypatch.setattr(upload_module, "_INSERT_CHUNK_SIZE", 2)
+    submitted = []
+
+    async def record_submit(detail_ids):
+        submitted.extend(detail_ids)
+
+    monkeypatch.setattr(menu_upload_workers, "submit", record_submit)
+
+    restaurant_id = uuid.uuid4()
+    async with session_factory() as db:
+        db.add(
+            Restaurant(
+                id=restaurant_id,
+                name="식당",
+                owner_name="홍길동",
+                owner_phone="010-0000-0000",
+                address="서울",
+                business_license="123-45-67890",
+            )
+        )
+        db.add(CanonicalMenu(id=uuid.uuid4(), name_ko="비빔밥", name_en="Bibimbap"))
+        await db.commit()
+    session_factory.inserts.clear()
+
+    csv_content = "name_ko,name_en,description_en,price\n" + "\n".join(
+        [
+            "불고기,Bulgogi,,15000",
+            "잡채,,,9000",
+            "김밥,Gimbap,,",
+            "김치찌개,Kimchi Stew,Spicy stew,9000",
+            "비빔밥,Bibimbap,,",
+            "불고기,,,",
+        ]
+    )
+    upload = UploadFile(file=io.BytesIO(csv_content.encode()), filename="menus.csv")
+
+    async with session_factory() as db:
+        task = await MenuUploadService(db).process_upload(restaurant_id, upload)
+
+    # 신규 메뉴 3건 / Detail 6건 → 청크 2건씩 multi-row INSERT
+    assert session_factory.inserts == [
+        "menu_upload_tasks",
+        "canonical_menus",
+        "canonical_menus",
+        "menu_upload_details",
+        "menu_upload_details",
+        "menu_upload_details",
+    ]
+    assert (task.total_menus, task.successful, task.skipped) == (6, 3, 2)
+    assert task.status == "processing"
+
+    async with session_factory() as db:
+        menus = {
+            name_ko: menu_id
+            for menu_id, name_ko in await db.execute(
+                select(CanonicalMenu.id, CanonicalMenu.name_ko)
+            )
+        }
+        details = (
+            (
+                await db.execute(
+                    select(MenuUploadDetail).order_by(MenuUploadDetail.row_number)
+                )
+            )
+            .scalars()
+            .all()
+        )
+
+    assert set(menus) == {"비빔밥", "불고기", "잡채", "김밥"}
+    assert [(d.name_ko, d.status, d.created_menu_id) for d in details] == [
+        ("불고기", "success", menus["불고기"]),
+        ("잡채", "success", menus["잡채"]),
+        ("김밥", "success", menus["김밥"]),
+        ("김치찌개", "pending", None),
+        ("비빔밥", "skipped", None),
+        ("불고기", "skipped", None),
+    ]
+    # 번역이 필요한 행만 워커 큐에 적재
+    assert submitted == [details[3].id]
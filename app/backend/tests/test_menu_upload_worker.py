@@ -0,0 +1,179 @@
+"""
+Menu Upload Worker Pool Tests
+LocalJobQueue + 기록용 행 처리기로 동시 처리, 재시도, 재시도 소진, pending sweep,
+Redis XADD 파이프라인 검증
+"""
+
+import asyncio
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from models.menu_upload import MenuUploadDetail, MenuUploadTask
+from services.job_queue import Job, LocalJobQueue, RedisStreamJobQueue
+from services.menu_upload_worker import MenuUploadWorkerPool
+
+
+class RecordingPool(MenuUploadWorkerPool):
+    def __init__(self, *args, fail_times=None, **kwargs):
+        super().__init__(*args, queue=LocalJobQueue(), **kwargs)
+        self.fail_times = fail_times or {}
+        self.attempts = {}
+        self.done = []
+        self.failed_rows = []
+        self.peak_busy = 0
+
+    async def recover_pending(self):
+        return 0
+
+    async def process_row(self, detail_id):
+        self.peak_busy = max(self.peak_busy, self.stats["busy"])
+        self.attempts[detail_id] = self.attempts.get(detail_id, 0) + 1
+        await asyncio.sleep(0.01)
+        if self.attempts[detail_id] <= self.fail_times.get(detail_id, 0):
+            raise ConnectionError("translation timeout")
+        self.done.append(detail_id)
+
+    async def fail_row(self, detail_id, error_message):
+        self.failed_rows.append((detail_id, error_message))
+
+
+async def _drain(pool, timeout=2.0):
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    queue = pool.queue
+    while queue.queue.qsize() or queue.in_progress:
+        assert loop.time() < deadline
+        await asyncio.sleep(0.01)
+
+
+async def test_rows_processed_concurrently_with_retries():
+    rows = [uuid.uuid4() for _ in range(10)]
+    flaky, broken = rows[0], rows[1]
+    pool = RecordingPool(
+        workers=4,
+        max_attempts=3,
+        retry_delay_seconds=0.01,
+        fail_times={flaky: 1, broken: 99},
+    )
+
+    await pool.start()
+    await pool.submit(rows)
+    await _drain(pool)
+    await pool.stop()
+
+    assert pool.peak_busy == 4
+    assert sorted(pool.done, key=str) == sorted(set(rows) - {broken}, key=str)
+    assert pool.attempts[flaky] == 2
+    assert pool.attempts[broken] == 3
+    assert pool.failed_rows == [(broken, "translation timeout")]
+    assert pool.stats["retried"] == 3 and pool.stats["failed"] == 1
+
+
+async def test_job_round_trips_through_stream_encoding():
+    job = Job(payload={"detail_id": "abc"}, attempt=2, not_before=12.5)
+
+    decoded = Job.decode(
+        "1-0", {k.encode(): v.encode() for k, v in job.encode().items()}
+    )
+
+    assert decoded == job
+    assert decoded.id == "1-0"
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def xadd(self, stream, fields):
+        self.commands.append(fields)
+
+    async def execute(self):
+        self.redis.round_trips += 1
+        start = len(self.redis.entries)
+        self.redis.entries.extend(self.commands)
+        return [f"{start + i}-0".encode() for i in range(len(self.commands))]
+
+
+class FakeRedis:
+    def __init__(self):
+        self.entries = []
+        self.round_trips = 0
+
+    async def xgroup_create(self, *args, **kwargs):
+        pass
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+async def test_redis_enqueue_many_pipelines_xadds():
+    redis = FakeRedis()
+    queue = RedisStreamJobQueue(redis, "jobs:test")
+    jobs = [Job(payload={"detail_id": str(i)}) for i in range(5)]
+
+    await queue.enqueue_many(jobs, chunk_size=2)
+
+    assert redis.round_trips == 3
+    assert [job.id for job in jobs] == [f"{i}-0" for i in range(5)]
+
+
+@pytest_asyncio.fixture
+async def session_factory(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'upload.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(MenuUploadTask.__table__.create)
+        await conn.run_sync(MenuUploadDetail.__table__.create)
+    yield async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    await engine.dispose()
+
+
+async def test_sweep_requeues_stale_pending_rows_when_queue_is_idle(session_factory):
+    now = datetime.now(timezone.utc)
+    task = MenuUploadTask(
+        id=uuid.uuid4(),
+        restaurant_id=uuid.uuid4(),
+        file_name="menus.csv",
+        status="processing",
+    )
+    stale, fresh, done = (uuid.uuid4() for _ in range(3))
+    async with session_factory() as session:
+        session.add(task)
+        for detail_id, status, age in [
+            (stale, "pending", 600),  # 적재 실패로 큐에 없는 행
+            (fresh, "pending", 0),
+            (done, "success", 600),
+        ]:
+            session.add(
+                MenuUploadDetail(
+                    id=detail_id,
+                    upload_task_id=task.id,
+                    name_ko="비빔밥",
+                    status=status,
+                    created_at=now - timedelta(seconds=age),
+                )
+            )
+        await session.commit()
+
+    pool = MenuUploadWorkerPool(
+        visibility_timeout_seconds=300,
+        session_factory=session_factory,
+        queue=LocalJobQueue(),
+    )
+    await pool.queue.enqueue(Job(payload={"detail_id": "other"}))
+    assert await pool.sweep() == 0  # 큐에 대기 작업이 있으면 건너뜀
+
+    await pool.queue.claim("test")
+    pool.queue.in_progress.clear()
+    assert await pool.sweep() == 1
+    requeued = await pool.queue.claim("test")
+    assert requeued.payload == {"detail_id": str(stale)}
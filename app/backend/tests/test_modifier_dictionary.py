@@ -0,0 +1,89 @@
+"""
+Modifier Dictionary Tests
+정렬 순서 / trie 탐색 / 버전 기반 hot reload 검증
+"""
+
+from types import SimpleNamespace
+
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from models import Modifier
+from services.modifier_dictionary import ModifierDictionary, ModifierDictionaryCache
+
+
+def _row(text_ko, type_, priority=10):
+    return SimpleNamespace(
+        text_ko=text_ko,
+        type=type_,
+        semantic_key=f"{type_}_{text_ko}",
+        translation_en=None,
+        priority=priority,
+    )
+
+
+ROWS = [
+    _row("매운", "taste"),
+    _row("한우", "ingredient"),
+    _row("원조", "emotion"),
+    _row("왕", "size", priority=5),
+    _row("왕대", "size"),
+]
+
+
+def test_entries_follow_engine_priority_order():
+    dictionary = ModifierDictionary(ROWS)
+
+    assert [e.text_ko for e in dictionary.entries] == [
+        "원조",
+        "한우",
+        "매운",
+        "왕대",
+        "왕",
+    ]
+
+
+def test_find_all_returns_contained_modifiers_in_order():
+    dictionary = ModifierDictionary(ROWS)
+
+    found = dictionary.find_all("원조매운한우불고기")
+    assert [e.text_ko for e in found] == ["원조", "한우", "매운"]
+
+    by_length = dictionary.find_all("왕대갈비", by_length=True)
+    assert [e.text_ko for e in by_length] == ["왕대", "왕"]
+
+
+def test_longest_match():
+    dictionary = ModifierDictionary(ROWS)
+
+    assert dictionary.longest_match("왕대갈비").text_ko == "왕대"
+    assert dictionary.longest_match("갈비왕", start=2).text_ko == "왕"
+    assert dictionary.longest_match("갈비") is None
+
+
+@pytest_asyncio.fixture
+async def session_factory(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'mod.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Modifier.__table__.create)
+    yield async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    await engine.dispose()
+
+
+async def test_cache_reloads_only_when_table_changes(session_factory):
+    cache = ModifierDictionaryCache(check_interval_seconds=0)
+
+    async with session_factory() as db:
+        db.add(Modifier(text_ko="원조", type="emotion", semantic_key="original"))
+        await db.commit()
+
+        first = await cache.get(db)
+        assert [e.text_ko for e in first.entries] == ["원조"]
+        assert await cache.get(db) is first
+
+        db.add(Modifier(text_ko="매운", type="taste", semantic_key="spicy"))
+        await db.commit()
+
+        second = await cache.get(db)
+        assert [e.text_ko for e in second.entries] == ["원조", "매운"]
+        assert cache.reloads == 2
@@ -0,0 +1,43 @@
+"""
+OCR Result Cache Tests
+이미지 내용 해시 키 + OcrResult 직렬화 왕복 검증
+"""
+
+from services.ocr_orchestrator import OcrOrchestrator
+from services.ocr_provider import (
+    MenuItem,
+    OcrConfidenceLevel,
+    OcrProviderType,
+    OcrResult,
+)
+
+
+def test_ocr_result_round_trip():
+    result = OcrResult(
+        provider=OcrProviderType.CLOVA,
+        success=True,
+        menu_items=[
+            MenuItem(
+                name_ko="짜장면",
+                prices=[{"size": "곱빼기", "price": 8000}],
+                ingredients=["춘장"],
+            )
+        ],
+        raw_text="짜장면 7000",
+        confidence=0.82,
+        confidence_level=OcrConfidenceLevel.MEDIUM,
+        price_parse_errors=["곱빼기?"],
+        triggered_fallback=True,
+        fallback_reason="신뢰도 0.60",
+    )
+
+    assert OcrResult.from_dict(result.to_dict()) == result
+
+
+async def test_cache_key_depends_on_content_and_preprocessing():
+    orchestrator = OcrOrchestrator()
+
+    key_a = await orchestrator._compute_cache_key(b"menu-photo", True)
+    assert key_a == await orchestrator._compute_cache_key(b"menu-photo", True)
+    assert key_a != await orchestrator._compute_cache_key(b"other-photo", True)
+    assert key_a != await orchestrator._compute_cache_key(b"menu-photo", False)
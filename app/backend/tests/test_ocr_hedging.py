@@ -0,0 +1,137 @@
+"""
+OCR Tier Router Hedging Tests
+지연/결과를 조절하는 가짜 공급자로 hedged 라우팅 검증
+"""
+
+import asyncio
+
+import services.ocr_orchestrator as orchestrator_module
+from services.ocr_orchestrator import OcrOrchestrator
+from services.ocr_provider import MenuItem, OcrProvider, OcrProviderType, OcrResult
+from services.ocr_tier_router import OcrTierRouter
+
+
+class FakeProvider(OcrProvider):
+    def __init__(self, provider_type, delay: float, confidence: float):
+        super().__init__()
+        self.provider_type = provider_type
+        self.delay = delay
+        self.confidence = confidence
+        self.cancelled = False
+
+    async def extract(self, image_data, enable_preprocessing=True):
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        return OcrResult(
+            provider=self.provider_type,
+            success=True,
+            menu_items=[MenuItem(name_ko="김치찌개", price=8000)],
+            confidence=self.confidence,
+        )
+
+    async def health_check(self):
+        return True
+
+
+def _router(tier_1, tier_2, hedge_delay=0.05) -> OcrTierRouter:
+    router = OcrTierRouter()
+    router.tier_1_provider = tier_1
+    router.tier_2_provider = tier_2
+    router.hedge_enabled = True
+    router.hedge_delay_seconds = hedge_delay
+    return router
+
+
+async def test_fast_tier_1_does_not_hedge():
+    gpt = FakeProvider(OcrProviderType.GPT_VISION, delay=0.01, confidence=0.9)
+    clova = FakeProvider(OcrProviderType.CLOVA, delay=0.01, confidence=0.9)
+    router = _router(gpt, clova)
+
+    result = await router.route(b"menu-photo")
+
+    assert result.provider == OcrProviderType.GPT_VISION
+    assert not result.triggered_fallback
+    assert router.stats.hedged == 0
+
+
+async def test_slow_tier_1_is_hedged_and_cancelled():
+    gpt = FakeProvider(OcrProviderType.GPT_VISION, delay=1.0, confidence=0.9)
+    clova = FakeProvider(OcrProviderType.CLOVA, delay=0.01, confidence=0.9)
+    router = _router(gpt, clova)
+
+    result = await router.route(b"menu-photo")
+    await asyncio.sleep(0)
+
+    assert result.provider == OcrProviderType.CLOVA
+    assert result.triggered_fallback
+    assert gpt.cancelled
+    stats = router.get_stats()
+    assert stats["hedged"] == 1 and stats["hedge_wins"] == 1
+    assert stats["latency_ms"]["tier_1"]["samples"] == 0  # 취소된 호출 제외
+
+
+async def test_hedged_tier_1_still_wins_if_tier_2_fails_trigger():
+    gpt = FakeProvider(OcrProviderType.GPT_VISION, delay=0.1, confidence=0.9)
+    clova = FakeProvider(OcrProviderType.CLOVA, delay=0.01, confidence=0.1)
+    router = _router(gpt, clova)
+
+    result = await router.route(b"menu-photo")
+
+    assert result.provider == OcrProviderType.GPT_VISION
+    assert router.stats.hedged == 1 and router.stats.hedge_wins == 0
+
+
+async def test_hard_image_runs_tiers_in_parallel():
+    gpt = FakeProvider(OcrProviderType.GPT_VISION, delay=0.01, confidence=0.3)
+    clova = FakeProvider(OcrProviderType.CLOVA, delay=0.02, confidence=0.9)
+    router = _router(gpt, clova, hedge_delay=10)
+
+    result = await router.route(b"menu-photo", hard=True)
+
+    assert result.provider == OcrProviderType.CLOVA
+    assert "신뢰도" in result.fallback_reason
+    assert router.stats.parallel == 1
+
+
+class FakeCache:
+    def __init__(self):
+        self.store = {}
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def set(self, key, value, ttl=None):
+        self.store[key] = value
+        return True
+
+    async def delete(self, key):
+        return self.store.pop(key, None) is not None
+
+
+async def test_shop_with_tier_1_fallback_routes_next_image_as_hard(monkeypatch):
+    monkeypatch.setattr(orchestrator_module, "cache_service", FakeCache())
+    gpt = FakeProvider(OcrProviderType.GPT_VISION, delay=0.01, confidence=0.3)
+    clova = FakeProvider(OcrProviderType.CLOVA, delay=0.02, confidence=0.9)
+    orchestrator = OcrOrchestrator()
+    orchestrator.tier_router = router = _router(gpt, clova, hedge_delay=10)
+
+    async def extract(shop_id):
+        return await orchestrator.extract_menu(
+            b"menu-photo", use_cache=False, shop_id=shop_id
+        )
+
+    assert (await extract("shop-1")).triggered_fallback  # 손글씨 메뉴판 등
+    assert router.stats.parallel == 0
+
+    await extract("shop-2")  # 다른 매장은 영향 없음
+    assert router.stats.parallel == 0
+
+    gpt.confidence = 0.9
+    assert not (await extract("shop-1")).triggered_fallback
+    assert router.stats.parallel == 1  # 같은 매장 다음 이미지는 처음부터 병렬
+
+    await extract("shop-1")  # Tier 1 채택으로 힌트 해제
+    assert router.stats.parallel == 1
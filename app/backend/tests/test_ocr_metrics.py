@@ -0,0 +1,88 @@
+"""
+OCR Metrics Tests
+Redis 해시 증가분 구성 + 히스토그램 분위수 계산 검증 (Redis 대신 기록용 캐시)
+"""
+
+import asyncio
+
+import pytest
+
+from services import ocr_metrics as metrics_module
+from services.ocr_metrics import (
+    COUNTERS_KEY,
+    LATENCY_KEY,
+    OcrMetrics,
+    histogram_percentile,
+    latency_bucket,
+)
+from services.ocr_provider import OcrProviderType, OcrResult
+
+
+class FakeHashCache:
+    """incr_hashes / get_hashes만 구현한 메모리 캐시"""
+
+    def __init__(self):
+        self.hashes = {}
+        self.calls = 0
+
+    async def incr_hashes(self, increments, ttl, fields=None):
+        self.calls += 1
+        await asyncio.sleep(0)  # 동시 기록 인터리빙
+        for key, values in increments.items():
+            target = self.hashes.setdefault(key, {})
+            for field, amount in values.items():
+                cast = float if isinstance(amount, float) else int
+                target[field] = str(cast(target.get(field, 0)) + amount)
+        for key, mapping in (fields or {}).items():
+            self.hashes.setdefault(key, {}).update(mapping)
+        return True
+
+    async def get_hashes(self, *keys):
+        return [dict(self.hashes.get(key, {})) for key in keys]
+
+
+@pytest.fixture
+def fake_cache(monkeypatch):
+    cache = FakeHashCache()
+    monkeypatch.setattr(metrics_module, "cache_service", cache)
+    return cache
+
+
+def test_histogram_percentile_uses_bucket_upper_bound():
+    buckets = {"le_500": 5, "le_2000": 4, "le_inf": 1}
+
+    assert latency_bucket(480) == "le_500"
+    assert latency_bucket(99999) == "le_inf"
+    assert histogram_percentile(buckets, 0.5) == 500.0
+    assert histogram_percentile(buckets, 0.9) == 2000.0
+    assert histogram_percentile({}, 0.5) is None
+
+
+async def test_concurrent_records_are_not_lost(fake_cache):
+    metrics = OcrMetrics()
+    results = [
+        OcrResult(
+            provider=(
+                OcrProviderType.CLOVA if i % 4 == 0 else OcrProviderType.GPT_VISION
+            ),
+            success=True,
+            triggered_fallback=i % 4 == 0,
+            processing_time_ms=800,
+            price_parse_errors=["?"] if i % 5 == 0 else [],
+        )
+        for i in range(20)
+    ]
+
+    await asyncio.gather(*(metrics.record(r) for r in results))
+    snapshot = await metrics.snapshot()
+
+    assert fake_cache.calls == 20  # 결과당 파이프라인 1회
+    assert snapshot["total_count"] == 20
+    assert snapshot["tier_2_count"] == 5
+    assert snapshot["tier_2_fallback_rate"] == "25.0%"
+    assert snapshot["price_error_rate"] == "20.0%"
+    assert snapshot["avg_processing_time_ms"] == 800
+    histogram = snapshot["latency_histogram"]
+    assert histogram["tier_1:gpt_vision"]["count"] == 15
+    assert histogram["tier_2:clova"]["p90_ms"] == 1000.0
+    assert set(fake_cache.hashes) == {COUNTERS_KEY, LATENCY_KEY}
@@ -0,0 +1,126 @@
+"""
+Perceptual Hash Tests
+같은 메뉴판의 약간 다른 사진은 가깝고, 다른 메뉴판은 멀어야 함
+매장 정보 없는 재촬영은 전체 인덱스로 이전 OCR 결과 재사용
+"""
+
+import cv2
+import numpy as np
+
+from services.ocr_near_duplicate import NearDuplicateIndex, near_duplicate_index
+from services.ocr_orchestrator import OcrOrchestrator
+from services.ocr_provider import MenuItem, OcrProviderType, OcrResult
+from utils.perceptual_hash import compute_image_phash, hamming_distance
+
+
+def _menu_board(seed: int) -> np.ndarray:
+    """텍스트 줄처럼 보이는 가로 막대가 있는 합성 메뉴판"""
+    rng = np.random.default_rng(seed)
+    image = np.full((600, 400), 235, dtype=np.uint8)
+    for row in range(12):
+        y = 30 + row * 45
+        width = int(rng.integers(120, 340))
+        cv2.rectangle(image, (30, y), (30 + width, y + 18), 30, -1)
+        cv2.rectangle(image, (330, y), (370, y + 18), 60, -1)
+    return image
+
+
+def test_near_duplicate_photos_have_small_distance():
+    board = _menu_board(seed=1)
+    # 다른 각도/조명: 약간 회전 + 밝기 변화 + 재압축
+    matrix = cv2.getRotationMatrix2D((200, 300), 2.0, 1.0)
+    shifted = cv2.warpAffine(board, matrix, (400, 600), borderValue=235)
+    shifted = cv2.convertScaleAbs(shifted, alpha=0.9, beta=15)
+
+    a = compute_image_phash(cv2.imencode(".jpg", board)[1].tobytes())
+    b = compute_image_phash(
+        cv2.imencode(".jpg", shifted, [cv2.IMWRITE_JPEG_QUALITY, 70])[1].tobytes()
+    )
+    c = compute_image_phash(cv2.imencode(".jpg", _menu_board(seed=2))[1].tobytes())
+
+    max_distance = NearDuplicateIndex(min_similarity=0.9).max_distance
+    assert hamming_distance(a, b) <= max_distance
+    assert hamming_distance(a, c) > max_distance
+
+
+def test_unreadable_image_has_no_hash():
+    assert compute_image_phash(b"not an image") is None
+
+
+class FakeCache:
+    def __init__(self):
+        self.values, self.lists = {}, {}
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def set(self, key, value, ttl=300):
+        self.values[key] = value
+
+    async def get_list(self, key):
+        return self.lists.get(key, [])
+
+    async def push_capped(self, key, value, max_len, ttl):
+        self.lists.setdefault(key, []).insert(0, value)
+
+
+def _jpeg(image, quality=95):
+    return cv2.imencode(".jpg", image, [cv2.IMWRITE_JPEG_QUALITY, quality])[1].tobytes()
+
+
+async def test_index_is_scoped_to_shop_and_verified_with_ssim(monkeypatch):
+    import services.ocr_near_duplicate as near_dup_module
+
+    monkeypatch.setattr(near_dup_module, "cache_service", FakeCache())
+    # pHash 임계값을 느슨하게 → 다른 메뉴판도 후보가 되고 SSIM이 걸러야 함
+    index = NearDuplicateIndex(min_similarity=0.5, min_ssim=0.8)
+    board = _menu_board(seed=1)
+    rescan = cv2.convertScaleAbs(board, alpha=0.9, beta=15)
+
+    await index.add(await index.compute(_jpeg(board)), "ocr:result:a", "shop-a")
+
+    assert await index.find(await index.compute(_jpeg(rescan, 70)), "shop-b") is None
+    assert await index.find(await index.compute(_jpeg(rescan, 70))) is None
+    assert (
+        await index.find(await index.compute(_jpeg(rescan, 70)), "shop-a")
+        == "ocr:result:a"
+    )
+    other = await index.compute(_jpeg(_menu_board(seed=2)))
+    assert await index.find(other, "shop-a") is None
+    assert index.stats["rejected"] == 1
+
+
+class CountingRouter:
+    def __init__(self):
+        self.calls = 0
+
+    async def route(self, image_data, enable_preprocessing=True, **kwargs):
+        self.calls += 1
+        return OcrResult(
+            provider=OcrProviderType.GPT_VISION,
+            success=True,
+            menu_items=[MenuItem(name_ko="김치찌개", price=8000)],
+            confidence=0.9,
+        )
+
+
+async def test_shopless_rescan_hits_global_index(monkeypatch):
+    import services.ocr_near_duplicate as near_dup_module
+    import services.ocr_orchestrator as orchestrator_module
+
+    cache = FakeCache()
+    monkeypatch.setattr(near_dup_module, "cache_service", cache)
+    monkeypatch.setattr(orchestrator_module, "cache_service", cache)
+    orchestrator = OcrOrchestrator()
+    orchestrator.tier_router = router = CountingRouter()
+    board = _menu_board(seed=1)
+    rescan = cv2.convertScaleAbs(board, alpha=0.9, beta=15)
+    hits = near_duplicate_index.stats["hits"]
+
+    # 관광객 스캔 (매장 정보 없음) → 기본 설정에서 전체 인덱스 사용
+    first = await orchestrator.extract_menu(_jpeg(board))
+    second = await orchestrator.extract_menu(_jpeg(rescan, 70))
+
+    assert router.calls == 1
+    assert second.menu_items == first.menu_items
+    assert near_duplicate_index.stats["hits"] == hits + 1
@@ -0,0 +1,51 @@
+"""
+Preprocess Pool Tests
+OpenCV 전처리가 워커 프로세스에서 실행되고 대기열/실패 메트릭이 집계되는지 확인
+"""
+
+import asyncio
+
+import cv2
+import numpy as np
+import pytest
+
+from services.preprocess_pool import PreprocessPool
+
+
+@pytest.fixture
+def pool():
+    pool = PreprocessPool(max_workers=1, max_queue=4, max_long_edge=120)
+    yield pool
+    pool.shutdown()
+
+
+def _menu_image_bytes() -> bytes:
+    image = np.full((240, 160, 3), 235, dtype=np.uint8)
+    for row in range(6):
+        cv2.rectangle(
+            image, (10, 20 + row * 35), (140, 35 + row * 35), (30, 30, 30), -1
+        )
+    return cv2.imencode(".png", image)[1].tobytes()
+
+
+async def test_preprocess_runs_in_worker_process(pool):
+    image_data = _menu_image_bytes()
+
+    results = await asyncio.gather(*(pool.preprocess(image_data) for _ in range(3)))
+
+    decoded = cv2.imdecode(np.frombuffer(results[0], np.uint8), cv2.IMREAD_COLOR)
+    assert results[0][:2] == b"\xff\xd8"  # JPEG
+    assert max(decoded.shape[:2]) == 120  # 긴 변 상한 적용
+    stats = pool.get_stats()
+    assert stats["completed"] == 3
+    assert stats["in_flight"] == 0
+    assert stats["queue_depth"] == 0
+    assert stats["peak_queue_depth"] >= 1  # 워커 1개에 3건 → 대기 발생
+
+
+async def test_preprocess_failure_propagates(pool):
+    with pytest.raises(ValueError):
+        await pool.preprocess(b"not an image")
+
+    assert pool.get_stats()["failed"] == 1
+    assert pool.get_stats()["in_flight"] == 0
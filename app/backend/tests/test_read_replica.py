@@ -0,0 +1,90 @@
+"""
+Read Replica Routing Tests
+두 개의 SQLite 파일을 primary / replica로 사용
+"""
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from database import ReadReplicaRouter
+
+
+async def _make_factory(path, label: str) -> tuple:
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}", echo=False)
+    async with engine.begin() as conn:
+        await conn.execute(text("CREATE TABLE origin (name TEXT)"))
+        await conn.execute(text("INSERT INTO origin VALUES (:name)"), {"name": label})
+    factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    return engine, factory
+
+
+@pytest_asyncio.fixture
+async def factories(tmp_path):
+    primary_engine, primary = await _make_factory(tmp_path / "primary.db", "primary")
+    replica_engine, replica = await _make_factory(tmp_path / "replica.db", "replica")
+    yield primary, replica
+    await primary_engine.dispose()
+    await replica_engine.dispose()
+
+
+async def _read_origin(router: ReadReplicaRouter) -> str:
+    async with router.session() as session:
+        result = await session.execute(text("SELECT name FROM origin"))
+        return result.scalar()
+
+
+async def test_reads_go_to_healthy_replica(factories):
+    primary, replica = factories
+    router = ReadReplicaRouter(primary, replica, check_interval_seconds=60)
+
+    assert await _read_origin(router) == "replica"
+    assert router.status()["lag_seconds"] == 0.0
+
+
+async def test_no_replica_uses_primary(factories):
+    primary, _ = factories
+    router = ReadReplicaRouter(primary, None)
+
+    assert not router.enabled
+    assert await _read_origin(router) == "primary"
+
+
+async def test_unhealthy_replica_falls_back_to_primary(factories):
+    primary, replica = factories
+    router = ReadReplicaRouter(primary, replica, check_interval_seconds=60)
+
+    router.mark_unhealthy("test")
+    assert await _read_origin(router) == "primary"
+
+    # 헬스체크 주기가 지나면 다시 replica 사용
+    router.check_interval_seconds = 0
+    assert await _read_origin(router) == "replica"
+
+
+async def test_lagging_replica_falls_back_to_primary(factories):
+    primary, replica = factories
+    router = ReadReplicaRouter(
+        primary, replica, max_lag_seconds=1.0, check_interval_seconds=60
+    )
+
+    async def lagging() -> float:
+        return 30.0
+
+    router._measure_lag = lagging
+    assert await _read_origin(router) == "primary"
+    assert router.status()["healthy"] is False
+
+
+async def test_connection_error_marks_replica_unhealthy(factories):
+    primary, replica = factories
+    router = ReadReplicaRouter(primary, replica, check_interval_seconds=60)
+
+    with pytest.raises(OperationalError):
+        async with router.session():
+            raise OperationalError("SELECT 1", {}, Exception("connection refused"))
+
+    assert router.healthy is False
+    assert await _read_origin(router) == "primary"
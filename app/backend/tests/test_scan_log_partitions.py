@@ -0,0 +1,28 @@
+"""
+ScanLog Partition Retention Tests
+"""
+
+from datetime import date
+
+from services.scan_log_partitions import (
+    next_month,
+    partition_month,
+    retention_cutoff,
+)
+
+
+def test_partition_month_parses_monthly_names():
+    assert partition_month("scan_logs_y2026m03") == date(2026, 3, 1)
+    assert partition_month("scan_logs_default") is None
+    assert partition_month("scan_logs_legacy") is None
+
+
+def test_retention_cutoff_crosses_year_boundary():
+    assert retention_cutoff(12, today=date(2026, 10, 19)) == date(2025, 10, 1)
+    assert retention_cutoff(3, today=date(2026, 2, 1)) == date(2025, 11, 1)
+    assert retention_cutoff(0, today=date(2026, 1, 31)) == date(2026, 1, 1)
+
+
+def test_next_month_bounds_rollup_cleanup():
+    assert next_month(date(2026, 3, 1)) == date(2026, 4, 1)
+    assert next_month(date(2025, 12, 1)) == date(2026, 1, 1)
@@ -0,0 +1,126 @@
+"""
+ScanLog Write-behind Writer Tests
+DB 대신 배치를 기록하는 writer로 배치/스필/재적재 동작 검증
+"""
+
+import asyncio
+import json
+import os
+import uuid
+
+from services import scan_log_writer as writer_module
+from services.scan_log_writer import ScanLogWriter
+
+
+class RecordingWriter(ScanLogWriter):
+    def __init__(self, *args, fail: bool = False, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fail = fail
+        self.batches = []
+
+    async def _write_batch(self, batch):
+        if self.fail:
+            raise ConnectionError("db down")
+        self.batches.append(list(batch))
+
+
+async def test_records_are_flushed_in_batches(tmp_path):
+    writer = RecordingWriter(
+        flush_size=3, flush_interval_ms=50, spill_path=str(tmp_path / "spill.jsonl")
+    )
+    await writer.start()
+    for i in range(7):
+        await writer.enqueue(menu_name_ko=f"메뉴{i}")
+    await asyncio.sleep(0.2)
+    await writer.stop()
+
+    sizes = [len(b) for b in writer.batches]
+    assert sum(sizes) == 7
+    assert max(sizes) <= 3
+    assert writer.get_stats()["flushed"] == 7
+
+
+async def test_stop_flushes_remaining_buffer(tmp_path):
+    writer = RecordingWriter(
+        flush_size=100, flush_interval_ms=10000, spill_path=str(tmp_path / "s.jsonl")
+    )
+    await writer.start()
+    for i in range(5):
+        await writer.enqueue(menu_name_ko=f"메뉴{i}")
+    await writer.stop()
+
+    assert sum(len(b) for b in writer.batches) == 5
+
+
+async def test_failed_flush_spills_and_replays(tmp_path):
+    writer = RecordingWriter(
+        fail=True, flush_size=10, spill_path=str(tmp_path / "spill.jsonl")
+    )
+    spill = writer.spill_path
+    assert spill.name == f"spill.{os.getpid()}.jsonl"
+    await writer.enqueue(menu_name_ko="김치찌개", shop_id=None)
+    await writer.enqueue(menu_name_ko="된장찌개")
+
+    lines = spill.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["menu_name_ko"] for line in lines] == [
+        "김치찌개",
+        "된장찌개",
+    ]
+
+    writer.fail = False
+    assert await writer.replay_spill() == 2
+    assert list(tmp_path.iterdir()) == []
+    assert [r["menu_name_ko"] for r in writer.batches[0]] == ["김치찌개", "된장찌개"]
+
+
+async def test_full_buffer_spills_after_timeout(tmp_path):
+    writer = RecordingWriter(
+        max_buffer=1, enqueue_timeout_ms=10, spill_path=str(tmp_path / "spill.jsonl")
+    )
+    writer._queue = asyncio.Queue(maxsize=1)
+    writer._task = asyncio.get_running_loop().create_future()  # running, no consumer
+
+    await writer.enqueue(menu_name_ko="a")
+    await writer.enqueue(menu_name_ko="b")
+
+    assert writer.get_stats()["spilled"] == 1
+    writer._task.cancel()
+
+
+def _write_spill(path, menu_name_ko):
+    record = {"id": str(uuid.uuid4()), "menu_name_ko": menu_name_ko}
+    path.write_text(json.dumps(record) + "\n", encoding="utf-8")
+
+
+async def test_workers_replay_each_spill_file_once(tmp_path):
+    # 이전 워커 2개 + 구버전 단일 파일 + 재적재 실패분
+    _write_spill(tmp_path / "spill.111.jsonl", "a")
+    _write_spill(tmp_path / "spill.222.jsonl", "b")
+    _write_spill(tmp_path / "spill.jsonl", "c")
+    _write_spill(tmp_path / "spill.replaying.333.abcd1234.jsonl", "d")
+
+    first = RecordingWriter(spill_path=str(tmp_path / "spill.jsonl"))
+    second = RecordingWriter(spill_path=str(tmp_path / "spill.jsonl"))
+    stale = second._spill_files()  # 경합: 선점 전에 본 목록
+
+    assert await first.replay_spill() == 4
+    # 먼저 선점된 파일은 FileNotFoundError 없이 건너뜀
+    assert all(second._claim(path) is None for path in stale)
+    assert await second.replay_spill() == 0
+
+    replayed = [r["menu_name_ko"] for batch in first.batches for r in batch]
+    assert sorted(replayed) == ["a", "b", "c", "d"]
+    assert list(tmp_path.iterdir()) == []
+
+
+async def test_locked_spill_file_is_left_for_its_owner(tmp_path):
+    if writer_module.fcntl is None:
+        return
+    spill = tmp_path / "spill.111.jsonl"
+    _write_spill(spill, "a")
+    writer = RecordingWriter(spill_path=str(tmp_path / "spill.jsonl"))
+
+    with open(spill, "a") as f:
+        writer_module.fcntl.flock(f.fileno(), writer_module.fcntl.LOCK_EX)
+        assert await writer.replay_spill() == 0  # 소유 워커가 기록 중
+    assert await writer.replay_spill() == 1
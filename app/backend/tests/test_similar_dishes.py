@@ -0,0 +1,149 @@
+"""
+Similar Dishes Resolution Tests
+precomputed 스냅샷 / legacy 문자열 정규화, 단일 IN 쿼리 조회, 기존 필드(similarity_reason) 보존 검증
+"""
+
+import uuid
+from types import SimpleNamespace
+
+import pytest
+
+from api.menu import _parse_similar_dish, _resolve_similar_dishes
+
+SNAPSHOT = {
+    "id": str(uuid.uuid4()),
+    "name_ko": "갈비구이",
+    "name_en": "Grilled Ribs",
+    "image_url": "https://cdn.example.com/galbi.jpg",
+    "spice_level": 1,
+    "similarity_reason": "같은 양념 갈비",
+    "difference": "숯불에 굽는다",
+}
+
+
+class FakeResult:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def scalars(self):
+        return self
+
+    def all(self):
+        return self.rows
+
+
+class FakeSession:
+    def __init__(self, menus):
+        self.menus = menus
+        self.statements = []
+
+    async def execute(self, statement):
+        self.statements.append(statement)
+        return FakeResult(self.menus)
+
+
+def _menu(name_ko, name_en, image_url=None, primary_image=None):
+    return SimpleNamespace(
+        id=uuid.uuid4(),
+        name_ko=name_ko,
+        name_en=name_en,
+        image_url=image_url,
+        primary_image=primary_image,
+        spice_level=2,
+    )
+
+
+def test_parse_similar_dish_handles_precomputed_and_legacy_entries():
+    assert _parse_similar_dish(SNAPSHOT) == {
+        "name_ko": "갈비구이",
+        "name_en": "Grilled Ribs",
+    }
+    assert _parse_similar_dish("불고기 (Bulgogi - marinated beef)") == {
+        "name_ko": "불고기",
+        "name_en": "Bulgogi - marinated beef",
+    }
+    assert _parse_similar_dish("잡채") == {"name_ko": "잡채", "name_en": "잡채"}
+
+
+async def test_precomputed_entries_skip_the_lookup():
+    db = FakeSession([])
+
+    resolved = await _resolve_similar_dishes([SNAPSHOT], db)
+
+    assert db.statements == []
+    assert resolved == [SNAPSHOT]
+
+
+async def test_remaining_names_resolved_with_single_in_query():
+    bulgogi = _menu("불고기", "Bulgogi", primary_image={"url": "https://x/b.jpg"})
+    japchae = _menu("잡채", "Japchae", image_url="https://x/j.jpg")
+    db = FakeSession([bulgogi, japchae])
+    legacy_object = {"name_ko": "잡채", "similarity_reason": "같은 당면 요리"}
+
+    resolved = await _resolve_similar_dishes(
+        [SNAPSHOT, "불고기 (Bulgogi)", legacy_object, "없는메뉴 (Unknown)"], db
+    )
+
+    assert len(db.statements) == 1
+    sql = str(db.statements[0].compile(compile_kwargs={"literal_binds": True}))
+    assert " IN (" in sql and "갈비구이" not in sql  # 스냅샷 항목은 조회 제외
+    assert resolved[0] == SNAPSHOT
+    assert resolved[1]["id"] == str(bulgogi.id)
+    assert resolved[1]["image_url"] == "https://x/b.jpg"
+    assert resolved[2]["image_url"] == "https://x/j.jpg"
+    assert resolved[2]["similarity_reason"] == "같은 당면 요리"
+    assert resolved[3] == {
+        "id": None,
+        "name_ko": "없는메뉴",
+        "name_en": "Unknown",
+        "image_url": None,
+        "spice_level": 0,
+    }
+
+
+class FakeCursor:
+    def __init__(self, rows):
+        self.rows = rows
+        self.queries = 0
+
+    def execute(self, query, params):
+        self.queries += 1
+
+    def fetchall(self):
+        return self.rows
+
+
+def test_enrichment_merges_snapshot_into_generated_entry():
+    pytest.importorskip("anthropic")
+    from scripts.enrich_missing_menus import resolve_similar_dishes
+
+    cursor = FakeCursor(
+        [
+            {
+                "id": SNAPSHOT["id"],
+                "name_ko": "갈비구이",
+                "name_en": "Grilled Ribs",
+                "image_url": None,
+                "primary_image": {"url": "https://cdn.example.com/new.jpg"},
+                "spice_level": None,
+            }
+        ]
+    )
+    conn = SimpleNamespace(cursor=lambda **kwargs: cursor)
+    generated = {
+        "name_ko": "갈비구이",
+        "similarity_reason": "같은 양념 갈비",
+        "difference": "숯불에 굽는다",
+    }
+
+    resolved = resolve_similar_dishes(conn, [generated, "떡갈비 (Tteokgalbi)"])
+
+    assert cursor.queries == 1
+    assert resolved[0] == {
+        **generated,
+        "id": SNAPSHOT["id"],
+        "name_en": "Grilled Ribs",
+        "image_url": "https://cdn.example.com/new.jpg",
+        "spice_level": 0,
+    }
+    assert resolved[1]["name_en"] == "Tteokgalbi" and resolved[1]["id"] is None
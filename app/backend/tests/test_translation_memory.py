@@ -0,0 +1,75 @@
+"""
+Translation Memory Tests
+SQLite 테이블로 exact-match 조회, 프롬프트 버전 분리, 배치 번역기의 LLM 생략 검증
+"""
+
+import asyncio
+
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from models.translation_memory import TranslationMemory
+from services.batch_translator import BATCH_PROMPT_VERSION, BatchTranslator
+from services.translation_memory import TranslationMemoryService
+
+
+@pytest_asyncio.fixture
+async def memory(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'tm.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(TranslationMemory.__table__.create)
+    yield TranslationMemoryService(
+        session_factory=async_sessionmaker(
+            engine, class_=AsyncSession, expire_on_commit=False
+        )
+    )
+    await engine.dispose()
+
+
+async def test_prefetch_matches_normalized_text_per_prompt_version(memory):
+    await memory.store(
+        [("pork spine", "ja", "豚の背骨"), ("pork spine", "zh", "猪脊骨")], "en", "v1"
+    )
+    memory._l1.clear()  # DB 조회 경로 검증
+
+    found = await memory.prefetch(
+        ["pork  spine ", "spicy broth"], "en", ["ja", "zh"], "v1"
+    )
+
+    assert found == {
+        ("pork  spine ", "ja"): "豚の背骨",
+        ("pork  spine ", "zh"): "猪脊骨",
+    }
+    assert await memory.lookup("pork spine", "en", "ja", "v2") is None
+    assert memory.get_stats()["db_hits"] == 2
+
+
+async def test_batch_translator_skips_llm_for_remembered_items(memory):
+    await memory.store(
+        [
+            ("Spicy kimchi stew", "ja", "キムチチゲ"),
+            ("Spicy kimchi stew", "zh", "泡菜汤"),
+        ],
+        "en",
+        BATCH_PROMPT_VERSION,
+    )
+    prompts = []
+
+    async def complete(prompt):
+        prompts.append(prompt)
+        return '{"translations": [{"id": "1", "ja": "冷麺", "zh": "冷面"}]}'
+
+    translator = BatchTranslator(
+        complete, max_batch_size=2, max_wait_seconds=0.01, memory=memory
+    )
+    first = await translator.translate("김치찌개", "Spicy kimchi stew")
+    second = await translator.translate("냉면", "Cold buckwheat noodles")
+
+    assert first == {"ja": "キムチチゲ", "zh": "泡菜汤"}
+    assert second == {"ja": "冷麺", "zh": "冷面"}
+    assert len(prompts) == 1 and "Spicy kimchi stew" not in prompts[0]
+    await asyncio.gather(*translator._batches)  # 배치 종료 시 저장
+    assert (
+        await memory.lookup("Cold buckwheat noodles", "en", "zh", BATCH_PROMPT_VERSION)
+        == "冷面"
+    )
@@ -2,7 +2,8 @@
 Image preprocessing utilities for OCR accuracy improvement.
 
 Uses OpenCV for:
-- Auto rotation (text orientation detection)
+- Resolution normalization (long edge cap)
+- Auto rotation (text orientation detection on a thumbnail)
 - Contrast enhancement (CLAHE)
 - Noise removal (Gaussian blur)
 """
@@ -15,6 +16,37 @@ import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# GPT Vision (detail=high)은 2048px 박스로 축소 후 처리 → 그 이상은 업로드/연산 낭비
+DEFAULT_MAX_LONG_EDGE = 2048
+
+# 방향 판정용 썸네일 긴 변 (텍스트 줄 엣지 분포는 이 크기에서도 유지됨)
+ORIENTATION_THUMBNAIL_EDGE = 512
+
+
+def normalize_resolution(
+    image: np.ndarray, max_long_edge: int = DEFAULT_MAX_LONG_EDGE
+) -> np.ndarray:
+    """
+    Downscale image so its long edge is at most max_long_edge.
+
+    Smaller images are returned unchanged (no upscaling).
+
+    Args:
+        image: Input image as numpy array
+        max_long_edge: Long edge cap in pixels (0 = no cap)
+
+    Returns:
+        Resized (or original) image as numpy array
+    """
+    height, width = image.shape[:2]
+    long_edge = max(height, width)
+    if not max_long_edge or long_edge <= max_long_edge:
+        return image
+
+    scale = max_long_edge / long_edge
+    size = (max(1, round(width * scale)), max(1, round(height * scale)))
+    return cv2.resize(image, size, interpolation=cv2.INTER_AREA)
+
 
 def auto_rotate_image(image: np.ndarray) -> np.ndarray:
     """
@@ -22,6 +54,8 @@ def auto_rotate_image(image: np.ndarray) -> np.ndarray:
 
     Tries 0, 90, 180, 270 degree rotations and picks the one
     with the most horizontal text lines (detected via edge analysis).
+    Scoring runs on a thumbnail; only the final rotation touches the
+    full-resolution image.
 
     Args:
         image: Input image as numpy array (BGR)
@@ -29,7 +63,8 @@ def auto_rotate_image(image: np.ndarray) -> np.ndarray:
     Returns:
         Rotated image as numpy array (BGR)
     """
-    gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+    thumbnail = normalize_resolution(image, ORIENTATION_THUMBNAIL_EDGE)
+    gray = cv2.cvtColor(thumbnail, cv2.COLOR_BGR2GRAY)
 
     best_angle = 0
     best_score = _score_text_orientation(gray)
@@ -121,19 +156,61 @@ def remove_noise(image: np.ndarray) -> np.ndarray:
     return cv2.GaussianBlur(image, (3, 3), 0)
 
 
-def preprocess_menu_image(image_path: str) -> str:
+def _run_pipeline(image: np.ndarray, max_long_edge: int) -> np.ndarray:
+    """Normalize resolution → auto-rotate → CLAHE → blur"""
+    image = normalize_resolution(image, max_long_edge)
+    image = auto_rotate_image(image)
+    image = enhance_contrast(image)
+    return remove_noise(image)
+
+
+def preprocess_image_bytes(
+    image_data: bytes, max_long_edge: int = DEFAULT_MAX_LONG_EDGE
+) -> bytes:
     """
-    Full preprocessing pipeline for menu images.
+    In-memory preprocessing pipeline for menu images (no temp files).
 
     Pipeline:
-    1. Load image
-    2. Auto-rotate for correct text orientation
-    3. Enhance contrast (CLAHE)
-    4. Remove noise (Gaussian blur)
-    5. Save preprocessed image
+    1. Decode encoded image bytes (JPEG/PNG/WEBP)
+    2. Normalize resolution (cap long edge)
+    3. Auto-rotate for correct text orientation
+    4. Enhance contrast (CLAHE)
+    5. Remove noise (Gaussian blur)
+    6. Encode as JPEG
+
+    Args:
+        image_data: Encoded image bytes
+        max_long_edge: Long edge cap in pixels (0 = keep original resolution)
+
+    Returns:
+        Preprocessed image as JPEG bytes
+
+    Raises:
+        ValueError: If image cannot be decoded by OpenCV
+    """
+    # np.frombuffer는 복사 없이 bytes를 그대로 참조
+    image = cv2.imdecode(np.frombuffer(image_data, dtype=np.uint8), cv2.IMREAD_COLOR)
+    if image is None:
+        raise ValueError("Failed to decode image")
+
+    logger.info(f"Preprocessing image ({image.shape})")
+    image = _run_pipeline(image, max_long_edge)
+
+    ok, encoded = cv2.imencode(".jpg", image)
+    if not ok:
+        raise ValueError("Failed to encode preprocessed image")
+    return encoded.tobytes()
+
+
+def preprocess_menu_image(
+    image_path: str, max_long_edge: int = DEFAULT_MAX_LONG_EDGE
+) -> str:
+    """
+    File-based preprocessing pipeline (same steps as preprocess_image_bytes).
 
     Args:
         image_path: Path to the original menu image
+        max_long_edge: Long edge cap in pixels (0 = keep original resolution)
 
     Returns:
         Path to the preprocessed image ({original}_preprocessed.jpg)
@@ -145,23 +222,13 @@ def preprocess_menu_image(image_path: str) -> str:
     if not os.path.exists(image_path):
         raise FileNotFoundError(f"Image not found: {image_path}")
 
-    # Step 1: Load
     image = cv2.imread(image_path)
     if image is None:
         raise ValueError(f"Failed to load image: {image_path}")
 
     logger.info(f"Preprocessing image: {image_path} ({image.shape})")
+    image = _run_pipeline(image, max_long_edge)
 
-    # Step 2: Auto-rotate
-    image = auto_rotate_image(image)
-
-    # Step 3: Enhance contrast
-    image = enhance_contrast(image)
-
-    # Step 4: Remove noise
-    image = remove_noise(image)
-
-    # Step 5: Save
     base, ext = os.path.splitext(image_path)
     output_path = f"{base}_preprocessed.jpg"
     cv2.imwrite(output_path, image)
@@ -54,3 +54,17 @@ def validate_image(file_bytes: bytes) -> Tuple[str, int, int]:
         )
 
     return img.format, width, height
+
+
+def detect_image_format(file_bytes: bytes) -> str:
+    """
+    Detect image format from magic bytes (no decoding)
+
+    Returns:
+        "JPEG", "PNG" or "WEBP" (defaults to "JPEG" if unknown)
+    """
+    if file_bytes[:8] == b"\x89PNG\r\n\x1a\n":
+        return "PNG"
+    if file_bytes[:4] == b"RIFF" and file_bytes[8:12] == b"WEBP":
+        return "WEBP"
+    return "JPEG"
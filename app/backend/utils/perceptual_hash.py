@@ -0,0 +1,144 @@
+"""
+Perceptual hashing utilities for near-duplicate menu photo detection.
+
+Same menu board photographed from slightly different angles/lighting
+produces different bytes but nearly identical perceptual hashes.
+
+- pHash: DCT low-frequency coefficients vs. median (robust to scale/contrast)
+- dHash: horizontal gradient signs (cheap, robust to brightness)
+- SSIM on a downscaled thumbnail: second check for pHash candidates
+  (pHash mostly reflects layout, so two different menus with a similar
+  layout can collide)
+"""
+
+from typing import Optional, Tuple
+
+import cv2
+import numpy as np
+
+HASH_BITS = 64
+THUMBNAIL_SIZE = 32  # SSIM 비교용 썸네일 한 변 (px, 작을수록 촬영 각도 차이에 관대)
+
+
+def _normalize_gray(gray: np.ndarray) -> np.ndarray:
+    """
+    Normalize grayscale image before hashing.
+
+    Mirrors the OCR preprocessing (CLAHE contrast + light blur) so lighting
+    differences between shots do not flip hash bits.
+    """
+    clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
+    return cv2.GaussianBlur(clahe.apply(gray), (3, 3), 0)
+
+
+def _bits_to_int(bits: np.ndarray) -> int:
+    value = 0
+    for bit in bits.flatten():
+        value = (value << 1) | int(bit)
+    return value
+
+
+def phash(gray: np.ndarray, hash_size: int = 8, highfreq_factor: int = 4) -> int:
+    """
+    DCT-based perceptual hash (hash_size^2 bits).
+
+    Args:
+        gray: Grayscale image as numpy array
+
+    Returns:
+        Hash as int
+    """
+    size = hash_size * highfreq_factor
+    resized = cv2.resize(gray, (size, size), interpolation=cv2.INTER_AREA)
+    dct = cv2.dct(np.float32(resized))
+    low_freq = dct[:hash_size, :hash_size]
+    # DC 성분(0,0)은 전체 밝기라 중앙값 계산에서 제외
+    median = np.median(low_freq.flatten()[1:])
+    return _bits_to_int(low_freq > median)
+
+
+def dhash(gray: np.ndarray, hash_size: int = 8) -> int:
+    """
+    Difference hash (hash_size^2 bits).
+
+    Args:
+        gray: Grayscale image as numpy array
+
+    Returns:
+        Hash as int
+    """
+    resized = cv2.resize(gray, (hash_size + 1, hash_size), interpolation=cv2.INTER_AREA)
+    return _bits_to_int(resized[:, 1:] > resized[:, :-1])
+
+
+def hamming_distance(a: int, b: int) -> int:
+    """Number of differing bits between two hashes."""
+    return (a ^ b).bit_count()
+
+
+def similarity(a: int, b: int, bits: int = HASH_BITS) -> float:
+    """Hash similarity in [0, 1] (1 = identical)."""
+    return 1.0 - hamming_distance(a, b) / bits
+
+
+def thumbnail(gray: np.ndarray, size: int = THUMBNAIL_SIZE) -> np.ndarray:
+    """Fixed-size grayscale thumbnail (size x size, uint8) for SSIM."""
+    return cv2.resize(gray, (size, size), interpolation=cv2.INTER_AREA)
+
+
+def ssim(a: np.ndarray, b: np.ndarray) -> float:
+    """
+    Mean structural similarity of two same-sized grayscale images.
+
+    Gaussian window (sigma=1.5), standard constants for 8-bit images.
+
+    Returns:
+        SSIM in [-1, 1] (1 = identical)
+    """
+    c1, c2 = (0.01 * 255) ** 2, (0.03 * 255) ** 2
+    a, b = a.astype(np.float64), b.astype(np.float64)
+
+    def blur(x: np.ndarray) -> np.ndarray:
+        return cv2.GaussianBlur(x, (7, 7), 1.5)
+
+    mu_a, mu_b = blur(a), blur(b)
+    var_a = blur(a * a) - mu_a**2
+    var_b = blur(b * b) - mu_b**2
+    cov = blur(a * b) - mu_a * mu_b
+    ssim_map = ((2 * mu_a * mu_b + c1) * (2 * cov + c2)) / (
+        (mu_a**2 + mu_b**2 + c1) * (var_a + var_b + c2)
+    )
+    return float(ssim_map.mean())
+
+
+def compute_image_signature(image_data: bytes) -> Optional[Tuple[int, np.ndarray]]:
+    """
+    Decode image as grayscale, normalize, and compute 64-bit pHash + thumbnail.
+
+    Args:
+        image_data: Encoded image bytes
+
+    Returns:
+        (pHash, thumbnail), or None if the image cannot be decoded
+    """
+    gray = cv2.imdecode(np.frombuffer(image_data, dtype=np.uint8), cv2.IMREAD_GRAYSCALE)
+    if gray is None:
+        return None
+    normalized = _normalize_gray(gray)
+    return phash(normalized), thumbnail(normalized)
+
+
+def compute_image_phash(image_data: bytes) -> Optional[int]:
+    """
+    Decode image as grayscale, normalize, and compute 64-bit pHash.
+
+    Args:
+        image_data: Encoded image bytes
+
+    Returns:
+        Hash as int, or None if the image cannot be decoded
+    """
+    gray = cv2.imdecode(np.frombuffer(image_data, dtype=np.uint8), cv2.IMREAD_GRAYSCALE)
+    if gray is None:
+        return None
+    return phash(_normalize_gray(gray))
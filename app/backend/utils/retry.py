@@ -5,6 +5,7 @@ Retry decorator for external API calls
 import asyncio
 import functools
 import logging
+import random
 from typing import TypeVar, Callable
 
 logger = logging.getLogger(__name__)
@@ -17,6 +18,7 @@ def async_retry(
     delay: float = 1.0,
     backoff: float = 2.0,
     exceptions: tuple = (Exception,),
+    jitter: bool = False,
 ):
     """
     Async retry decorator with exponential backoff
@@ -26,6 +28,8 @@ def async_retry(
         delay: Initial delay in seconds
         backoff: Delay multiplier
         exceptions: Exception types to catch
+        jitter: Sleep a random duration in [0, delay] (full jitter) so
+            concurrent callers do not retry in lockstep
     """
 
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
@@ -44,12 +48,15 @@ def async_retry(
                         )
                         raise
 
+                    sleep_for = (
+                        random.uniform(0, current_delay) if jitter else current_delay
+                    )
                     logger.warning(
                         f"⚠️  {func.__name__} attempt {attempt}/{max_attempts} failed: {e}. "
-                        f"Retrying in {current_delay}s..."
+                        f"Retrying in {sleep_for:.2f}s..."
                     )
 
-                    await asyncio.sleep(current_delay)
+                    await asyncio.sleep(sleep_for)
                     current_delay *= backoff
 
             # Should never reach here